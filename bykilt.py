@@ -2039,7 +2039,8 @@ Tests include browser initialization, profile validation, and recording path ver
 
                     # Run async test execution
                     try:
-                        test_results = asyncio.run(execute_test())
+                        from src.browser.browser_pool import closing_browser_pool
+                        test_results = asyncio.run(closing_browser_pool(execute_test()))
                     except Exception as e:
                         # Fallback for sync context
                         test_results = {
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the standalone prompt matcher.
+
+Builds a synthetic action registry with a configurable number of actions and
+compares the compiled matcher (Aho-Corasick index + precompiled parameter
+patterns) with the previous linear scan over every action.
+
+Usage:
+    python scripts/bench_prompt_matcher.py --actions 300 --iterations 2000
+"""
+
+import argparse
+import contextlib
+import io
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.standalone_prompt_evaluator import ActionRegistry  # noqa: E402
+
+WORDS = ["search", "get", "title", "phrase", "login", "export", "report", "nlp",
+         "download", "upload", "form", "fill", "click", "table", "scrape", "page"]
+
+
+def build_actions(count: int) -> List[Dict[str, Any]]:
+    """Generate ``count`` actions with two or three keyword names and params."""
+    actions = []
+    for i in range(count):
+        parts = [WORDS[i % len(WORDS)], WORDS[(i // len(WORDS)) % len(WORDS)], f"v{i}"]
+        actions.append({
+            "name": "-".join(parts),
+            "type": "browser-control",
+            "params": [{"name": "query"}, {"name": "limit"}, {"name": f"opt{i % 7}"}],
+        })
+    return actions
+
+
+def linear_match(actions: List[Dict[str, Any]], prompt: str) -> Optional[Dict[str, Any]]:
+    """Previous implementation: two linear passes plus per-call regex builds."""
+    for action in actions:
+        if f"@{action['name']}" in prompt:
+            return linear_extract(action, prompt)
+    for action in actions:
+        if all(keyword in prompt.lower() for keyword in action['name'].split('-')):
+            return linear_extract(action, prompt)
+    return None
+
+
+def linear_extract(action: Dict[str, Any], prompt: str) -> Dict[str, Any]:
+    params = {}
+    for param in [p['name'] for p in action['params']]:
+        match = re.search(rf'{param}=(\S+)', prompt)
+        if match:
+            params[param] = match.group(1)
+    return {"command_name": action["name"], "params": params}
+
+
+def compiled_match(registry: ActionRegistry, prompt: str) -> Optional[Dict[str, Any]]:
+    action = registry.match_exact(prompt) or registry.match_keywords(prompt)
+    if action is None:
+        return None
+    return {"command_name": action["name"], "params": registry.extract_params(prompt, action)}
+
+
+def time_per_call(fn, prompts: List[str], iterations: int) -> float:
+    """Return mean microseconds per call."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(prompts[i % len(prompts)])
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the standalone prompt matcher')
+    parser.add_argument('--actions', type=int, default=300, help='Number of registered actions (default: 300)')
+    parser.add_argument('--iterations', type=int, default=2000, help='Prompts evaluated per variant (default: 2000)')
+    args = parser.parse_args()
+
+    actions = build_actions(args.actions)
+    prompts = [
+        f"@{actions[-1]['name']} query=foo limit=10",             # exact match, last action
+        f"please {actions[args.actions // 2]['name'].replace('-', ' ')} query=bar",  # keyword match
+        "no registered command in this prompt at all",            # miss
+    ]
+
+    start = time.perf_counter()
+    registry = ActionRegistry({"actions": actions})
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # Silence the extractor's progress prints while timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        for prompt in prompts:
+            old, new = linear_match(actions, prompt), compiled_match(registry, prompt)
+            if (old or {}).get("command_name") != (new or {}).get("command_name"):
+                raise SystemExit(f"Matcher mismatch for {prompt!r}: {old} != {new}")
+        linear_us = time_per_call(lambda p: linear_match(actions, p), prompts, args.iterations)
+        compiled_us = time_per_call(lambda p: compiled_match(registry, p), prompts, args.iterations)
+
+    print(f"Actions: {args.actions}, iterations: {args.iterations}")
+    print(f"Registry build: {build_ms:.2f} ms (once per llms.txt version)")
+    print(f"Linear scan:    {linear_us:8.1f} us/prompt")
+    print(f"Compiled index: {compiled_us:8.1f} us/prompt ({linear_us / compiled_us:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for secret masking in the JSONL logging pipeline.
+
+Measures the per-record cost of ``JsonlLogger._emit`` (file I/O disabled) with
+the compiled SecretMasker and with the previous implementation, which ran
+every rule's ``re.sub`` under a lock and read the environment on each call.
+
+Usage:
+    python scripts/bench_secret_masker.py --records 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.logging.jsonl_logger import JsonlLogger  # noqa: E402
+from src.security.secret_masker import SecretMasker  # noqa: E402
+
+MESSAGES = [
+    ("Job started", {"job_id": "job_0001", "row": 17}),
+    ("Navigated to https://example.com/search?q=playwright", {"status": 200, "elapsed_ms": 412}),
+    ("Batch progress 120/500 completed", {"batch_id": "batch_20240101", "failed": 3}),
+    ("Element not found, retrying selector #submit-button", {"attempt": 2, "timeout_ms": 5000}),
+    ("Calling API with key sk-TESTKEY1234567890abcdef1234567890abcdef", {"endpoint": "/v1/chat"}),
+]
+
+
+class LegacyMasker:
+    """The previous SecretMasker.mask_text/mask_dict behaviour."""
+
+    def __init__(self, rules):
+        self._rules = list(rules)
+        self._lock = threading.Lock()
+
+    def _enabled(self) -> bool:
+        return os.getenv("BYKILT_SECRET_MASKING_ENABLED", "true").lower() in {"1", "true", "yes", "on"}
+
+    def mask_text(self, text: str) -> str:
+        if not self._enabled() or not text:
+            return text
+        with self._lock:
+            for rule in self._rules:
+                text = rule.pattern.sub(rule.replacement, text)
+        return text
+
+    def mask_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._enabled() or not data:
+            return data
+
+        def _mask_value(value: Any) -> Any:
+            if isinstance(value, str):
+                return self.mask_text(value)
+            if isinstance(value, dict):
+                return {k: _mask_value(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [_mask_value(item) for item in value]
+            return value
+
+        return _mask_value(data)
+
+
+def time_emit(logger: JsonlLogger, records: int) -> float:
+    """Return mean microseconds per ``_emit`` call."""
+    start = time.perf_counter()
+    for i in range(records):
+        msg, extra = MESSAGES[i % len(MESSAGES)]
+        logger._emit("INFO", msg, dict(extra))
+    return (time.perf_counter() - start) / records * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark secret masking in JsonlLogger._emit')
+    parser.add_argument('--records', type=int, default=20000, help='Records emitted per variant (default: 20000)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.setdefault("BYKILT_RUN_ID", "bench")
+        os.chdir(tmp)
+        masker = SecretMasker.get_instance()
+        legacy = LegacyMasker(masker._rules)
+        logger = JsonlLogger.get("bench_masking")
+
+        with patch.object(logger, "_append_line"):
+            with patch("src.logging.jsonl_logger.mask_text", legacy.mask_text), \
+                    patch("src.logging.jsonl_logger.mask_dict", legacy.mask_dict), \
+                    patch("src.logging.jsonl_logger.is_masking_enabled", legacy._enabled):
+                legacy_us = time_emit(logger, args.records)
+            compiled_us = time_emit(logger, args.records)
+
+            with patch("src.logging.jsonl_logger.is_masking_enabled", lambda: False):
+                baseline_us = time_emit(logger, args.records)
+
+    print(f"Records: {args.records} ({len(MESSAGES)} message shapes, 1 in {len(MESSAGES)} has a secret)")
+    print(f"_emit, masking off:      {baseline_us:6.1f} us/record")
+    print(f"_emit, legacy masker:    {legacy_us:6.1f} us/record (masking {legacy_us - baseline_us:5.1f} us)")
+    print(f"_emit, compiled masker:  {compiled_us:6.1f} us/record (masking {compiled_us - baseline_us:5.1f} us)")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,12 +14,14 @@ import uvicorn
 import nest_asyncio
 import os
 from src.browser.browser_config import BrowserConfig
+from src.browser.browser_pool import shutdown_browser_pool
 from src.utils.log_ui import create_log_tab  # Correct import from log_ui instead of app_logger
 from src.utils.app_logger import logger
 import gradio as gr
 from src.core.artifact_manager import ArtifactManager
 from src.api.metrics_router import router as metrics_router
 from src.api.realtime_router import router as realtime_router
+from src.browser.screencast import set_live_view_served
 from src.api.trace_viewer_router import router as trace_viewer_router
 from src.ui.services import ensure_playwright_trace_assets
 
@@ -58,7 +60,8 @@ def create_fastapi_app(demo, args):
                 },
             )
         yield
-        # Shutdown (if needed)
+        # Shutdown: close warm browsers launched on the server loop
+        await shutdown_browser_pool()
 
     app = FastAPI(lifespan=lifespan)
     
@@ -89,6 +92,7 @@ def create_fastapi_app(demo, args):
     # Metrics API (Issue #59)
     app.include_router(metrics_router)
     app.include_router(realtime_router)
+    set_live_view_served()
     app.include_router(trace_viewer_router)
 
     # Artifact manifest listing (#36)
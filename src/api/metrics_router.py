@@ -55,11 +55,12 @@ def get_series(name: str,
 @router.get("/series/{name}/summary")
 def get_series_summary(name: str,
                        since_seconds: Optional[int] = Query(None, ge=1),
-                       tag: Optional[str] = Query(None, description="tag filter key=value")) -> Dict[str, Any]:
+                       tag: Optional[str] = Query(None, description="tag filter key=value"),
+                       exact: Optional[bool] = Query(None, description="force exact (true) or sketch (false) percentiles")) -> Dict[str, Any]:
     series = _get_metric_series_or_404(name)
     tags_filter = _parse_tag_filter(tag)
 
-    summary = compute_summary(series, since_seconds=since_seconds, tags_filter=tags_filter)
+    summary = compute_summary(series, since_seconds=since_seconds, tags_filter=tags_filter, exact=exact)
     return {"name": name, **summary}
 
 
@@ -11,6 +11,8 @@ from typing import Any, Dict
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from src.browser.screencast import get_stream
+from src.config.feature_flags import FeatureFlags
 from src.ui.services import get_feature_flag_service
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,8 @@ router = APIRouter(prefix="/ws", tags=["realtime"])
 
 _RUN_HISTORY_FILE = Path("logs/run_history.json")
 _POLL_INTERVAL = float(os.getenv("RUN_HISTORY_WS_POLL_INTERVAL", "1.0"))
+_LIVE_VIEW_WAIT_INTERVAL = 0.2
+_LIVE_VIEW_WAIT_TIMEOUT = 60.0
 
 
 @router.websocket("/run-history")
@@ -49,6 +53,36 @@ async def run_history_stream(websocket: WebSocket) -> None:
         )
 
 
+@router.websocket("/live-view/{stream_id}")
+async def live_view_stream(websocket: WebSocket, stream_id: str) -> None:
+    """Push screencast frames of a headless run (see src.browser.screencast)."""
+    await websocket.accept()
+    if not FeatureFlags.get("ui.live_view_screencast", expected_type=bool, default=True):
+        await websocket.close()
+        return
+
+    try:
+        stream = get_stream(stream_id)
+        waited = 0.0
+        while stream is None and waited < _LIVE_VIEW_WAIT_TIMEOUT:
+            # The viewer connects before the agent's browser session exists
+            await asyncio.sleep(_LIVE_VIEW_WAIT_INTERVAL)
+            waited += _LIVE_VIEW_WAIT_INTERVAL
+            stream = get_stream(stream_id)
+
+        if stream is not None:
+            async for frame in stream.frames():
+                await websocket.send_text(json.dumps(frame.to_payload()))
+        await websocket.send_text(json.dumps({"type": "end"}))
+    except WebSocketDisconnect:  # pragma: no cover - expected on client close
+        logger.debug("Live view websocket disconnected")
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning(
+            "Live view websocket encountered error",
+            extra={"event": "ui.live_view.error", "error": repr(exc)},
+        )
+
+
 def _build_run_history_payload() -> str:
     data = _load_history_entries()
     stats = _compute_stats(data)
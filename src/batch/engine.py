@@ -5,7 +5,9 @@ This module provides the core functionality for processing CSV files
 and generating batch jobs for browser automation tasks.
 """
 
+import asyncio
 import csv
+import itertools
 import json
 import logging
 import uuid
@@ -39,6 +41,9 @@ from .models import (
     BATCH_MANIFEST_FILENAME,
     JOBS_DIRNAME,
 )
+from .manifest_index import BatchManifestIndex
+from .manifest_store import ManifestJournal, StreamingManifestWriter
+from .retry import RetryOutcome, RetryScheduler
 from .utils import to_portable_relpath
 
 if TYPE_CHECKING:
@@ -59,6 +64,16 @@ DEFAULT_RETRY_DELAY = 1.0  # Default initial delay between retries in seconds
 DEFAULT_BACKOFF_FACTOR = 2.0  # Default exponential backoff multiplier
 MAX_RETRY_DELAY = 60.0  # Maximum retry delay in seconds (cap for exponential backoff)
 
+# Number of characters read from the start of a CSV file for delimiter detection
+CSV_SNIFF_SAMPLE_SIZE = 1024
+
+# Number of journaled job status changes between manifest compactions
+DEFAULT_MANIFEST_CHECKPOINT_INTERVAL = 100
+
+# Constants for concurrent execution
+DEFAULT_MAX_PARALLEL_JOBS = 1  # Sequential execution unless explicitly configured
+MAX_PARALLEL_JOBS_LIMIT = 64  # Upper bound for the worker pool size
+
 
 class BatchEngine:
     """
@@ -105,6 +120,8 @@ class BatchEngine:
             'validate_headers': True, # Validate CSV headers exist
             'skip_empty_rows': True, # Skip empty rows automatically
             'log_level': 'INFO',     # Logging level (DEBUG, INFO, WARNING, ERROR)
+            'max_parallel_jobs': DEFAULT_MAX_PARALLEL_JOBS, # Jobs executed concurrently by execute_batch_jobs
+            'manifest_checkpoint_interval': DEFAULT_MANIFEST_CHECKPOINT_INTERVAL, # Journal records between manifest compactions
         }
 
         # Load configuration from environment variables first
@@ -121,6 +138,9 @@ class BatchEngine:
         # Configure logging level
         self._configure_logging()
 
+        # Persistent job/batch -> manifest path index (created lazily)
+        self._manifest_index: Optional[BatchManifestIndex] = None
+
     def _validate_file_type(self, csv_path: str):
         """
         Validate that the file is a CSV file based on extension and MIME type.
@@ -176,6 +196,8 @@ class BatchEngine:
             'BATCH_VALIDATE_HEADERS': ('validate_headers', lambda x: x.lower() in ('true', '1', 'yes')),
             'BATCH_SKIP_EMPTY_ROWS': ('skip_empty_rows', lambda x: x.lower() in ('true', '1', 'yes')),
             'BATCH_LOG_LEVEL': ('log_level', str),
+            'BATCH_MAX_PARALLEL_JOBS': ('max_parallel_jobs', int),
+            'BATCH_MANIFEST_CHECKPOINT_INTERVAL': ('manifest_checkpoint_interval', int),
         }
 
         for env_var, (config_key, converter) in env_mapping.items():
@@ -227,6 +249,18 @@ class BatchEngine:
                 if not isinstance(value, bool):
                     raise ConfigurationError(f"{bool_key} must be a boolean, got: {value} ({type(value).__name__})")
 
+            # Validate max_parallel_jobs
+            max_parallel = self.config['max_parallel_jobs']
+            if not isinstance(max_parallel, int) or isinstance(max_parallel, bool) or max_parallel <= 0:
+                raise ConfigurationError(f"max_parallel_jobs must be a positive integer, got: {max_parallel}")
+            if max_parallel > MAX_PARALLEL_JOBS_LIMIT:
+                raise ConfigurationError(f"max_parallel_jobs too large: {max_parallel}. Maximum allowed: {MAX_PARALLEL_JOBS_LIMIT}")
+
+            # Validate manifest_checkpoint_interval
+            checkpoint_interval = self.config['manifest_checkpoint_interval']
+            if not isinstance(checkpoint_interval, int) or isinstance(checkpoint_interval, bool) or checkpoint_interval <= 0:
+                raise ConfigurationError(f"manifest_checkpoint_interval must be a positive integer, got: {checkpoint_interval}")
+
             # Validate log_level
             valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
             log_level = self.config['log_level'].upper()
@@ -329,36 +363,40 @@ class BatchEngine:
                                     f"Consider splitting the file or increasing 'max_file_size_mb' in configuration.")
 
         if file_size_mb > 100:  # Warn for files larger than 100MB
-            self.logger.warning(f"Large CSV file detected ({file_size_mb:.1f}MB). Consider using streaming processing.")
+            self.logger.warning(f"Large CSV file detected ({file_size_mb:.1f}MB). Consider streaming it with iter_csv_chunks() "
+                                f"or create_batch_jobs(..., retain_jobs=False).")
 
-    def _read_and_parse_csv_content(self, csv_path_obj: Path, csv_path: str, chunk_size: Optional[int]) -> List[Dict[str, Any]]:
+    def _iter_csv_content_chunks(self, csv_path_obj: Path, csv_path: str,
+                                 chunk_size: Optional[int]) -> Iterator[List[Dict[str, Any]]]:
         """
-        Read and parse CSV file content.
-        
+        Stream CSV file content as chunks of row dictionaries.
+
+        Only the first block of the file is read up front to detect the delimiter;
+        rows are then yielded in chunks so memory use is bounded by ``chunk_size``.
+
         Args:
             csv_path_obj: Resolved Path object
             csv_path: Original path string for error messages
-            chunk_size: Number of rows to process at once. If None, uses configured chunk_size
-            
-        Returns:
-            List of dictionaries representing CSV rows
-            
+            chunk_size: Number of rows per yielded chunk. If None, uses configured chunk_size
+
+        Yields:
+            Lists of dictionaries representing CSV rows
+
         Raises:
-            FileProcessingError: If parsing fails
-            UnicodeDecodeError: If encoding is invalid
+            FileProcessingError: If parsing fails or no valid rows are found
         """
+        effective_chunk_size = chunk_size if chunk_size is not None else self.config['chunk_size']
         try:
             with open(csv_path_obj, 'r', encoding=self.config['encoding']) as f:
-                # Check if file has content
-                content = f.read()
-                if not content.strip():
+                # Check if file has content using the first block only
+                sample = f.read(CSV_SNIFF_SAMPLE_SIZE)
+                if not sample.strip() and not self._has_non_whitespace(f):
                     raise FileProcessingError(f"CSV file contains no data: '{csv_path}'. The file is empty or contains only whitespace.")
 
                 f.seek(0)
 
                 # Detect delimiter and handle various CSV formats
                 try:
-                    sample = content[:1024] if len(content) > 1024 else content
                     sniffer = csv.Sniffer()
                     delimiter = sniffer.sniff(sample).delimiter
                 except csv.Error:
@@ -367,7 +405,7 @@ class BatchEngine:
                     self.logger.warning(f"Could not detect delimiter for {csv_path}, using '{delimiter}'")
 
                 reader = csv.DictReader(f, delimiter=delimiter)
-                rows = []
+                chunk: List[Dict[str, Any]] = []
                 processed_rows = 0
 
                 for row_num, row in enumerate(reader, start=2):  # Start from 2 (header is 1)
@@ -381,21 +419,22 @@ class BatchEngine:
                         self.logger.debug(f"Skipping invalid row {row_num} in {csv_path}")
                         continue
 
-                    rows.append(row)
+                    chunk.append(row)
                     processed_rows += 1
 
-                    # Process in chunks to avoid memory issues with very large files
-                    # Use the provided chunk_size parameter, fallback to config if not provided
-                    effective_chunk_size = chunk_size if chunk_size is not None else self.config['chunk_size']
-                    if processed_rows % effective_chunk_size == 0:
+                    if len(chunk) >= effective_chunk_size:
                         self.logger.debug(f"Processed {processed_rows} rows from {csv_path}")
+                        yield chunk
+                        chunk = []
 
-                if not rows:
+                if chunk:
+                    yield chunk
+
+                if processed_rows == 0:
                     raise FileProcessingError(f"No valid data rows found in CSV file: '{csv_path}'. "
                                             f"The file may contain only headers or all rows were filtered out.")
 
-                self.logger.info(f"Successfully parsed {len(rows)} valid rows from {csv_path}")
-                return rows
+                self.logger.info(f"Successfully parsed {processed_rows} valid rows from {csv_path}")
 
         except UnicodeDecodeError as e:
             raise FileProcessingError(f"Invalid file encoding in '{csv_path}'. Expected '{self.config['encoding']}' encoding. "
@@ -408,12 +447,43 @@ class BatchEngine:
             raise FileProcessingError(f"Failed to parse CSV file '{csv_path}': {e}. "
                                     f"Please check the file format, encoding, and contents.")
 
+    @staticmethod
+    def _has_non_whitespace(f) -> bool:
+        """Return True if the remainder of an open text file contains non-whitespace."""
+        while True:
+            block = f.read(CSV_SNIFF_SAMPLE_SIZE * 64)
+            if not block:
+                return False
+            if block.strip():
+                return True
+
+    def _read_and_parse_csv_content(self, csv_path_obj: Path, csv_path: str, chunk_size: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        Read and parse CSV file content.
+        
+        Args:
+            csv_path_obj: Resolved Path object
+            csv_path: Original path string for error messages
+            chunk_size: Number of rows to process at once. If None, uses configured chunk_size
+            
+        Returns:
+            List of dictionaries representing CSV rows
+            
+        Raises:
+            FileProcessingError: If parsing fails
+            UnicodeDecodeError: If encoding is invalid
+        """
+        rows: List[Dict[str, Any]] = []
+        for chunk in self._iter_csv_content_chunks(csv_path_obj, csv_path, chunk_size):
+            rows.extend(chunk)
+        return rows
+
     def parse_csv(self, csv_path: str, chunk_size: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Parse CSV file and return list of row dictionaries.
 
-        This method handles various CSV formats, encoding issues, and provides
-        memory-efficient processing for large files through chunked reading.
+        This method handles various CSV formats and encoding issues. All rows are
+        materialized in memory; use ``iter_csv_chunks`` to stream large files.
 
         Args:
             csv_path: Path to CSV file (absolute or relative)
@@ -447,15 +517,44 @@ class BatchEngine:
         # Read and parse CSV content
         return self._read_and_parse_csv_content(csv_path_obj, csv_path, chunk_size)
 
-    def create_batch_jobs(self, csv_path: str) -> BatchManifest:
+    def iter_csv_chunks(self, csv_path: str, chunk_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a CSV file as chunks of row dictionaries.
+
+        Performs the same security, size and format checks as ``parse_csv`` but
+        never holds more than ``chunk_size`` rows in memory.
+
+        Args:
+            csv_path: Path to CSV file (absolute or relative)
+            chunk_size: Rows per chunk. If None, uses the configured chunk_size value.
+
+        Yields:
+            Lists of dictionaries representing CSV rows
+
+        Example:
+            ```python
+            for chunk in engine.iter_csv_chunks('huge.csv', chunk_size=500):
+                process(chunk)
+            ```
+        """
+        csv_path_obj = Path(csv_path).resolve()
+        self._check_security_for_path(csv_path_obj, csv_path)
+        self._validate_csv_file_exists_and_size(csv_path_obj, csv_path)
+        yield from self._iter_csv_content_chunks(csv_path_obj, csv_path, chunk_size)
+
+    def create_batch_jobs(self, csv_path: str, retain_jobs: bool = True) -> BatchManifest:
         """
         Create batch jobs from CSV file.
 
-        Parses the CSV file and creates individual job files for each row.
-        Generates a unique batch ID and creates a manifest file tracking all jobs.
+        Streams the CSV file and creates individual job files for each row.
+        Job files and manifest entries are written as rows are read, so
+        ingestion memory does not grow with the size of the CSV.
 
         Args:
             csv_path: Path to CSV file to process
+            retain_jobs: Keep created jobs on the returned manifest (default: True).
+                         Pass False for very large files to keep memory flat; the
+                         persisted manifest still contains every job.
 
         Returns:
             BatchManifest containing all generated jobs and batch metadata
@@ -474,10 +573,10 @@ class BatchEngine:
         batch_id = str(uuid.uuid4())
         run_id = self.run_context.run_id_base
 
-        # Parse CSV
-        rows = self.parse_csv(csv_path)
-
-        if not rows:
+        # Validate the CSV before touching the artifacts directory
+        chunks = self.iter_csv_chunks(csv_path)
+        first_chunk = next(chunks, None)
+        if not first_chunk:
             raise FileProcessingError(f"No valid rows found in CSV file: '{csv_path}'. "
                                     f"The file may be empty or contain only invalid data.")
 
@@ -485,41 +584,47 @@ class BatchEngine:
         jobs_dir = self.run_context.artifact_dir("jobs")
         jobs_dir.mkdir(exist_ok=True)
 
-        # Create individual job files
-        jobs = []
-        for i, row_data in enumerate(rows):
-            job_id = f"{run_id}_{i+1:04d}"
-            job = BatchJob(
-                job_id=job_id,
-                run_id=run_id,
-                row_data=row_data,
-                batch_id=batch_id,  # Set batch_id for metrics tracking
-                row_index=i  # Set row index for robust field extraction
-            )
-
-            # Save individual job file
-            job_file = jobs_dir / f"{job_id}.json"
-            with open(job_file, 'w', encoding='utf-8') as f:
-                json.dump(job.to_dict(), f, indent=2, ensure_ascii=False)
-
-            jobs.append(job)
-            self.logger.info(f"Created job {job_id} for row {i+1}")
-
-        # Create batch manifest
+        manifest_file = self.run_context.artifact_dir("batch") / BATCH_MANIFEST_FILENAME
         manifest = BatchManifest(
             batch_id=batch_id,
             run_id=run_id,
             csv_path=csv_path,
-            total_jobs=len(jobs),
-            jobs=jobs
+            total_jobs=0
         )
 
-        # Save manifest
-        manifest_file = self.run_context.artifact_dir("batch") / BATCH_MANIFEST_FILENAME
-        with open(manifest_file, 'w', encoding='utf-8') as f:
-            json.dump(manifest.to_dict(), f, indent=2, ensure_ascii=False)
+        # Create individual job files, streaming each entry into the manifest
+        index = self._get_manifest_index()
+        index.register_batch(batch_id, manifest_file)
+        with StreamingManifestWriter(manifest_file, manifest) as writer:
+            for chunk in itertools.chain([first_chunk], chunks):
+                chunk_job_ids = []
+                for row_data in chunk:
+                    i = writer.job_count
+                    job_id = f"{run_id}_{i+1:04d}"
+                    job = BatchJob(
+                        job_id=job_id,
+                        run_id=run_id,
+                        row_data=row_data,
+                        batch_id=batch_id,  # Set batch_id for metrics tracking
+                        row_index=i  # Set row index for robust field extraction
+                    )
+
+                    # Save individual job file
+                    job_file = jobs_dir / f"{job_id}.json"
+                    with open(job_file, 'w', encoding='utf-8') as f:
+                        json.dump(job.to_dict(), f, indent=2, ensure_ascii=False)
+
+                    writer.add_job(job)
+                    chunk_job_ids.append(job_id)
+                    if retain_jobs:
+                        manifest.jobs.append(job)
+                    self.logger.info(f"Created job {job_id} for row {i+1}")
+
+                index.register_jobs(batch_id, manifest_file, chunk_job_ids)
 
-        self.logger.info(f"Created batch with {len(jobs)} jobs (batch_id: {batch_id})")
+        manifest.total_jobs = writer.job_count
+
+        self.logger.info(f"Created batch with {manifest.total_jobs} jobs (batch_id: {batch_id})")
 
         # Record batch creation metrics
         self._record_batch_creation_metrics(manifest)
@@ -612,12 +717,10 @@ class BatchEngine:
             return None
 
         try:
-            with open(manifest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                manifest = BatchManifest.from_dict(data)
-
-                if manifest.batch_id == batch_id:
-                    return manifest
+            manifest = self._read_manifest_file(manifest_file, replay_journal=False)
+            if manifest.batch_id == batch_id:
+                ManifestJournal(manifest_file).replay(manifest)
+                return manifest
         except Exception as e:
             self.logger.error(f"Failed to load batch manifest: {e}")
 
@@ -625,6 +728,10 @@ class BatchEngine:
 
     def _search_batch_manifest_in_artifacts(self, batch_id: str) -> Optional[BatchManifest]:
         """Search for batch manifest in artifacts/runs directory."""
+        manifest_file = self._lookup_indexed_batch_manifest(batch_id)
+        if manifest_file is not None:
+            return self._load_manifest(manifest_file)
+
         artifacts_root = get_artifacts_base_dir() / "runs"
 
         if not artifacts_root.exists():
@@ -638,12 +745,9 @@ class BatchEngine:
                 continue
 
             try:
-                with open(manifest_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    manifest = BatchManifest.from_dict(data)
-
-                    if manifest.batch_id == batch_id:
-                        candidates.append((manifest_file, manifest))
+                manifest = self._read_manifest_file(manifest_file, replay_journal=False)
+                if manifest.batch_id == batch_id:
+                    candidates.append((manifest_file, manifest))
 
             except Exception as e:
                 self.logger.error(f"Failed to load batch manifest {manifest_file}: {e}")
@@ -651,7 +755,10 @@ class BatchEngine:
         if candidates:
             # Return the manifest with the most recent mtime
             candidates.sort(key=lambda x: x[0].stat().st_mtime, reverse=True)
-            return candidates[0][1]
+            manifest_file, manifest = candidates[0]
+            self._reindex_manifest(manifest_file, manifest)
+            ManifestJournal(manifest_file).replay(manifest)
+            return manifest
 
         return None
 
@@ -695,11 +802,14 @@ class BatchEngine:
                 return
 
             self._update_single_job_status(job, status, error_message, manifest)
-            self._save_manifest(manifest_file, manifest)
 
-            # Generate summary if batch is complete
+            # Generate summary and compact the manifest if batch is complete;
+            # otherwise only append the change to the job-state journal
             if self._is_batch_complete(manifest):
+                self._save_manifest(manifest_file, manifest)
                 self._generate_batch_summary(manifest)
+            else:
+                ManifestJournal(manifest_file).record_status(job, manifest)
 
             # Record metrics for job completion
             self._record_job_metrics(job, status, error_message)
@@ -800,7 +910,7 @@ class BatchEngine:
             job.artifacts = []
         job.artifacts.append(artifact_entry)
 
-        # Persist entire manifest update
+        # Persist entire manifest update (also folds any journaled job state)
         try:
             self._save_manifest(manifest_file, manifest)
         except Exception as e:  # noqa: BLE001
@@ -881,10 +991,8 @@ class BatchEngine:
     def _load_and_check_manifest(self, manifest_file: Path, job_id: str) -> bool:
         """Load manifest and check if it contains the specified job."""
         try:
-            with open(manifest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                manifest = BatchManifest.from_dict(data)
-                return any(job.job_id == job_id for job in manifest.jobs)
+            manifest = self._read_manifest_file(manifest_file, replay_journal=False)
+            return any(job.job_id == job_id for job in manifest.jobs or [])
         except Exception as e:
             self.logger.error(f"Failed to load batch manifest {manifest_file}: {e}")
             return False
@@ -896,6 +1004,15 @@ class BatchEngine:
         if manifest_file.exists() and self._load_and_check_manifest(manifest_file, job_id):
             return manifest_file
 
+        # Consult the persistent index, dropping the entry if it went stale
+        index = self._get_manifest_index()
+        indexed_file = index.lookup_job(job_id)
+        if indexed_file is not None:
+            if indexed_file.exists() and self._load_and_check_manifest(indexed_file, job_id):
+                return indexed_file
+            self.logger.debug(f"Dropping stale manifest index entry for job {job_id}")
+            index.forget_job(job_id)
+
         # Search through all batch manifest files in artifacts/runs
         artifacts_root = get_artifacts_base_dir() / "runs"
 
@@ -905,11 +1022,49 @@ class BatchEngine:
         # Look for batch manifest files in all run directories
         for batch_dir in artifacts_root.glob("*-batch"):
             manifest_file = batch_dir / BATCH_MANIFEST_FILENAME
-            if manifest_file.exists() and self._load_and_check_manifest(manifest_file, job_id):
+            if not manifest_file.exists():
+                continue
+            try:
+                manifest = self._read_manifest_file(manifest_file, replay_journal=False)
+            except Exception as e:
+                self.logger.error(f"Failed to load batch manifest {manifest_file}: {e}")
+                continue
+            if any(job.job_id == job_id for job in manifest.jobs):
+                self._reindex_manifest(manifest_file, manifest)
                 return manifest_file
 
         return None
 
+    # ==================== Manifest Index Methods ====================
+    # These methods keep the persistent job/batch -> manifest path index in sync
+
+    def _get_manifest_index(self) -> BatchManifestIndex:
+        """Return the persistent manifest index, creating it on first use."""
+        if self._manifest_index is None:
+            self._manifest_index = BatchManifestIndex()
+        return self._manifest_index
+
+    def _reindex_manifest(self, manifest_file: Path, manifest: BatchManifest) -> None:
+        """Repair the index for a manifest found by scanning."""
+        index = self._get_manifest_index()
+        index.register_batch(manifest.batch_id, manifest_file)
+        index.register_jobs(manifest.batch_id, manifest_file, (job.job_id for job in manifest.jobs))
+
+    def _lookup_indexed_batch_manifest(self, batch_id: str) -> Optional[Path]:
+        """Return the indexed manifest path for a batch after verifying it."""
+        index = self._get_manifest_index()
+        manifest_file = index.lookup_batch(batch_id)
+        if manifest_file is None:
+            return None
+        try:
+            if manifest_file.exists() and self._read_manifest_file(manifest_file, replay_journal=False).batch_id == batch_id:
+                return manifest_file
+        except Exception as e:
+            self.logger.debug(f"Indexed manifest {manifest_file} unreadable: {e}")
+        self.logger.debug(f"Dropping stale manifest index entry for batch {batch_id}")
+        index.forget_batch(batch_id)
+        return None
+
     def _update_single_job_status(self, job: BatchJob, status: str, error_message: Optional[str], manifest: BatchManifest):
         """Update a single job's status and related counters."""
         job.status = status
@@ -924,27 +1079,39 @@ class BatchEngine:
             elif status == 'failed':
                 manifest.failed_jobs += 1
 
+    def _read_manifest_file(self, manifest_file: Path, replay_journal: bool = True) -> BatchManifest:
+        """Read a manifest file, optionally replaying its job-state journal."""
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = BatchManifest.from_dict(json.load(f))
+        if replay_journal:
+            ManifestJournal(manifest_file).replay(manifest)
+        return manifest
+
     def _load_manifest(self, manifest_file: Path) -> Optional[BatchManifest]:
-        """Load batch manifest from file."""
+        """Load batch manifest from file, replaying any journaled job state changes."""
         try:
-            with open(manifest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return BatchManifest.from_dict(data)
+            return self._read_manifest_file(manifest_file)
         except Exception as e:
             self.logger.error(f"Failed to load batch manifest: {e}")
             return None
 
     def _save_manifest(self, manifest_file: Path, manifest: BatchManifest):
-        """Save batch manifest to file."""
+        """Save (compact) batch manifest to file and truncate its journal."""
         try:
-            manifest_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(manifest_file, 'w', encoding='utf-8') as f:
-                json.dump(manifest.to_dict(), f, indent=2, ensure_ascii=False)
+            ManifestJournal(manifest_file).compact(manifest)
             self.logger.debug(f"Saved batch manifest to {manifest_file}")
         except Exception as e:
             self.logger.error(f"Failed to save batch manifest: {e}")
             raise
 
+    def _checkpoint_manifest(self, manifest_file: Path) -> None:
+        """Fold the job-state journal into the manifest on disk."""
+        journal = ManifestJournal(manifest_file)
+        if not journal.exists():
+            return
+        manifest = self._read_manifest_file(manifest_file)
+        self._save_manifest(manifest_file, manifest)
+
     def _find_job_by_id(self, manifest: BatchManifest, job_id: str) -> Optional[BatchJob]:
         """Find job by ID in manifest."""
         for job in manifest.jobs:
@@ -1204,14 +1371,16 @@ class BatchEngine:
         manifest_file = self.run_context.artifact_dir("batch") / BATCH_MANIFEST_FILENAME
         if manifest_file.exists():
             try:
-                with open(manifest_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    manifest = BatchManifest.from_dict(data)
-                    if manifest.batch_id == batch_id:
-                        return manifest_file
+                manifest = self._read_manifest_file(manifest_file, replay_journal=False)
+                if manifest.batch_id == batch_id:
+                    return manifest_file
             except Exception:
                 pass
 
+        indexed_file = self._lookup_indexed_batch_manifest(batch_id)
+        if indexed_file is not None:
+            return indexed_file
+
         # Search in artifacts/runs
         artifacts_root = get_artifacts_base_dir() / "runs"
         if not artifacts_root.exists():
@@ -1221,11 +1390,10 @@ class BatchEngine:
             manifest_file = batch_dir / BATCH_MANIFEST_FILENAME
             if manifest_file.exists():
                 try:
-                    with open(manifest_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        manifest = BatchManifest.from_dict(data)
-                        if manifest.batch_id == batch_id:
-                            return manifest_file
+                    manifest = self._read_manifest_file(manifest_file, replay_journal=False)
+                    if manifest.batch_id == batch_id:
+                        self._reindex_manifest(manifest_file, manifest)
+                        return manifest_file
                 except Exception:
                     continue
 
@@ -1387,8 +1555,9 @@ class BatchEngine:
         Execute all pending jobs in a batch.
 
         This method finds all pending jobs in the specified batch and executes them
-        using the browser automation system. Jobs are executed sequentially to avoid
-        resource conflicts.
+        using the browser automation system. Jobs are executed sequentially by
+        default to avoid resource conflicts; set the ``max_parallel_jobs`` config
+        value to run up to that many jobs concurrently as asyncio tasks.
 
         Args:
             batch_id: Batch identifier to execute
@@ -1436,78 +1605,80 @@ class BatchEngine:
 
             self.logger.info(f"Starting execution of {len(pending_jobs)} pending jobs in batch {batch_id}")
 
-            # Execute jobs sequentially
-            executed = 0
-            completed = 0
-            failed = 0
+            # Execute jobs through a bounded worker pool. With the default
+            # max_parallel_jobs=1 this degenerates to sequential execution.
+            max_parallel_jobs = self.config['max_parallel_jobs']
+            manifest_file = self._find_manifest_file_for_batch(batch_id)
+            semaphore = asyncio.Semaphore(max_parallel_jobs)
+            manifest_lock = asyncio.Lock()
+            counts = {'executed': 0, 'completed': 0, 'failed': 0}
             job_results = []
 
-            for job in pending_jobs:
-                try:
-                    # Update job status to running
-                    job.status = 'running'
-                    self._save_manifest(self._find_manifest_file_for_batch(batch_id), manifest)
-
-                    # Execute job with retry
-                    status = await self.execute_job_with_retry(
-                        job, max_retries, retry_delay, backoff_factor, max_retry_delay
-                    )
-
-                    # Update job status
-                    job.status = status
-                    if status == 'completed':
-                        completed += 1
-                        manifest.completed_jobs += 1
-                    elif status == 'failed':
-                        failed += 1
-                        manifest.failed_jobs += 1
-
-                    executed += 1
+            # Job status changes are appended to the manifest's job-state journal;
+            # the full manifest is only rewritten every checkpoint_interval records
+            # and once at the end of the batch.
+            journal = ManifestJournal(manifest_file)
+            checkpoint_interval = self.config['manifest_checkpoint_interval']
+            journal_state = {'records': 0}
+
+            def _journal_status(job: BatchJob) -> None:
+                journal.record_status(job, manifest)
+                journal_state['records'] += 1
+                if journal_state['records'] % checkpoint_interval == 0:
+                    self._checkpoint_manifest(manifest_file)
+
+            # One scheduler is shared by all jobs so its delayed-retry queue
+            # reflects every job currently waiting out a backoff.
+            scheduler = RetryScheduler(
+                max_retries, retry_delay, backoff_factor, max_retry_delay, logger_=self.logger
+            )
 
-                    job_results.append({
-                        'job_id': job.job_id,
-                        'status': status,
-                        'error_message': job.error_message
-                    })
+            async def _run_job(job: BatchJob) -> None:
+                async def _mark_running(attempt: int) -> None:
+                    if attempt == 1:
+                        # Update job status to running
+                        async with manifest_lock:
+                            job.status = 'running'
+                            _journal_status(job)
 
+                try:
+                    # The semaphore is only held while an attempt executes; jobs
+                    # waiting out a retry backoff release it for other jobs.
+                    status = await self._run_job_with_scheduler(
+                        job, scheduler, slot=semaphore, before_attempt=_mark_running
+                    )
+                    error_message = job.error_message
                     self.logger.info(f"Job {job.job_id} finished with status: {status}")
 
                 except Exception as e:
                     # Mark job as failed
-                    job.status = 'failed'
-                    job.error_message = str(e)
-                    failed += 1
-                    manifest.failed_jobs += 1
-                    executed += 1
+                    status = 'failed'
+                    error_message = str(e)
+                    job.error_message = error_message
+                    self.logger.error(f"Job {job.job_id} failed: {e}")
 
+                # Counters, manifest persistence and progress reporting are
+                # serialized so callbacks observe jobs in completion order.
+                async with manifest_lock:
+                    self._record_job_outcome(manifest, job, status, counts)
                     job_results.append({
                         'job_id': job.job_id,
-                        'status': 'failed',
-                        'error_message': str(e)
+                        'status': status,
+                        'error_message': error_message
                     })
+                    _journal_status(job)
+                    self._report_job_progress(manifest, progress_callback)
 
-                    self.logger.error(f"Job {job.job_id} failed: {e}")
+            if max_parallel_jobs > 1:
+                self.logger.info(f"Running up to {max_parallel_jobs} jobs concurrently for batch {batch_id}")
+            await asyncio.gather(*(_run_job(job) for job in pending_jobs))
 
-                # Save manifest after each job
-                manifest_file_for_save = self._find_manifest_file_for_batch(batch_id)
-                self._save_manifest(manifest_file_for_save, manifest)
-
-                # Call progress callback if provided
-                if progress_callback:
-                    try:
-                        progress_callback(manifest.completed_jobs, manifest.total_jobs)
-                    except Exception as e:
-                        # Best-effort; never fail job execution because of callback
-                        self.logger.debug(f"Progress callback failed: {e}")
-
-                # Emit a concise progress message after each job so CLI/UI can reflect
-                # incremental progress (e.g., "Jobs: 1/4 completed"). This addresses
-                # the issue where status stayed at 0/4 until the end of execution.
-                try:
-                    self.logger.info(f"Jobs: {manifest.completed_jobs}/{manifest.total_jobs} completed")
-                except Exception:
-                    # Best-effort; never fail job execution because of logging
-                    self.logger.debug("Failed to emit progress message")
+            # Compact the journal into the manifest at batch end
+            self._checkpoint_manifest(manifest_file)
+
+            executed = counts['executed']
+            completed = counts['completed']
+            failed = counts['failed']
 
             # Generate batch summary if complete
             if self._is_batch_complete(manifest):
@@ -1538,6 +1709,38 @@ class BatchEngine:
             self.logger.error(error_msg)
             raise ValueError(error_msg) from e
 
+    def _record_job_outcome(self, manifest: BatchManifest, job: BatchJob, status: str,
+                            counts: Dict[str, int]) -> None:
+        """Apply a finished job's status to the manifest and execution counters."""
+        job.status = status
+        if status == 'completed':
+            counts['completed'] += 1
+            manifest.completed_jobs += 1
+        elif status == 'failed':
+            counts['failed'] += 1
+            manifest.failed_jobs += 1
+        counts['executed'] += 1
+
+    def _report_job_progress(self, manifest: BatchManifest,
+                             progress_callback: Optional[Callable[[int, int], None]]) -> None:
+        """Notify the progress callback and emit a progress log line."""
+        # Call progress callback if provided
+        if progress_callback:
+            try:
+                progress_callback(manifest.completed_jobs, manifest.total_jobs)
+            except Exception as e:
+                # Best-effort; never fail job execution because of callback
+                self.logger.debug(f"Progress callback failed: {e}")
+
+        # Emit a concise progress message after each job so CLI/UI can reflect
+        # incremental progress (e.g., "Jobs: 1/4 completed"). This addresses
+        # the issue where status stayed at 0/4 until the end of execution.
+        try:
+            self.logger.info(f"Jobs: {manifest.completed_jobs}/{manifest.total_jobs} completed")
+        except Exception:
+            # Best-effort; never fail job execution because of logging
+            self.logger.debug("Failed to emit progress message")
+
     async def execute_job_with_retry(self, job: BatchJob, max_retries: int = DEFAULT_MAX_RETRIES,
                               retry_delay: float = DEFAULT_RETRY_DELAY,
                               backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
@@ -1545,6 +1748,10 @@ class BatchEngine:
         """
         Execute a job with automatic retry on failure.
 
+        Backoff waits use ``asyncio.sleep`` with full-jitter exponential delays
+        (a random delay between 0 and the capped exponential ceiling), so the
+        event loop keeps serving other jobs while this one waits.
+
         Args:
             job: Job to execute (must be valid BatchJob instance)
             max_retries: Maximum number of retry attempts (must be >= 0, default: DEFAULT_MAX_RETRIES)
@@ -1567,41 +1774,54 @@ class BatchEngine:
             max_retries, retry_delay, backoff_factor, max_retry_delay
         )
 
-        last_error: Optional[str] = None
-        last_exception: Optional[Exception] = None
-        current_delay = retry_delay
+        scheduler = RetryScheduler(
+            max_retries, retry_delay, backoff_factor, max_retry_delay, logger_=self.logger
+        )
+        return await self._run_job_with_scheduler(job, scheduler)
 
-        for attempt in range(max_retries + 1):  # +1 for initial attempt
-            try:
-                self.logger.info(f"Executing job {job.job_id} (attempt {attempt + 1}/{max_retries + 1})")
+    async def _run_job_with_scheduler(self, job: BatchJob, scheduler: RetryScheduler,
+                                      slot: Optional[asyncio.Semaphore] = None,
+                                      before_attempt: Optional[Callable[[int], Awaitable[None]]] = None) -> str:
+        """
+        Run a job through the retry scheduler and record per-attempt metrics.
+
+        Args:
+            job: Job to execute
+            scheduler: Retry scheduler holding the backoff policy
+            slot: Optional concurrency semaphore held only while an attempt runs
+            before_attempt: Optional coroutine called with the attempt number
+                            once the slot has been acquired
 
-                # Execute the job using the actual implementation
-                status = await self._execute_single_job(job)
+        Returns:
+            'completed' when an attempt succeeds
 
-                if status == 'completed':
-                    self.logger.info(f"Job {job.job_id} completed successfully on attempt {attempt + 1}")
-                    return 'completed'
-                else:
-                    error_msg = f"Job execution returned unexpected status: {status}"
-                    self.logger.warning(f"Job {job.job_id} returned status '{status}' on attempt {attempt + 1}")
-                    raise ValueError(error_msg)
+        Raises:
+            The last attempt's exception when every attempt failed
+        """
+        total_attempts = scheduler.max_retries + 1
+
+        async def _attempt(attempt: int) -> str:
+            if before_attempt is not None:
+                await before_attempt(attempt)
+            self.logger.info(f"Executing job {job.job_id} (attempt {attempt}/{total_attempts})")
+
+            # Execute the job using the actual implementation
+            status = await self._execute_single_job(job)
+            if status != 'completed':
+                self.logger.warning(f"Job {job.job_id} returned status '{status}' on attempt {attempt}")
+                raise ValueError(f"Job execution returned unexpected status: {status}")
+            return status
 
-            except Exception as e:
-                last_error = str(e)
-                last_exception = e
-                self.logger.warning(f"Job {job.job_id} failed on attempt {attempt + 1}: {type(e).__name__}")
-
-                # Don't retry on the last attempt
-                if attempt < max_retries:
-                    self.logger.info(f"Retrying job {job.job_id} in {current_delay:.1f}s...")
-                    time.sleep(current_delay)
-                    # Exponential backoff with configurable parameters
-                    current_delay = min(current_delay * backoff_factor, max_retry_delay)
-                else:
-                    self.logger.error(f"Job {job.job_id} failed after {max_retries + 1} attempts")
+        outcome = await scheduler.run(job.job_id, _attempt, slot=slot)
+        self._record_attempt_metrics(job, outcome)
+
+        if outcome.status == 'completed':
+            self.logger.info(f"Job {job.job_id} completed successfully on attempt {len(outcome.attempts)}")
+            return 'completed'
 
         # All attempts failed
-        error_summary = f"Failed after {max_retries + 1} attempts"
+        last_exception = outcome.error
+        error_summary = f"Failed after {total_attempts} attempts"
         job.error_message = f"{error_summary}. Last error: {type(last_exception).__name__ if last_exception else 'Unknown'}"
         self.logger.error(f"Job {job.job_id} permanently failed: {error_summary}")
 
@@ -1611,6 +1831,41 @@ class BatchEngine:
         else:
             raise RuntimeError(f"Job {job.job_id}: {error_summary}")
 
+    def _record_attempt_metrics(self, job: BatchJob, outcome: RetryOutcome) -> None:
+        """Record per-attempt timing metrics for a job."""
+        try:
+            from ..metrics import get_metrics_collector, MetricType
+
+            collector = get_metrics_collector()
+            if collector is None:
+                return
+
+            for attempt in outcome.attempts:
+                collector.record_metric(
+                    name="job_attempt_duration_seconds",
+                    value=attempt.duration_seconds,
+                    metric_type=MetricType.HISTOGRAM,
+                    tags={
+                        "batch_id": job.batch_id or "unknown",
+                        "outcome": attempt.outcome,
+                        "attempt": str(attempt.attempt)
+                    }
+                )
+
+            if outcome.total_backoff_seconds > 0:
+                collector.record_metric(
+                    name="job_retry_backoff_seconds",
+                    value=outcome.total_backoff_seconds,
+                    metric_type=MetricType.HISTOGRAM,
+                    tags={
+                        "batch_id": job.batch_id or "unknown",
+                        "status": outcome.status
+                    }
+                )
+
+        except Exception as e:
+            self.logger.debug(f"Failed to record attempt metrics: {e}")
+
     async def _execute_single_job(self, job: BatchJob) -> str:
         """
         Execute a single job.
@@ -2014,11 +2269,15 @@ async def start_batch(csv_path: str, run_context: Optional[RunContext] = None, c
             - validate_headers (bool): Validate CSV headers (default: True)
             - skip_empty_rows (bool): Skip empty rows during processing (default: True)
             - log_level (str): Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+            - max_parallel_jobs (int): Number of jobs executed concurrently (default: 1)
         execute_immediately: Whether to execute jobs immediately after creation (default: True)
         progress_callback: Optional callback function called after each job completion with (completed_jobs, total_jobs)
 
     Returns:
-        BatchManifest for the created batch
+        BatchManifest for the created batch. Jobs are streamed to the job files
+        and the persisted manifest, so without execution ``jobs`` is empty and
+        ``total_jobs`` carries the count; after execution the manifest is
+        reloaded from disk.
 
     Raises:
         ValueError: If CSV parsing fails or configuration is invalid
@@ -2047,7 +2306,8 @@ async def start_batch(csv_path: str, run_context: Optional[RunContext] = None, c
         run_context = RunContext.get()
 
     engine = BatchEngine(run_context, config)
-    manifest = engine.create_batch_jobs(csv_path)
+    # Jobs go straight to the job files and manifest; keep ingestion memory flat
+    manifest = engine.create_batch_jobs(csv_path, retain_jobs=False)
 
     # Execute jobs immediately if requested
     if execute_immediately:
@@ -0,0 +1,137 @@
+"""
+Persistent job/batch -> manifest path index.
+
+Looking up the manifest that owns a job used to mean globbing every
+``artifacts/runs/*-batch`` directory and parsing each manifest. This module
+keeps a small SQLite index (``artifacts/runs/batch_index.sqlite3``) mapping
+job and batch ids to manifest paths. The index is an optimization only:
+every error is logged and reported as a miss so callers fall back to a scan.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.utils.fs_paths import get_artifacts_base_dir
+
+logger = logging.getLogger(__name__)
+
+BATCH_INDEX_FILENAME = "batch_index.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id TEXT PRIMARY KEY,
+    manifest_path TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL,
+    manifest_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_manifest_path ON jobs(manifest_path);
+CREATE INDEX IF NOT EXISTS idx_jobs_batch_id ON jobs(batch_id);
+"""
+
+
+class BatchManifestIndex:
+    """
+    SQLite-backed lookup of manifest paths by job id and batch id.
+
+    Example:
+        ```python
+        index = BatchManifestIndex()
+        index.register_batch(batch_id, manifest_file)
+        index.register_jobs(batch_id, manifest_file, job_ids)
+        path = index.lookup_job(job_id)  # Path or None
+        ```
+    """
+
+    def __init__(self, index_path: Optional[Path] = None):
+        self.index_path = Path(index_path) if index_path else get_artifacts_base_dir() / "runs" / BATCH_INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.index_path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def register_batch(self, batch_id: str, manifest_file: Path) -> None:
+        """Map a batch to its manifest, dropping job entries of batches it replaced."""
+        path = str(Path(manifest_file).resolve())
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM jobs WHERE manifest_path = ? AND batch_id != ?", (path, batch_id))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO batches(batch_id, manifest_path, updated_at) VALUES (?, ?, ?)",
+                        (batch_id, path, time.time()),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Batch index update failed for batch {batch_id}: {e}")
+
+    def register_jobs(self, batch_id: str, manifest_file: Path, job_ids: Iterable[str]) -> None:
+        """Map job ids to the manifest that contains them."""
+        path = str(Path(manifest_file).resolve())
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO jobs(job_id, batch_id, manifest_path) VALUES (?, ?, ?)",
+                        ((job_id, batch_id, path) for job_id in job_ids),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Batch index update failed for jobs of batch {batch_id}: {e}")
+
+    def _lookup(self, sql: str, key: str) -> Optional[Path]:
+        try:
+            with self._lock:
+                row = self._connect().execute(sql, (key,)).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Batch index lookup failed for {key}: {e}")
+            return None
+        return Path(row[0]) if row else None
+
+    def lookup_job(self, job_id: str) -> Optional[Path]:
+        """Return the indexed manifest path for a job, if any."""
+        return self._lookup("SELECT manifest_path FROM jobs WHERE job_id = ?", job_id)
+
+    def lookup_batch(self, batch_id: str) -> Optional[Path]:
+        """Return the indexed manifest path for a batch, if any."""
+        return self._lookup("SELECT manifest_path FROM batches WHERE batch_id = ?", batch_id)
+
+    def forget_job(self, job_id: str) -> None:
+        """Remove a stale job entry."""
+        self._delete("DELETE FROM jobs WHERE job_id = ?", job_id)
+
+    def forget_batch(self, batch_id: str) -> None:
+        """Remove a stale batch entry together with its jobs."""
+        self._delete("DELETE FROM jobs WHERE batch_id = ?", batch_id)
+        self._delete("DELETE FROM batches WHERE batch_id = ?", batch_id)
+
+    def _delete(self, sql: str, key: str) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(sql, (key,))
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Batch index repair failed for {key}: {e}")
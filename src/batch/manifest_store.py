@@ -0,0 +1,191 @@
+"""
+Batch manifest persistence helpers.
+
+This module provides incremental writers for ``batch_manifest.json`` so large
+batches can be persisted without holding every job in memory, and an
+append-only job-state journal so per-job status changes do not rewrite the
+whole manifest.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+from .models import BatchJob, BatchManifest, BATCH_JOURNAL_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingManifestWriter:
+    """
+    Write a batch manifest one job at a time.
+
+    Jobs are appended to a temporary file as they are created and the file is
+    atomically renamed over the target on successful close. ``total_jobs`` is
+    written last, once the final count is known. The resulting file is plain
+    JSON and loads with ``BatchManifest.from_dict``.
+
+    Example:
+        ```python
+        header = BatchManifest(batch_id, run_id, csv_path, total_jobs=0)
+        with StreamingManifestWriter(manifest_file, header) as writer:
+            for job in jobs:
+                writer.add_job(job)
+        ```
+    """
+
+    def __init__(self, manifest_file: Path, header: BatchManifest):
+        self.manifest_file = Path(manifest_file)
+        self.header = header
+        self.job_count = 0
+        self._tmp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        self._fh: Optional[TextIO] = None
+
+    def __enter__(self) -> "StreamingManifestWriter":
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(self._tmp_file, 'w', encoding='utf-8')
+        self._fh = fh
+        header = self.header.to_dict()
+        header.pop('jobs', None)
+        header.pop('total_jobs', None)
+        fh.write("{\n")
+        for key, value in header.items():
+            fh.write(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+        fh.write('  "jobs": [')
+        return self
+
+    def add_job(self, job: BatchJob) -> None:
+        """Append a single job entry to the manifest."""
+        if self._fh is None:
+            raise RuntimeError("StreamingManifestWriter is not open")
+        entry = json.dumps(job.to_dict(), indent=2, ensure_ascii=False).replace("\n", "\n    ")
+        self._fh.write(("," if self.job_count else "") + "\n    " + entry)
+        self.job_count += 1
+
+    def __exit__(self, exc_type, exc, tb) -> Optional[bool]:
+        fh, self._fh = self._fh, None
+        if fh is None:
+            return None
+        if exc_type is not None:
+            fh.close()
+            try:
+                self._tmp_file.unlink()
+            except OSError:
+                pass
+            return None
+        try:
+            fh.write(("\n  " if self.job_count else "") + "],\n")
+            fh.write(f'  "total_jobs": {self.job_count}\n}}\n')
+        finally:
+            fh.close()
+        os.replace(self._tmp_file, self.manifest_file)
+        logger.debug(f"Streamed {self.job_count} jobs to {self.manifest_file}")
+        return None
+
+
+def write_manifest_atomic(manifest_file: Path, manifest: BatchManifest) -> None:
+    """Write a full manifest via a temporary file and atomic rename."""
+    manifest_file = Path(manifest_file)
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest.to_dict(), f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, manifest_file)
+
+
+class ManifestJournal:
+    """
+    Append-only JSONL journal of job state changes for a batch manifest.
+
+    Each line records one job status change with absolute values (including
+    the manifest counters), so replaying a record more than once is harmless. The journal
+    lives next to the manifest (``batch_manifest.journal.jsonl``) and is
+    truncated whenever the manifest is compacted.
+
+    Example:
+        ```python
+        journal = ManifestJournal(manifest_file)
+        journal.record_status(job, manifest)
+        ...
+        manifest = BatchManifest.from_dict(data)
+        journal.replay(manifest)
+        ```
+    """
+
+    def __init__(self, manifest_file: Path):
+        self.manifest_file = Path(manifest_file)
+        self.path = self.manifest_file.with_name(self.manifest_file.stem + BATCH_JOURNAL_SUFFIX)
+
+    def exists(self) -> bool:
+        """Return True if the journal has pending records."""
+        try:
+            return self.path.stat().st_size > 0
+        except OSError:
+            return False
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a single record as one JSON line."""
+        record.setdefault("ts", datetime.now(timezone.utc).isoformat())
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+    def record_status(self, job: BatchJob, manifest: BatchManifest) -> None:
+        """Record a job status change together with the manifest counters."""
+        self.append({
+            "op": "status",
+            "job_id": job.job_id,
+            "status": job.status,
+            "error_message": job.error_message,
+            "completed_at": job.completed_at,
+            "completed_jobs": manifest.completed_jobs,
+            "failed_jobs": manifest.failed_jobs,
+        })
+
+    def read_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield journal records, skipping malformed (e.g. torn) lines."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed journal line {line_no} in {self.path}")
+
+    def replay(self, manifest: BatchManifest) -> int:
+        """Apply journal records to ``manifest`` in place; returns records applied."""
+        jobs_by_id = {job.job_id: job for job in manifest.jobs or []}
+        applied = 0
+        for record in self.read_records():
+            job = jobs_by_id.get(record.get("job_id", ""))
+            if job is None:
+                continue
+            if record.get("op") != "status":
+                continue
+            job.status = record.get("status", job.status)
+            job.error_message = record.get("error_message")
+            job.completed_at = record.get("completed_at")
+            manifest.completed_jobs = record.get("completed_jobs", manifest.completed_jobs)
+            manifest.failed_jobs = record.get("failed_jobs", manifest.failed_jobs)
+            applied += 1
+        return applied
+
+    def clear(self) -> None:
+        """Drop all journal records (after the manifest has been compacted)."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def compact(self, manifest: BatchManifest) -> None:
+        """Persist ``manifest`` atomically and truncate the journal."""
+        write_manifest_atomic(self.manifest_file, manifest)
+        self.clear()
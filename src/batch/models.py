@@ -13,6 +13,7 @@ from typing import Dict, List, Optional, Any
 # Constants
 BATCH_MANIFEST_FILENAME = "batch_manifest.json"
 JOBS_DIRNAME = "jobs"
+BATCH_JOURNAL_SUFFIX = ".journal.jsonl"  # Appended to the manifest stem
 
 
 @dataclass
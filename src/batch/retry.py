@@ -0,0 +1,158 @@
+"""
+Non-blocking retry scheduling for batch jobs.
+
+This module provides the retry machinery used by the batch engine. Backoff
+waits are performed with ``asyncio.sleep`` so the event loop (and any other
+job or server sharing it) keeps running, and delays use full-jitter
+exponential backoff to avoid synchronized retry storms.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from dataclasses import dataclass, asdict, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryAttempt:
+    """Timing record for a single job attempt."""
+    attempt: int
+    started_at: float
+    duration_seconds: float
+    outcome: str  # completed, failed
+    error_type: Optional[str] = None
+    retry_delay_seconds: Optional[float] = None  # Backoff scheduled after this attempt
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+@dataclass
+class RetryOutcome:
+    """Result of running a job through the retry scheduler."""
+    job_id: str
+    status: str  # completed, failed
+    attempts: List[RetryAttempt] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+    @property
+    def total_backoff_seconds(self) -> float:
+        """Total time spent waiting between attempts."""
+        return sum(a.retry_delay_seconds or 0.0 for a in self.attempts)
+
+
+class RetryScheduler:
+    """
+    Schedules job attempts with full-jitter exponential backoff.
+
+    Failed jobs are parked in a delayed-retry queue until their backoff
+    expires. When a concurrency ``slot`` (semaphore) is supplied it is only
+    held while an attempt executes, so other jobs can use the slot while a
+    job waits for its retry.
+
+    Example:
+        ```python
+        scheduler = RetryScheduler(max_retries=3, retry_delay=1.0,
+                                   backoff_factor=2.0, max_retry_delay=60.0)
+        outcome = await scheduler.run(job.job_id, run_attempt, slot=semaphore)
+        ```
+    """
+
+    def __init__(self, max_retries: int, retry_delay: float, backoff_factor: float,
+                 max_retry_delay: float, rng: Optional[random.Random] = None,
+                 logger_: Optional[logging.Logger] = None):
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.backoff_factor = backoff_factor
+        self.max_retry_delay = max_retry_delay
+        self._rng = rng or random
+        self.logger = logger_ or logger
+        # Delayed-retry queue: job_id -> monotonic time when the retry is due
+        self._delayed: Dict[str, float] = {}
+
+    def backoff_ceiling(self, retry_number: int) -> float:
+        """Return the capped exponential delay for the given retry (0-based)."""
+        return min(self.retry_delay * (self.backoff_factor ** retry_number), self.max_retry_delay)
+
+    def compute_delay(self, retry_number: int) -> float:
+        """Return a full-jitter delay in ``[0, backoff_ceiling(retry_number)]``."""
+        return self._rng.uniform(0, self.backoff_ceiling(retry_number))
+
+    def pending_retries(self) -> Dict[str, float]:
+        """Return job ids waiting for retry mapped to seconds until they are due."""
+        now = time.monotonic()
+        return {job_id: max(0.0, due - now) for job_id, due in self._delayed.items()}
+
+    async def run(self, job_id: str, attempt_fn: Callable[[int], Awaitable[str]],
+                  slot: Optional[asyncio.Semaphore] = None) -> RetryOutcome:
+        """
+        Run ``attempt_fn`` until it succeeds or retries are exhausted.
+
+        Args:
+            job_id: Identifier used for logging and the delayed-retry queue
+            attempt_fn: Coroutine function receiving the 1-based attempt number;
+                        returns a status string or raises on failure
+            slot: Optional semaphore held only while an attempt is executing
+
+        Returns:
+            RetryOutcome with per-attempt timing; ``error`` holds the last
+            exception when every attempt failed
+        """
+        outcome = RetryOutcome(job_id=job_id, status='failed')
+        total_attempts = self.max_retries + 1  # +1 for initial attempt
+
+        for attempt in range(1, total_attempts + 1):
+            error: Optional[Exception] = None
+            # Time the attempt itself, not the wait for a free slot
+            async with slot if slot is not None else contextlib.nullcontext():
+                started_at = time.time()
+                start = time.perf_counter()
+                try:
+                    status = await attempt_fn(attempt)
+                except Exception as e:
+                    error = e
+                duration = time.perf_counter() - start
+
+            if error is None:
+                outcome.attempts.append(RetryAttempt(
+                    attempt=attempt,
+                    started_at=started_at,
+                    duration_seconds=duration,
+                    outcome='completed',
+                ))
+                outcome.status = status
+                outcome.error = None
+                return outcome
+
+            record = RetryAttempt(
+                attempt=attempt,
+                started_at=started_at,
+                duration_seconds=duration,
+                outcome='failed',
+                error_type=type(error).__name__,
+            )
+            outcome.attempts.append(record)
+            outcome.error = error
+            self.logger.warning(f"Job {job_id} failed on attempt {attempt}: {type(error).__name__}")
+
+            # Don't retry on the last attempt
+            if attempt >= total_attempts:
+                self.logger.error(f"Job {job_id} failed after {total_attempts} attempts")
+                break
+
+            delay = self.compute_delay(attempt - 1)
+            record.retry_delay_seconds = delay
+            self.logger.info(f"Retrying job {job_id} in {delay:.1f}s...")
+            self._delayed[job_id] = time.monotonic() + delay
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._delayed.pop(job_id, None)
+
+        return outcome
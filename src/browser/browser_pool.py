@@ -0,0 +1,421 @@
+"""
+Warm browser pool for browser-control and batch execution.
+
+Every ``execute_direct_browser_control`` call used to build a new
+``GitScriptAutomator``, copy the Chrome/Edge profile into a temporary
+workspace and start a fresh Playwright instance, which dominated the wall
+time of short batch rows. ``BrowserContextPool`` keeps up to ``size``
+launched browsers per ``PoolKey`` (browser_type, headless, recording) and
+leases them out:
+
+- built-in Chromium: the browser stays warm and every lease gets a fresh
+  incognito ``BrowserContext`` (closed on release), so cookies and storage
+  never leak between runs and ``record_video_dir`` can be set per lease;
+- Chrome/Edge with a copied profile: the persistent context stays warm (the
+  profile is copied once per slot) and pages opened during a lease are
+  closed on release. Profile state such as cookies is intentionally kept.
+
+Slots are health-checked on checkout and recycled after ``max_uses`` leases.
+When every slot of a key is busy, an overflow browser is launched and closed
+after use, so parallel batch jobs are never serialised by the pool.
+
+Playwright objects are bound to the event loop that created them, so
+``get_browser_pool()`` returns one shared pool per running loop. Entry points
+own its shutdown: the FastAPI lifespan calls ``shutdown_browser_pool()`` and
+``asyncio.run`` callers wrap their coroutine in ``closing_browser_pool()``.
+The pool is opt-in via the ``browser.warm_pool_enabled`` feature flag.
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.config.feature_flags import FeatureFlags
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_USES = 20
+HEALTH_CHECK_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class PoolKey:
+    """Browsers are only shared between leases with the same launch settings."""
+    browser_type: str
+    headless: bool
+    recording: bool
+
+
+def _default_context_options(record_video_dir: Optional[str]) -> Dict[str, Any]:
+    return {"record_video_dir": record_video_dir} if record_video_dir else {}
+
+
+class PooledBrowser:
+    """
+    One launched browser owned by the pool.
+
+    Exactly one of ``browser`` (incognito contexts per lease) or ``context``
+    (persistent profile context shared across leases) is set.
+    """
+
+    def __init__(
+        self,
+        key: PoolKey,
+        *,
+        playwright=None,
+        browser=None,
+        context=None,
+        workspace: Optional[tempfile.TemporaryDirectory] = None,
+        video_dir: Optional[Path] = None,
+        context_options: Callable[[Optional[str]], Dict[str, Any]] = _default_context_options,
+    ):
+        if (browser is None) == (context is None):
+            raise ValueError("PooledBrowser requires exactly one of browser or context")
+        self.key = key
+        self.playwright = playwright
+        self.browser = browser
+        self.context = context
+        self.workspace = workspace
+        self.video_dir = video_dir
+        self.context_options = context_options
+        self.uses = 0
+        self.in_use = False
+        self.pooled = True
+        self.created_at = time.time()
+
+    @property
+    def kind(self) -> str:
+        return "browser" if self.browser is not None else "persistent"
+
+    async def is_healthy(self, timeout: float = HEALTH_CHECK_TIMEOUT_SECONDS) -> bool:
+        """Cheap liveness probe: connection state or one round-trip to the browser."""
+        try:
+            if self.browser is not None:
+                return bool(self.browser.is_connected())
+            await asyncio.wait_for(self.context.cookies(), timeout)
+            return True
+        except Exception as e:  # noqa: BLE001 - any failure means "replace me"
+            logger.debug(f"Pooled {self.key.browser_type} browser failed health check: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Close the browser, stop Playwright and remove the profile workspace."""
+        for closable in (self.context, self.browser):
+            if closable is not None:
+                try:
+                    await closable.close()
+                except Exception as e:  # noqa: BLE001
+                    logger.debug(f"Error closing pooled browser: {e}")
+        if self.playwright is not None:
+            try:
+                await self.playwright.stop()
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Error stopping pooled playwright instance: {e}")
+        if self.workspace is not None:
+            self.workspace.cleanup()
+
+
+Launcher = Callable[[PoolKey], Awaitable[PooledBrowser]]
+
+
+async def launch_pooled_browser(key: PoolKey) -> PooledBrowser:
+    """
+    Default launcher, mirroring ``GitScriptAutomator.launch_browser_with_profile``.
+
+    Args:
+        key: Browser type and launch settings
+
+    Returns:
+        PooledBrowser: Warm built-in Chromium browser or persistent profile context
+    """
+    from playwright.async_api import async_playwright
+    from src.utils.git_script_automator import GitScriptAutomator
+
+    automator = GitScriptAutomator(key.browser_type)
+    launcher = automator.browser_launcher
+    if launcher.is_using_builtin_chromium():
+        playwright = await async_playwright().start()
+        try:
+            browser = await playwright.chromium.launch(
+                headless=key.headless,
+                args=list(launcher.CHROMIUM_NO_PROFILE_ARGS),
+                ignore_default_args=["--enable-automation"],
+            )
+        except Exception:
+            await playwright.stop()
+            raise
+        return PooledBrowser(key, playwright=playwright, browser=browser,
+                             context_options=launcher.get_chromium_context_options)
+
+    workspace = tempfile.TemporaryDirectory(prefix="bykilt_pool_")
+    video_dir = Path(workspace.name) / "videos" if key.recording else None
+    try:
+        context = await automator.launch_browser_with_profile(
+            workspace.name, key.headless, str(video_dir) if video_dir else None
+        )
+    except Exception:
+        workspace.cleanup()
+        raise
+    return PooledBrowser(key, playwright=getattr(context, "_playwright_instance", None),
+                         context=context, workspace=workspace, video_dir=video_dir)
+
+
+class BrowserContextPool:
+    """
+    Per-key pool of warm browsers handing out isolated contexts.
+
+    Example:
+        ```python
+        pool = BrowserContextPool(size=2, max_uses=20)
+        key = PoolKey("chrome", headless=True, recording=False)
+        async with pool.lease(key) as context:
+            page = await context.new_page()
+            await page.goto("https://example.com")
+        await pool.close()
+        ```
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_uses: int = DEFAULT_MAX_USES,
+                 launcher: Optional[Launcher] = None,
+                 health_timeout: float = HEALTH_CHECK_TIMEOUT_SECONDS):
+        if size < 1 or max_uses < 1:
+            raise ValueError("Browser pool requires size >= 1 and max_uses >= 1")
+        self.size = size
+        self.max_uses = max_uses
+        self.health_timeout = health_timeout
+        self._launcher = launcher or launch_pooled_browser
+        self._lock = asyncio.Lock()
+        self._slots: Dict[PoolKey, List[PooledBrowser]] = {}
+        self._launching: Dict[PoolKey, int] = {}
+        self._tasks: set = set()
+        self._closed = False
+        self._stats = {"hits": 0, "launches": 0, "overflow": 0, "recycled": 0, "unhealthy": 0}
+
+    # ---------------- Checkout / checkin -------------------
+    async def _checkout(self, key: PoolKey) -> PooledBrowser:
+        while True:
+            async with self._lock:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                slots = self._slots.setdefault(key, [])
+                candidate = next((slot for slot in slots if not slot.in_use), None)
+                if candidate is None:
+                    pooled = len(slots) + self._launching.get(key, 0) < self.size
+                    if pooled:
+                        self._launching[key] = self._launching.get(key, 0) + 1
+                    break
+                # Reserve the slot, then probe it without holding the pool-wide lock
+                candidate.in_use = True
+
+            if await candidate.is_healthy(self.health_timeout):
+                async with self._lock:
+                    candidate.uses += 1
+                    self._stats["hits"] += 1
+                return candidate
+
+            async with self._lock:
+                if candidate in self._slots.get(key, []):
+                    self._slots[key].remove(candidate)
+                self._stats["unhealthy"] += 1
+            self._spawn(candidate.close())
+
+        # Launch outside the lock so other keys / idle slots are not blocked
+        try:
+            slot = await self._launcher(key)
+        finally:
+            if pooled:
+                async with self._lock:
+                    self._launching[key] -= 1
+        slot.in_use = True
+        slot.uses = 1
+        slot.pooled = pooled
+        async with self._lock:
+            self._stats["launches"] += 1
+            if pooled and not self._closed:
+                self._slots.setdefault(key, []).append(slot)
+            else:
+                slot.pooled = False
+                self._stats["overflow"] += int(not pooled)
+        return slot
+
+    async def _checkin(self, slot: PooledBrowser) -> None:
+        async with self._lock:
+            slot.in_use = False
+            retire = not slot.pooled or self._closed or slot.uses >= self.max_uses
+            if retire and slot.pooled:
+                self._slots[slot.key].remove(slot)
+                self._stats["recycled"] += 1
+                if not self._closed:
+                    # Keep the key warm: launch the replacement in the background
+                    self._spawn(self.warm(slot.key, 1))
+        if retire:
+            await slot.close()
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @asynccontextmanager
+    async def lease(self, key: PoolKey, record_video_dir: Optional[str] = None):
+        """
+        Lease an isolated browser context for ``key``.
+
+        Args:
+            key: Launch settings
+            record_video_dir: Per-lease video directory (built-in Chromium only;
+                profile contexts record into the slot's ``video_dir``)
+
+        Yields:
+            BrowserContext: Fresh incognito context, or the warm persistent context
+        """
+        slot = await self._checkout(key)
+        try:
+            if slot.browser is not None:
+                context = await slot.browser.new_context(**slot.context_options(record_video_dir))
+                try:
+                    yield context
+                finally:
+                    try:
+                        await context.close()
+                    except Exception as e:  # noqa: BLE001
+                        logger.debug(f"Error closing leased context: {e}")
+            else:
+                existing = list(slot.context.pages)
+                try:
+                    yield slot.context
+                finally:
+                    for page in list(slot.context.pages):
+                        if page not in existing:
+                            try:
+                                await page.close()
+                            except Exception as e:  # noqa: BLE001
+                                logger.debug(f"Error closing leased page: {e}")
+        finally:
+            await self._checkin(slot)
+
+    # ---------------- Maintenance -------------------
+    async def warm(self, key: PoolKey, count: Optional[int] = None) -> int:
+        """
+        Pre-launch idle browsers for ``key`` (up to the pool size).
+
+        Returns:
+            int: Number of browsers launched
+        """
+        launched = 0
+        for _ in range(count or self.size):
+            async with self._lock:
+                if self._closed:
+                    break
+                if len(self._slots.get(key, [])) + self._launching.get(key, 0) >= self.size:
+                    break
+                self._launching[key] = self._launching.get(key, 0) + 1
+            try:
+                slot = await self._launcher(key)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Browser pool warm-up failed for {key}: {e}")
+                break
+            finally:
+                async with self._lock:
+                    self._launching[key] -= 1
+            async with self._lock:
+                self._stats["launches"] += 1
+                if not self._closed:
+                    self._slots.setdefault(key, []).append(slot)
+                    launched += 1
+                    continue
+            await slot.close()
+        return launched
+
+    async def close(self) -> None:
+        """Close idle browsers now; leased ones are closed when released."""
+        async with self._lock:
+            self._closed = True
+            idle = [slot for slots in self._slots.values() for slot in slots if not slot.in_use]
+            for slots in self._slots.values():
+                slots[:] = [slot for slot in slots if slot.in_use]
+        # Pending warm-ups notice the closed flag and close what they launched
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for slot in idle:
+            await slot.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus per-key slot usage for status reporting."""
+        return {
+            **self._stats,
+            "size": self.size,
+            "max_uses": self.max_uses,
+            "keys": {
+                f"{key.browser_type}/{'headless' if key.headless else 'headed'}"
+                f"{'/recording' if key.recording else ''}": {
+                    "slots": len(slots),
+                    "in_use": sum(1 for slot in slots if slot.in_use),
+                }
+                for key, slots in self._slots.items()
+            },
+        }
+
+
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserContextPool]" = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool() -> Optional[BrowserContextPool]:
+    """
+    Return the shared pool for the running event loop, or None when disabled.
+
+    Controlled by the ``browser.warm_pool_enabled``, ``browser.warm_pool_size``
+    and ``browser.warm_pool_max_uses`` feature flags.
+    """
+    if not FeatureFlags.get("browser.warm_pool_enabled", expected_type=bool, default=False):
+        return None
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        size = FeatureFlags.get("browser.warm_pool_size", expected_type=int, default=DEFAULT_POOL_SIZE)
+        max_uses = FeatureFlags.get("browser.warm_pool_max_uses", expected_type=int, default=DEFAULT_MAX_USES)
+        pool = _pools[loop] = BrowserContextPool(size=max(1, size), max_uses=max(1, max_uses))
+        logger.info(f"🔥 Warm browser pool enabled (size={pool.size}, max_uses={pool.max_uses})")
+    return pool
+
+
+async def shutdown_browser_pool() -> None:
+    """Close the running loop's shared pool, if any."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+async def closing_browser_pool(coro: Awaitable[Any]) -> Any:
+    """
+    Await ``coro`` and then shut down the loop's pool.
+
+    Use at ``asyncio.run`` entry points (CLI batch runs, one-off test runs):
+    the pool belongs to that loop, so its browsers would otherwise outlive it.
+
+    Example:
+        ```python
+        manifest = asyncio.run(closing_browser_pool(start_batch(csv_path, run_context)))
+        ```
+    """
+    try:
+        return await coro
+    finally:
+        await shutdown_browser_pool()
+
+
+__all__ = [
+    "BrowserContextPool",
+    "PoolKey",
+    "PooledBrowser",
+    "launch_pooled_browser",
+    "get_browser_pool",
+    "shutdown_browser_pool",
+    "closing_browser_pool",
+]
@@ -0,0 +1,291 @@
+"""
+CDP screencast live view for headless runs.
+
+``run_with_stream`` used to poll ``capture_screenshot()`` every 50ms, encode a
+full JPEG through the screenshot manager and re-render a Gradio HTML block
+with the base64 payload on every iteration. ``ScreencastStream`` instead
+attaches a CDP session to the agent's page and lets Chromium push frames
+via ``Page.startScreencast``:
+
+- frames are acked as soon as they arrive and fanned out to subscribers
+  through a one-slot buffer each, so a slow viewer always gets the newest
+  frame and older undelivered frames are dropped rather than queued;
+- every ``ADAPT_WINDOW_FRAMES`` frames the drop ratio is checked and the
+  JPEG quality is lowered (viewers falling behind) or raised again (no
+  drops), restarting the screencast with the new quality.
+
+Streams are registered by id and served to the UI by the
+``/ws/live-view/{stream_id}`` websocket in ``src.api.realtime_router``. The
+app that mounts that router calls ``set_live_view_served()``; without it (e.g.
+the standalone Gradio UI) callers keep screenshot polling.
+Screencast needs a Chromium-based browser; ``start()`` returns False
+elsewhere so callers can fall back to screenshot polling.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUALITY = 60
+MIN_QUALITY = 30
+MAX_QUALITY = 80
+QUALITY_STEP = 10
+ADAPT_WINDOW_FRAMES = 20
+DROP_RATIO_DOWNGRADE = 0.25
+
+
+@dataclass(frozen=True)
+class ScreencastFrame:
+    """One JPEG frame as delivered by ``Page.screencastFrame`` (data is base64)."""
+    seq: int
+    data: str
+    width: int
+    height: int
+    quality: int
+    timestamp: float
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "type": "frame",
+            "seq": self.seq,
+            "data": self.data,
+            "width": self.width,
+            "height": self.height,
+            "quality": self.quality,
+        }
+
+
+class ScreencastStream:
+    """
+    Live JPEG frames of one Playwright page over CDP.
+
+    Example:
+        ```python
+        stream = ScreencastStream(max_width=1280, max_height=1100)
+        if await stream.start(page):
+            register_stream(stream_id, stream)
+            async for frame in stream.frames():
+                await websocket.send_text(json.dumps(frame.to_payload()))
+        ```
+    """
+
+    def __init__(
+        self,
+        max_width: int = 1280,
+        max_height: int = 1100,
+        quality: int = DEFAULT_QUALITY,
+        min_quality: int = MIN_QUALITY,
+        max_quality: int = MAX_QUALITY,
+    ):
+        self.max_width = max_width
+        self.max_height = max_height
+        self.min_quality = min_quality
+        self.max_quality = max_quality
+        self.quality = max(min_quality, min(quality, max_quality))
+        self.page = None
+        self._session: Optional[Any] = None
+        self._subscribers: List[asyncio.Queue] = []
+        self._latest: Optional[ScreencastFrame] = None
+        self._seq = 0
+        self._window_frames = 0
+        self._window_drops = 0
+        self._restart_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.frames_received = 0
+        self.frames_dropped = 0
+
+    @property
+    def active(self) -> bool:
+        return self._session is not None and not self._closed
+
+    # ---------------- Lifecycle -------------------
+    async def start(self, page) -> bool:
+        """
+        Attach to ``page`` and start the screencast (replaces a previous page).
+
+        Args:
+            page: Playwright page of a Chromium-based browser
+
+        Returns:
+            bool: False when CDP is unavailable (e.g. Firefox/WebKit)
+        """
+        await self._detach()
+        try:
+            session = await page.context.new_cdp_session(page)
+            session.on("Page.screencastFrame", self._on_frame)
+            self._session = session
+            self.page = page
+            await self._send_start()
+        except Exception as e:
+            logger.debug(f"Screencast unavailable, falling back to screenshots: {e}")
+            self._session = None
+            self.page = None
+            return False
+        self._closed = False
+        logger.debug(f"📺 Screencast started (quality={self.quality}) on {page.url}")
+        return True
+
+    async def close(self) -> None:
+        """Stop the screencast and end every subscriber's ``frames()`` iterator."""
+        self._closed = True
+        await self._detach()
+        for queue in list(self._subscribers):
+            self._offer(queue, None)
+
+    async def _send_start(self) -> None:
+        session = self._session
+        if session is None:
+            return
+        await session.send("Page.startScreencast", {
+            "format": "jpeg",
+            "quality": self.quality,
+            "maxWidth": self.max_width,
+            "maxHeight": self.max_height,
+            "everyNthFrame": 1,
+        })
+
+    async def _detach(self) -> None:
+        if self._restart_task and not self._restart_task.done():
+            self._restart_task.cancel()
+        self._restart_task = None
+        session, self._session, self.page = self._session, None, None
+        if session is None:
+            return
+        try:
+            await session.send("Page.stopScreencast")
+            await session.detach()
+        except Exception:
+            pass  # page already closed
+
+    async def _restart(self) -> None:
+        session = self._session
+        if session is None:
+            return  # detached while the restart was pending
+        try:
+            await session.send("Page.stopScreencast")
+            await self._send_start()
+            logger.debug(f"📺 Screencast quality adjusted to {self.quality}")
+        except Exception as e:
+            logger.debug(f"Screencast restart failed: {e}")
+
+    # ---------------- Frames -------------------
+    def _on_frame(self, params: Dict[str, Any]) -> None:
+        session = self._session
+        if session is None:
+            return
+        # Ack first: Chromium holds back the next frame until this one is acked
+        asyncio.ensure_future(self._ack(session, params.get("sessionId")))
+        metadata = params.get("metadata") or {}
+        self._seq += 1
+        frame = ScreencastFrame(
+            seq=self._seq,
+            data=params.get("data", ""),
+            width=int(metadata.get("deviceWidth") or 0),
+            height=int(metadata.get("deviceHeight") or 0),
+            quality=self.quality,
+            timestamp=time.time(),
+        )
+        self.publish(frame)
+
+    @staticmethod
+    async def _ack(session, session_id) -> None:
+        try:
+            await session.send("Page.screencastFrameAck", {"sessionId": session_id})
+        except Exception:
+            pass
+
+    def publish(self, frame: ScreencastFrame) -> None:
+        """Hand ``frame`` to every subscriber, replacing any frame they have not taken yet."""
+        self._latest = frame
+        self.frames_received += 1
+        dropped = 0
+        for queue in self._subscribers:
+            dropped += self._offer(queue, frame)
+        self.frames_dropped += dropped
+        if self._subscribers:
+            self._window_frames += 1
+            self._window_drops += 1 if dropped else 0
+            if self._window_frames >= ADAPT_WINDOW_FRAMES:
+                self._adapt_quality()
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item: Optional[ScreencastFrame]) -> int:
+        dropped = 0
+        if queue.full():
+            queue.get_nowait()
+            dropped = 1
+        queue.put_nowait(item)
+        return dropped
+
+    def _adapt_quality(self) -> None:
+        ratio = self._window_drops / self._window_frames
+        self._window_frames = self._window_drops = 0
+        if ratio > DROP_RATIO_DOWNGRADE and self.quality > self.min_quality:
+            self.quality = max(self.min_quality, self.quality - QUALITY_STEP)
+        elif ratio == 0 and self.quality < self.max_quality:
+            self.quality = min(self.max_quality, self.quality + QUALITY_STEP // 2)
+        else:
+            return
+        if self._session is not None and (self._restart_task is None or self._restart_task.done()):
+            self._restart_task = asyncio.ensure_future(self._restart())
+
+    async def frames(self) -> AsyncIterator[ScreencastFrame]:
+        """Yield the newest frame whenever one arrives, until ``close()``."""
+        if self._closed:
+            if self._latest is not None:
+                yield self._latest
+            return
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if self._latest is not None:
+            queue.put_nowait(self._latest)
+        self._subscribers.append(queue)
+        try:
+            while True:
+                frame = await queue.get()
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            self._subscribers.remove(queue)
+
+
+_streams: Dict[str, ScreencastStream] = {}
+_live_view_served = False
+
+
+def register_stream(stream_id: str, stream: ScreencastStream) -> None:
+    """Expose ``stream`` to ``/ws/live-view/{stream_id}``."""
+    _streams[stream_id] = stream
+
+
+def unregister_stream(stream_id: str) -> None:
+    _streams.pop(stream_id, None)
+
+
+def get_stream(stream_id: str) -> Optional[ScreencastStream]:
+    return _streams.get(stream_id)
+
+
+def set_live_view_served(served: bool = True) -> None:
+    """Record whether ``/ws/live-view`` is mounted in the running server."""
+    global _live_view_served
+    _live_view_served = served
+
+
+def is_live_view_served() -> bool:
+    return _live_view_served
+
+
+__all__ = [
+    "ScreencastFrame",
+    "ScreencastStream",
+    "register_stream",
+    "unregister_stream",
+    "get_stream",
+    "set_live_view_served",
+    "is_live_view_served",
+]
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Mapping, Sequence
 
 from src.batch.engine import BatchEngine, start_batch
+from src.browser.browser_pool import closing_browser_pool
 from src.runtime.run_context import RunContext
 
 logger = logging.getLogger(__name__)
@@ -96,11 +97,11 @@ def _run_start_batch(
     """
 
     async def _invoke():
-        return await start_batch(
+        return await closing_browser_pool(start_batch(
             str(csv_path),
             run_context,
             execute_immediately=execute_immediately,
-        )
+        ))
 
     try:
         logger.debug("Starting batch with asyncio.run")
@@ -16,7 +16,19 @@ Supported types: bool, int, str.
 
 Runtime overrides:
   FeatureFlags.set_override(name, value, ttl_seconds=None)
-  Expiring overrides are removed lazily upon access.
+  Expiring overrides are removed lazily on the first access after their
+  deadline (deadlines are kept in a min-heap, so reads only compare against
+  the earliest one).
+
+Concurrency:
+  Resolved values are published as an immutable snapshot dict that writers
+  replace wholesale (copy-on-write) under the lock. ``get`` on an already
+  resolved flag reads the current snapshot without taking the lock.
+
+Hot reload:
+  The defaults file is re-read when its mtime changes. The mtime is checked at
+  most once per ``_MTIME_CHECK_INTERVAL_SECONDS``, so cached reads in between
+  touch neither the lock nor the filesystem.
 
 Artifacts:
   A single artifact of resolved (current) flag values is written lazily on
@@ -46,14 +58,17 @@ Non-goals (future issues):
 """
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+import math
 import os
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 from src.utils.fs_paths import get_artifacts_base_dir
@@ -62,6 +77,7 @@ logger = logging.getLogger(__name__)
 
 
 _DEFAULT_FLAGS_FILE = "config/feature_flags.yaml"
+_MTIME_CHECK_INTERVAL_SECONDS = 1.0  # throttle for the hot-reload stat of the defaults file
 _ARTIFACT_ROOT = get_artifacts_base_dir() / "runs"  # retained for backward compatibility
 
 try:
@@ -82,7 +98,8 @@ class FeatureFlags:
     """Static facade for feature flag resolution.
 
     All state is stored on the class to keep a minimal integration surface.
-    Thread-safety: runtime override operations are guarded by a lock.
+    Thread-safety: all mutations are guarded by a lock; cached reads are
+    lock-free (see ``_resolved_cache``).
     """
 
     # Boolean string value constants for consistency and maintainability
@@ -93,9 +110,17 @@ class FeatureFlags:
     _defaults: Dict[str, _FlagDef] = {}
     _overrides: Dict[str, Tuple[Any, Optional[datetime]]] = {}
     _artifact_written = False
+    # Published snapshot of resolved values. Never mutated in place: writers
+    # build a new dict and swap the reference (see _publish), so readers can
+    # use whatever dict they observe without locking.
     _resolved_cache: Dict[str, Any] = {}
+    # Min-heap of (deadline_epoch, name) for TTL overrides; entries are
+    # validated against _overrides when popped (stale entries are skipped)
+    _expiry_heap: List[Tuple[float, str]] = []
+    _next_expiry: float = math.inf
     _flags_file: Path | None = None
     _flags_mtime: float | None = None  # track mtime to auto-reload if file updated during runtime
+    _next_mtime_check: float = 0.0  # time.monotonic() deadline for the next hot-reload stat
 
     # Lazy artifact creation control
     _lazy_artifact_enabled = True  # default: enabled for backward compatibility
@@ -107,11 +132,12 @@ class FeatureFlags:
         """Reload defaults from file, clearing caches (runtime overrides kept)."""
         with cls._lock:
             cls._defaults = {}
-            cls._resolved_cache = {}
+            cls._publish(clear=True)
             cls._artifact_written = False
             cls._lazy_artifact_triggered = False  # reset lazy creation trigger on reload
             cls._flags_file = cls._determine_flags_file()
             cls._flags_mtime = None
+            cls._next_mtime_check = time.monotonic() + _MTIME_CHECK_INTERVAL_SECONDS
             if cls._flags_file and cls._flags_file.exists():
                 try:
                     try:
@@ -156,8 +182,14 @@ class FeatureFlags:
           * bool -> False, int -> 0, str -> "" (if expected_type specified)
         """
         cls._ensure_loaded()
+        if time.time() >= cls._next_expiry:
+            cls._expire_due()
+        # Fast path: lock-free read of the published snapshot
+        snapshot = cls._resolved_cache
+        if name in snapshot:
+            return cls._coerce(snapshot[name], expected_type, name)
+
         with cls._lock:
-            cls._prune_expired()
             if name in cls._resolved_cache:
                 return cls._coerce(cls._resolved_cache[name], expected_type, name)
 
@@ -206,7 +238,7 @@ class FeatureFlags:
                         # (Artifact creation logic moved above for undefined flags only)
 
             coerced = cls._coerce(resolved, expected_type, name)
-            cls._resolved_cache[name] = coerced
+            cls._publish({name: coerced})
 
             return coerced
 
@@ -226,7 +258,7 @@ class FeatureFlags:
         """
         cls._ensure_loaded()
         with cls._lock:
-            cls._prune_expired()
+            cls._expire_due()
 
             # Check runtime override first (highest precedence)
             if name in cls._overrides:
@@ -248,9 +280,11 @@ class FeatureFlags:
             expiry = None
             if ttl_seconds is not None and ttl_seconds > 0:
                 expiry = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+                heapq.heappush(cls._expiry_heap, (expiry.timestamp(), name))
+                cls._next_expiry = cls._expiry_heap[0][0]
             cls._overrides[name] = (value, expiry)
             # override should refresh cache
-            cls._resolved_cache.pop(name, None)
+            cls._publish(remove=(name,))
             logger.info(
                 "Runtime feature flag override set",
                 extra={"event": "flag.override.set", "flag": name, "ttl": ttl_seconds},
@@ -261,7 +295,7 @@ class FeatureFlags:
     def clear_override(cls, name: str) -> None:
         with cls._lock:
             if cls._overrides.pop(name, None) is not None:
-                cls._resolved_cache.pop(name, None)
+                cls._publish(remove=(name,))
                 logger.info(
                     "Runtime feature flag override cleared",
                     extra={"event": "flag.override.cleared", "flag": name},
@@ -273,7 +307,9 @@ class FeatureFlags:
         with cls._lock:
             if cls._overrides:
                 cls._overrides.clear()
-                cls._resolved_cache.clear()
+                cls._expiry_heap = []
+                cls._next_expiry = math.inf
+                cls._publish(clear=True)
                 logger.info("All runtime feature flag overrides cleared", extra={"event": "flag.override.cleared_all"})
                 cls._maybe_write_artifact(force_refresh=True)
 
@@ -283,7 +319,7 @@ class FeatureFlags:
         cls._ensure_loaded()
         with cls._lock:
             if cls._resolved_cache:
-                cls._resolved_cache.clear()
+                cls._publish(clear=True)
 
     @classmethod
     def get_all_flags(cls) -> Dict[str, Dict[str, Any]]:
@@ -302,7 +338,7 @@ class FeatureFlags:
         result = {}
         
         with cls._lock:
-            cls._prune_expired()
+            cls._expire_due()
             
             # Collect all defined flags
             for name, flag_def in cls._defaults.items():
@@ -440,6 +476,10 @@ class FeatureFlags:
             cls.reload()
             return
         # Hot-reload if file mtime changed (Issue #91: tests modify defaults between runs)
+        now = time.monotonic()
+        if now < cls._next_mtime_check:
+            return
+        cls._next_mtime_check = now + _MTIME_CHECK_INTERVAL_SECONDS
         try:
             if cls._flags_file.exists():
                 current_mtime = cls._flags_file.stat().st_mtime
@@ -514,18 +554,52 @@ class FeatureFlags:
             )
         return value
 
+    @classmethod
+    def _publish(cls, updates: Dict[str, Any] | None = None, remove: Iterable[str] = (), clear: bool = False) -> None:
+        """Swap in a new resolved snapshot (caller holds the lock)."""
+        snapshot = {} if clear else dict(cls._resolved_cache)
+        for name in remove:
+            snapshot.pop(name, None)
+        if updates:
+            snapshot.update(updates)
+        cls._resolved_cache = snapshot
+
+    @classmethod
+    def _expire_due(cls) -> None:
+        """Pop overrides whose deadline passed, using the deadline heap."""
+        with cls._lock:
+            now = datetime.now(timezone.utc)
+            now_ts = now.timestamp()
+            expired: List[str] = []
+            while cls._expiry_heap and cls._expiry_heap[0][0] <= now_ts:
+                _deadline, name = heapq.heappop(cls._expiry_heap)
+                entry = cls._overrides.get(name)
+                # Skip stale heap entries (override cleared or replaced)
+                if entry is not None and entry[1] is not None and entry[1] <= now:
+                    cls._overrides.pop(name, None)
+                    expired.append(name)
+            cls._next_expiry = cls._expiry_heap[0][0] if cls._expiry_heap else math.inf
+            if expired:
+                cls._publish(remove=expired)
+                for name in expired:
+                    logger.info("Expired feature flag override removed", extra={"event": "flag.override.expired", "flag": name})
+
     @classmethod
     def _prune_expired(cls) -> None:
-        """Remove expired runtime overrides.
+        """Remove all expired runtime overrides (full sweep).
 
-        This method may be called from multiple places to ensure expired overrides are cleaned up.
+        Regular reads rely on ``_expire_due``; this sweep also catches overrides
+        whose deadline was never pushed to the heap.
         """
-        now = datetime.now(timezone.utc)
-        expired = [k for k, (_v, exp) in cls._overrides.items() if exp and exp <= now]
-        for k in expired:
-            cls._overrides.pop(k, None)
-            cls._resolved_cache.pop(k, None)
-            logger.info("Expired feature flag override removed", extra={"event": "flag.override.expired", "flag": k})
+        with cls._lock:
+            cls._expire_due()
+            now = datetime.now(timezone.utc)
+            expired = [k for k, (_v, exp) in cls._overrides.items() if exp and exp <= now]
+            for k in expired:
+                cls._overrides.pop(k, None)
+                logger.info("Expired feature flag override removed", extra={"event": "flag.override.expired", "flag": k})
+            if expired:
+                cls._publish(remove=expired)
 
     @classmethod
     def _create_fallback_artifact_dir(cls, suffix: str) -> Path:
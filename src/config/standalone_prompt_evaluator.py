@@ -2,37 +2,243 @@
 LLM非依存のプロンプト評価機能
 事前登録されたコマンドの解析とパラメータ抽出を行います
 """
+import functools
 import re
 import os
+import threading
 import yaml
-from typing import Dict, List, Any, Optional, Union
+from collections import deque
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple, Union
 
-def load_actions_config_standalone() -> Dict[str, Any]:
-    """llms.txtファイルを読み込み、アクション設定を取得"""
+_DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'llms.txt')
+
+# 抽出対象の @コマンド トークン (例: "@phrase-search query=foo" -> "phrase-search")
+_COMMAND_TOKEN_PATTERN = re.compile(r'@([^\s@]+)')
+
+
+class SubstringIndex:
+    """
+    Aho-Corasick による複数パターンの部分文字列検索
+
+    登録したパターンのうち ``text`` に含まれるものを 1 回の走査で列挙します。
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+
+        for pattern in dict.fromkeys(p for p in patterns if p):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state] += (pattern,)
+
+        # 幅優先で失敗遷移を構築
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[str]:
+        """``text`` に含まれる登録パターンの集合を返す"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+@functools.lru_cache(maxsize=1024)
+def _param_pattern(param: str) -> Pattern[str]:
+    return re.compile(rf'{re.escape(param)}=(\S+)')
+
+
+def _param_names(param_names: Union[str, List[Dict[str, Any]], None]) -> List[str]:
+    # Convert param_names to list if it's a string
+    if isinstance(param_names, str):
+        return [p.strip() for p in param_names.split(',')]
+    if isinstance(param_names, list):
+        return [p['name'] for p in param_names if isinstance(p, dict) and 'name' in p]
+    return []
+
+
+class ActionRegistry:
+    """
+    llms.txt から構築したアクションのルックアップテーブル
+
+    @コマンドの完全一致用の ``by_name`` に加え、@コマンド名とキーワードの
+    Aho-Corasick インデックス、およびアクションごとのコンパイル済み
+    パラメータ抽出パターンをレジストリ構築時に一度だけ用意します。
+    """
+
+    def __init__(self, actions_config: Dict[str, Any]):
+        self.config = actions_config
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.order: Dict[str, int] = {}
+        self.param_patterns: Dict[str, List[Tuple[str, Pattern[str]]]] = {}
+        # 部分一致用: 定義順のアクションと、そのキーワード (空文字は常に一致するため除外)
+        self._keyword_entries: List[Tuple[FrozenSet[str], Dict[str, Any]]] = []
+        self._entries_by_keyword: Dict[str, List[int]] = {}
+        self._keywordless_entry: Optional[int] = None
+
+        for action in actions_config.get('actions') or []:
+            if not (isinstance(action, dict) and 'name' in action):
+                continue
+            action_name = str(action['name'])
+            if action_name not in self.by_name:
+                self.by_name[action_name] = action
+                self.order[action_name] = len(self.order)
+                self.param_patterns[action_name] = [
+                    (param, _param_pattern(param)) for param in _param_names(action.get('params', []))
+                ]
+
+            keywords = frozenset(k for k in action_name.split('-') if k)
+            entry = len(self._keyword_entries)
+            self._keyword_entries.append((keywords, action))
+            if not keywords and self._keywordless_entry is None:
+                self._keywordless_entry = entry
+            for keyword in keywords:
+                self._entries_by_keyword.setdefault(keyword, []).append(entry)
+
+        self._command_index = SubstringIndex(f"@{name}" for name in self.by_name)
+        self._keyword_index = SubstringIndex(self._entries_by_keyword)
+
+    def match_exact(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """@コマンド形式の完全一致 (定義順で最初のアクションを優先)"""
+        hits = [token for token in _COMMAND_TOKEN_PATTERN.findall(prompt) if token in self.by_name]
+        if not hits and '@' in prompt:
+            # 句読点が続く場合など、トークン分割で拾えないケースは部分文字列で判定
+            hits = [command[1:] for command in self._command_index.find(prompt)]
+        if hits:
+            return self.by_name[min(hits, key=self.order.__getitem__)]
+        return None
+
+    def match_keywords(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """キーワードベースの部分一致 (すべてのキーワードを含む最初のアクション)"""
+        found = self._keyword_index.find(prompt.lower())
+        best = self._keywordless_entry
+        for keyword in found:
+            for entry in self._entries_by_keyword[keyword]:
+                if best is not None and entry >= best:
+                    break
+                if self._keyword_entries[entry][0] <= found:
+                    best = entry
+                    break
+        return self._keyword_entries[best][1] if best is not None else None
+
+    def extract_params(self, prompt: str, action: Dict[str, Any]) -> Dict[str, str]:
+        """コンパイル済みパターンでアクションのパラメータを抽出"""
+        patterns = self.param_patterns.get(str(action.get('name')))
+        if patterns is None:
+            return extract_params_standalone(prompt, action.get('params', []))
+        return _extract_params(prompt, patterns)
+
+
+_EMPTY_REGISTRY = ActionRegistry({})
+_registry_lock = threading.Lock()
+_registry_cache: Dict[str, Tuple[Tuple[int, int], ActionRegistry]] = {}
+
+
+def _parse_actions_config(config_path: str) -> Dict[str, Any]:
+    with open(config_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+
+    # Parse YAML structure
     try:
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'llms.txt')
-        if not os.path.exists(config_path):
-            print(f"⚠️ Actions config file not found at {config_path}")
-            return {}
-            
-        with open(config_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # Parse YAML structure
-        try:
-            actions_config = yaml.safe_load(content)
-            if isinstance(actions_config, dict) and 'actions' in actions_config:
-                return actions_config
-            else:
-                print("⚠️ Invalid actions config structure")
-                return {}
-        except yaml.YAMLError as e:
-            print(f"⚠️ YAML parsing error: {e}")
+        actions_config = yaml.safe_load(content)
+        if isinstance(actions_config, dict) and 'actions' in actions_config:
+            return actions_config
+        else:
+            print("⚠️ Invalid actions config structure")
             return {}
-    except Exception as e:
-        print(f"⚠️ Error loading actions config: {e}")
+    except yaml.YAMLError as e:
+        print(f"⚠️ YAML parsing error: {e}")
         return {}
 
+
+def get_action_registry_standalone(config_path: Optional[str] = None) -> ActionRegistry:
+    """
+    llms.txt のアクションレジストリを取得 (プロセス単位でキャッシュ)
+
+    ファイルの mtime と size が変わらない限り、YAML を再解析せずに
+    キャッシュ済みのレジストリを返します。
+
+    Args:
+        config_path: llms.txt のパス (省略時はリポジトリ直下の llms.txt)
+
+    Returns:
+        ActionRegistry: アクションレジストリ (設定がない場合は空)
+    """
+    config_path = config_path or _DEFAULT_CONFIG_PATH
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        print(f"⚠️ Actions config file not found at {config_path}")
+        return _EMPTY_REGISTRY
+    except OSError as e:
+        print(f"⚠️ Error loading actions config: {e}")
+        return _EMPTY_REGISTRY
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _registry_cache.get(config_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with _registry_lock:
+        cached = _registry_cache.get(config_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            registry = ActionRegistry(_parse_actions_config(config_path))
+        except Exception as e:
+            print(f"⚠️ Error loading actions config: {e}")
+            return _EMPTY_REGISTRY
+        _registry_cache[config_path] = (key, registry)
+        return registry
+
+
+def clear_action_registry_cache() -> None:
+    """キャッシュ済みのアクションレジストリを破棄"""
+    with _registry_lock:
+        _registry_cache.clear()
+
+
+def load_actions_config_standalone() -> Dict[str, Any]:
+    """llms.txtファイルを読み込み、アクション設定を取得 (キャッシュ済みの設定を返すため変更しないこと)"""
+    return get_action_registry_standalone().config
+
+
+def _build_match_result(registry: ActionRegistry, prompt: str, action: Dict[str, Any]) -> Dict[str, Any]:
+    # パラメータを抽出
+    extracted_params = registry.extract_params(prompt, action)
+
+    return {
+        'is_command': True,
+        'command_name': action['name'],
+        'action_def': action,
+        'params': extracted_params
+    }
+
+
 def pre_evaluate_prompt_standalone(prompt: str) -> Optional[Dict[str, Any]]:
     """
     LLM非依存でプロンプトを事前評価し、登録済みアクションとマッチするかチェック
@@ -45,55 +251,23 @@ def pre_evaluate_prompt_standalone(prompt: str) -> Optional[Dict[str, Any]]:
     """
     try:
         print(f"🔍 Evaluating prompt: {prompt}")
-        actions_config = load_actions_config_standalone()
+        registry = get_action_registry_standalone()
         
-        if not actions_config or 'actions' not in actions_config:
+        if not registry.by_name:
             print("⚠️ No actions config available")
             return None
         
-        actions = actions_config['actions']
-        
-        # 最初に正確なマッチを探す
-        for action in actions:
-            if isinstance(action, dict) and 'name' in action:
-                action_name = action['name']
-                
-                # @コマンド形式の正確なマッチング (例: @phrase-search)
-                if prompt.startswith(f"@{action_name}") or f"@{action_name}" in prompt:
-                    print(f"✅ Found exact matching action: {action_name}")
-                    
-                    # パラメータを抽出
-                    extracted_params = extract_params_standalone(prompt, action.get('params', []))
-                    
-                    return {
-                        'is_command': True,
-                        'command_name': action_name,
-                        'action_def': action,
-                        'params': extracted_params
-                    }
+        # 最初に正確なマッチを探す (@コマンド形式, 例: @phrase-search)
+        action = registry.match_exact(prompt)
+        if action is not None:
+            print(f"✅ Found exact matching action: {action['name']}")
+            return _build_match_result(registry, prompt, action)
         
-        # 次に部分的なマッチを探す
-        for action in actions:
-            if isinstance(action, dict) and 'name' in action:
-                action_name = action['name']
-                
-                # より柔軟なマッチング（キーワードベース）- ただし、より厳密に
-                action_keywords = action_name.split('-')
-                prompt_words = prompt.lower().split()
-                
-                # すべてのキーワードが含まれているかチェック
-                if all(keyword in prompt.lower() for keyword in action_keywords):
-                    print(f"✅ Found partial matching action: {action_name}")
-                    
-                    # パラメータを抽出
-                    extracted_params = extract_params_standalone(prompt, action.get('params', []))
-                    
-                    return {
-                        'is_command': True,
-                        'command_name': action_name,
-                        'action_def': action,
-                        'params': extracted_params
-                    }
+        # 次に部分的なマッチを探す (キーワードベース)
+        action = registry.match_keywords(prompt)
+        if action is not None:
+            print(f"✅ Found partial matching action: {action['name']}")
+            return _build_match_result(registry, prompt, action)
         
         print("⚠️ No matching action found")
         return None
@@ -113,29 +287,24 @@ def extract_params_standalone(prompt: str, param_names: Union[str, List[Dict[str
     Returns:
         Dict[str, str]: 抽出されたパラメータ
     """
+    return _extract_params(prompt, [(param, _param_pattern(param)) for param in _param_names(param_names)])
+
+
+def _extract_params(prompt: str, patterns: List[Tuple[str, Pattern[str]]]) -> Dict[str, str]:
     print(f"🔍 Extracting parameters from: {prompt}")
     params = {}
-    
-    if not param_names:
-        return params
-    
-    # Convert param_names to list if it's a string
-    if isinstance(param_names, str):
-        param_list = [p.strip() for p in param_names.split(',')]
-    elif isinstance(param_names, list):
-        param_list = [p['name'] for p in param_names if isinstance(p, dict) and 'name' in p]
-    else:
-        return params
+    words = None
 
-    for param in param_list:
+    for param, pattern in patterns:
         # パラメータ=値 形式の抽出
-        match = re.search(rf'{param}=(\S+)', prompt)
+        match = pattern.search(prompt)
         if match:
             params[param] = match.group(1)
             print(f"✅ Extracted {param}={params[param]}")
         else:
             # スペース区切りでの抽出も試行
-            words = prompt.split()
+            if words is None:
+                words = prompt.split()
             for i, word in enumerate(words):
                 if param in word.lower() and i + 1 < len(words):
                     params[param] = words[i + 1]
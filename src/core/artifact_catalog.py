@@ -0,0 +1,460 @@
+"""Incremental artifact catalog (Issue #277 follow-up)
+
+Listing artifacts used to glob every ``*-art/manifest_v2.json`` under
+``artifacts/runs``, then stat, sort and parse all of them before slicing a
+page. The catalog keeps one row per artifact in a small SQLite database
+(``artifacts/runs/artifact_catalog.sqlite3``) so a page is a single indexed
+query.
+
+Freshness:
+  * ``ArtifactManager`` re-indexes its own run whenever it writes a manifest
+    (``notify_manifest_written``); this only happens once a catalog exists.
+  * ``reconcile()`` walks the directory tree using directory mtimes: listings
+    of unchanged directories are reused, and a run is only re-read when its
+    manifest or one of its subdirectories changed.
+  * ``reconcile_if_stale()`` (used per listing request) only walks the tree
+    when the runs root mtime changed or ``RECONCILE_TTL_SECONDS`` elapsed, so
+    a page does not cost a walk over every run.
+
+Ordering matches the previous scan: runs by manifest mtime (newest first),
+then the order of entries inside the manifest. Keyset cursors encode the
+position ``(manifest mtime, run dir, ordinal)``.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.core.manifest_log import delta_path, read_manifest
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "artifact_catalog.sqlite3"
+_MANIFEST_FILENAME = "manifest_v2.json"
+_RUN_DIR_SUFFIX = "-art"
+_UNREGISTERED_ELEMENT_SUFFIXES = {".txt", ".csv"}
+RECONCILE_TTL_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_dir TEXT PRIMARY KEY,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_dir TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    sort_key INTEGER NOT NULL,
+    dir_name TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER,
+    created_at TEXT NOT NULL,
+    meta TEXT,
+    PRIMARY KEY (run_dir, ordinal)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_order ON artifacts(sort_key DESC, run_dir, ordinal);
+CREATE INDEX IF NOT EXISTS idx_artifacts_type_order ON artifacts(type, sort_key DESC, run_dir, ordinal);
+"""
+
+Cursor = Tuple[int, str, int]
+
+
+# ---------------------------------------------------------------------------
+# Manifest -> rows
+# ---------------------------------------------------------------------------
+def resolve_artifact_path(path_str: str, manifest_dir: Path, artifacts_root: Path) -> Path | None:
+    """Resolve artifact path from manifest entry.
+
+    Tries multiple strategies:
+    1. Absolute path as-is
+    2. Relative to manifest directory
+    3. Relative to artifacts root
+    4. Relative to runs directory
+    5. Relative to project root (for paths like "artifacts/runs/...")
+    """
+    candidate = Path(path_str)
+    if candidate.is_absolute() and candidate.exists():
+        return candidate
+
+    for base in (manifest_dir, artifacts_root, artifacts_root / "runs", artifacts_root.parent):
+        candidate = base / path_str
+        if candidate.exists():
+            return candidate
+
+    return None
+
+
+def load_manifest_rows(manifest_path: Path, artifacts_root: Path,
+                       data: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    """Return artifact rows for one run directory.
+
+    Includes manifest entries whose file exists, followed by unregistered
+    ``elements/*.txt|*.csv`` files.
+
+    Args:
+        manifest_path: ``<run>-art/manifest_v2.json``
+        artifacts_root: Base artifacts directory used to resolve relative paths
+        data: Already-parsed manifest (skips reading the file)
+    """
+    run_id = manifest_path.parent.name.replace(_RUN_DIR_SUFFIX, "")
+
+    if data is None:
+        # Includes entries still pending in the write-behind delta log
+        data = read_manifest(manifest_path)
+        if data is None:
+            return []
+
+    rows: List[Dict[str, Any]] = []
+    registered_paths: set[str] = set()
+
+    for artifact in data.get("artifacts", []):
+        path_str = artifact.get("path", "")
+        if not path_str:
+            continue
+        artifact_path = resolve_artifact_path(path_str, manifest_path.parent, artifacts_root)
+        if not artifact_path or not artifact_path.exists():
+            continue
+        registered_paths.add(str(artifact_path))
+        rows.append({
+            "run_id": run_id,
+            "type": artifact.get("type", ""),
+            "path": str(artifact_path),
+            "size": artifact.get("size"),
+            "created_at": artifact.get("created_at", ""),
+            "meta": artifact.get("meta"),
+        })
+
+    elements_dir = manifest_path.parent / "elements"
+    if elements_dir.is_dir():
+        for file_path in elements_dir.iterdir():
+            if not file_path.is_file() or file_path.suffix.lower() not in _UNREGISTERED_ELEMENT_SUFFIXES:
+                continue
+            if str(file_path) in registered_paths:
+                continue
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            rows.append({
+                "run_id": run_id,
+                "type": "element_capture",
+                "path": str(file_path),
+                "size": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "meta": {"format": file_path.suffix[1:], "unregistered": True},
+            })
+
+    return rows
+
+
+def encode_cursor(position: Cursor) -> str:
+    """Encode a keyset position as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(json.dumps(list(position)).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        sort_key, run_dir, ordinal = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        return int(sort_key), str(run_dir), int(ordinal)
+    except Exception as e:  # noqa: BLE001
+        raise ValueError(f"invalid cursor: {token!r}") from e
+
+
+# ---------------------------------------------------------------------------
+# Catalog
+# ---------------------------------------------------------------------------
+class ArtifactCatalog:
+    """SQLite-backed artifact index for one ``artifacts/runs`` root.
+
+    Example:
+        ```python
+        catalog = ArtifactCatalog.for_root(runs_root, artifacts_root)
+        catalog.reconcile()
+        rows, next_cursor, total = catalog.query(artifact_type="video", limit=20)
+        ```
+    """
+
+    _instances: Dict[Path, "ArtifactCatalog"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, runs_root: Path, artifacts_root: Path):
+        self.runs_root = Path(runs_root)
+        self.artifacts_root = Path(artifacts_root)
+        self.path = self.runs_root / CATALOG_FILENAME
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # dir path -> (mtime_ns, child directory names, child file names)
+        self._listings: Dict[str, Tuple[int, Tuple[str, ...], frozenset]] = {}
+        # (runs root mtime_ns, monotonic time) of the last reconcile
+        self._reconciled: Optional[Tuple[int, float]] = None
+
+    @classmethod
+    def for_root(cls, runs_root: Path, artifacts_root: Path) -> "ArtifactCatalog":
+        """Return the shared catalog instance for ``runs_root``."""
+        key = Path(runs_root).resolve()
+        with cls._instances_lock:
+            catalog = cls._instances.get(key)
+            if catalog is None:
+                catalog = cls._instances[key] = cls(key, artifacts_root)
+            catalog.artifacts_root = Path(artifacts_root)
+            return catalog
+
+    @classmethod
+    def reset_instances(cls) -> None:
+        """Close and forget shared instances (testing/support only)."""
+        with cls._instances_lock:
+            for catalog in cls._instances.values():
+                catalog.close()
+            cls._instances.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---------------- Indexing -------------------
+    def _run_key(self, run_dir: Path) -> str:
+        return Path(os.path.relpath(run_dir, self.runs_root)).as_posix()
+
+    def index_run(self, run_dir: Path, data: Dict[str, Any] | None = None, signature: str | None = None) -> int:
+        """(Re)index one ``<run>-art`` directory; returns the number of rows."""
+        manifest_path = run_dir / _MANIFEST_FILENAME
+        try:
+            sort_key = manifest_path.stat().st_mtime_ns
+        except OSError:
+            self.forget_run(run_dir)
+            return 0
+        rows = load_manifest_rows(manifest_path, self.artifacts_root, data)
+        if signature is None:
+            signature = self._run_signature(run_dir)
+        key = self._run_key(run_dir)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM artifacts WHERE run_dir = ?", (key,))
+                conn.executemany(
+                    "INSERT INTO artifacts(run_dir, ordinal, sort_key, dir_name, run_id, type, path, size, created_at, meta)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (key, ordinal, sort_key, run_dir.name, row["run_id"], row["type"], row["path"],
+                         row["size"], row["created_at"],
+                         json.dumps(row["meta"], ensure_ascii=False) if row["meta"] is not None else None)
+                        for ordinal, row in enumerate(rows)
+                    ),
+                )
+                conn.execute("INSERT OR REPLACE INTO runs(run_dir, signature) VALUES (?, ?)", (key, signature))
+        return len(rows)
+
+    def forget_run(self, run_dir: Path) -> None:
+        key = self._run_key(run_dir)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM artifacts WHERE run_dir = ?", (key,))
+                conn.execute("DELETE FROM runs WHERE run_dir = ?", (key,))
+
+    def _listing(self, directory: str) -> Tuple[int, Tuple[str, ...], frozenset]:
+        """Return (mtime_ns, subdirs, files) for a directory, reusing unchanged listings."""
+        mtime_ns = os.stat(directory).st_mtime_ns
+        cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+        subdirs: List[str] = []
+        files: List[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    else:
+                        files.append(entry.name)
+                except OSError:
+                    continue
+        listing = (mtime_ns, tuple(sorted(subdirs)), frozenset(files))
+        self._listings[directory] = listing
+        return listing
+
+    def _walk(self, top: str) -> Iterator[Tuple[str, int, Tuple[str, ...], frozenset]]:
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns, subdirs, files = self._listing(directory)
+            except OSError:
+                self._listings.pop(directory, None)
+                continue
+            yield directory, mtime_ns, subdirs, files
+            stack.extend(os.path.join(directory, name) for name in reversed(subdirs))
+
+    def _run_signature(self, run_dir: Path) -> str:
+        """Manifest and delta log stat plus the mtime of every directory inside the run."""
+        manifest = run_dir / _MANIFEST_FILENAME
+        try:
+            st = manifest.stat()
+        except OSError:
+            return ""
+        parts = [f"{st.st_mtime_ns}:{st.st_size}"]
+        try:
+            # Write-behind appends do not touch the manifest or any directory mtime
+            delta_st = delta_path(manifest).stat()
+            parts.append(f"delta={delta_st.st_mtime_ns}:{delta_st.st_size}")
+        except OSError:
+            pass
+        for directory, mtime_ns, _, _ in self._walk(str(run_dir)):
+            parts.append(f"{os.path.relpath(directory, run_dir)}={mtime_ns}")
+        return "|".join(parts)
+
+    def reconcile(self) -> Dict[str, int]:
+        """Bring the catalog in line with the filesystem.
+
+        Returns:
+            Counts of ``indexed`` (re-read) and ``removed`` runs
+        """
+        with self._lock:
+            known = dict(self._connect().execute("SELECT run_dir, signature FROM runs").fetchall())
+            seen: set[str] = set()
+            indexed = 0
+            for directory, _, _, files in self._walk(str(self.runs_root)):
+                if not directory.endswith(_RUN_DIR_SUFFIX) or _MANIFEST_FILENAME not in files:
+                    continue
+                run_dir = Path(directory)
+                key = self._run_key(run_dir)
+                seen.add(key)
+                signature = self._run_signature(run_dir)
+                if known.get(key) != signature:
+                    self.index_run(run_dir, signature=signature)
+                    indexed += 1
+            removed = [key for key in known if key not in seen]
+            if removed:
+                conn = self._connect()
+                with conn:
+                    conn.executemany("DELETE FROM artifacts WHERE run_dir = ?", ((k,) for k in removed))
+                    conn.executemany("DELETE FROM runs WHERE run_dir = ?", ((k,) for k in removed))
+            self._reconciled = (self._listings.get(str(self.runs_root), (0,))[0], time.monotonic())
+            return {"indexed": indexed, "removed": len(removed)}
+
+    def reconcile_if_stale(self, ttl: float = RECONCILE_TTL_SECONDS) -> Optional[Dict[str, int]]:
+        """Reconcile only when the runs root changed or ``ttl`` seconds passed.
+
+        Runs written by this process are kept current by
+        ``notify_manifest_written``; this catches new run directories and
+        writes from other processes.
+
+        Returns:
+            ``reconcile()`` counts, or None when the catalog was fresh enough
+        """
+        with self._lock:
+            if self._reconciled is not None:
+                root_mtime, reconciled_at = self._reconciled
+                try:
+                    unchanged = os.stat(self.runs_root).st_mtime_ns == root_mtime
+                except OSError:
+                    unchanged = False
+                if unchanged and time.monotonic() - reconciled_at < ttl:
+                    return None
+            return self.reconcile()
+
+    # ---------------- Query -------------------
+    def query(self, run_id: str | None = None, artifact_type: str = "all", limit: int = 50,
+              offset: int = 0, cursor: str | None = None) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+        """Return one page of rows, the next cursor (or None) and the total count.
+
+        ``limit=0`` returns every remaining row.
+        """
+        where: List[str] = []
+        args: List[Any] = []
+        if artifact_type != "all":
+            where.append("type = ?")
+            args.append(artifact_type)
+        if run_id:
+            where.append("substr(dir_name, 1, ?) = ?")
+            args.extend([len(run_id), run_id])
+
+        filters = (" WHERE " + " AND ".join(where)) if where else ""
+        page_where = list(where)
+        page_args = list(args)
+        if cursor:
+            sort_key, run_dir, ordinal = decode_cursor(cursor)
+            page_where.append(
+                "(sort_key < ? OR (sort_key = ? AND (run_dir > ? OR (run_dir = ? AND ordinal > ?))))"
+            )
+            page_args.extend([sort_key, sort_key, run_dir, run_dir, ordinal])
+        page_filters = (" WHERE " + " AND ".join(page_where)) if page_where else ""
+
+        with self._lock:
+            conn = self._connect()
+            total = conn.execute(f"SELECT COUNT(*) FROM artifacts{filters}", args).fetchone()[0]
+            fetched = conn.execute(
+                "SELECT sort_key, run_dir, ordinal, run_id, type, path, size, created_at, meta FROM artifacts"
+                f"{page_filters} ORDER BY sort_key DESC, run_dir ASC, ordinal ASC LIMIT ? OFFSET ?",
+                page_args + [limit + 1 if limit > 0 else -1, offset],
+            ).fetchall()
+
+        has_next = limit > 0 and len(fetched) > limit
+        page = fetched[:limit] if has_next else fetched
+        rows = [
+            {
+                "run_id": r[3],
+                "type": r[4],
+                "path": r[5],
+                "size": r[6],
+                "created_at": r[7],
+                "meta": json.loads(r[8]) if r[8] else None,
+            }
+            for r in page
+        ]
+        next_cursor = encode_cursor((page[-1][0], page[-1][1], page[-1][2])) if has_next else None
+        return rows, next_cursor, total
+
+
+def notify_manifest_written(manifest_path: Path, data: Dict[str, Any] | None = None,
+                            search_depth: int = 3) -> None:
+    """Re-index a run after its manifest was written.
+
+    Looks for an existing catalog in the ancestors of the run directory; does
+    nothing when no catalog has been created yet. Never raises.
+    """
+    try:
+        run_dir = Path(manifest_path).parent
+        for runs_root in list(run_dir.parents)[:search_depth]:
+            if (runs_root / CATALOG_FILENAME).exists():
+                catalog = ArtifactCatalog.for_root(runs_root, runs_root.parent)
+                catalog.index_run(run_dir, data)
+                return
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Artifact catalog update failed for {manifest_path}: {e}")
+
+
+__all__ = [
+    "ArtifactCatalog",
+    "CATALOG_FILENAME",
+    "load_manifest_rows",
+    "resolve_artifact_path",
+    "encode_cursor",
+    "decode_cursor",
+    "notify_manifest_written",
+]
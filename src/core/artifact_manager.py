@@ -26,12 +26,17 @@ Design Notes:
         }
   - Each run writes its manifest under artifacts/runs/<run_id>-art/manifest_v2.json
   - Listing API will aggregate manifests (lightweight scan) and optionally filter by type.
+  - Write-behind: once a manifest holds more than MANIFEST_INLINE_LIMIT entries, new
+    entries are appended to manifest_v2.delta.jsonl and compacted into manifest_v2.json
+    at most every MANIFEST_FLUSH_DELAY_SECONDS and at run end (flush_manifest / exit).
+    Direct readers should use src.core.manifest_log.read_manifest.
 
 Future:
   * Add hashing/integrity, streaming updates, metrics (#58) integration.
 """
 from __future__ import annotations
 
+import atexit
 import base64
 import json
 import os
@@ -39,19 +44,38 @@ import time
 import shutil
 import logging
 import threading
+import weakref
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.config.feature_flags import FeatureFlags
+from src.core.artifact_catalog import notify_manifest_written
+from src.core.manifest_log import append_delta, delta_path, read_manifest
 from src.runtime.run_context import RunContext
 from src.utils.fs_paths import get_artifacts_base_dir
 
 _ARTIFACT_COMPONENT = "art"
 _MANIFEST_FILENAME = "manifest_v2.json"
+# Manifests up to this size are rewritten on every entry (cheap, always current on disk)
+MANIFEST_INLINE_LIMIT = 200
+# Longest time a deferred entry waits in the delta log before compaction
+MANIFEST_FLUSH_DELAY_SECONDS = 2.0
 logger = logging.getLogger(__name__)
 
+
+_live_managers: "weakref.WeakSet[ArtifactManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers() -> None:
+    """Compact pending delta entries of every live manager at interpreter exit."""
+    for manager in list(_live_managers):
+        manager.flush_manifest()
+
+
+atexit.register(_flush_live_managers)
+
 @dataclass
 class ArtifactEntry:
     type: str
@@ -72,6 +96,13 @@ class ArtifactManager:
         self.dir = self.rc.artifact_dir(_ARTIFACT_COMPONENT)
         self.manifest_path = self.dir / _MANIFEST_FILENAME
         self._manifest_cache: Dict[str, Any] | None = None
+        # write-behind state (see MANIFEST_INLINE_LIMIT)
+        self._manifest_lock = threading.RLock()
+        self._entry_keys: set[tuple[Optional[str], Optional[str]]] = set()
+        self._duplicate_videos = False
+        self._pending_entries = 0
+        self._flush_timer: threading.Timer | None = None
+        _live_managers.add(self)
         # metrics (process local, thread-safe increments)
         self._metrics_lock = threading.Lock()
         self._video_count = 0
@@ -102,6 +133,7 @@ class ArtifactManager:
                 backup = self.manifest_path.with_suffix(".prev.json")
                 try:
                     self.manifest_path.replace(backup)
+                    delta_path(self.manifest_path).unlink(missing_ok=True)
                 except Exception:  # noqa: BLE001
                     pass
                 # fresh cache; will lazily recreate on first add
@@ -121,17 +153,16 @@ class ArtifactManager:
         try:
             # De-dup: skip if same video already recorded in manifest for this run
             try:
-                manifest = self.get_manifest()
+                self.get_manifest()
                 portable_path = self._to_portable_relpath(final_path)
                 logger.debug(
                     "Video manifest pre-check",
                     extra={
                         "event": "artifact.video.manifest.pre_check",
                         "portable_path": portable_path,
-                        "existing": [a.get("path") for a in manifest.get("artifacts", []) if a.get("type") == "video"],
                     },
                 )
-                if any(a.get("type") == "video" and a.get("path") == portable_path for a in manifest.get("artifacts", [])):
+                if ("video", portable_path) in self._entry_keys:
                     logger.debug(
                         "Video manifest entry already exists; skipping duplicate",
                         extra={
@@ -291,33 +322,92 @@ class ArtifactManager:
 
     # ---------------- Manifest -------------------
     def _load_manifest(self) -> Dict[str, Any]:
-        if self._manifest_cache is not None:
-            return self._manifest_cache
-        if self.manifest_path.exists():
-            try:
-                self._manifest_cache = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        with self._manifest_lock:
+            if self._manifest_cache is not None:
                 return self._manifest_cache
-            except Exception:
-                pass
-        self._manifest_cache = {
-            "schema": "artifact-manifest-v2",
-            "run_id": self.rc.run_id_base,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "artifacts": [],
-        }
-        return self._manifest_cache
+            data = read_manifest(self.manifest_path)
+            if data is None:
+                data = {
+                    "schema": "artifact-manifest-v2",
+                    "run_id": self.rc.run_id_base,
+                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "artifacts": [],
+                }
+            self._set_manifest_cache(data)
+            return data
+
+    def _set_manifest_cache(self, data: Dict[str, Any]) -> None:
+        """Install ``data`` as the cache and rebuild the path-keyed entry index."""
+        self._manifest_cache = data
+        self._entry_keys = set()
+        self._duplicate_videos = False
+        for artifact in data.get("artifacts", []):
+            self._index_entry(artifact)
+        # Entries replayed from a delta log left by an earlier process need compaction
+        self._pending_entries = 1 if delta_path(self.manifest_path).exists() else 0
+
+    def _index_entry(self, artifact: Dict[str, Any]) -> None:
+        key = (artifact.get("type"), artifact.get("path"))
+        if key[0] == "video" and key in self._entry_keys:
+            self._duplicate_videos = True
+        self._entry_keys.add(key)
 
     def _persist_manifest(self) -> None:
-        data = self._load_manifest()
-        data["generated_at"] = datetime.now(timezone.utc).isoformat()
-        tmp = self.manifest_path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        tmp.replace(self.manifest_path)
+        """Atomically rewrite the manifest (compacting any delta log)."""
+        with self._manifest_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            data = self._load_manifest()
+            data["generated_at"] = datetime.now(timezone.utc).isoformat()
+            tmp = self.manifest_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp.replace(self.manifest_path)
+            delta_path(self.manifest_path).unlink(missing_ok=True)
+            self._pending_entries = 0
+        # Keep the artifact listing catalog in step without a rescan (no-op if none exists)
+        notify_manifest_written(self.manifest_path, data)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(MANIFEST_FLUSH_DELAY_SECONDS, self._flush_from_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._manifest_lock:
+            self._flush_timer = None
+        try:
+            self.flush_manifest()
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "Deferred manifest flush failed",
+                extra={"event": "artifact.manifest.flush_fail", "error": repr(e)},
+            )
 
     def add_entry(self, entry: ArtifactEntry) -> None:
-        manifest = self._load_manifest()
-        manifest["artifacts"].append(asdict(entry))
-        self._persist_manifest()
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            row = asdict(entry)
+            manifest["artifacts"].append(row)
+            self._index_entry(row)
+            if len(manifest["artifacts"]) <= MANIFEST_INLINE_LIMIT and not self._pending_entries:
+                self._persist_manifest()
+                return
+            try:
+                append_delta(self.manifest_path, row)
+            except OSError as e:
+                logger.debug(f"Manifest delta append failed, rewriting manifest: {e}")
+                self._persist_manifest()
+                return
+            self._pending_entries += 1
+            self._schedule_flush()
+
+    def flush_manifest(self) -> None:
+        """Compact pending delta entries into manifest_v2.json (no-op when nothing is pending)."""
+        with self._manifest_lock:
+            if self._pending_entries and self._manifest_cache is not None:
+                self._persist_manifest()
 
     # ---------------- Accessors (Issue #35 helper) -------------------
     def get_manifest(self, reload: bool = False) -> Dict[str, Any]:
@@ -327,19 +417,28 @@ class ArtifactManager:
         Safe for tests and lightweight listing API (#36) to inspect without
         mutating state.
         """
-        if reload and self.manifest_path.exists():
-            try:
-                data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
-                self._manifest_cache = data
-                return data
-            except Exception:  # noqa: BLE001
-                pass
+        if reload:
+            with self._manifest_lock:
+                data = read_manifest(self.manifest_path)
+                if data is not None:
+                    self._set_manifest_cache(data)
+                    return data
         return self._load_manifest()
 
     def persist_manifest(self) -> None:
         """Persist the current manifest to disk (public API for external updates)"""
         self._persist_manifest()
 
+    def update_manifest(self, mutator: Callable[[Dict[str, Any]], None]) -> None:
+        """Apply ``mutator`` to the manifest and persist it under the manifest lock.
+
+        Prefer this over ``get_manifest()`` + ``persist_manifest()`` when updating
+        from another thread, so the mutation cannot race a concurrent write.
+        """
+        with self._manifest_lock:
+            mutator(self._load_manifest())
+            self._persist_manifest()
+
     # ---------------- Video Handling (#30) -------------------
     def register_video_file(self, video_path: Path) -> Path:
         """Register a video artifact. Optionally transcode to target container.
@@ -398,27 +497,23 @@ class ArtifactManager:
     def _dedupe_video_entries(self) -> None:
         if not self._should_write_manifest():
             return
-        manifest = self.get_manifest()
-        artifacts = manifest.get("artifacts", [])
-        seen: set[str] = set()
-        changed = False
-        deduped: List[Dict[str, Any]] = []
-        for a in artifacts:
-            if a.get("type") == "video":
-                key = a.get("path")
-                if key in seen:
-                    changed = True
-                    continue
-                seen.add(key)
-            deduped.append(a)
-        if changed:
+        with self._manifest_lock:
+            manifest = self.get_manifest()
+            # The entry index flags duplicates as they are loaded/added; no scan otherwise
+            if not self._duplicate_videos:
+                return
+            seen: set[str] = set()
+            deduped: List[Dict[str, Any]] = []
+            for a in manifest.get("artifacts", []):
+                if a.get("type") == "video":
+                    key = a.get("path")
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                deduped.append(a)
             manifest["artifacts"] = deduped
-            # persist directly (bypass cache interference)
-            tmp = self.manifest_path.with_suffix(".tmp")
-            tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
-            tmp.replace(self.manifest_path)
-            # refresh cache to stay consistent
-            self._manifest_cache = manifest
+            self._set_manifest_cache(manifest)
+            self._persist_manifest()
 
     def get_video_metrics(self) -> Dict[str, int]:
         with self._metrics_lock:
@@ -495,13 +590,9 @@ class ArtifactManager:
         root = get_artifacts_base_dir() / "runs"
         manifests: List[Dict[str, Any]] = []
         for p in sorted(root.glob("*-art"), reverse=True):
-            m = p / _MANIFEST_FILENAME
-            if m.exists():
-                try:
-                    data = json.loads(m.read_text(encoding="utf-8"))
-                    manifests.append(data)
-                except Exception:
-                    continue
+            data = read_manifest(p / _MANIFEST_FILENAME)
+            if data is not None:
+                manifests.append(data)
             if limit and len(manifests) >= limit:
                 break
         return manifests
@@ -539,6 +630,8 @@ def get_artifact_manager() -> ArtifactManager:
 def reset_artifact_manager_singleton() -> None:  # pragma: no cover - test helper
     """Reset the module-level ArtifactManager singleton (testing/support only)."""
     global _default_manager
+    if _default_manager is not None:
+        _default_manager.flush_manifest()
     _default_manager = None
 
 __all__ = [
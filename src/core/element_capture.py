@@ -11,6 +11,9 @@ Minimal Scope per Issue #34:
   - Path traversal safe label -> sanitized filename (<label>.txt)
   - Metrics hook (increment elements count) via ArtifactManager manifest count
 
+Extract commands use async_extract_batch(page, specs) to read every selector and
+field in one page.evaluate round trip and persist each result with capture_batch_result.
+
 Out of Scope (future Issues #35 / #58): structured JSON merging, metrics exporter integration.
 """
 from __future__ import annotations
@@ -201,6 +204,125 @@ async def _collect_async_fields(
     return collected
 
 
+# Single round trip for every selector/field of an extract command. Returns one
+# columnar entry per spec: {"count", "preview", "content_count", "text"?, "value"?, "html"?}
+# or {"error"} when the selector is not plain CSS/XPath (Playwright-only engines).
+# Playwright's CSS engine also matches inside open shadow roots while
+# document.querySelectorAll does not, so once the page has any open shadow root
+# CSS selectors are matched per tree (host first, then its shadow content).
+_BATCH_EXTRACT_JS = """
+(specs) => {
+  const shadowRoots = [];
+  const collectRoots = (root) => {
+    for (const el of root.querySelectorAll('*')) {
+      if (el.shadowRoot) {
+        shadowRoots.push(el.shadowRoot);
+        collectRoots(el.shadowRoot);
+      }
+    }
+  };
+  collectRoots(document);
+  const deepQuery = (root, s, acc) => {
+    for (const el of root.querySelectorAll('*')) {
+      if (el.matches(s)) acc.push(el);
+      if (el.shadowRoot) deepQuery(el.shadowRoot, s, acc);
+    }
+    return acc;
+  };
+  return specs.map(({selector, fields}) => {
+    let nodes;
+    try {
+      const s = selector.startsWith('css=') ? selector.slice(4) : selector;
+      if (s.startsWith('xpath=') || s.startsWith('//') || s.startsWith('(//') || s.startsWith('..')) {
+        const snap = document.evaluate(s.startsWith('xpath=') ? s.slice(6) : s, document, null,
+                                       XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        nodes = [];
+        for (let i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+      } else {
+        nodes = shadowRoots.length ? deepQuery(document, s, []) : Array.from(document.querySelectorAll(s));
+      }
+    } catch (e) {
+      return {error: String(e)};
+    }
+    const out = {count: nodes.length, preview: [], content_count: 0};
+    for (const el of nodes) {
+      const t = (el.textContent || '').trim();
+      if (t) {
+        out.content_count++;
+        if (out.preview.length < 3) out.preview.push(t);
+      }
+    }
+    if (fields.includes('text')) out.text = nodes.map(el => el instanceof HTMLElement ? el.innerText : null);
+    if (fields.includes('value')) out.value = nodes.map(el =>
+      (el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement || el instanceof HTMLSelectElement) ? el.value : null);
+    if (fields.includes('html')) out.html = nodes.map(el => el instanceof Element ? el.innerHTML : null);
+    return out;
+  });
+}
+"""
+
+
+async def async_extract_batch(page, specs: List[dict]) -> Optional[List[dict]]:
+    """Extract every ``{"selector", "fields"}`` spec with a single ``page.evaluate``.
+
+    Args:
+        page: Playwright async Page
+        specs: One entry per selector; ``fields`` is a subset of ['text', 'value', 'html']
+
+    Returns:
+        Columnar results aligned with ``specs`` (entries may carry ``error`` for
+        selectors that need Playwright's own engines), or None if the evaluate failed.
+    """
+    payload = [
+        {"selector": spec["selector"], "fields": sorted({f.lower() for f in (spec.get("fields") or ["text"])})}
+        for spec in specs
+    ]
+    try:
+        results = await page.evaluate(_BATCH_EXTRACT_JS, payload)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"element_capture.batch_fail selectors={len(specs)} err={type(e).__name__}:{e}")
+        return None
+    if not isinstance(results, list) or len(results) != len(specs):
+        return None
+    return results
+
+
+def _collect_batch_fields(result: dict, selector: str, normalized_fields: set[str]) -> List[str]:
+    collected: List[str] = []
+    count = result.get("count", 0)
+    multi = count > 1
+    for index in range(count):
+        for field_name, _, skip_blank, multiline in _ASYNC_FIELD_CONFIG:
+            if field_name not in normalized_fields:
+                continue
+            column = result.get(field_name) or []
+            value = column[index] if index < len(column) else None
+            if value is None:
+                _log_field_failure(field_name, selector, index, ValueError(f"{field_name} not available"), async_mode=True)
+                continue
+            if field_name == "text":
+                value = value.strip()
+            if skip_blank and not value:
+                continue
+            _append_entry(collected, field_name.upper(), index, multi, value, multiline)
+    return collected
+
+
+def capture_batch_result(result: dict, selector: str, label: str, fields: Optional[List[str]] = None) -> Optional[Path]:
+    """Persist one :func:`async_extract_batch` entry like :func:`async_capture_element_value`."""
+    fields = fields or ["text"]
+    safe_label = _sanitize_label(label)
+    try:
+        if not result.get("count"):
+            logger.warning(f"element_capture.async_no_match selector={selector}")
+            return None
+        collected = _collect_batch_fields(result, selector, {field.lower() for field in fields})
+        return _persist_capture(collected, selector, safe_label)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"element_capture.batch_fail selector={selector} err={type(e).__name__}:{e}")
+        return None
+
+
 def capture_element_value(page, selector: str, label: str, fields: Optional[List[str]] = None) -> Optional[Path]:
     """Capture specified element value aspects and persist as a text artifact.
 
@@ -247,4 +369,4 @@ async def async_capture_element_value(page, selector: str, label: str, fields: O
         logger.warning(f"element_capture.async_fail selector={selector} err={type(e).__name__}:{e}")
         return None
 
-__all__ = ["capture_element_value", "async_capture_element_value"]
+__all__ = ["capture_element_value", "async_capture_element_value", "async_extract_batch", "capture_batch_result"]
@@ -0,0 +1,94 @@
+"""Write-behind delta log for ``manifest_v2.json``.
+
+Large runs append new manifest entries to ``manifest_v2.delta.jsonl`` (one JSON
+object per line) instead of re-serializing the whole manifest on every
+capture; ArtifactManager compacts the log back into the manifest on a timer
+and at run end. Readers that open the manifest file directly should go
+through :func:`read_manifest`, which replays any pending delta entries.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DELTA_SUFFIX = ".delta.jsonl"
+_RUN_DIR_SUFFIX = "-art"
+
+
+def delta_path(manifest_path: Path) -> Path:
+    """``<run>-art/manifest_v2.json`` -> ``<run>-art/manifest_v2.delta.jsonl``."""
+    return manifest_path.with_suffix(DELTA_SUFFIX)
+
+
+def entry_key(entry: Dict[str, Any]) -> tuple:
+    """Identity of a manifest entry, used to skip entries already compacted."""
+    return entry.get("type"), entry.get("path"), entry.get("created_at")
+
+
+def append_delta(manifest_path: Path, entry: Dict[str, Any]) -> None:
+    """Append one manifest entry to the delta log."""
+    with open(delta_path(manifest_path), "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def read_delta(manifest_path: Path) -> List[Dict[str, Any]]:
+    """Return pending delta entries; a torn trailing line (crash mid-write) is ignored."""
+    try:
+        lines = delta_path(manifest_path).read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+    entries = []
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            logger.debug(f"Skipping corrupt manifest delta line in {manifest_path.parent}")
+            continue
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+def merge_delta(data: Dict[str, Any], entries: List[Dict[str, Any]]) -> int:
+    """Append ``entries`` not yet present in ``data``; returns the number added."""
+    artifacts = data.setdefault("artifacts", [])
+    seen = {entry_key(a) for a in artifacts}
+    added = 0
+    for entry in entries:
+        key = entry_key(entry)
+        if key in seen:
+            continue
+        seen.add(key)
+        artifacts.append(entry)
+        added += 1
+    return added
+
+
+def read_manifest(manifest_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a manifest including pending delta entries; None if neither exists or parses."""
+    data: Optional[Dict[str, Any]] = None
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+    entries = read_delta(manifest_path)
+    if data is None:
+        if not entries:
+            return None
+        data = {
+            "schema": "artifact-manifest-v2",
+            "run_id": manifest_path.parent.name.replace(_RUN_DIR_SUFFIX, ""),
+            "artifacts": [],
+        }
+    if entries:
+        merge_delta(data, entries)
+    return data
+
+
+__all__ = ["DELTA_SUFFIX", "delta_path", "append_delta", "read_delta", "merge_delta", "read_manifest"]
@@ -4,25 +4,46 @@ Implements production JSONL logging with:
     - Component based singleton acquisition (`JsonlLogger.get(component)`)
     - Structured event emission (level, msg, component, seq, ts, run_id_base, extra fields)
     - Hook pipeline (mutate / enrich / drop) – hooks return dict or raise to abort
-    - File rotation (max size bytes) & retention (keep N rotated files)
+    - File rotation (max size bytes / max age) & retention (keep N rotated files)
+    - Optional background gzip compression of rotated segments with a sidecar index
     - Thread-safe append (per component lock)
 
 Environment overrides:
     BYKILT_LOG_MAX_SIZE: int (bytes)   – default 1_000_000 (~1MB)
     BYKILT_LOG_MAX_FILES: int          – number of *rotated* files to keep (default 5)
+    BYKILT_LOG_ROTATE_SECONDS: int     – also rotate once the active file is this old (default: off)
+    BYKILT_LOG_COMPRESS: str           – "gzip" to compress rotated segments in the background (default "none")
     BYKILT_LOG_FLUSH_ALWAYS: bool-like – if truthy, flush+fsync on every write (slower; default false)
+    BYKILT_LOG_ASYNC: bool-like        – if truthy, hand lines to a background writer thread (default false;
+                                         ignored when BYKILT_LOG_FLUSH_ALWAYS is set)
+    BYKILT_LOG_ASYNC_BATCH_BYTES: int  – async mode: flush once this many bytes are queued (default 65536)
+    BYKILT_LOG_ASYNC_FLUSH_MS: int     – async mode: flush queued lines at least this often (default 200)
     LOG_LEVEL: str                     – minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL) – default INFO
 
 Rotation scheme:
     active: app.log.jsonl
     rotated: app.log.jsonl.1 (most recent), app.log.jsonl.2 ...
-    When size > max_size after a write, rotation occurs before next write.
+    When size > max_size (or the file is older than BYKILT_LOG_ROTATE_SECONDS)
+    after a write, rotation occurs before next write.
+
+    With BYKILT_LOG_COMPRESS=gzip the numbered chain is replaced by timestamped
+    segments (app.log.jsonl.<UTC stamp>.gz + .idx.json sidecar); the caller only
+    renames the active file and compression happens in the background
+    (see ``src.logging.log_segments``).
 
 Retention:
-    Oldest file index > max_files is deleted.
+    Oldest file index > max_files is deleted (oldest segments beyond max_files
+    when compressing).
+
+Write modes:
+    sync (default)  – open/append/close per record, visible on disk when the call returns
+    durable         – BYKILT_LOG_FLUSH_ALWAYS; sync plus fsync per record
+    async           – BYKILT_LOG_ASYNC; callers only enqueue the encoded line. A writer
+                      thread keeps the file open and writes/flushes in batches; call
+                      ``flush()`` to wait for queued lines (done automatically at exit).
 
 Design choices:
-    - Simplicity over compression (no gzip yet; future enhancement issue)
+    - Compression is opt-in so the plain numbered files stay the default layout
     - Size check performed *after* write to avoid double encoding overhead
     - Timestamp in UTC ISO8601 with 'Z'
 
@@ -36,12 +57,18 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, Any, ClassVar, Optional
 import threading
+import atexit
 import json
 import os
+import queue
+import sys
+import time
+import weakref
 from datetime import datetime, timezone
 import io
 
 from src.runtime.run_context import RunContext
+from src.logging.log_segments import COMPRESSION_MODES, flush_segment_compression, rotate_to_segment
 from src.security.secret_masker import mask_text, mask_dict, is_masking_enabled
 
 Hook = Callable[[dict], dict]
@@ -64,6 +91,168 @@ _CANONICAL_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 _DEFAULT_LOG_LEVEL = 20  # INFO level
 _DEFAULT_LOG_LEVEL_NAME = "INFO"  # Default level name
 
+_DEFAULT_ASYNC_BATCH_BYTES = 64 * 1024
+_DEFAULT_ASYNC_FLUSH_MS = 200
+
+
+class _AsyncSink:
+    """Background writer that batches encoded lines into a kept-open file.
+
+    Rotation follows the synchronous path: after a line pushes the file past
+    ``max_size`` the file is closed, rotated and reopened.
+    """
+
+    _STOP = object()
+
+    def __init__(self, component: str, file_path: Path, max_size: int, max_files: int,
+                 batch_bytes: int, flush_interval: float, policy: "_RotationPolicy"):
+        self.file_path = file_path
+        self.max_size = max_size
+        self.max_files = max_files
+        self.policy = policy
+        self._segment_started: Optional[float] = None
+        self.batch_bytes = batch_bytes
+        self.flush_interval = flush_interval
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._error_reported = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"jsonl-writer-{component}", daemon=True)
+        self._thread.start()
+        _async_sinks.add(self)
+
+    def submit(self, data: bytes) -> bool:
+        """Queue a line; False once the sink is closed (caller writes synchronously)."""
+        if self._closed:
+            return False
+        self._queue.put(data)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every line queued so far is written; False on timeout."""
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        fh: Optional[io.BufferedWriter] = None
+        pending: list[bytes] = []
+        pending_bytes = 0
+        deadline = 0.0
+        while True:
+            try:
+                if pending:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                else:
+                    item = self._queue.get()
+            except queue.Empty:
+                item = None  # flush interval elapsed
+
+            if isinstance(item, bytes):
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+                pending_bytes += len(item)
+                if pending_bytes < self.batch_bytes:
+                    continue
+
+            if pending:
+                fh = self._write_batch(fh, pending)
+                pending = []
+                pending_bytes = 0
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                if fh is not None:
+                    fh.close()
+                return
+
+    def _write_batch(self, fh: Optional[io.BufferedWriter], lines: list[bytes]) -> Optional[io.BufferedWriter]:
+        try:
+            for data in lines:
+                if fh is None:
+                    self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                    fh = open(self.file_path, "ab")
+                if self._segment_started is None:
+                    self._segment_started = time.time()
+                fh.write(data)
+                if fh.tell() > self.max_size or self.policy.expired(self._segment_started):
+                    fh.close()
+                    fh = None
+                    self._segment_started = None
+                    self.policy.rotate(self.file_path, self.max_files)
+            if fh is not None:
+                fh.flush()
+        except OSError as e:  # pragma: no cover - disk errors must not kill the writer
+            if not self._error_reported:
+                self._error_reported = True
+                print(f"JsonlLogger async writer error for {self.file_path}: {e}", file=sys.stderr)
+            if fh is not None:
+                try:
+                    fh.close()
+                except OSError:
+                    pass
+            fh = None
+        return fh
+
+
+_async_sinks: "weakref.WeakSet[_AsyncSink]" = weakref.WeakSet()
+
+
+def _close_async_sinks() -> None:
+    for sink in list(_async_sinks):
+        sink.close(timeout=5.0)
+
+
+atexit.register(_close_async_sinks)
+
+
+@dataclass(frozen=True, slots=True)
+class _RotationPolicy:
+    compress: str = "none"
+    rotate_seconds: int = 0  # 0 disables age-based rotation
+
+    @classmethod
+    def from_env(cls) -> "_RotationPolicy":
+        compress = (os.getenv("BYKILT_LOG_COMPRESS") or "none").strip().lower()
+        if compress not in COMPRESSION_MODES:
+            compress = "none"
+        return cls(compress=compress, rotate_seconds=_get_env_int("BYKILT_LOG_ROTATE_SECONDS", 0))
+
+    def expired(self, segment_started: Optional[float]) -> bool:
+        return bool(self.rotate_seconds) and segment_started is not None \
+            and time.time() - segment_started >= self.rotate_seconds
+
+    def rotate(self, fp: Path, max_files: int) -> None:
+        if self.compress == "gzip":
+            rotate_to_segment(fp, max_files)
+        else:
+            _rotate_files(fp, max_files)
+
+
+def _create_async_sink(component: str, file_path: Path, policy: _RotationPolicy) -> Optional[_AsyncSink]:
+    """Return a background sink when async mode is enabled (durable mode wins)."""
+    if not _get_env_bool("BYKILT_LOG_ASYNC", False) or _get_env_bool("BYKILT_LOG_FLUSH_ALWAYS", False):
+        return None
+    return _AsyncSink(
+        component,
+        file_path,
+        max_size=_get_env_int("BYKILT_LOG_MAX_SIZE", 1_000_000),
+        max_files=_get_env_int("BYKILT_LOG_MAX_FILES", 5),
+        batch_bytes=_get_env_int("BYKILT_LOG_ASYNC_BATCH_BYTES", _DEFAULT_ASYNC_BATCH_BYTES),
+        flush_interval=_get_env_int("BYKILT_LOG_ASYNC_FLUSH_MS", _DEFAULT_ASYNC_FLUSH_MS) / 1000,
+        policy=policy,
+    )
+
+
 @dataclass(slots=True)
 class _LoggerCore:
     component: str
@@ -72,6 +261,17 @@ class _LoggerCore:
     seq: int = 0
     # Each core gets its own lock (avoid shared dataclass default instance)
     lock: threading.Lock = field(default_factory=threading.Lock)
+    # Background writer (async mode only)
+    sink: Optional[_AsyncSink] = None
+    policy: _RotationPolicy = field(default_factory=_RotationPolicy)
+    # Wall-clock time of the first write to the active file (age-based rotation)
+    segment_started: Optional[float] = None
+
+    @classmethod
+    def create(cls, component: str, file_path: Path) -> "_LoggerCore":
+        policy = _RotationPolicy.from_env()
+        return cls(component=component, file_path=file_path, policy=policy,
+                   sink=_create_async_sink(component, file_path, policy))
 
 class JsonlLogger:
     _instances: ClassVar[dict[str, "JsonlLogger"]] = {}
@@ -166,11 +366,10 @@ class JsonlLogger:
                 except Exception:
                     existing_parent = None
                 if existing_parent != category_dir:
-                    core = _LoggerCore(component=normalized, file_path=file_path)
-                    cls._instances[cache_key] = JsonlLogger(core)
+                    existing.close(timeout=0)
+                    cls._instances[cache_key] = JsonlLogger(_LoggerCore.create(normalized, file_path))
             else:
-                core = _LoggerCore(component=normalized, file_path=file_path)
-                cls._instances[cache_key] = JsonlLogger(core)
+                cls._instances[cache_key] = JsonlLogger(_LoggerCore.create(normalized, file_path))
 
             return cls._instances[cache_key]
 
@@ -224,12 +423,17 @@ class JsonlLogger:
             self._append_line(line)
 
     def _append_line(self, line: str) -> None:
+        sink = self._c.sink
+        if sink is not None and sink.submit((line + "\n").encode("utf-8")):
+            return
         max_size = _get_env_int("BYKILT_LOG_MAX_SIZE", 1_000_000)
         max_files = _get_env_int("BYKILT_LOG_MAX_FILES", 5)
         flush_always = _get_env_bool("BYKILT_LOG_FLUSH_ALWAYS", False)
         fp = self._c.file_path
         fp.parent.mkdir(parents=True, exist_ok=True)
         encoded = (line + "\n").encode("utf-8")
+        if self._c.segment_started is None:
+            self._c.segment_started = time.time()
         with open(fp, "ab") as f:
             f.write(encoded)
             if flush_always:
@@ -238,43 +442,14 @@ class JsonlLogger:
         # Rotation check AFTER write
         try:
             size = fp.stat().st_size
-            if size > max_size:
+            if size > max_size or self._c.policy.expired(self._c.segment_started):
                 self._rotate_files(max_files)
         except FileNotFoundError:  # pragma: no cover - race unlikely
             return
 
     def _rotate_files(self, max_files: int) -> None:
-        fp = self._c.file_path
-        if not fp.exists():
-            return
-        # Delete the oldest if it'll overflow window
-        oldest = fp.with_name(fp.name + f".{max_files}")
-        if oldest.exists():
-            try:
-                oldest.unlink()
-            except OSError:  # pragma: no cover - ignore
-                pass
-        # Shift indexes up: .(n) -> .(n+1). Use range including max_files to avoid off-by-one.
-        # Example max_files=5:
-        #   delete .5 (above) then move .4->.5 .3->.4 .2->.3 .1->.2 active->.1
-        for idx in range(max_files, 0, -1):
-            if idx == 1:
-                # active file will be moved after loop
-                continue
-            src = fp.with_name(fp.name + f".{idx-1}")
-            dst = fp.with_name(fp.name + f".{idx}")
-            if src.exists():
-                try:
-                    src.replace(dst)
-                except OSError:  # pragma: no cover
-                    pass
-        # Move active -> .1
-        try:
-            fp.replace(fp.with_name(fp.name + ".1"))
-            # Create a fresh empty active file so callers always see an existing path
-            fp.touch(exist_ok=True)
-        except OSError:  # pragma: no cover
-            return
+        self._c.segment_started = None
+        self._c.policy.rotate(self._c.file_path, max_files)
 
     # Public level helpers
     def debug(self, msg: str, **extra: Any) -> None:
@@ -297,6 +472,21 @@ class JsonlLogger:
         """Register a pipeline hook (order preserved)."""
         self._c.hooks.append(hook)
 
+    # ------------- Async writer control -------------
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued lines (async mode) and pending segments are on disk."""
+        sink = self._c.sink
+        done = sink.flush(timeout) if sink is not None else True
+        if self._c.policy.compress != "none":
+            done = flush_segment_compression(timeout) and done
+        return done
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush and stop the background writer (async mode); no-op otherwise."""
+        sink = self._c.sink
+        if sink is not None:
+            sink.close(timeout)
+
     # ------------- Introspection -------------
     @property
     def file_path(self) -> Path:
@@ -314,6 +504,39 @@ def _design_phase_ping() -> bool:
     return True  # kept for backward compatibility with existing tests
 
 
+def _rotate_files(fp: Path, max_files: int) -> None:
+    if not fp.exists():
+        return
+    # Delete the oldest if it'll overflow window
+    oldest = fp.with_name(fp.name + f".{max_files}")
+    if oldest.exists():
+        try:
+            oldest.unlink()
+        except OSError:  # pragma: no cover - ignore
+            pass
+    # Shift indexes up: .(n) -> .(n+1). Use range including max_files to avoid off-by-one.
+    # Example max_files=5:
+    #   delete .5 (above) then move .4->.5 .3->.4 .2->.3 .1->.2 active->.1
+    for idx in range(max_files, 0, -1):
+        if idx == 1:
+            # active file will be moved after loop
+            continue
+        src = fp.with_name(fp.name + f".{idx-1}")
+        dst = fp.with_name(fp.name + f".{idx}")
+        if src.exists():
+            try:
+                src.replace(dst)
+            except OSError:  # pragma: no cover
+                pass
+    # Move active -> .1
+    try:
+        fp.replace(fp.with_name(fp.name + ".1"))
+        # Create a fresh empty active file so callers always see an existing path
+        fp.touch(exist_ok=True)
+    except OSError:  # pragma: no cover
+        return
+
+
 # ---- Helpers ----
 def _get_env_int(name: str, default: int) -> int:
     v = os.getenv(name)
@@ -0,0 +1,206 @@
+"""Compressed log segments for JsonlLogger rotation (Issue #57 follow-up)
+
+When compression is enabled, rotation no longer shifts a numbered chain of
+files. The active file is renamed once to a timestamped ``.pending`` segment
+and a background thread then:
+
+    1. gzip-compresses it to ``app.log.jsonl.<UTC stamp>.gz``
+    2. writes a sidecar index ``<segment>.gz.idx.json`` with first/last ``ts``,
+       ``seq`` range, line count and per-level counts
+    3. deletes the oldest segments beyond ``max_files``
+
+The caller only pays for a single rename. Pending segments left behind by a
+crash are picked up by the next rotation in the same directory.
+"""
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PENDING_SUFFIX = ".pending"
+SEGMENT_SUFFIX = ".gz"
+INDEX_SUFFIX = ".idx.json"
+
+COMPRESSION_MODES = {"none", "gzip"}
+
+
+def _segment_name(fp: Path) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    candidate = fp.with_name(f"{fp.name}.{stamp}{PENDING_SUFFIX}")
+    counter = 1
+    while candidate.exists() or candidate.with_name(candidate.name[:-len(PENDING_SUFFIX)] + SEGMENT_SUFFIX).exists():
+        candidate = fp.with_name(f"{fp.name}.{stamp}-{counter}{PENDING_SUFFIX}")
+        counter += 1
+    return candidate
+
+
+def _segment_order(fp: Path, path: Path, suffix: str) -> Tuple[str, int]:
+    """Sort key (stamp, collision counter) for ``<fp.name>.<stamp>[-<n>]<suffix>``.
+
+    Plain name order would put ``<stamp>-1`` before ``<stamp>`` ('-' < '.').
+    """
+    label = path.name[len(fp.name) + 1:len(path.name) - len(suffix)]
+    stamp, _, counter = label.partition("-")
+    return stamp, int(counter) if counter.isdigit() else 0
+
+
+def rotate_to_segment(fp: Path, max_files: int) -> Optional[Path]:
+    """Move the active file aside and queue it for compression.
+
+    Returns the pending segment path, or None if there was nothing to rotate.
+    """
+    if not fp.exists():
+        return None
+    pending = _segment_name(fp)
+    try:
+        fp.replace(pending)
+        # Create a fresh empty active file so callers always see an existing path
+        fp.touch(exist_ok=True)
+    except OSError:  # pragma: no cover
+        return None
+    _compressor().submit(fp, max_files)
+    return pending
+
+
+def list_segments(fp: Path) -> List[Path]:
+    """Return compressed segments for an active log file, oldest first."""
+    return sorted(fp.parent.glob(f"{fp.name}.*{SEGMENT_SUFFIX}"),
+                  key=lambda path: _segment_order(fp, path, SEGMENT_SUFFIX))
+
+
+def read_segment_index(segment: Path) -> Optional[Dict[str, Any]]:
+    """Return the sidecar index of a compressed segment, if present."""
+    try:
+        with open(segment.with_name(segment.name + INDEX_SUFFIX), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def flush_segment_compression(timeout: Optional[float] = None) -> bool:
+    """Wait for queued segments to be compressed; False on timeout."""
+    if _instance is None:
+        return True
+    return _instance.flush(timeout)
+
+
+def _compress_segment(pending: Path) -> Path:
+    """Compress a pending segment and write its sidecar index."""
+    segment = pending.with_name(pending.name[:-len(PENDING_SUFFIX)] + SEGMENT_SUFFIX)
+    tmp = segment.with_name(segment.name + ".tmp")
+    index: Dict[str, Any] = {
+        "segment": segment.name,
+        "first_ts": None,
+        "last_ts": None,
+        "first_seq": None,
+        "last_seq": None,
+        "lines": 0,
+        "levels": {},
+        "raw_bytes": 0,
+    }
+    with open(pending, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+        for raw in src:
+            dst.write(raw)
+            index["raw_bytes"] += len(raw)
+            index["lines"] += 1
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            ts, seq, level = record.get("ts"), record.get("seq"), record.get("level")
+            if ts is not None:
+                index["first_ts"] = index["first_ts"] or ts
+                index["last_ts"] = ts
+            if isinstance(seq, int):
+                index["first_seq"] = seq if index["first_seq"] is None else min(index["first_seq"], seq)
+                index["last_seq"] = seq if index["last_seq"] is None else max(index["last_seq"], seq)
+            if level:
+                index["levels"][level] = index["levels"].get(level, 0) + 1
+    tmp.replace(segment)
+    index["compressed_bytes"] = segment.stat().st_size
+
+    index_path = segment.with_name(segment.name + INDEX_SUFFIX)
+    index_tmp = index_path.with_name(index_path.name + ".tmp")
+    with open(index_tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    index_tmp.replace(index_path)
+    pending.unlink()
+    return segment
+
+
+def _apply_retention(fp: Path, max_files: int) -> None:
+    segments = list_segments(fp)
+    for segment in segments[:max(0, len(segments) - max_files)]:
+        for path in (segment, segment.with_name(segment.name + INDEX_SUFFIX)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class _SegmentCompressor:
+    """Single background thread compressing rotated segments in order."""
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="jsonl-segment-compressor", daemon=True)
+        self._thread.start()
+
+    def submit(self, fp: Path, max_files: int) -> None:
+        self._queue.put((fp, max_files))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            fp, max_files = item
+            try:
+                # Also picks up segments left pending by an earlier crash
+                pending_segments = sorted(fp.parent.glob(f"{fp.name}.*{PENDING_SUFFIX}"),
+                                          key=lambda path: _segment_order(fp, path, PENDING_SUFFIX))
+                for pending in pending_segments:
+                    _compress_segment(pending)
+                _apply_retention(fp, max_files)
+            except Exception as e:  # pragma: no cover - never kill the compressor thread
+                print(f"JsonlLogger segment compression failed for {fp}: {e}", file=sys.stderr)
+
+
+_instance: Optional[_SegmentCompressor] = None
+_instance_lock = threading.Lock()
+
+
+def _compressor() -> _SegmentCompressor:
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = _SegmentCompressor()
+    return _instance
+
+
+atexit.register(flush_segment_compression, 10.0)
+
+
+__all__ = [
+    "COMPRESSION_MODES",
+    "rotate_to_segment",
+    "list_segments",
+    "read_segment_index",
+    "flush_segment_compression",
+]
@@ -190,5 +190,8 @@ from .collector import (
     get_system_metrics,
     record_system_metrics,
     MetricValue,
-    MetricSeries
+    MetricSeries,
+    LabelSchema,
+    AggregatedMetric,
+    Exemplar
 )
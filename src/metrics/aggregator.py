@@ -2,47 +2,86 @@
 Metrics aggregation helpers (Issue #59: Run Metrics API)
 
 Provides basic summaries for numeric metric series, including percentiles.
+Large series are summarized from mergeable quantile sketches.
 """
 from __future__ import annotations
 
-from typing import Dict, Optional, List
+from array import array
+from bisect import bisect_left
+from typing import Dict, Optional
 
 import math
 
-from .collector import MetricSeries, MetricValue, MetricType
+from .collector import MetricSeries, MetricType
+from .sketch import QuantileSketch
+
+# Series up to this many points are summarized exactly by sorting
+EXACT_SUMMARY_MAX_POINTS = 10_000
 
 
 def _filtered_values(series: MetricSeries, since_seconds: Optional[int] = None,
-                     tags_filter: Optional[Dict[str, str]] = None) -> List[MetricValue]:
-    values = series.get_values(tags_filter)
-    if since_seconds is not None and since_seconds > 0:
-        cutoff = (values[-1].timestamp.timestamp() - since_seconds) if len(values) > 0 else 0
-        values = [v for v in values if v.timestamp.timestamp() >= cutoff]
+                     tags_filter: Optional[Dict[str, str]] = None) -> array:
+    timestamps, values = series.get_arrays(tags_filter)
+    if since_seconds is not None and since_seconds > 0 and len(timestamps) > 0:
+        # Timestamps are appended in order, so the window is a suffix
+        start = bisect_left(timestamps, timestamps[-1] - since_seconds)
+        values = values[start:]
     return values
 
 
+def _empty_summary(metric_type: MetricType) -> Dict[str, float]:
+    return {
+        "count": 0,
+        "min": 0.0,
+        "max": 0.0,
+        "avg": 0.0,
+        "p50": 0.0,
+        "p90": 0.0,
+        "p95": 0.0,
+        "p99": 0.0,
+        "type": metric_type.value,
+    }
+
+
+def summarize_sketch(sketch: QuantileSketch, metric_type: MetricType) -> Dict[str, float]:
+    """Build a summary dict from a (possibly merged) quantile sketch."""
+    if not sketch.count:
+        return _empty_summary(metric_type)
+    return {
+        "count": sketch.count,
+        "min": sketch.min,
+        "max": sketch.max,
+        "avg": sketch.avg,
+        "p50": sketch.quantile(0.50),
+        "p90": sketch.quantile(0.90),
+        "p95": sketch.quantile(0.95),
+        "p99": sketch.quantile(0.99),
+        "type": metric_type.value,
+    }
+
+
 def compute_summary(series: MetricSeries, *, since_seconds: Optional[int] = None,
-                    tags_filter: Optional[Dict[str, str]] = None) -> Dict[str, float]:
+                    tags_filter: Optional[Dict[str, str]] = None,
+                    exact: Optional[bool] = None) -> Dict[str, float]:
     """Compute summary statistics for a metric series.
 
     For TIMER/HISTOGRAM/GAUGE metrics, returns min/max/avg and percentiles.
     For COUNTER, treats each value as a unit event and reports count only.
+
+    ``exact=None`` sorts the raw values for series of up to
+    EXACT_SUMMARY_MAX_POINTS points and otherwise reads percentiles from the
+    series' quantile sketches (within 1% relative error); ``exact=True`` or
+    ``exact=False`` forces either mode.
     """
-    vals = _filtered_values(series, since_seconds, tags_filter)
-    numeric = [float(v.value) for v in vals]
+    if exact is None:
+        exact = len(series) <= EXACT_SUMMARY_MAX_POINTS
+    if not exact:
+        return summarize_sketch(series.get_sketch(tags_filter, since_seconds), series.metric_type)
+
+    numeric = _filtered_values(series, since_seconds, tags_filter)
 
     if not numeric:
-        return {
-            "count": 0,
-            "min": 0.0,
-            "max": 0.0,
-            "avg": 0.0,
-            "p50": 0.0,
-            "p90": 0.0,
-            "p95": 0.0,
-            "p99": 0.0,
-            "type": series.metric_type.value,
-        }
+        return _empty_summary(series.metric_type)
 
     n = len(numeric)
     s_min = min(numeric)
@@ -71,4 +110,4 @@ def compute_summary(series: MetricSeries, *, since_seconds: Optional[int] = None
     }
 
 
-__all__ = ["compute_summary"]
+__all__ = ["compute_summary", "summarize_sketch", "EXACT_SUMMARY_MAX_POINTS"]
@@ -8,15 +8,21 @@ system performance, job execution statistics, and custom metrics.
 import time
 import psutil
 import threading
-from typing import Dict, List, Optional, Any, Callable
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import json
 import csv
+import logging
 import os
 from pathlib import Path
 
+from .sketch import QuantileSketch
+
+logger = logging.getLogger(__name__)
+
 
 class MetricType(Enum):
     """Types of metrics that can be collected."""
@@ -46,57 +52,401 @@ class MetricValue:
         }
 
 
+# Maximum number of points retained per series; the oldest point is
+# overwritten once a series is full, independent of max_age_seconds.
+DEFAULT_SERIES_CAPACITY = 100_000
+
+# Width of the time buckets used for per-series quantile sketches
+DEFAULT_SKETCH_INTERVAL_SECONDS = 60
+
+# Distinct tag sets tracked with their own sketch per bucket; beyond this a
+# bucket keeps only its untagged sketch and filtered summaries use the points
+MAX_TAGGED_SKETCHES_PER_BUCKET = 32
+
+TagKey = Tuple[Tuple[str, str], ...]
+
+
 @dataclass
 class MetricSeries:
-    """Time series data for a specific metric."""
+    """Time series data for a specific metric.
+
+    Points are stored in ring buffers of float64 timestamps and values
+    (``array('d')``) with tag sets interned to integer ids, so appending a
+    value is amortized O(1). Points older than ``max_age_seconds`` are evicted
+    from the head of the buffer on insert.
+
+    Each value is also folded into one untagged quantile sketch per
+    ``sketch_interval_seconds`` time bucket, so large series can be
+    summarized without sorting (see ``get_sketch``). Buckets additionally keep
+    a sketch per tag set for up to ``MAX_TAGGED_SKETCHES_PER_BUCKET`` tag
+    sets; high-cardinality tags (e.g. ``job_id``) switch the bucket to the
+    exact path for filtered summaries, so memory stays bounded.
+    """
     name: str
     metric_type: MetricType
-    values: List[MetricValue] = field(default_factory=list)
     max_age_seconds: int = 3600  # 1 hour default retention
+    capacity: int = DEFAULT_SERIES_CAPACITY
+    sketch_interval_seconds: int = DEFAULT_SKETCH_INTERVAL_SECONDS
+    _timestamps: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+    _values: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+    _tag_ids: array = field(default_factory=lambda: array('l'), init=False, repr=False)
+    _start: int = field(default=0, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    _tag_sets: List[Dict[str, str]] = field(default_factory=list, init=False, repr=False)
+    _tag_index: Dict[TagKey, int] = field(default_factory=dict, init=False, repr=False)
+    _sketches: Dict[int, QuantileSketch] = field(default_factory=dict, init=False, repr=False)
+    # bucket -> per tag set sketches, or None once the bucket exceeded the tag-set limit
+    _tagged_sketches: Dict[int, Optional[Dict[TagKey, QuantileSketch]]] = field(
+        default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if self.sketch_interval_seconds <= 0:
+            raise ValueError("sketch_interval_seconds must be positive")
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def values(self) -> List[MetricValue]:
+        """All retained values, oldest first (materialized on access)."""
+        return self.get_values()
 
     def add_value(self, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """Add a new value to the series."""
-        metric_value = MetricValue(
-            name=self.name,
-            value=value,
-            timestamp=datetime.now(),
-            tags=tags or {},
-            metric_type=self.metric_type
-        )
-        self.values.append(metric_value)
-        self._cleanup_old_values()
+        now = time.time()
+        value = float(value)
+        key: TagKey = tuple(sorted(tags.items())) if tags else ()
+        with self._lock:
+            self._evict_older_than(now - self.max_age_seconds)
+            self._append(now, value, self._intern_tags(key))
+            bucket = int(now // self.sketch_interval_seconds)
+            sketch = self._sketches.get(bucket)
+            if sketch is None:
+                sketch = self._sketches[bucket] = QuantileSketch()
+                self._tagged_sketches[bucket] = {}
+            sketch.add(value)
+            if key:
+                self._add_tagged(bucket, key, value)
+
+    def _add_tagged(self, bucket: int, key: TagKey, value: float) -> None:
+        tagged = self._tagged_sketches.get(bucket)
+        if tagged is None:
+            return
+        sketch = tagged.get(key)
+        if sketch is None:
+            if len(tagged) >= MAX_TAGGED_SKETCHES_PER_BUCKET:
+                self._tagged_sketches[bucket] = None
+                return
+            sketch = tagged[key] = QuantileSketch()
+        sketch.add(value)
+
+    def _intern_tags(self, key: TagKey) -> int:
+        tag_id = self._tag_index.get(key)
+        if tag_id is None:
+            if len(self._tag_sets) >= 2 * self.capacity:
+                self._compact_tags()
+            tag_id = len(self._tag_sets)
+            self._tag_sets.append(dict(key))
+            self._tag_index[key] = tag_id
+        return tag_id
+
+    def _compact_tags(self) -> None:
+        """Drop interned tag sets no longer referenced by a retained point."""
+        remap: Dict[int, int] = {}
+        tag_sets: List[Dict[str, str]] = []
+        tag_index: Dict[TagKey, int] = {}
+        for pos in self._positions():
+            old_id = self._tag_ids[pos]
+            new_id = remap.get(old_id)
+            if new_id is None:
+                new_id = remap[old_id] = len(tag_sets)
+                tag_set = self._tag_sets[old_id]
+                tag_sets.append(tag_set)
+                tag_index[tuple(sorted(tag_set.items()))] = new_id
+            self._tag_ids[pos] = new_id
+        self._tag_sets, self._tag_index = tag_sets, tag_index
+
+    def _append(self, timestamp: float, value: float, tag_id: int) -> None:
+        size = len(self._timestamps)
+        if size < self.capacity:
+            # Growing: live points occupy [start, size), reclaim the evicted prefix lazily
+            if self._start and self._start >= size // 2:
+                for buf in (self._timestamps, self._values, self._tag_ids):
+                    del buf[:self._start]
+                self._start = 0
+            self._timestamps.append(timestamp)
+            self._values.append(value)
+            self._tag_ids.append(tag_id)
+            self._count += 1
+            return
+
+        if self._count == size:
+            # Full: overwrite the oldest point
+            pos = self._start
+            self._start = (self._start + 1) % size
+        else:
+            pos = (self._start + self._count) % size
+            self._count += 1
+        self._timestamps[pos] = timestamp
+        self._values[pos] = value
+        self._tag_ids[pos] = tag_id
+
+    def _evict_older_than(self, cutoff: float) -> None:
+        """Remove values older than max_age_seconds."""
+        # Sketch buckets go once every value they could hold is past the cutoff
+        while self._sketches:
+            oldest = next(iter(self._sketches))
+            if (oldest + 1) * self.sketch_interval_seconds > cutoff:
+                break
+            del self._sketches[oldest]
+            self._tagged_sketches.pop(oldest, None)
+
+        size = len(self._timestamps)
+        while self._count and self._timestamps[self._start] <= cutoff:
+            self._start = (self._start + 1) % size
+            self._count -= 1
+        if not self._count and size:
+            self._clear_buffers()
 
     def _cleanup_old_values(self) -> None:
         """Remove values older than max_age_seconds."""
-        cutoff_time = datetime.now().timestamp() - self.max_age_seconds
-        self.values = [
-            v for v in self.values
-            if v.timestamp.timestamp() > cutoff_time
-        ]
+        with self._lock:
+            self._evict_older_than(time.time() - self.max_age_seconds)
+
+    def _clear_buffers(self) -> None:
+        self._timestamps = array('d')
+        self._values = array('d')
+        self._tag_ids = array('l')
+        self._start = 0
+        self._count = 0
+        self._tag_sets.clear()
+        self._tag_index.clear()
+
+    def _positions(self) -> Iterator[int]:
+        size = len(self._timestamps)
+        for i in range(self._count):
+            yield (self._start + i) % size
+
+    def _matching_tag_ids(self, tags_filter: Optional[Dict[str, str]]) -> Optional[Set[int]]:
+        if not tags_filter:
+            return None
+        return {
+            tag_id for tag_id, tags in enumerate(self._tag_sets)
+            if all(tags.get(k) == filter_value for k, filter_value in tags_filter.items())
+        }
+
+    def get_arrays(self, tags_filter: Optional[Dict[str, str]] = None) -> Tuple[array, array]:
+        """Return ``(timestamps, values)`` as float64 arrays, oldest first.
+
+        Timestamps are POSIX seconds. This avoids materializing MetricValue
+        objects and is what the aggregator works on.
+        """
+        with self._lock:
+            tag_ids = self._matching_tag_ids(tags_filter)
+            if tag_ids is None:
+                end = self._start + self._count
+                size = len(self._timestamps)
+                if end <= size:
+                    return self._timestamps[self._start:end], self._values[self._start:end]
+                wrap = end - size
+                return (self._timestamps[self._start:] + self._timestamps[:wrap],
+                        self._values[self._start:] + self._values[:wrap])
+
+            timestamps, values = array('d'), array('d')
+            for pos in self._positions():
+                if self._tag_ids[pos] in tag_ids:
+                    timestamps.append(self._timestamps[pos])
+                    values.append(self._values[pos])
+            return timestamps, values
+
+    def get_sketch(self, tags_filter: Optional[Dict[str, str]] = None,
+                   since_seconds: Optional[int] = None) -> QuantileSketch:
+        """Return a merged quantile sketch of the matching values.
+
+        ``since_seconds`` is measured back from the newest value and is
+        resolved at ``sketch_interval_seconds`` granularity. Unfiltered
+        sketches merge one sketch per bucket and also cover values that the
+        ring buffer already overwrote at capacity but that are still within
+        ``max_age_seconds``. Filtered sketches come from the retained points
+        when a bucket in range exceeded ``MAX_TAGGED_SKETCHES_PER_BUCKET``.
+        """
+        merged = QuantileSketch()
+        with self._lock:
+            if not self._sketches:
+                return merged
+            first_bucket = None
+            if since_seconds is not None and since_seconds > 0:
+                newest = max(self._sketches) * self.sketch_interval_seconds
+                if self._count:
+                    newest = self._timestamps[(self._start + self._count - 1) % len(self._timestamps)]
+                first_bucket = int((newest - since_seconds) // self.sketch_interval_seconds)
+            buckets = [b for b in self._sketches if first_bucket is None or b >= first_bucket]
+
+            if not tags_filter:
+                for bucket in buckets:
+                    merged.merge(self._sketches[bucket])
+                return merged
+
+            if any(self._tagged_sketches.get(bucket) is None for bucket in buckets):
+                # High-cardinality tags: exact path over the retained points
+                tag_ids = self._matching_tag_ids(tags_filter)
+                cutoff = first_bucket * self.sketch_interval_seconds if first_bucket is not None else None
+                for pos in self._positions():
+                    if self._tag_ids[pos] in tag_ids and (cutoff is None or self._timestamps[pos] >= cutoff):
+                        merged.add(self._values[pos])
+                return merged
+
+            matches: Dict[TagKey, bool] = {}
+            for bucket in buckets:
+                for key, sketch in self._tagged_sketches[bucket].items():
+                    matched = matches.get(key)
+                    if matched is None:
+                        tags = dict(key)
+                        matched = matches[key] = all(
+                            tags.get(k) == filter_value for k, filter_value in tags_filter.items()
+                        )
+                    if matched:
+                        merged.merge(sketch)
+        return merged
+
+    def _make_value(self, pos: int) -> MetricValue:
+        return MetricValue(
+            name=self.name,
+            value=self._values[pos],
+            timestamp=datetime.fromtimestamp(self._timestamps[pos]),
+            tags=dict(self._tag_sets[self._tag_ids[pos]]),
+            metric_type=self.metric_type
+        )
 
     def get_values(self, tags_filter: Optional[Dict[str, str]] = None) -> List[MetricValue]:
         """Get values, optionally filtered by tags."""
-        if not tags_filter:
-            return self.values.copy()
-
-        return [
-            v for v in self.values
-            if all(v.tags.get(k) == filter_value for k, filter_value in tags_filter.items())
-        ]
+        with self._lock:
+            tag_ids = self._matching_tag_ids(tags_filter)
+            return [
+                self._make_value(pos) for pos in self._positions()
+                if tag_ids is None or self._tag_ids[pos] in tag_ids
+            ]
 
     def get_latest_value(self, tags_filter: Optional[Dict[str, str]] = None) -> Optional[MetricValue]:
         """Get the most recent value."""
-        values = self.get_values(tags_filter)
-        return values[-1] if values else None
+        with self._lock:
+            tag_ids = self._matching_tag_ids(tags_filter)
+            size = len(self._timestamps)
+            for i in range(self._count - 1, -1, -1):
+                pos = (self._start + i) % size
+                if tag_ids is None or self._tag_ids[pos] in tag_ids:
+                    return self._make_value(pos)
+            return None
 
 
-class MetricsCollector:
-    """Core metrics collection and storage manager."""
+# Distinct values a label may take within one metric before the cardinality
+# guard folds it into exemplars
+DEFAULT_MAX_LABEL_VALUES = 100
+
+# Distinct label sets pre-aggregated per metric; further sets share an overflow entry
+DEFAULT_MAX_LABEL_SETS = 1000
+
+OVERFLOW_LABEL = "__overflow__"
+
+
+@dataclass(frozen=True)
+class LabelSchema:
+    """Labels kept on a metric; any other label is folded into exemplars."""
+    labels: Tuple[str, ...]
+
+    def split(self, tags: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Split tags into (kept labels, exemplar labels)."""
+        kept = {k: v for k, v in tags.items() if k in self.labels}
+        folded = {k: v for k, v in tags.items() if k not in self.labels}
+        return kept, folded
+
+
+# Job metrics carry job_id for traceability only; it is kept as an exemplar
+DEFAULT_LABEL_SCHEMAS: Dict[str, LabelSchema] = {
+    "job_status": LabelSchema(("run_id", "batch_id", "status")),
+    "job_duration_seconds": LabelSchema(("run_id", "batch_id", "status")),
+    "job_errors": LabelSchema(("run_id", "batch_id", "error_type")),
+    "job.status_change": LabelSchema(("run_id", "status")),
+    "job.status": LabelSchema(("run_id",)),
+}
+
+
+@dataclass
+class Exemplar:
+    """A sample's folded high-cardinality labels (e.g. job_id)."""
+    labels: Dict[str, str]
+    value: float
+    timestamp: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"labels": self.labels, "value": self.value,
+                "timestamp": datetime.fromtimestamp(self.timestamp).isoformat()}
 
-    def __init__(self, storage_path: Optional[str] = None):
+
+@dataclass
+class AggregatedMetric:
+    """Pre-aggregated state for one metric and label set.
+
+    COUNTERs keep count/sum, HISTOGRAMs and TIMERs additionally keep a
+    quantile sketch, and GAUGEs keep the last value. Only the most recent
+    exemplar is retained, so memory does not grow with the number of samples.
+    """
+    labels: Dict[str, str]
+    metric_type: MetricType
+    count: int = 0
+    sum: float = 0.0
+    last_value: Optional[float] = None
+    sketch: Optional[QuantileSketch] = None
+    exemplar: Optional[Exemplar] = None
+
+    def observe(self, value: float, timestamp: float, exemplar_labels: Optional[Dict[str, str]] = None) -> None:
+        self.count += 1
+        self.sum += value
+        self.last_value = value
+        if self.metric_type in (MetricType.HISTOGRAM, MetricType.TIMER):
+            if self.sketch is None:
+                self.sketch = QuantileSketch()
+            self.sketch.add(value)
+        if exemplar_labels:
+            self.exemplar = Exemplar(exemplar_labels, value, timestamp)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"labels": self.labels, "count": self.count, "sum": self.sum}
+        if self.metric_type == MetricType.GAUGE:
+            data["value"] = self.last_value
+        if self.sketch is not None:
+            data.update({f"p{q}": self.sketch.quantile(q / 100) for q in (50, 90, 95, 99)})
+        if self.exemplar is not None:
+            data["exemplar"] = self.exemplar.to_dict()
+        return data
+
+
+class MetricsCollector:
+    """Core metrics collection and storage manager.
+
+    Samples are stored in per-metric series and also pre-aggregated per label
+    set. Labels outside a metric's registered LabelSchema, and labels that
+    exceed ``max_label_values`` distinct values, are removed from the stored
+    tags and kept only as exemplars, so the number of label sets (and
+    therefore memory and export time) stays bounded.
+    """
+
+    def __init__(self, storage_path: Optional[str] = None,
+                 max_label_values: int = DEFAULT_MAX_LABEL_VALUES,
+                 max_label_sets: int = DEFAULT_MAX_LABEL_SETS):
         self.series: Dict[str, MetricSeries] = {}
         self.storage_path = Path(storage_path) if storage_path else None
+        self.max_label_values = max_label_values
+        self.max_label_sets = max_label_sets
         self._lock = threading.Lock()
+        self._label_lock = threading.Lock()
+        self._schemas: Dict[str, LabelSchema] = dict(DEFAULT_LABEL_SCHEMAS)
+        self._aggregates: Dict[str, Dict[TagKey, AggregatedMetric]] = {}
+        self._label_values: Dict[str, Dict[str, Set[str]]] = {}
+        self._folded_labels: Dict[str, Set[str]] = {}
 
         # Create storage directory if specified
         if self.storage_path:
@@ -121,12 +471,74 @@ class MetricsCollector:
                 self.series[name] = MetricSeries(name, metric_type, max_age_seconds=max_age_seconds)
             return self.series[name]
 
+    def register_label_schema(self, name: str, labels: Iterable[str]) -> None:
+        """Restrict metric ``name`` to ``labels``; other labels become exemplars."""
+        with self._label_lock:
+            self._schemas[name] = LabelSchema(tuple(labels))
+
     def record_metric(self, name: str, value: float,
                      tags: Optional[Dict[str, str]] = None,
                      metric_type: MetricType = MetricType.GAUGE) -> None:
         """Record a metric value."""
         series = self.get_or_create_series(name, metric_type)
-        series.add_value(value, tags)
+        with self._label_lock:
+            labels, exemplar_labels = self._apply_label_policy(name, tags or {})
+            aggregate = self._get_aggregate(name, series.metric_type, labels, exemplar_labels)
+            aggregate.observe(float(value), time.time(), exemplar_labels)
+        series.add_value(value, labels)
+
+    def _apply_label_policy(self, name: str, tags: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Split tags into stored labels and exemplar-only labels."""
+        schema = self._schemas.get(name)
+        if schema is not None:
+            return schema.split(tags)
+
+        folded = self._folded_labels.setdefault(name, set())
+        seen = self._label_values.setdefault(name, {})
+        labels: Dict[str, str] = {}
+        exemplar_labels: Dict[str, str] = {}
+        for key, value in tags.items():
+            if key not in folded:
+                values = seen.setdefault(key, set())
+                values.add(value)
+                if len(values) <= self.max_label_values:
+                    labels[key] = value
+                    continue
+                folded.add(key)
+                del seen[key]
+                logger.warning(
+                    f"Metric '{name}' label '{key}' exceeded {self.max_label_values} values; "
+                    f"folding it into exemplars"
+                )
+            exemplar_labels[key] = value
+        return labels, exemplar_labels
+
+    def _get_aggregate(self, name: str, metric_type: MetricType, labels: Dict[str, str],
+                       exemplar_labels: Dict[str, str]) -> AggregatedMetric:
+        aggregates = self._aggregates.setdefault(name, {})
+        key: TagKey = tuple(sorted(labels.items()))
+        aggregate = aggregates.get(key)
+        if aggregate is None:
+            if len(aggregates) >= self.max_label_sets:
+                # Too many label sets: share one overflow entry, keep the labels as exemplar
+                exemplar_labels.update(labels)
+                labels.clear()
+                labels[OVERFLOW_LABEL] = "true"
+                key = ((OVERFLOW_LABEL, "true"),)
+                aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregate = aggregates[key] = AggregatedMetric(dict(labels), metric_type)
+        return aggregate
+
+    def get_aggregates(self, name: str) -> List[AggregatedMetric]:
+        """Return the pre-aggregated label sets for a metric."""
+        with self._label_lock:
+            return list(self._aggregates.get(name, {}).values())
+
+    def get_folded_labels(self, name: str) -> Set[str]:
+        """Return labels of ``name`` that the cardinality guard folded into exemplars."""
+        with self._label_lock:
+            return set(self._folded_labels.get(name, set()))
 
     def get_metric_series(self, name: str) -> Optional[MetricSeries]:
         """Get a metric series by name."""
@@ -142,7 +554,8 @@ class MetricsCollector:
         for name, series in self.series.items():
             data[name] = {
                 "type": series.metric_type.value,
-                "values": [v.to_dict() for v in series.values]
+                "values": [v.to_dict() for v in series.values],
+                "aggregates": [a.to_dict() for a in self.get_aggregates(name)]
             }
 
         json_str = json.dumps(data, indent=2, ensure_ascii=False)
@@ -172,7 +585,8 @@ class MetricsCollector:
             base_filepath = "artifacts/metrics"
 
         for name, series in self.series.items():
-            if not series.values:
+            values = series.get_values()
+            if not values:
                 continue
 
             filename = f"{name}.csv"
@@ -187,13 +601,13 @@ class MetricsCollector:
                 # Write header
                 header = ["timestamp", "value"]
                 tag_keys = set()
-                for value in series.values:
+                for value in values:
                     tag_keys.update(value.tags.keys())
                 header.extend(sorted(tag_keys))
                 writer.writerow(header)
 
                 # Write data
-                for value in series.values:
+                for value in values:
                     row = [value.timestamp.isoformat(), value.value]
                     for key in sorted(tag_keys):
                         row.append(value.tags.get(key, ""))
@@ -207,6 +621,10 @@ class MetricsCollector:
         """Clear all metric data."""
         with self._lock:
             self.series.clear()
+        with self._label_lock:
+            self._aggregates.clear()
+            self._label_values.clear()
+            self._folded_labels.clear()
 
 
 # Global metrics collector instance
@@ -304,10 +722,10 @@ def record_job_status(job_id: str, status: str, run_id: Optional[str] = None) ->
         metric_type=MetricType.COUNTER
     )
 
-    # Update job status gauge
+    # Update job status gauge (one series for all jobs; job_id is kept as exemplar)
     status_value = {"pending": 0, "running": 1, "completed": 2, "failed": 3}.get(status, -1)
     collector.record_metric(
-        f"job.{job_id}.status",
+        "job.status",
         status_value,
         tags={"job_id": job_id, "run_id": run_id or ""},
         metric_type=MetricType.GAUGE
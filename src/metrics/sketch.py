@@ -0,0 +1,133 @@
+"""
+Mergeable quantile sketches for metric summaries.
+
+Implements a DDSketch-style sketch: values are counted in logarithmically
+sized buckets so every quantile estimate is within ``relative_accuracy`` of
+the true value. Memory depends on the range of recorded values, not on how
+many were recorded, and two sketches with the same accuracy merge exactly by
+adding bucket counts, which lets summaries be combined across workers.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Optional
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# Magnitudes below this are counted as zero
+_MIN_INDEXABLE = 1e-9
+
+
+class QuantileSketch:
+    """DDSketch-style quantile sketch with relative-error guarantees."""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Record a single value."""
+        value = float(value)
+        if value > _MIN_INDEXABLE:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif value < -_MIN_INDEXABLE:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self._zero += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold ``other`` into this sketch in place and return self."""
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, n in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + n
+        for key, n in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + n
+        self._zero += other._zero
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the estimated value at quantile ``q`` (0..1), or None if empty."""
+        if not self.count:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+
+        rank = q * (self.count - 1)
+        seen = 0
+        # Negative values, most negative first
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+        seen += self._zero
+        if seen > rank:
+            return self._clamp(0.0)
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    @property
+    def avg(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for transport between workers."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": {str(k): n for k, n in self._positive.items()},
+            "negative": {str(k): n for k, n in self._negative.items()},
+            "zero": self._zero,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch produced by ``to_dict``."""
+        sketch = cls(data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY))
+        sketch._positive = {int(k): int(n) for k, n in data.get("positive", {}).items()}
+        sketch._negative = {int(k): int(n) for k, n in data.get("negative", {}).items()}
+        sketch._zero = int(data.get("zero", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
+
+
+__all__ = ["QuantileSketch", "DEFAULT_RELATIVE_ACCURACY"]
@@ -6,13 +6,15 @@ import os
 import tempfile
 from pathlib import Path
 import shutil
+from contextlib import asynccontextmanager
 from src.utils.debug_utils import DebugUtils
 from src.utils.git_script_automator import GitScriptAutomator
 from src.utils.profile_manager import ProfileManager
 from src.utils.browser_launcher import BrowserLauncher
+from src.browser.browser_pool import PoolKey, get_browser_pool
 from src.utils.timeout_manager import get_timeout_manager, TimeoutScope, TimeoutError, CancellationError, TimeoutManager
 from src.core.screenshot_manager import async_capture_page_screenshot
-from src.core.element_capture import async_capture_element_value
+from src.core.element_capture import async_capture_element_value, async_extract_batch, capture_batch_result
 from src.core.artifact_manager import get_artifact_manager
 from src.runtime.run_context import RunContext
 
@@ -102,6 +104,43 @@ def _normalize_extract_entries(options: Dict[str, Any]) -> List[Dict[str, Any]]:
     return normalized
 
 
+def _log_extract_preview(selector: str, label: str, count: int, preview: List[str]) -> None:
+    logger.info(json.dumps({
+        "event": "browser_control.extract",
+        "selector": selector,
+        "label": label,
+        "count": count,
+        "preview": preview[:3],
+    }, ensure_ascii=False))
+
+
+async def _extract_entry_per_element(page, selector: str, label: str, fields: List[str] | None) -> None:
+    """Per-element fallback for selectors the batched evaluate cannot resolve (Playwright-only engines)."""
+    elements = await page.query_selector_all(selector)
+    texts = [await element.text_content() for element in elements]
+    texts = [t.strip() for t in texts if t and t.strip()]
+    _log_extract_preview(selector, label, len(texts), texts)
+
+    try:
+        saved = await async_capture_element_value(
+            page,
+            selector=selector,
+            label=label,
+            fields=fields,
+        )
+        if saved:
+            logger.info(f"Saved element capture: {saved}")
+    except Exception as capture_exc:  # noqa: BLE001
+        logger.warning(
+            "element_capture.async_dispatch_fail",
+            extra={
+                "event": "element_capture.async_dispatch_fail",
+                "selector": selector,
+                "error": repr(capture_exc),
+            },
+        )
+
+
 async def _handle_extract_content(page, timeout_manager: TimeoutManager, cmd: Dict[str, Any], action: Dict[str, Any]) -> bool:
     options = cmd.get("args", [{}])[0] or {}
     normalized = _normalize_extract_entries(options)
@@ -109,6 +148,7 @@ async def _handle_extract_content(page, timeout_manager: TimeoutManager, cmd: Di
     default_fields = options.get("fields")
     label_usage: Dict[str, int] = {}
 
+    targets = []
     for entry in normalized:
         selector = entry.get("selector")
         if not selector:
@@ -117,37 +157,24 @@ async def _handle_extract_content(page, timeout_manager: TimeoutManager, cmd: Di
         count = label_usage.get(base_label, 0)
         label_usage[base_label] = count + 1
         label = base_label if count == 0 else f"{base_label}_{count}"
-        fields = entry.get("fields") or default_fields
-
-        elements = await page.query_selector_all(selector)
-        texts = [await element.text_content() for element in elements]
-        texts = [t.strip() for t in texts if t and t.strip()]
-        logger.info(json.dumps({
-            "event": "browser_control.extract",
-            "selector": selector,
-            "label": label,
-            "count": len(texts),
-            "preview": texts[:3],
-        }, ensure_ascii=False))
+        targets.append((selector, label, entry.get("fields") or default_fields))
+
+    # One page.evaluate for every selector and field of the command
+    results = await async_extract_batch(
+        page, [{"selector": selector, "fields": fields} for selector, _, fields in targets]
+    ) if targets else None
+
+    for index, (selector, label, fields) in enumerate(targets):
+        result = results[index] if results else None
+        # No match may be a shadow-DOM hit only Playwright's selector engine sees
+        if not result or result.get("error") or not result.get("count"):
+            await _extract_entry_per_element(page, selector, label, fields)
+            continue
 
-        try:
-            saved = await async_capture_element_value(
-                page,
-                selector=selector,
-                label=label,
-                fields=fields,
-            )
-            if saved:
-                logger.info(f"Saved element capture: {saved}")
-        except Exception as capture_exc:  # noqa: BLE001
-            logger.warning(
-                "element_capture.async_dispatch_fail",
-                extra={
-                    "event": "element_capture.async_dispatch_fail",
-                    "selector": selector,
-                    "error": repr(capture_exc),
-                },
-            )
+        _log_extract_preview(selector, label, result.get("content_count", 0), result.get("preview") or [])
+        saved = capture_batch_result(result, selector=selector, label=label, fields=fields)
+        if saved:
+            logger.info(f"Saved element capture: {saved}")
     return True
 
 
@@ -489,46 +516,77 @@ async def _execute_browser_operation_impl(action: Dict[str, Any], params: Dict[s
     commands = await convert_flow_to_commands(flow, params)
     logger.info(f"Converted flow to {len(commands)} commands: {json.dumps(commands)}")
 
+    headless = params.get('headless', False)
+
+    # Initialize recording if enabled (correct logical condition)
+    recording_context = None
+    if recording_enabled and resolved_recording_path:
+        from src.utils.recording_factory import RecordingFactory
+
+        run_context = {
+            'run_id': rc.run_id_base,
+            'run_type': 'browser-control',
+            'save_recording_path': str(resolved_recording_path),
+            'enable_recording': True,
+        }
+        recording_context = RecordingFactory.init_recorder(run_context)
+
+    record_video_dir = str(resolved_recording_path) if resolved_recording_path else None
+
+    # Execute with or without recording context
+    video_path: Path | None = None
+    recording_attempted = resolved_recording_path is not None
+
+    if recording_context:
+        async with recording_context:
+            async with _open_browser_context(browser_type, headless, record_video_dir) as context:
+                success, video_path = await _execute_with_context(context, commands, timeout_manager, slowmo, action)
+    else:
+        async with _open_browser_context(browser_type, headless, record_video_dir) as context:
+            success, video_path = await _execute_with_context(context, commands, timeout_manager, slowmo, action)
+
+    video_path = _relocate_video(video_path, resolved_recording_path)
+    _register_video_artifact(video_path, recording_attempted)
+    # Run end: compact any write-behind manifest entries
+    artifact_manager.flush_manifest()
+    return success
+
+
+@asynccontextmanager
+async def _open_browser_context(browser_type: str, headless: bool, record_video_dir: Optional[str]):
+    """Lease a context from the warm browser pool, or cold-launch one when the pool is disabled."""
+    pool = get_browser_pool()
+    if pool is not None:
+        key = PoolKey(browser_type, bool(headless), record_video_dir is not None)
+        logger.info(f"🔍 Executing browser-control with warm pool, browser_type={browser_type}")
+        async with pool.lease(key, record_video_dir=record_video_dir) as context:
+            yield context
+        return
+
     # Use new method: GitScriptAutomator with NEW_METHOD
     automator = GitScriptAutomator(browser_type)
 
     # Create a temporary workspace directory for the automator
     with tempfile.TemporaryDirectory() as temp_workspace:
-        # Execute the commands using the browser context
         logger.info(f"🔍 Executing browser-control with NEW_METHOD, browser_type={browser_type}")
+        async with automator.browser_context(temp_workspace, headless=headless, record_video_dir=record_video_dir) as context:
+            yield context
 
-        # Initialize recording if enabled (correct logical condition)
-        recording_context = None
-        if recording_enabled and resolved_recording_path:
-            from src.utils.recording_factory import RecordingFactory
-
-            run_context = {
-                'run_id': rc.run_id_base,
-                'run_type': 'browser-control',
-                'save_recording_path': str(resolved_recording_path),
-                'enable_recording': True,
-            }
-            recording_context = RecordingFactory.init_recorder(run_context)
-
-        # Use recording context if available
-        context_manager_kwargs = {"headless": params.get('headless', False)}
-        if resolved_recording_path:
-            context_manager_kwargs["record_video_dir"] = str(resolved_recording_path)
 
-        # Execute with or without recording context
-        video_path: Path | None = None
-        recording_attempted = resolved_recording_path is not None
-
-        if recording_context:
-            async with recording_context:
-                async with automator.browser_context(temp_workspace, **context_manager_kwargs) as context:
-                    success, video_path = await _execute_with_context(context, commands, timeout_manager, slowmo, action)
-        else:
-            async with automator.browser_context(temp_workspace, **context_manager_kwargs) as context:
-                success, video_path = await _execute_with_context(context, commands, timeout_manager, slowmo, action)
+def _relocate_video(video_path: Path | None, recording_dir: Path | None) -> Path | None:
+    """Move a video recorded into a pooled profile workspace to the requested recording directory."""
+    if not video_path or not recording_dir or not video_path.exists():
+        return video_path
+    if video_path.resolve().parent == recording_dir.resolve():
+        return video_path
+    try:
+        target = recording_dir / video_path.name
+        shutil.move(str(video_path), str(target))
+        return target
+    except OSError as move_exc:
+        logger.warning("video.relocate_fail %s", move_exc)
+        return video_path
 
-        _register_video_artifact(video_path, recording_attempted)
-        return success
 
 async def _execute_with_context(context, commands: List[Dict[str, Any]], timeout_manager: TimeoutManager, slowmo: int, action: Dict[str, Any]) -> Tuple[bool, Path | None]:
     page = None
@@ -0,0 +1,213 @@
+"""Persistent, mtime-aware recordings index (Issue #303 follow-up).
+
+The recursive scanner used to walk and stat the whole tree on every call.
+``RecordingsIndex`` keeps a SQLite database at ``<root>/.recordings_index.sqlite3``
+with one row per file and one row per directory:
+
+- ``refresh()`` stats every known directory and only re-lists the ones whose
+  mtime changed (new, renamed or deleted entries change the parent mtime);
+- files modified within ``HOT_WINDOW_SECONDS`` are re-stat'ed on each refresh,
+  since a recording that is still being written grows without touching its
+  directory;
+- ``query()`` reads ``ORDER BY mtime DESC`` from an index, so a page costs
+  O(offset + limit) instead of a full walk.
+
+Hidden files (including the index itself) are ignored, as in the scanner.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".recordings_index.sqlite3"
+
+# Files newer than this are re-stat'ed on refresh (recordings still being written)
+HOT_WINDOW_SECONDS = 60.0
+# Directory mtimes this close to "now" may hide a same-tick change; rescan them next time
+_UNSETTLED_DIR_SECONDS = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    rel TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    subdirs TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    rel TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    suffix TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    hot INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_files_mtime ON files(mtime DESC, rel);
+CREATE INDEX IF NOT EXISTS idx_files_dir ON files(dir);
+CREATE INDEX IF NOT EXISTS idx_files_hot ON files(hot) WHERE hot = 1;
+"""
+
+
+class RecordingsIndex:
+    """
+    Incremental file index for one recordings root.
+
+    Example:
+        ```python
+        index = RecordingsIndex.for_root(Path("artifacts/runs").resolve())
+        index.refresh()
+        rows = index.query({".webm", ".mp4"}, limit=50, offset=0)  # [(path, size, mtime)]
+        ```
+    """
+
+    _instances: Dict[Path, "RecordingsIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: Path, clock=time.time):
+        self.root = Path(root)
+        self.path = self.root / INDEX_FILENAME
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def for_root(cls, root: Path) -> "RecordingsIndex":
+        """Return the shared index for an already-resolved root."""
+        with cls._instances_lock:
+            index = cls._instances.get(root)
+            if index is None:
+                index = cls._instances[root] = cls(root)
+            return index
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---------------- Refresh -------------------
+    def _list_dir(self, rel: str, now: float) -> Tuple[List[str], List[tuple]]:
+        """Return (subdir names, file rows) for one directory."""
+        subdirs: List[str] = []
+        rows: List[tuple] = []
+        with os.scandir(self.root / rel) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                        continue
+                    if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                        continue
+                    stats = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:  # vanished mid-scan
+                    continue
+                rows.append((
+                    f"{rel}/{entry.name}" if rel else entry.name,
+                    rel,
+                    os.path.splitext(entry.name)[1].lower(),
+                    stats.st_size,
+                    stats.st_mtime,
+                    int(now - stats.st_mtime < HOT_WINDOW_SECONDS),
+                ))
+        return subdirs, rows
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index in line with the filesystem.
+
+        Returns:
+            Dict[str, int]: Number of ``rescanned`` and ``removed`` directories
+        """
+        now = self._clock()
+        with self._lock:
+            conn = self._connect()
+            known = {
+                rel: (mtime_ns, json.loads(subdirs))
+                for rel, mtime_ns, subdirs in conn.execute("SELECT rel, mtime_ns, subdirs FROM dirs")
+            }
+            seen = set()
+            rescanned = 0
+            with conn:
+                stack = [""]
+                while stack:
+                    rel = stack.pop()
+                    try:
+                        mtime_ns = os.stat(self.root / rel).st_mtime_ns
+                    except (FileNotFoundError, NotADirectoryError):
+                        continue
+                    seen.add(rel)
+                    cached = known.get(rel)
+                    if cached is not None and cached[0] == mtime_ns:
+                        subdirs = cached[1]
+                    else:
+                        try:
+                            subdirs, rows = self._list_dir(rel, now)
+                        except (FileNotFoundError, NotADirectoryError):
+                            seen.discard(rel)
+                            continue
+                        rescanned += 1
+                        if now - mtime_ns / 1e9 < _UNSETTLED_DIR_SECONDS:
+                            mtime_ns = -1
+                        conn.execute("DELETE FROM files WHERE dir = ?", (rel,))
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO files(rel, dir, suffix, size, mtime, hot) VALUES (?, ?, ?, ?, ?, ?)",
+                            rows,
+                        )
+                        conn.execute(
+                            "INSERT OR REPLACE INTO dirs(rel, mtime_ns, subdirs) VALUES (?, ?, ?)",
+                            (rel, mtime_ns, json.dumps(subdirs)),
+                        )
+                    stack.extend(f"{rel}/{name}" if rel else name for name in subdirs)
+
+                removed = [rel for rel in known if rel not in seen]
+                conn.executemany("DELETE FROM dirs WHERE rel = ?", ((rel,) for rel in removed))
+                conn.executemany("DELETE FROM files WHERE dir = ?", ((rel,) for rel in removed))
+                self._refresh_hot_files(conn, now)
+        return {"rescanned": rescanned, "removed": len(removed)}
+
+    def _refresh_hot_files(self, conn: sqlite3.Connection, now: float) -> None:
+        for rel, in conn.execute("SELECT rel FROM files WHERE hot = 1").fetchall():
+            try:
+                stats = os.stat(self.root / rel, follow_symlinks=False)
+            except FileNotFoundError:
+                conn.execute("DELETE FROM files WHERE rel = ?", (rel,))
+                continue
+            conn.execute(
+                "UPDATE files SET size = ?, mtime = ?, hot = ? WHERE rel = ?",
+                (stats.st_size, stats.st_mtime, int(now - stats.st_mtime < HOT_WINDOW_SECONDS), rel),
+            )
+
+    # ---------------- Query -------------------
+    def query(self, extensions: Iterable[str], *, limit: int, offset: int) -> List[Tuple[Path, int, float]]:
+        """Return ``(path, size_bytes, mtime)`` newest first; ``limit=0`` returns nothing."""
+        suffixes = sorted(extensions)
+        if limit <= 0 or not suffixes:
+            return []
+        placeholders = ", ".join("?" for _ in suffixes)
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT rel, size, mtime FROM files WHERE suffix IN ({placeholders})"
+                " ORDER BY mtime DESC, rel LIMIT ? OFFSET ?",
+                (*suffixes, limit, offset),
+            ).fetchall()
+        return [(self.root / rel, size, mtime) for rel, size, mtime in rows]
+
+
+__all__ = ["RecordingsIndex", "INDEX_FILENAME", "HOT_WINDOW_SECONDS"]
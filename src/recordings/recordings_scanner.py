@@ -4,6 +4,10 @@ Provides a flag-gated iterator that walks `artifacts/runs` (or a caller
 specified root) to collect video artifacts safely without loading the entire
  tree into memory. The newest recordings are returned first and callers can
 page through results via `limit` and `offset`.
+
+Recursive scans are served from a persistent index (``recordings_index``)
+that only re-lists directories whose mtime changed; the full walk remains as
+a fallback when the index cannot be used (e.g. read-only root).
 """
 
 from __future__ import annotations
@@ -11,11 +15,13 @@ from __future__ import annotations
 from itertools import islice
 import logging
 import os
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Sequence
 
 from src.config.feature_flags import FeatureFlags
+from src.recordings.recordings_index import RecordingsIndex
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +97,14 @@ def scan_recordings(
     if not FeatureFlags.is_enabled(_FLAG_RECURSIVE_SCAN):
         return _scan_flat(root_resolved, extensions, limit=limit, offset=offset)
 
+    try:
+        return _scan_indexed(root_resolved, extensions, limit=limit, offset=offset)
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning(
+            "Recordings index unavailable, walking the tree",
+            extra={"event": "recordings.scan.index_unavailable", "root": str(root_resolved), "error": str(exc)},
+        )
+
     return _scan_recursive(
         root_resolved,
         extensions,
@@ -100,6 +114,15 @@ def scan_recordings(
     )
 
 
+def _scan_indexed(root: Path, extensions: set[str], *, limit: int, offset: int) -> Iterator[RecordingItem]:
+    # Subdirectories are never followed through symlinks, so everything the
+    # index sees stays under the (already whitelisted) resolved root.
+    index = RecordingsIndex.for_root(root)
+    index.refresh()
+    rows = index.query(extensions, limit=limit, offset=offset)
+    return iter([RecordingItem(path=path, size_bytes=size, modified_at=mtime) for path, size, mtime in rows])
+
+
 def _scan_flat(root: Path, extensions: set[str], *, limit: int, offset: int) -> Iterator[RecordingItem]:
     candidates: list[RecordingItem] = []
 
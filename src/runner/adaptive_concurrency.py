@@ -0,0 +1,192 @@
+"""
+Adaptive concurrency limit for QueueManager.
+
+A fixed ``max_concurrency`` is either too low (idle host) or too high (headless
+Chromium sessions exhaust memory long before CPU). ``AdaptiveConcurrencyController``
+adjusts the limit with AIMD (additive increase, multiplicative decrease):
+
+- decrease by ``decrease_factor`` when the host is under memory/CPU pressure,
+  the recent failure rate is too high, or recent run times drift well above
+  the long-term baseline;
+- increase by ``increase_step`` when the queue is using every slot and none of
+  the above applies.
+
+Host signals come from ``src.utils.memory_monitor``. The limit changes live;
+running items are never interrupted, a lower limit only delays new starts.
+"""
+
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ResourceProbe = Callable[[], Dict[str, Any]]
+
+
+@dataclass
+class AdaptiveConcurrencyConfig:
+    """Tuning knobs for AdaptiveConcurrencyController (``runner.adaptive_concurrency``)."""
+    min_limit: int = 1
+    max_limit: int = 16
+    increase_step: int = 1
+    decrease_factor: float = 0.7
+    # Recent median run time above baseline * latency_tolerance counts as congestion
+    latency_tolerance: float = 2.0
+    max_failure_rate: float = 0.3
+    # Completed runs considered for failure rate / recent latency
+    window_size: int = 20
+    min_samples: int = 5
+    # Host limits (memory pressure "high"/"critical" from MemoryMonitor always decreases)
+    cpu_high_percent: float = 90.0
+    max_rss_mb: Optional[float] = None
+    # Minimum time between two limit changes
+    adjust_interval_seconds: float = 5.0
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "AdaptiveConcurrencyConfig":
+        """Build from a config mapping, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+
+def _memory_monitor_probe() -> Dict[str, Any]:
+    """Default probe: memory pressure, CPU and process-tree RSS from MemoryMonitor."""
+    try:
+        from src.utils.memory_monitor import memory_monitor
+    except ImportError as e:  # psutil missing
+        logger.debug(f"Memory monitor unavailable, adaptive concurrency uses run results only: {e}")
+        return {}
+    status = memory_monitor.get_memory_status()
+    status.update(memory_monitor.get_resource_usage())
+    return status
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD controller for a live concurrency limit.
+
+    Example:
+        ```python
+        controller = AdaptiveConcurrencyController(initial_limit=3)
+        controller.record_result(run_time=12.5, success=True)
+        new_limit = controller.adjust(active=3)
+        ```
+    """
+
+    def __init__(self, initial_limit: int, config: Optional[AdaptiveConcurrencyConfig] = None,
+                 resource_probe: Optional[ResourceProbe] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.config = config or AdaptiveConcurrencyConfig()
+        if self.config.min_limit < 1 or self.config.max_limit < self.config.min_limit:
+            raise ValueError("Adaptive concurrency requires 1 <= min_limit <= max_limit")
+        self._probe = resource_probe or _memory_monitor_probe
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = self._clamp(initial_limit)
+        self._results: deque = deque(maxlen=self.config.window_size)
+        self._baseline: Optional[float] = None
+        self._last_adjust = float("-inf")
+        self.last_reason = "initial"
+
+    def _clamp(self, value: int) -> int:
+        return max(self.config.min_limit, min(self.config.max_limit, int(value)))
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, value: int) -> int:
+        """Manually override the current limit (still clamped to min/max)."""
+        with self._lock:
+            self._limit = self._clamp(value)
+            self.last_reason = "manual"
+            return self._limit
+
+    def record_result(self, run_time: Optional[float], success: bool) -> None:
+        """Record a finished run."""
+        with self._lock:
+            self._results.append((run_time, success))
+            if success and run_time is not None:
+                # Slow-moving baseline of healthy run times
+                self._baseline = run_time if self._baseline is None else 0.95 * self._baseline + 0.05 * run_time
+
+    def _congestion_reason(self, resources: Dict[str, Any]) -> Optional[str]:
+        cfg = self.config
+        if resources.get("pressure_level") in ("high", "critical") or resources.get("is_low_memory"):
+            return f"memory pressure {resources.get('used_percent', 0):.0f}%"
+        if cfg.max_rss_mb and resources.get("rss_mb", 0) > cfg.max_rss_mb:
+            return f"rss {resources['rss_mb']}MB > {cfg.max_rss_mb}MB"
+        if resources.get("cpu_percent", 0) >= cfg.cpu_high_percent:
+            return f"cpu {resources['cpu_percent']:.0f}%"
+
+        if len(self._results) >= cfg.min_samples:
+            failures = sum(1 for _, ok in self._results if not ok)
+            if failures / len(self._results) > cfg.max_failure_rate:
+                return f"failure rate {failures}/{len(self._results)}"
+            run_times = [rt for rt, ok in self._results if ok and rt is not None]
+            if self._baseline and len(run_times) >= cfg.min_samples:
+                recent = statistics.median(run_times)
+                if recent > self._baseline * cfg.latency_tolerance:
+                    return f"run time {recent:.1f}s > {cfg.latency_tolerance}x baseline {self._baseline:.1f}s"
+        return None
+
+    def adjust(self, active: int, force: bool = False) -> int:
+        """
+        Re-evaluate the limit from recent results and host resources.
+
+        Args:
+            active: Number of currently running items
+            force: Ignore ``adjust_interval_seconds``
+
+        Returns:
+            int: The (possibly unchanged) limit
+        """
+        now = self._clock()
+        with self._lock:
+            if not force and now - self._last_adjust < self.config.adjust_interval_seconds:
+                return self._limit
+            self._last_adjust = now
+
+        try:
+            resources = self._probe() or {}
+        except Exception as e:
+            logger.warning(f"Resource probe failed: {e}")
+            resources = {}
+
+        with self._lock:
+            old = self._limit
+            reason = self._congestion_reason(resources)
+            if reason:
+                self._limit = self._clamp(int(old * self.config.decrease_factor))
+                # One decrease per congestion signal; judge the new limit on fresh results
+                self._results.clear()
+            elif active >= old:
+                self._limit = self._clamp(old + self.config.increase_step)
+                reason = "saturated"
+            else:
+                return old
+            self.last_reason = reason
+
+        if self._limit != old:
+            logger.info(f"Adaptive concurrency: {old} -> {self._limit} ({reason})")
+        return self._limit
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state for status reporting."""
+        with self._lock:
+            return {
+                "limit": self._limit,
+                "min_limit": self.config.min_limit,
+                "max_limit": self.config.max_limit,
+                "baseline_run_time": self._baseline,
+                "samples": len(self._results),
+                "last_reason": self.last_reason,
+            }
+
+
+__all__ = ["AdaptiveConcurrencyConfig", "AdaptiveConcurrencyController"]
@@ -9,16 +9,34 @@ Part of Issue #47 implementation for parallel execution queue & concurrency limi
 
 import asyncio
 import heapq
+import json
 import logging
 import time
-from typing import Dict, List, Any, Optional, Callable
+from collections import OrderedDict, deque
+from typing import Dict, List, Any, Optional, Callable, TextIO
 from dataclasses import dataclass
 from enum import Enum
 import threading
 from pathlib import Path
 
+from .adaptive_concurrency import AdaptiveConcurrencyConfig, AdaptiveConcurrencyController
+from .queue_store import QueueStore, QUEUE_STORE_FILENAME
+
 logger = logging.getLogger(__name__)
 
+# Finished (completed/failed/cancelled) items kept for status and stats
+DEFAULT_COMPLETED_RETENTION = 1000
+
+# Append-only queue event stream (in the manager's artifacts directory)
+QUEUE_EVENTS_FILENAME = "queue_events.jsonl"
+# Queue events within this window are folded into one manifest write
+DEFAULT_MANIFEST_DEBOUNCE_SECONDS = 2.0
+# Recent events / stats entries embedded in the manifest snapshot
+MANIFEST_EVENT_LIMIT = 1000
+MANIFEST_STATS_LIMIT = 100
+# How often execute_next() re-checks for a free slot
+SLOT_POLL_INTERVAL_SECONDS = 0.05
+
 
 class QueueState(Enum):
     """Queue item states"""
@@ -61,15 +79,34 @@ class QueueManager:
     - Queue state tracking
     - Async execution support
     - Thread-safe operations
+    - Optional durable store: waiting and orphaned running items are resumed
+      after a restart (see ``queue_store``)
+    - Append-only event stream (``queue_events.jsonl``); the artifact manifest
+      only receives a debounced snapshot of the queue state
+    - Live concurrency changes, optionally driven by an
+      ``AdaptiveConcurrencyController`` (run time, failure rate, host memory/CPU)
+
+    Example:
+        ```python
+        manager = QueueManager(artifacts_dir, max_concurrency=3, store_path=artifacts_dir / "queue_state.sqlite3")
+        manager.enqueue("run-1", "Nightly batch")
+        ```
     """
 
-    def __init__(self, artifacts_dir: Path, max_concurrency: int = 5):
+    def __init__(self, artifacts_dir: Path, max_concurrency: int = 5,
+                 store_path: Optional[Path] = None,
+                 completed_retention: int = DEFAULT_COMPLETED_RETENTION,
+                 manifest_debounce_seconds: float = DEFAULT_MANIFEST_DEBOUNCE_SECONDS,
+                 concurrency_controller: Optional[AdaptiveConcurrencyController] = None):
         self.artifacts_dir = artifacts_dir
-        self._max_concurrency = max_concurrency
-        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._controller = concurrency_controller
+        self._max_concurrency = concurrency_controller.limit if concurrency_controller else max_concurrency
         self._queue: List[QueueItem] = []  # Will use heapq operations
+        self._waiting: Dict[str, QueueItem] = {}  # id -> item for every entry in _queue
         self._active: Dict[str, QueueItem] = {}
-        self._completed: Dict[str, QueueItem] = {}
+        self._completed: "OrderedDict[str, QueueItem]" = OrderedDict()
+        self._completed_retention = max(0, completed_retention)
+        self._finished_total = 0
         self._lock = threading.Lock()
         self._completed_count = 0
         self._cancelled_count = 0
@@ -85,8 +122,82 @@ class QueueManager:
             "avg_wait_time": 0.0
         }
 
+        # Event stream and debounced manifest snapshot
+        self._events_path = Path(artifacts_dir) / QUEUE_EVENTS_FILENAME
+        self._events_file: Optional[TextIO] = None
+        self._events_lock = threading.Lock()
+        self._recent_events: deque = deque(maxlen=MANIFEST_EVENT_LIMIT)
+        self._recent_stats: deque = deque(maxlen=MANIFEST_STATS_LIMIT)
+        self._manifest_debounce_seconds = max(0.0, manifest_debounce_seconds)
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_timer: Optional[threading.Timer] = None
+        self._snapshot_dirty = False
+
+        self._store = QueueStore(store_path) if store_path else None
+        if self._store is not None:
+            self._recover_from_store(self._store)
+
         # Don't start stats logging automatically - let caller start it when ready
 
+    def _recover_from_store(self, store: QueueStore) -> None:
+        """Rebuild the in-memory queue from the durable store after a restart."""
+        resumed = requeued = 0
+        for row in store.load_all():
+            try:
+                state = QueueState(row["state"])
+            except ValueError:
+                logger.warning(f"Skipping stored queue item with unknown state: {row}")
+                continue
+            item = QueueItem(
+                id=row["id"],
+                name=row["name"],
+                state=state,
+                created_at=row["created_at"],
+                started_at=row["started_at"],
+                completed_at=row["completed_at"],
+                priority=row["priority"],
+                metadata=row["metadata"],
+            )
+            if state == QueueState.RUNNING:
+                # The process that started it is gone: run it again
+                item.state = QueueState.WAITING
+                item.started_at = None
+                item.metadata["recovered_runs"] = item.metadata.get("recovered_runs", 0) + 1
+                store.save(item)
+                requeued += 1
+            if item.state == QueueState.WAITING:
+                heapq.heappush(self._queue, item)
+                self._waiting[item.id] = item
+                resumed += 1
+            else:
+                self._completed[item.id] = item
+        evicted = self._trim_completed()
+        if evicted:
+            store.delete(evicted)
+        if resumed:
+            logger.info(f"Queue recovered from {store.path}: {resumed} waiting ({requeued} were running)")
+
+    def _trim_completed(self) -> List[str]:
+        """Drop the oldest finished items beyond the retention limit."""
+        evicted = []
+        while len(self._completed) > self._completed_retention:
+            item_id, _ = self._completed.popitem(last=False)
+            evicted.append(item_id)
+        return evicted
+
+    def _finish(self, item: QueueItem) -> None:
+        """Record a finished item; caller must hold ``_lock``."""
+        self._completed.pop(item.id, None)
+        self._completed[item.id] = item
+        self._finished_total += 1
+        evicted = self._trim_completed()
+        if self._store is not None:
+            self._store.save(item, evicted)
+
+    def _persist(self, item: QueueItem) -> None:
+        if self._store is not None:
+            self._store.save(item)
+
     async def start_stats_logging(self) -> None:
         """Start periodic queue statistics logging (async)"""
         if self._stats_task is not None:
@@ -112,25 +223,13 @@ class QueueManager:
 
     @max_concurrency.setter
     def max_concurrency(self, value: int) -> None:
-        """Set max concurrency"""
-        if value < 1:
-            raise ValueError("Max concurrency must be at least 1")
-
-        # Only allow changing if no active tasks are running
-        if not self._has_no_pending_tasks():
-            raise RuntimeError("Cannot change max_concurrency while tasks are active.")
-
-        self._max_concurrency = value
-        self._semaphore = asyncio.Semaphore(value)
-
-    def _has_no_pending_tasks(self) -> bool:
-        """
-        Check if there are no active or waiting tasks (pending tasks)
+        """Set max concurrency (takes effect immediately, see update_max_concurrency)"""
+        self.update_max_concurrency(value)
 
-        Returns:
-            bool: True if there are no active or waiting tasks, False otherwise
-        """
-        return len(self._active) == 0 and len(self._queue) == 0
+    def _adapt(self, busy: int) -> None:
+        """Let the adaptive controller re-evaluate the limit (rate limited)."""
+        if self._controller is not None:
+            self._max_concurrency = self._controller.adjust(busy)
 
     # Test helper methods
     def _add_active_item_for_testing(self, item_id: str, name: str) -> None:
@@ -146,6 +245,7 @@ class QueueManager:
     def _clear_queue_for_testing(self) -> None:
         """Test helper: Clear the queue (violates encapsulation for testing)"""
         self._queue.clear()
+        self._waiting.clear()
 
     def _get_shutdown_event_for_testing(self) -> asyncio.Event:
         """Test helper: Get shutdown event (violates encapsulation for testing)"""
@@ -172,9 +272,10 @@ class QueueManager:
         with self._lock:
             while self._queue:
                 item = heapq.heappop(self._queue)
+                self._waiting.pop(item.id, None)
                 item.state = QueueState.CANCELLED
                 item.completed_at = time.time()
-                self._completed[item.id] = item
+                self._finish(item)
                 self._cancelled_count += 1
                 logger.info(f"Item cancelled during shutdown: {item.id}")
 
@@ -185,6 +286,15 @@ class QueueManager:
 
         # Log final stats
         self.log_queue_stats()
+        self.flush_manifest_snapshot()
+
+        with self._events_lock:
+            if self._events_file is not None:
+                self._events_file.close()
+                self._events_file = None
+
+        if self._store is not None:
+            self._store.close()
 
         logger.info("QueueManager shutdown complete")
 
@@ -203,7 +313,7 @@ class QueueManager:
         """
         with self._lock:
             # Check if item already exists
-            if item_id in self._active or item_id in [item.id for item in self._queue]:
+            if item_id in self._active or item_id in self._waiting:
                 raise ValueError(f"Item {item_id} already exists in queue")
 
             item = QueueItem(
@@ -217,6 +327,8 @@ class QueueManager:
 
             # Add to priority queue
             heapq.heappush(self._queue, item)
+            self._waiting[item_id] = item
+            self._persist(item)
             self._stats["total_enqueued"] += 1
             self._stats["max_queue_length"] = max(self._stats["max_queue_length"], len(self._queue))
 
@@ -227,29 +339,45 @@ class QueueManager:
 
             return item
 
-    async def execute_next(self) -> Optional[QueueItem]:
+    async def execute_next(self, wait_for_slot: bool = True) -> Optional[QueueItem]:
         """
         Execute next item in queue (async)
 
+        Args:
+            wait_for_slot: Wait until fewer than ``max_concurrency`` items are
+                running before starting the next one. The limit is re-read on
+                every check, so live (adaptive) changes apply immediately.
+                Pass False to start the item regardless of the limit.
+
         Returns:
             QueueItem or None: Next item to execute, or None if queue empty
         """
-        async with self._semaphore:
+        while True:
             with self._lock:
                 if not self._queue:
                     return None
 
-                item = heapq.heappop(self._queue)
-                item.state = QueueState.RUNNING
-                item.started_at = time.time()
-                self._active[item.id] = item
+                busy = len(self._active)
+                if not wait_for_slot or busy < self._max_concurrency:
+                    item = heapq.heappop(self._queue)
+                    self._waiting.pop(item.id, None)
+                    item.state = QueueState.RUNNING
+                    item.started_at = time.time()
+                    self._active[item.id] = item
+                    self._persist(item)
 
-                logger.info(f"Item started: {item.id} (running={len(self._active)})")
+                    logger.info(f"Item started: {item.id} (running={len(self._active)})")
 
-                # Log to queue log
-                self._log_queue_event("started", item)
+                    # Log to queue log
+                    self._log_queue_event("started", item)
 
-                return item
+                    return item
+
+            if self._shutdown_event.is_set():
+                return None
+            # All slots busy with work waiting: the controller may raise the limit
+            self._adapt(busy)
+            await asyncio.sleep(SLOT_POLL_INTERVAL_SECONDS)
 
     def complete_item(self, item_id: str, success: bool = True) -> None:
         """
@@ -264,10 +392,11 @@ class QueueManager:
                 logger.warning(f"Item {item_id} not found in running items")
                 return
 
+            busy = len(self._active)
             item = self._active.pop(item_id)
             item.state = QueueState.COMPLETED if success else QueueState.FAILED
             item.completed_at = time.time()
-            self._completed[item_id] = item
+            self._finish(item)
 
             if success:
                 self._stats["total_completed"] += 1
@@ -290,6 +419,11 @@ class QueueManager:
             # Log to queue log
             self._log_queue_event("completed", item)
 
+        if self._controller is not None:
+            run_time = item.completed_at - item.started_at if item.started_at else None
+            self._controller.record_result(run_time, success)
+            self._adapt(busy)
+
     def cancel_item(self, item_id: str) -> None:
         """
         Cancel running item
@@ -305,7 +439,7 @@ class QueueManager:
             item = self._active.pop(item_id)
             item.state = QueueState.CANCELLED
             item.completed_at = time.time()
-            self._completed[item_id] = item
+            self._finish(item)
             self._cancelled_count += 1
 
             logger.info(f"Item cancelled: {item_id}")
@@ -313,6 +447,19 @@ class QueueManager:
             # Log to queue log
             self._log_queue_event("cancelled", item)
 
+    def get_item(self, item_id: str) -> Optional[QueueItem]:
+        """
+        Look up an item by id (waiting, running or retained finished item)
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            QueueItem or None if unknown or evicted by retention
+        """
+        with self._lock:
+            return self._waiting.get(item_id) or self._active.get(item_id) or self._completed.get(item_id)
+
     def get_queue_status(self) -> Dict[str, Any]:
         """
         Get current queue status
@@ -324,9 +471,10 @@ class QueueManager:
             return {
                 "queue_length": len(self._queue),
                 "running_count": len(self._active),
-                "completed_count": len(self._completed),
+                "completed_count": self._finished_total,
                 "max_concurrency": self.max_concurrency,
                 "current_concurrency": len(self._active),
+                "adaptive_concurrency": self._controller.snapshot() if self._controller else None,
                 "stats": self._stats.copy(),
                 "waiting_items": [
                     {
@@ -349,87 +497,104 @@ class QueueManager:
 
     def _log_queue_event(self, event: str, item: QueueItem) -> None:
         """
-        Log queue event to file
+        Append queue event to the queue event stream
+
+        Events go to ``queue_events.jsonl`` in the artifacts directory (one JSON
+        object per line, file kept open). The manifest is only refreshed by the
+        debounced snapshot, see ``flush_manifest_snapshot``.
 
         Args:
             event: Event type (enqueued, started, completed, cancelled)
             item: Queue item
         """
-        try:
-            log_file = self.artifacts_dir / "runs" / item.id / "queue.log"
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-            log_entry = f"[{timestamp}] {event.upper()}: {item.id} ({item.name}) priority={item.priority}"
-
-            if item.started_at and item.created_at:
-                wait_time = item.started_at - item.created_at
-                log_entry += f" wait_time={wait_time:.2f}s"
-
-            if item.completed_at and item.started_at:
-                run_time = item.completed_at - item.started_at
-                log_entry += f" run_time={run_time:.2f}s"
-
-            log_entry += "\n"
-
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(log_entry)
-
-            # Update manifest with queue state
-            self._update_manifest_queue_state(item, event)
+        entry: Dict[str, Any] = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "event": event,
+            "item_id": item.id,
+            "item_name": item.name,
+            "state": item.state.value,
+            "priority": item.priority,
+        }
+        if item.started_at and item.created_at:
+            entry["wait_time"] = round(item.started_at - item.created_at, 3)
+        if item.completed_at and item.started_at:
+            entry["run_time"] = round(item.completed_at - item.started_at, 3)
 
+        try:
+            with self._events_lock:
+                if self._events_file is None:
+                    self._events_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._events_file = open(self._events_path, "a", encoding="utf-8")
+                self._events_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self._events_file.flush()
         except Exception as e:
             logger.error(f"Failed to log queue event: {e}")
 
-    def _update_manifest_queue_state(self, item: QueueItem, event: str) -> None:
+        self._recent_events.append(entry)
+        self._schedule_manifest_snapshot()
+
+    def _schedule_manifest_snapshot(self) -> None:
+        """Mark the manifest snapshot stale and arm the debounce timer once."""
+        with self._snapshot_lock:
+            self._snapshot_dirty = True
+            if self._snapshot_timer is None:
+                timer = threading.Timer(self._manifest_debounce_seconds, self._run_scheduled_snapshot)
+                timer.daemon = True
+                self._snapshot_timer = timer
+                timer.start()
+
+    def _run_scheduled_snapshot(self) -> None:
+        with self._snapshot_lock:
+            self._snapshot_timer = None
+        self.flush_manifest_snapshot()
+
+    def flush_manifest_snapshot(self) -> None:
         """
-        Update manifest with queue state change
+        Write the current queue snapshot to the manifest now, if it changed
 
-        Args:
-            item: Queue item
-            event: Event type (enqueued, started, completed, cancelled)
+        Replaces ``queue_state`` (items and recent events) and ``queue_stats``
+        in one ``persist_manifest()`` call instead of one per queue event.
         """
+        with self._snapshot_lock:
+            if self._snapshot_timer is not None:
+                self._snapshot_timer.cancel()
+                self._snapshot_timer = None
+            if not self._snapshot_dirty:
+                return
+            self._snapshot_dirty = False
+
+        with self._lock:
+            items = {
+                item.id: {
+                    "name": item.name,
+                    "state": item.state.value,
+                    "created_at": item.created_at,
+                    "started_at": item.started_at,
+                    "completed_at": item.completed_at,
+                    "priority": item.priority,
+                    "metadata": item.metadata
+                }
+                for group in (self._completed.values(), self._active.values(), self._waiting.values())
+                for item in group
+            }
+            events = list(self._recent_events)
+            stats = list(self._recent_stats)
+
         try:
             from src.core.artifact_manager import get_artifact_manager
             artifact_manager = get_artifact_manager()
 
-            manifest = artifact_manager.get_manifest()
-
-            # Initialize queue_state if not exists
-            if "queue_state" not in manifest:
+            def _apply(manifest: Dict[str, Any]) -> None:
                 manifest["queue_state"] = {
-                    "items": {},
-                    "events": []
+                    "items": items,
+                    "events": events,
+                    "event_log": str(self._events_path)
                 }
+                if stats:
+                    manifest["queue_stats"] = stats
 
-            # Update item state
-            queue_state = manifest["queue_state"]
-            queue_state["items"][item.id] = {
-                "name": item.name,
-                "state": item.state.value,
-                "created_at": item.created_at,
-                "started_at": item.started_at,
-                "completed_at": item.completed_at,
-                "priority": item.priority,
-                "metadata": item.metadata
-            }
-
-            # Add event to events list
-            timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-            event_entry = {
-                "timestamp": timestamp,
-                "event": event,
-                "item_id": item.id,
-                "item_name": item.name,
-                "state": item.state.value
-            }
-            queue_state["events"].append(event_entry)
-
-            # Keep only last 1000 events to prevent manifest from growing too large
-            if len(queue_state["events"]) > 1000:
-                queue_state["events"] = queue_state["events"][-1000:]
-
-            artifact_manager.persist_manifest()
+            # Runs on the debounce timer thread: mutate and persist under the manifest lock
+            artifact_manager.update_manifest(_apply)
 
         except Exception as e:
             logger.error(f"Failed to update manifest queue state: {e}")
@@ -490,27 +655,14 @@ class QueueManager:
 
     def log_queue_stats(self) -> None:
         """
-        Log current queue statistics to manifest
+        Log current queue statistics (written to the manifest with the next snapshot)
         """
         try:
             stats = self.get_queue_stats()
 
-            # Update manifest with queue stats
-            from src.core.artifact_manager import get_artifact_manager
-            artifact_manager = get_artifact_manager()
-
-            manifest = artifact_manager.get_manifest()
-
-            if "queue_stats" not in manifest:
-                manifest["queue_stats"] = []
-
             # Keep only last 100 stats entries to prevent manifest from growing too large
-            queue_stats = manifest["queue_stats"]
-            queue_stats.append(stats)
-            if len(queue_stats) > 100:
-                queue_stats.pop(0)
-
-            artifact_manager.persist_manifest()
+            self._recent_stats.append(stats)
+            self._schedule_manifest_snapshot()
 
             logger.info("Queue stats logged", extra={"queue_stats": stats})
 
@@ -521,19 +673,21 @@ class QueueManager:
         """
         Update maximum concurrency limit
 
+        Takes effect immediately: running items keep running and a lower limit
+        only delays new starts, so no drain is needed. With an adaptive
+        controller the value is clamped to its min/max and adaptation
+        continues from it.
+
         Args:
             new_limit: New concurrency limit
         """
         if new_limit < 1:
             raise ValueError("Max concurrency must be at least 1")
 
-        # Only allow changing if no active tasks are running
-        if not self._has_no_pending_tasks():
-            raise RuntimeError("Cannot change max_concurrency while tasks are active.")
-
         old_limit = self._max_concurrency
+        if self._controller is not None:
+            new_limit = self._controller.set_limit(new_limit)
         self._max_concurrency = new_limit
-        self._semaphore = asyncio.Semaphore(new_limit)
 
         logger.info(f"Max concurrency updated: {old_limit} -> {new_limit}")
 
@@ -549,27 +703,57 @@ def get_queue_manager(max_concurrency: Optional[int] = None) -> QueueManager:
     Args:
         max_concurrency: Max concurrency for new instance
 
+    Config (``runner`` section):
+        max_concurrency: Default concurrency limit (3)
+        queue_persistence: Persist the queue under ``artifacts/runs`` so a
+            restarted process resumes it (default: false)
+        completed_retention: Finished items kept in memory/store (1000)
+        adaptive_concurrency: Mapping with ``enabled: true`` and optional
+            AdaptiveConcurrencyConfig fields (min_limit, max_limit, ...)
+
     Returns:
         QueueManager: Global queue manager instance
     """
     global _queue_manager
     if _queue_manager is None:
+        runner_config: Dict[str, Any] = {}
+        try:
+            from src.config.multi_env_loader import load_config
+            runner_config = load_config().get("runner", {}) or {}
+        except Exception as e:
+            if max_concurrency is None:
+                logger.warning(f"Failed to load max_concurrency from config: {e}, using default=3")
+
         # Try to load from config if not specified
         if max_concurrency is None:
-            try:
-                from src.config.multi_env_loader import load_config
-                config = load_config()
-                max_concurrency = config.get("runner", {}).get("max_concurrency", 3)
-            except Exception as e:
-                logger.warning(f"Failed to load max_concurrency from config: {e}, using default=3")
-                max_concurrency = 3
+            max_concurrency = runner_config.get("max_concurrency", 3)
 
         # Get artifacts directory
         from src.runtime.run_context import RunContext
         rc = RunContext.get()
         artifacts_dir = rc.artifact_dir("art")
 
-        _queue_manager = QueueManager(artifacts_dir=artifacts_dir, max_concurrency=max_concurrency or 3)
+        store_path = None
+        if runner_config.get("queue_persistence", False):
+            # Shared across runs (not per-run) so a restart can find it
+            from src.utils.fs_paths import get_artifacts_base_dir
+            store_path = get_artifacts_base_dir() / "runs" / QUEUE_STORE_FILENAME
+
+        controller = None
+        adaptive_config = runner_config.get("adaptive_concurrency") or {}
+        if adaptive_config.get("enabled", False):
+            controller = AdaptiveConcurrencyController(
+                initial_limit=max_concurrency or 3,
+                config=AdaptiveConcurrencyConfig.from_dict(adaptive_config),
+            )
+
+        _queue_manager = QueueManager(
+            artifacts_dir=artifacts_dir,
+            max_concurrency=max_concurrency or 3,
+            store_path=store_path,
+            completed_retention=runner_config.get("completed_retention", DEFAULT_COMPLETED_RETENTION),
+            concurrency_controller=controller,
+        )
     return _queue_manager
 
 
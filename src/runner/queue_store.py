@@ -0,0 +1,131 @@
+"""
+Durable backing store for QueueManager.
+
+QueueManager keeps its priority heap in memory as a hot cache; this module
+mirrors every state change into a small SQLite database (WAL mode) so that a
+restarted process can resume waiting items and re-queue items that were
+running when the previous process died. Store errors are logged and never
+interrupt queue operations.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUE_STORE_FILENAME = "queue_state.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_items (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    state TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    completed_at REAL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_queue_items_state ON queue_items(state);
+"""
+
+
+class QueueStore:
+    """
+    SQLite-backed persistence of queue items keyed by item id.
+
+    Example:
+        ```python
+        store = QueueStore(artifacts_dir / "queue_state.sqlite3")
+        store.save(item)
+        rows = store.load_all()  # List of dicts ordered by created_at
+        store.delete([item.id])
+        ```
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def save(self, item, evicted_ids: Iterable[str] = ()) -> None:
+        """Insert or update ``item`` and drop ``evicted_ids`` in one transaction."""
+        try:
+            metadata = json.dumps(item.metadata or {}, ensure_ascii=False, default=str)
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO queue_items"
+                        "(id, name, state, priority, created_at, started_at, completed_at, metadata)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (item.id, item.name, item.state.value, item.priority, item.created_at,
+                         item.started_at, item.completed_at, metadata),
+                    )
+                    conn.executemany("DELETE FROM queue_items WHERE id = ?", ((i,) for i in evicted_ids))
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(f"Queue store update failed for {item.id}: {e}")
+
+    def delete(self, item_ids: Iterable[str]) -> None:
+        """Remove items by id."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany("DELETE FROM queue_items WHERE id = ?", ((i,) for i in item_ids))
+        except sqlite3.Error as e:
+            logger.error(f"Queue store delete failed: {e}")
+
+    def load_all(self) -> List[dict]:
+        """Return every stored item as a dict, oldest first."""
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT id, name, state, priority, created_at, started_at, completed_at, metadata"
+                    " FROM queue_items ORDER BY created_at"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Queue store load failed ({self.path}): {e}")
+            return []
+
+        items = []
+        for row in rows:
+            try:
+                metadata = json.loads(row[7]) if row[7] else {}
+            except ValueError:
+                metadata = {}
+            items.append({
+                "id": row[0],
+                "name": row[1],
+                "state": row[2],
+                "priority": row[3],
+                "created_at": row[4],
+                "started_at": row[5],
+                "completed_at": row[6],
+                "metadata": metadata,
+            })
+        return items
+
+
+__all__ = ["QueueStore", "QUEUE_STORE_FILENAME"]
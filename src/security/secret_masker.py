@@ -17,11 +17,17 @@ Security Patterns Supported:
     - Generic: Long alphanumeric strings (32+ chars)
 
 Configuration:
-    - BYKILT_SECRET_MASKING_ENABLED: Enable/disable masking (default: true)
+    - BYKILT_SECRET_MASKING_ENABLED: Enable/disable masking (default: true,
+      read once when the singleton is created)
     - Custom patterns can be added via SecretMasker.add_pattern()
 
 Performance:
-    - Regex compilation cached
+    - All rules are compiled into one alternation of named groups, so a
+      message without secrets is scanned once instead of once per rule
+    - A literal/character-class pre-scan (``str`` substring checks plus a
+      ``[A-Za-z0-9]{32}`` scan for the generic long-token rule) skips
+      messages that cannot match
+    - Readers use an immutable rules snapshot; only add/remove/clear lock
     - Early exit on disabled state
     - Minimal overhead (<5ms per log entry)
 """
@@ -29,18 +35,112 @@ from __future__ import annotations
 
 import re
 import os
-from typing import List, Dict, Any, Pattern, Optional
+from typing import List, Dict, Any, Pattern, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from threading import Lock
 
 
 @dataclass
 class MaskingRule:
-    """Represents a single masking rule with pattern and replacement."""
+    """Represents a single masking rule with pattern and replacement.
+
+    ``literals`` and ``min_alnum_run`` are optional pre-filter hints: a message
+    can only match when it contains one of the literals, or (for rules without
+    literals) an ASCII alphanumeric run of at least ``min_alnum_run`` chars.
+    A rule with neither hint is always evaluated.
+    """
     name: str
     pattern: Pattern[str]
     replacement: str
     description: str = ""
+    literals: Tuple[str, ...] = ()
+    min_alnum_run: int = 0
+
+
+# Backreferences inside a pattern would point at the wrong group once combined
+_PATTERN_BACKREF = re.compile(r'\\[1-9]|\(\?P=')
+
+
+@lru_cache(maxsize=None)
+def _alnum_run(length: int) -> Pattern[str]:
+    """Character-class scan for an ASCII alphanumeric run of ``length`` chars."""
+    return re.compile(f"[A-Za-z0-9]{{{length}}}")
+
+
+def _has_alnum_run(text: str, length: int) -> bool:
+    return len(text) >= length and _alnum_run(length).search(text) is not None
+
+
+def _rule_may_match(rule: MaskingRule, text: str) -> bool:
+    """Cheap pre-scan for one rule; False means the rule cannot match."""
+    if rule.literals:
+        return any(literal in text for literal in rule.literals)
+    if rule.min_alnum_run:
+        return _has_alnum_run(text, rule.min_alnum_run)
+    return True
+
+
+@dataclass(frozen=True)
+class _RulesSnapshot:
+    """Immutable compiled view of the rules; swapped atomically on change.
+
+    ``detector`` is every rule joined into one alternation, so a message is
+    scanned once to learn whether anything matches at all. Messages that do
+    match are rewritten rule by rule in definition order (skipping rules whose
+    hints are absent): a leftmost-first alternation would let one rule's match
+    swallow the start of an overlapping secret that a later rule masks.
+    """
+    rules: Tuple[MaskingRule, ...]
+    detector: Optional[Pattern[str]]
+    literals: Tuple[str, ...]
+    min_alnum_run: int
+    always_scan: bool
+
+    @classmethod
+    def build(cls, rules: List[MaskingRule]) -> "_RulesSnapshot":
+        rules = tuple(rules)
+        literals = tuple(dict.fromkeys(lit for r in rules for lit in r.literals))
+        runs = [r.min_alnum_run for r in rules if not r.literals and r.min_alnum_run]
+        always_scan = any(not r.literals and not r.min_alnum_run for r in rules)
+
+        detector: Optional[Pattern[str]] = None
+        combinable = all(
+            not _PATTERN_BACKREF.search(r.pattern.pattern) and r.pattern.flags == re.UNICODE
+            for r in rules
+        )
+        if rules and combinable:
+            try:
+                detector = re.compile("|".join(
+                    f"(?P<_mask{i}>{rule.pattern.pattern})" for i, rule in enumerate(rules)
+                ))
+            except re.error:
+                # e.g. duplicate group names or inline flags: rules are tried one by one
+                detector = None
+
+        return cls(rules, detector, literals, min(runs, default=0), always_scan)
+
+    def may_match(self, text: str) -> bool:
+        """Cheap pre-scan; False means no rule can match ``text``."""
+        if self.always_scan:
+            return True
+        for literal in self.literals:
+            if literal in text:
+                return True
+        return bool(self.min_alnum_run) and _has_alnum_run(text, self.min_alnum_run)
+
+    def apply(self, text: str) -> str:
+        if self.detector is not None and self.detector.search(text) is None:
+            return text
+        for rule in self.rules:
+            if not _rule_may_match(rule, text):
+                continue
+            try:
+                text = rule.pattern.sub(rule.replacement, text)
+            except Exception:
+                # Skip problematic patterns to avoid breaking the masking pipeline
+                continue
+        return text
 
 
 class SecretMasker:
@@ -52,7 +152,9 @@ class SecretMasker:
     def __init__(self):
         self._rules: List[MaskingRule] = []
         self._rules_lock: Lock = Lock()
-        self._enabled: bool = self._get_env_enabled()
+        self._snapshot: _RulesSnapshot = _RulesSnapshot.build([])
+        self._env_enabled: bool = self._get_env_enabled()
+        self._enabled: bool = self._env_enabled
 
         # Initialize default patterns
         self._initialize_default_patterns()
@@ -79,19 +181,22 @@ class SecretMasker:
                 name="openai_api_key",
                 pattern=re.compile(r'\b(sk-[a-zA-Z0-9]{32,})\b'),
                 replacement="sk-****",
-                description="OpenAI API keys"
+                description="OpenAI API keys",
+                literals=("sk-",)
             ),
             MaskingRule(
                 name="stripe_secret_key",
                 pattern=re.compile(r'\b(sk_(?:live_|test_)?[a-zA-Z0-9]{24,})\b'),
                 replacement="sk_****",
-                description="Stripe secret keys"
+                description="Stripe secret keys",
+                literals=("sk_",)
             ),
             MaskingRule(
                 name="generic_api_key",
                 pattern=re.compile(r'\b(pk_[a-zA-Z0-9]{24,})\b'),
                 replacement="pk_****",
-                description="Generic private keys"
+                description="Generic private keys",
+                literals=("pk_",)
             ),
 
             # Slack tokens
@@ -99,7 +204,8 @@ class SecretMasker:
                 name="slack_token",
                 pattern=re.compile(r'\b(xox[pba]-[0-9]-[0-9]{12}-[0-9]{12}-[a-zA-Z0-9]{24,})\b'),
                 replacement="xox*-****-****-****-****",
-                description="Slack bot/user tokens"
+                description="Slack bot/user tokens",
+                literals=("xox",)
             ),
 
             # Password fields (both JSON and direct values)
@@ -107,13 +213,15 @@ class SecretMasker:
                 name="password_field",
                 pattern=re.compile(r'("password"|"passwd"|"pwd")\s*:\s*"([^"]{3,})"'),
                 replacement=r'\1: "****"',
-                description="JSON password fields"
+                description="JSON password fields",
+                literals=('"password"', '"passwd"', '"pwd"')
             ),
             MaskingRule(
                 name="password_param",
                 pattern=re.compile(r'\b(password|passwd|pwd)=([^&\s]{3,})'),
                 replacement=r'\1=****',
-                description="URL/form password parameters"
+                description="URL/form password parameters",
+                literals=("password=", "passwd=", "pwd=")
             ),
 
             # Bearer tokens
@@ -121,7 +229,8 @@ class SecretMasker:
                 name="bearer_token",
                 pattern=re.compile(r'\b(Bearer\s+)([a-zA-Z0-9_\-\.]{20,})\b'),
                 replacement=r'\1****',
-                description="Bearer token authentication"
+                description="Bearer token authentication",
+                literals=("Bearer",)
             ),
 
             # Authorization headers
@@ -129,7 +238,8 @@ class SecretMasker:
                 name="auth_header",
                 pattern=re.compile(r'\b(Authorization)\s*:\s*([^\s]{10,})\b'),
                 replacement=r'\1: ****',
-                description="Authorization header values"
+                description="Authorization header values",
+                literals=("Authorization",)
             ),
 
             # Generic long alphanumeric strings (potential secrets)
@@ -137,14 +247,21 @@ class SecretMasker:
                 name="generic_secret",
                 pattern=re.compile(r'\b([a-zA-Z0-9]{32,})\b'),
                 replacement="****",
-                description="Generic long alphanumeric strings"
+                description="Generic long alphanumeric strings",
+                min_alnum_run=32
             ),
         ]
 
         with self._rules_lock:
             self._rules.extend(default_patterns)
+            self._publish_rules()
+
+    def _publish_rules(self) -> None:
+        """Rebuild the compiled snapshot; caller must hold ``_rules_lock``."""
+        self._snapshot = _RulesSnapshot.build(self._rules)
 
-    def add_pattern(self, name: str, pattern: str, replacement: str, description: str = "") -> None:
+    def add_pattern(self, name: str, pattern: str, replacement: str, description: str = "",
+                    literals: Tuple[str, ...] = ()) -> None:
         """Add a custom masking pattern.
 
         Args:
@@ -152,15 +269,18 @@ class SecretMasker:
             pattern: Regex pattern string
             replacement: Replacement string (can use \1, \2 for groups)
             description: Optional description
+            literals: Substrings of which at least one occurs in every match.
+                Lets the pre-scan skip messages; omit to always evaluate.
         """
         try:
             compiled_pattern = re.compile(pattern)
-            rule = MaskingRule(name, compiled_pattern, replacement, description)
+            rule = MaskingRule(name, compiled_pattern, replacement, description, tuple(literals))
 
             with self._rules_lock:
                 # Remove existing rule with same name if present
                 self._rules = [r for r in self._rules if r.name != name]
                 self._rules.append(rule)
+                self._publish_rules()
 
         except re.error as e:
             raise ValueError(f"Invalid regex pattern for '{name}': {e}")
@@ -174,6 +294,7 @@ class SecretMasker:
         with self._rules_lock:
             original_length = len(self._rules)
             self._rules = [r for r in self._rules if r.name != name]
+            self._publish_rules()
             return len(self._rules) < original_length
 
     def mask_text(self, text: str) -> str:
@@ -185,20 +306,13 @@ class SecretMasker:
         Returns:
             Text with secrets masked
         """
-        if not (self._get_env_enabled() and self._enabled) or not text:
+        if not (self._env_enabled and self._enabled) or not text:
             return text
 
-        masked_text = text
-
-        with self._rules_lock:
-            for rule in self._rules:
-                try:
-                    masked_text = rule.pattern.sub(rule.replacement, masked_text)
-                except Exception:
-                    # Skip problematic patterns to avoid breaking the masking pipeline
-                    continue
-
-        return masked_text
+        snapshot = self._snapshot
+        if not snapshot.may_match(text):
+            return text
+        return snapshot.apply(text)
 
     def mask_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively mask sensitive information in a dictionary.
@@ -207,18 +321,35 @@ class SecretMasker:
             data: Dictionary to sanitize
 
         Returns:
-            Dictionary with secrets masked
+            Dictionary with secrets masked. Containers without any masked
+            value are returned as-is rather than copied.
         """
-        if not (self._get_env_enabled() and self._enabled) or not data:
+        if not (self._env_enabled and self._enabled) or not data:
             return data
 
+        snapshot = self._snapshot
+
         def _mask_value(value: Any) -> Any:
             if isinstance(value, str):
-                return self.mask_text(value)
+                return snapshot.apply(value) if value and snapshot.may_match(value) else value
             elif isinstance(value, dict):
-                return {k: _mask_value(v) for k, v in value.items()}
+                masked = None
+                for k, v in value.items():
+                    new = _mask_value(v)
+                    if new is not v:
+                        if masked is None:
+                            masked = dict(value)
+                        masked[k] = new
+                return value if masked is None else masked
             elif isinstance(value, list):
-                return [_mask_value(item) for item in value]
+                masked_list = None
+                for i, item in enumerate(value):
+                    new = _mask_value(item)
+                    if new is not item:
+                        if masked_list is None:
+                            masked_list = list(value)
+                        masked_list[i] = new
+                return value if masked_list is None else masked_list
             else:
                 return value
 
@@ -226,7 +357,7 @@ class SecretMasker:
 
     def is_enabled(self) -> bool:
         """Check if secret masking is currently enabled."""
-        return self._get_env_enabled() and self._enabled
+        return self._env_enabled and self._enabled
 
     def set_enabled(self, enabled: bool) -> None:
         """Enable or disable secret masking."""
@@ -249,6 +380,7 @@ class SecretMasker:
         """Clear all masking patterns (including defaults)."""
         with self._rules_lock:
             self._rules.clear()
+            self._publish_rules()
 
 
 # Convenience functions for easy access
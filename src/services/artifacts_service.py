@@ -4,23 +4,34 @@ Provides a stable API surface for listing and accessing artifacts from run manif
 Handles pagination, filtering by run_id and artifact type, and security validation.
 
 Design:
-  - Scans manifest_v2.json files under artifacts/runs/
+  - Reads an incremental SQLite catalog of manifest_v2.json entries under
+    artifacts/runs/ (full manifest scan as fallback)
   - Filters by run_id, artifact type (video, screenshot, element_capture)
-  - Returns paginated results with metadata
+  - Returns paginated results with metadata (offset or keyset cursor)
   - Security: only serves files within canonical artifacts directory
 """
 
 from __future__ import annotations
 
+import logging
+import os
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import List, Literal, Sequence
-
+from typing import List, Literal, Sequence, Tuple
+
+from src.core.artifact_catalog import (
+    ArtifactCatalog,
+    Cursor,
+    decode_cursor,
+    encode_cursor,
+    load_manifest_rows,
+)
 from src.core.artifact_manager import get_artifact_manager
 from src.runtime.run_context import RunContext
 from src.utils.fs_paths import get_artifacts_base_dir
 
+logger = logging.getLogger(__name__)
+
 ArtifactType = Literal["video", "screenshot", "element_capture", "all"]
 
 _MAX_LIMIT = 100
@@ -53,6 +64,8 @@ class ArtifactsPage:
     offset: int
     has_next: bool
     total_count: int | None = None
+    # Opaque keyset cursor for the following page (pass as ListArtifactsParams.cursor)
+    next_cursor: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -63,12 +76,17 @@ class ListArtifactsParams:
     artifact_type: ArtifactType = "all"
     limit: int = 50
     offset: int = 0
+    cursor: str | None = None
     allowed_roots: Sequence[Path] | None = None
 
 
 def list_artifacts(params: ListArtifactsParams | None = None) -> ArtifactsPage:
     """List artifacts with optional filtering by run_id and type.
 
+    Pages come from the artifact catalog (see ``src.core.artifact_catalog``);
+    if the catalog is unavailable the manifests are scanned directly. Both
+    paths return the same order and accept the same cursors.
+
     Args:
         params: Query parameters for filtering and pagination
 
@@ -88,6 +106,7 @@ def list_artifacts(params: ListArtifactsParams | None = None) -> ArtifactsPage:
         raise ValueError("offset must be non-negative")
     if params.limit > _MAX_LIMIT:
         raise ValueError(f"limit must not exceed {_MAX_LIMIT}")
+    cursor_position = decode_cursor(params.cursor) if params.cursor else None
 
     artifacts_root = get_artifacts_base_dir() / "runs"
     if not artifacts_root.exists():
@@ -101,9 +120,34 @@ def list_artifacts(params: ListArtifactsParams | None = None) -> ArtifactsPage:
 
     _ensure_within_allowed_roots(artifacts_root, allowed_roots)
 
-    # Collect all artifacts from manifests
-    all_artifacts: List[ArtifactItemDTO] = []
+    try:
+        catalog = ArtifactCatalog.for_root(artifacts_root, get_artifacts_base_dir())
+        catalog.reconcile_if_stale()
+        rows, next_cursor, total_count = catalog.query(
+            run_id=params.run_id,
+            artifact_type=params.artifact_type,
+            limit=params.limit,
+            offset=params.offset,
+            cursor=params.cursor,
+        )
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Artifact catalog unavailable, scanning manifests: {e}")
+        rows, next_cursor, total_count = _scan_manifests(artifacts_root, params, cursor_position)
+
+    return ArtifactsPage(
+        items=[ArtifactItemDTO(**row) for row in rows],
+        limit=params.limit,
+        offset=params.offset,
+        has_next=next_cursor is not None,
+        total_count=total_count,
+        next_cursor=next_cursor,
+    )
+
 
+def _scan_manifests(
+    artifacts_root: Path, params: ListArtifactsParams, cursor_position: Cursor | None
+) -> Tuple[List[dict], str | None, int]:
+    """Catalog-less listing: read every manifest under ``artifacts_root``."""
     # If specific run_id is provided, only scan that manifest (recursively)
     if params.run_id:
         manifest_paths = list(artifacts_root.glob(f"**/{params.run_id}*-art/{_MANIFEST_FILENAME}"))
@@ -111,158 +155,54 @@ def list_artifacts(params: ListArtifactsParams | None = None) -> ArtifactsPage:
         # Scan all manifests recursively
         manifest_paths = list(artifacts_root.glob(f"**/*-art/{_MANIFEST_FILENAME}"))
 
-    # Sort by modification time (newest first)
-    manifest_paths.sort(key=lambda p: p.stat().st_mtime if p.exists() else 0, reverse=True)
-
-    for manifest_path in manifest_paths:
+    def _position(manifest_path: Path) -> Tuple[int, str]:
         try:
-            artifacts = _load_artifacts_from_manifest(manifest_path, params.artifact_type)
-            all_artifacts.extend(artifacts)
-        except Exception:  # noqa: BLE001
-            # Skip invalid manifests
-            continue
+            sort_key = manifest_path.stat().st_mtime_ns
+        except OSError:
+            sort_key = 0
+        return -sort_key, Path(os.path.relpath(manifest_path.parent, artifacts_root)).as_posix()
+
+    # Newest first, same order as the catalog
+    positioned = sorted((_position(p), p) for p in manifest_paths)
+
+    all_rows: List[Tuple[Cursor, dict]] = []
+    for (neg_sort_key, run_dir), manifest_path in positioned:
+        for ordinal, row in enumerate(_load_manifest_rows(manifest_path)):
+            if params.artifact_type != "all" and row["type"] != params.artifact_type:
+                continue
+            all_rows.append(((-neg_sort_key, run_dir, ordinal), row))
+
+    total_count = len(all_rows)
+    if cursor_position is not None:
+        sort_key, run_dir, ordinal = cursor_position
+        all_rows = [
+            (pos, row) for pos, row in all_rows
+            if (-pos[0], pos[1], pos[2]) > (-sort_key, run_dir, ordinal)
+        ]
 
     # Apply pagination
-    total_count = len(all_artifacts)
     start = params.offset
-    end = start + params.limit if params.limit > 0 else len(all_artifacts)
-
-    page_items = all_artifacts[start:end]
-    has_next = end < total_count
-
-    return ArtifactsPage(
-        items=page_items,
-        limit=params.limit,
-        offset=params.offset,
-        has_next=has_next,
-        total_count=total_count,
-    )
-
-
-def _load_artifacts_from_manifest(manifest_path: Path, artifact_type: ArtifactType) -> List[ArtifactItemDTO]:
-    """Load artifacts from a single manifest file and scan for unregistered files."""
-    import json
+    end = start + params.limit if params.limit > 0 else len(all_rows)
+    page = all_rows[start:end]
+    next_cursor = encode_cursor(page[-1][0]) if page and end < len(all_rows) else None
+    return [row for _, row in page], next_cursor, total_count
 
-    # Extract run_id from path (format: <run_id>-art/manifest_v2.json)
-    run_id = manifest_path.parent.name.replace("-art", "")
 
+def _load_manifest_rows(manifest_path: Path) -> List[dict]:
     try:
-        data = json.loads(manifest_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return load_manifest_rows(manifest_path, get_artifacts_base_dir())
+    except Exception:  # noqa: BLE001
+        # Skip invalid manifests
         return []
 
-    artifacts = data.get("artifacts", [])
-    results: List[ArtifactItemDTO] = []
-    registered_paths: set[str] = set()  # Track registered paths
-
-    artifacts_root = get_artifacts_base_dir()
-
-    # First, load artifacts from manifest
-    for artifact in artifacts:
-        art_type = artifact.get("type", "")
-
-        # Filter by type if specified
-        if artifact_type != "all" and art_type != artifact_type:
-            continue
-
-        # Resolve path (handle both relative and absolute)
-        path_str = artifact.get("path", "")
-        if not path_str:
-            continue
-
-        # Try to resolve path relative to various bases
-        artifact_path = _resolve_artifact_path(path_str, manifest_path.parent, artifacts_root)
-
-        if not artifact_path or not artifact_path.exists():
-            continue
-
-        registered_paths.add(str(artifact_path))
-        results.append(
-            ArtifactItemDTO(
-                run_id=run_id,
-                type=art_type,
-                path=str(artifact_path),
-                size=artifact.get("size"),
-                created_at=artifact.get("created_at", ""),
-                meta=artifact.get("meta"),
-            )
-        )
 
-    # Second, scan for unregistered element_capture files (.txt, .csv)
-    # Only scan if artifact_type is "element_capture" or "all"
-    if artifact_type in ("element_capture", "all"):
-        elements_dir = manifest_path.parent / "elements"
-        if elements_dir.exists() and elements_dir.is_dir():
-            for file_path in elements_dir.iterdir():
-                if not file_path.is_file():
-                    continue
-                
-                # Check if it's a txt or csv file
-                if file_path.suffix.lower() not in {".txt", ".csv"}:
-                    continue
-                
-                # Skip if already registered
-                if str(file_path) in registered_paths:
-                    continue
-                
-                # Add as element_capture artifact
-                try:
-                    stat = file_path.stat()
-                    results.append(
-                        ArtifactItemDTO(
-                            run_id=run_id,
-                            type="element_capture",
-                            path=str(file_path),
-                            size=stat.st_size,
-                            created_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            meta={"format": file_path.suffix[1:], "unregistered": True},
-                        )
-                    )
-                except Exception:  # noqa: BLE001
-                    # Skip files that can't be stat'd
-                    continue
-
-    return results
-
-
-def _resolve_artifact_path(path_str: str, manifest_dir: Path, artifacts_root: Path) -> Path | None:
-    """Resolve artifact path from manifest entry.
-
-    Tries multiple strategies:
-    1. Relative to manifest directory
-    2. Relative to artifacts root
-    3. Absolute path if within artifacts root
-    4. Relative to project root (for paths like "artifacts/runs/...")
-    """
-    # Try as-is if absolute
-    candidate = Path(path_str)
-    if candidate.is_absolute() and candidate.exists():
-        return candidate
-
-    # Try relative to manifest directory
-    candidate = manifest_dir / path_str
-    if candidate.exists():
-        return candidate
-
-    # Try relative to artifacts root
-    candidate = artifacts_root / path_str
-    if candidate.exists():
-        return candidate
-
-    # Try relative to runs directory
-    runs_dir = artifacts_root / "runs"
-    candidate = runs_dir / path_str
-    if candidate.exists():
-        return candidate
-
-    # Try relative to project root (for paths like "artifacts/runs/...")
-    # Get project root (parent of artifacts_root)
-    project_root = artifacts_root.parent
-    candidate = project_root / path_str
-    if candidate.exists():
-        return candidate
-
-    return None
+def _load_artifacts_from_manifest(manifest_path: Path, artifact_type: ArtifactType) -> List[ArtifactItemDTO]:
+    """Load artifacts from a single manifest file and scan for unregistered files."""
+    return [
+        ArtifactItemDTO(**row)
+        for row in _load_manifest_rows(manifest_path)
+        if artifact_type == "all" or row["type"] == artifact_type
+    ]
 
 
 def _ensure_within_allowed_roots(path: Path, allowed_roots: Sequence[Path]) -> None:
@@ -1,6 +1,8 @@
 import asyncio
+import html
 import logging
 import traceback
+import uuid
 from typing import Dict, Any, List, Optional, Union, Callable, Awaitable
 
 import gradio as gr
@@ -20,11 +22,105 @@ except ImportError:
         """Stub: Agent functionality not available when ENABLE_LLM=false"""
         raise RuntimeError("Agent functionality is disabled (ENABLE_LLM=false)")
 
-from src.utils.utils import capture_screenshot
+from src.browser.screencast import ScreencastStream, is_live_view_served, register_stream, unregister_stream
+from src.config.feature_flags import FeatureFlags
+from src.utils.utils import capture_screenshot, get_live_page
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def _waiting_html(stream_vw: int, stream_vh: int) -> str:
+    return f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Waiting for browser session...</h1>"
+
+
+def _live_view_html(stream_id: str, stream_vw: int, stream_vh: int) -> str:
+    """Iframe that renders /ws/live-view frames (srcdoc so the script runs on Gradio updates)."""
+    doc = f"""<!DOCTYPE html>
+<html><body style="margin:0">
+<img id="frame" style="width:100%; height:100%; object-fit:contain" alt="Waiting for browser session...">
+<script>
+(function() {{
+  const img = document.getElementById('frame');
+  const loc = window.parent.location;
+  const proto = loc.protocol === 'https:' ? 'wss' : 'ws';
+  let ended = false;
+  function connect() {{
+    const ws = new WebSocket(`${{proto}}://${{loc.host}}/ws/live-view/{stream_id}`);
+    ws.onmessage = (event) => {{
+      const msg = JSON.parse(event.data);
+      if (msg.type === 'frame') {{
+        img.src = 'data:image/jpeg;base64,' + msg.data;
+      }} else if (msg.type === 'end') {{
+        ended = true;
+      }}
+    }};
+    ws.onclose = () => {{
+      if (!ended) {{ setTimeout(connect, 1000); }}
+    }};
+  }}
+  connect();
+}})();
+</script>
+</body></html>"""
+    return (
+        f'<iframe srcdoc="{html.escape(doc, quote=True)}" '
+        f'style="width:{stream_vw}vw; height:{stream_vh}vh; border:1px solid #ccc;"></iframe>'
+    )
+
+
+class _HeadlessLiveView:
+    """
+    Live view of a headless agent run.
+
+    Streams CDP screencast frames over ``/ws/live-view/<id>`` when the
+    ``ui.live_view_screencast`` flag is on, the FastAPI app serving that
+    websocket is running and the browser is Chromium-based; otherwise falls
+    back to polling ``capture_screenshot`` into an ``<img>``.
+    """
+
+    def __init__(self, window_w: int, window_h: int, stream_vw: int, stream_vh: int):
+        self.stream_id = uuid.uuid4().hex
+        self.stream_vw = stream_vw
+        self.stream_vh = stream_vh
+        self.streaming = False
+        self.stream: Optional[ScreencastStream] = None
+        # The standalone Gradio UI does not mount /ws/live-view
+        if is_live_view_served() and FeatureFlags.get("ui.live_view_screencast", expected_type=bool, default=True):
+            self.stream = ScreencastStream(max_width=window_w, max_height=window_h)
+
+    async def render(self, browser_context) -> Optional[str]:
+        """HTML for this tick, or None when the screencast iframe is already showing."""
+        if self.stream is not None:
+            page = get_live_page(browser_context)
+            if page is None:
+                return None if self.streaming else _waiting_html(self.stream_vw, self.stream_vh)
+            if page is self.stream.page and self.stream.active:
+                return None
+            if await self.stream.start(page):
+                register_stream(self.stream_id, self.stream)
+                if self.streaming:
+                    return None  # switched tabs; the iframe keeps its websocket
+                self.streaming = True
+                return _live_view_html(self.stream_id, self.stream_vw, self.stream_vh)
+            if not self.streaming:
+                self.stream = None  # no CDP (e.g. Firefox): poll screenshots instead
+            else:
+                return None
+
+        encoded_screenshot = await capture_screenshot(browser_context)
+        if encoded_screenshot is None:
+            return _waiting_html(self.stream_vw, self.stream_vh)
+        return (
+            f'<img src="data:image/jpeg;base64,{encoded_screenshot}" '
+            f'style="width:{self.stream_vw}vw; height:{self.stream_vh}vh; border:1px solid #ccc;">'
+        )
+
+    async def close(self) -> None:
+        if self.stream is not None:
+            await self.stream.close()
+            unregister_stream(self.stream_id)
+
 async def run_with_stream(
     agent_type: str,
     llm_provider: str,
@@ -83,7 +179,8 @@ async def run_with_stream(
         html_content = f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Using browser...</h1>"
         yield [html_content] + list(result)
     else:
-        # Handle headless mode with periodic UI updates
+        # Handle headless mode with a live view
+        live_view = _HeadlessLiveView(window_w, window_h, stream_vw, stream_vh)
         try:
             agent_state.clear_stop()
             agent_task = asyncio.create_task(
@@ -104,31 +201,32 @@ async def run_with_stream(
             html_content = f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Using browser...</h1>"
             final_result = errors = model_actions = model_thoughts = ""
             latest_videos = trace = history_file = None
+            shown_html = None
 
-            # Periodically update UI while agent is running
+            # Update the UI while the agent is running; screencast frames bypass Gradio entirely
             while not agent_task.done():
                 try:
-                    browser_context = globals_dict["browser_context"]
-                    encoded_screenshot = await capture_screenshot(browser_context)
-                    if encoded_screenshot is not None:
-                        html_content = f'<img src="data:image/jpeg;base64,{encoded_screenshot}" style="width:{stream_vw}vw; height:{stream_vh}vh; border:1px solid #ccc;">'
-                    else:
-                        html_content = f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Waiting for browser session...</h1>"
-                except Exception as e:
-                    html_content = f"<h1 style='width:{stream_vw}vw; height:{stream_vh}vh'>Waiting for browser session...</h1>"
+                    rendered = await live_view.render(globals_dict["browser_context"])
+                except Exception:
+                    rendered = _waiting_html(stream_vw, stream_vh)
+                if rendered is not None:
+                    html_content = rendered
+                html_output = html_content if html_content != shown_html else gr.update()
 
                 # Check if stop was requested
                 if agent_state and agent_state.is_stop_requested():
                     yield [
-                        html_content, final_result, errors, model_actions, model_thoughts, latest_videos, trace, history_file,
+                        html_output, final_result, errors, model_actions, model_thoughts, latest_videos, trace, history_file,
                         gr.update(value="Stopping...", interactive=False), gr.update(interactive=False),
                     ]
+                    shown_html = html_content
                     break
-                else:
+                elif html_content != shown_html:
                     yield [
-                        html_content, final_result, errors, model_actions, model_thoughts, latest_videos, trace, history_file,
+                        html_output, final_result, errors, model_actions, model_thoughts, latest_videos, trace, history_file,
                         gr.update(value="Stop", interactive=True), gr.update(interactive=True)
                     ]
+                    shown_html = html_content
                 await asyncio.sleep(0.05)
 
             # Once the agent task completes, get results
@@ -148,7 +246,8 @@ async def run_with_stream(
                 run_button = gr.update(interactive=True)
 
             yield [
-                html_content, final_result, errors, model_actions, model_thoughts, latest_videos, trace, history_file,
+                html_content if html_content != shown_html else gr.update(),
+                final_result, errors, model_actions, model_thoughts, latest_videos, trace, history_file,
                 stop_button, run_button
             ]
         except Exception as e:
@@ -157,3 +256,5 @@ async def run_with_stream(
                 "", f"Error: {str(e)}\n{traceback.format_exc()}", "", "", None, None, None,
                 gr.update(value="Stop", interactive=True), gr.update(interactive=True)
             ]
+        finally:
+            await live_view.close()
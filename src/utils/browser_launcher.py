@@ -56,7 +56,21 @@ class BrowserLauncher:
         "--disable-background-tasks", 
         "--disable-component-extensions-with-background-pages",
     ]
-    
+
+    # 内蔵Chromium (プロファイルなし) 用の最小限の引数
+    CHROMIUM_NO_PROFILE_ARGS = [
+        "--disable-blink-features=AutomationControlled",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-default-apps",
+        "--disable-background-networking",
+        "--disable-popup-blocking",
+        "--disable-sync",  # Google APIキー関連の同期を無効化
+        "--disable-signin",  # サインイン機能を無効化
+        "--disable-google-default-apis",  # Google API使用を無効化
+        "--disable-component-cloud-policy",  # クラウドポリシーを無効化
+    ]
+
     def __init__(self, browser_type: str):
         """
         BrowserLauncher を初期化
@@ -328,6 +342,34 @@ class BrowserLauncher:
             logger.error(f"❌ Failed to launch {self.browser_type} in headless mode: {e}")
             raise
     
+    def get_chromium_context_options(
+        self,
+        record_video_dir: Optional[str] = None,
+        record_video_size: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
+        """
+        内蔵Chromium (プロファイルなし) 用の new_context オプションを生成
+
+        Args:
+            record_video_dir: ビデオ録画保存ディレクトリ（オプション）
+            record_video_size: 録画サイズ（オプション）
+
+        Returns:
+            Dict[str, Any]: browser.new_context() に渡すオプション
+        """
+        context_options: Dict[str, Any] = {
+            'user_agent': self._get_user_agent(),
+            'accept_downloads': True,
+            'bypass_csp': True,
+            'ignore_https_errors': True,
+            'java_script_enabled': True,
+        }
+        if record_video_dir:
+            context_options['record_video_dir'] = record_video_dir
+            context_options['record_video_size'] = record_video_size or {"width": 1280, "height": 720}
+            logger.info(f"🎥 Video recording enabled: {record_video_dir}")
+        return context_options
+
     async def launch_chromium_without_profile(  # noqa: C901, PLR0915, CCR001
         self,
         record_video_dir: Optional[str] = None,
@@ -346,32 +388,10 @@ class BrowserLauncher:
         """
         logger.info(f"🚀 Launching Chromium without profile (API key warning avoidance)")
         
-        # Chromium用の最小限の引数
-        chromium_args = [
-            "--disable-blink-features=AutomationControlled",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--disable-default-apps",
-            "--disable-background-networking",
-            "--disable-popup-blocking",
-            "--disable-sync",  # Google APIキー関連の同期を無効化
-            "--disable-signin",  # サインイン機能を無効化
-            "--disable-google-default-apis",  # Google API使用を無効化
-            "--disable-component-cloud-policy",  # クラウドポリシーを無効化
-        ]
+        chromium_args = list(self.CHROMIUM_NO_PROFILE_ARGS)
         
         try:
-            context_options: Dict[str, Any] = {
-                'user_agent': self._get_user_agent(),
-                'accept_downloads': True,
-                'bypass_csp': True,
-                'ignore_https_errors': True,
-                'java_script_enabled': True,
-            }
-            if record_video_dir:
-                context_options['record_video_dir'] = record_video_dir
-                context_options['record_video_size'] = record_video_size or {"width": 1280, "height": 720}
-                logger.info(f"🎥 Video recording enabled: {record_video_dir}")
+            context_options = self.get_chromium_context_options(record_video_dir, record_video_size)
 
             start_context = await self._launch_chromium_start_mode(
                 chromium_args,
@@ -39,6 +39,27 @@ class MemoryMonitor:
                 'is_low_memory': False
             }
     
+    def get_resource_usage(self) -> Dict[str, Any]:
+        """ホストCPU使用率と自プロセスツリー(ブラウザ子プロセス含む)のRSSを取得"""
+        try:
+            process = psutil.Process(os.getpid())
+            rss = process.memory_info().rss
+            for child in process.children(recursive=True):
+                try:
+                    rss += child.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return {
+                'cpu_percent': psutil.cpu_percent(interval=None),
+                'rss_mb': round(rss / (1024 * 1024))
+            }
+        except Exception as e:
+            logger.warning(f"Failed to get resource usage: {e}")
+            return {
+                'cpu_percent': 0.0,
+                'rss_mb': 0
+            }
+
     def _calculate_pressure_level(self, used_percent: float) -> str:
         """メモリ圧迫レベルを計算"""
         if used_percent >= 95:
@@ -8,6 +8,9 @@ import logging
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+from src.config.feature_flags import FeatureFlags
+from .profile_snapshot import ProfileSnapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,12 +49,14 @@ class ProfileManager:
         "temp"
     ]
     
-    def __init__(self, source_profile_dir: str):
+    def __init__(self, source_profile_dir: str, use_snapshots: Optional[bool] = None):
         """
         ProfileManager を初期化
         
         Args:
             source_profile_dir: 元のブラウザプロファイルディレクトリ
+            use_snapshots: プロファイルスナップショット (ゴールデンコピー) を使うか
+                (省略時は browser.profile_snapshots_enabled フラグに従う)
             
         Raises:
             FileNotFoundError: ソースプロファイルディレクトリが存在しない場合
@@ -59,6 +64,7 @@ class ProfileManager:
         self.source_profile_dir = Path(source_profile_dir)
         if not self.source_profile_dir.exists():
             raise FileNotFoundError(f"Source profile directory not found: {source_profile_dir}")
+        self.use_snapshots = use_snapshots
         
         logger.info(f"🔧 ProfileManager initialized for: {source_profile_dir}")
     
@@ -99,6 +105,18 @@ class ProfileManager:
         selenium_default.mkdir(exist_ok=True)
         
         logger.info(f"🔧 Creating Selenium profile: {selenium_profile}")
+
+        if self._snapshots_enabled():
+            try:
+                snapshot = ProfileSnapshot.for_source(self.source_profile_dir, self.ESSENTIAL_FILES)
+                snapshot.refresh()
+                materialized = snapshot.materialize(selenium_profile)
+                logger.info(f"✅ Selenium profile created from snapshot with {len(materialized)} files")
+                return str(selenium_profile), len(materialized)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Profile snapshot failed, falling back to full copy: {e}")
+                shutil.rmtree(selenium_profile, ignore_errors=True)
+                selenium_default.mkdir(parents=True, exist_ok=True)
         
         # 重要ファイルのコピー
         copied_files = []
@@ -134,6 +152,11 @@ class ProfileManager:
         logger.info(f"✅ Selenium profile created with {len(copied_files)} files copied")
         return str(selenium_profile), len(copied_files)
     
+    def _snapshots_enabled(self) -> bool:
+        if self.use_snapshots is not None:
+            return self.use_snapshots
+        return bool(FeatureFlags.get("browser.profile_snapshots_enabled", expected_type=bool, default=True))
+
     def cleanup_selenium_profile(self, selenium_profile_dir: str) -> bool:
         """
         SeleniumProfileディレクトリを安全に削除
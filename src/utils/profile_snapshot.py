@@ -0,0 +1,337 @@
+"""
+ProfileSnapshot - cached golden copy of the essential browser profile files
+
+``ProfileManager.create_selenium_profile_with_stats`` used to copy every
+essential profile file from the live Chrome/Edge profile on every launch.
+``ProfileSnapshot`` keeps one golden copy per source profile instead:
+
+- ``refresh()`` compares each source file against a size + mtime manifest and
+  only copies (and sha256-hashes) files that changed, so an unchanged file is
+  never copied twice. The manifest's ``snapshot_id`` is a hash of the file
+  contents.
+- ``materialize()`` builds a SeleniumProfile from the golden copy with a
+  reflink (copy-on-write clone on APFS/btrfs/XFS) where the filesystem
+  supports it, a hardlink for files Chrome only ever replaces atomically,
+  and a plain copy otherwise.
+
+SQLite files (Cookies, History, ...) are written in place by the browser, so
+they are never hardlinked: that would write run state back into the golden
+copy. Golden files are kept read-only and their stat is re-checked on every
+refresh so an accidental in-place write is detected and repaired.
+
+The golden copy contains the user's cookies and saved logins and is kept
+until its source profile disappears (``prune_snapshots``) or the cache
+directory is deleted, so it lives in a per-user cache directory created with
+mode 0700: ``$BYKILT_PROFILE_SNAPSHOT_DIR``, otherwise
+``~/Library/Caches/2bykilt/profile_snapshots`` (macOS),
+``%LOCALAPPDATA%\\2bykilt\\profile_snapshots`` (Windows) or
+``${XDG_CACHE_HOME:-~/.cache}/2bykilt/profile_snapshots``.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR_ENV = "BYKILT_PROFILE_SNAPSHOT_DIR"
+CACHE_APP_DIR = "2bykilt"
+DEFAULT_SNAPSHOT_DIR_NAME = "profile_snapshots"
+MANIFEST_FILENAME = "manifest.json"
+MAX_FILE_BYTES = 100 * 1024 * 1024  # same limit as the legacy full copy
+
+# Chrome rewrites these via write-to-temp + rename (ImportantFileWriter), so a
+# hardlinked run copy is replaced rather than modified in place
+ATOMIC_REPLACE_FILES = frozenset({"Preferences", "Secure Preferences", "Local State", "Bookmarks"})
+
+_FICLONE = 0x40049409  # linux/fs.h
+_CHUNK = 1024 * 1024
+
+
+def _user_cache_dir() -> Path:
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+        return Path(base) if base else Path.home() / "AppData" / "Local"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches"
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+
+def default_snapshot_root() -> Path:
+    """Per-user cache root for golden profile copies."""
+    override = os.environ.get(SNAPSHOT_DIR_ENV)
+    if override:
+        return Path(override)
+    return _user_cache_dir() / CACHE_APP_DIR / DEFAULT_SNAPSHOT_DIR_NAME
+
+
+def _make_private_dir(path: Path) -> None:
+    """Create ``path`` (and missing parents) with the final directory private from the start."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.mkdir(mode=0o700, exist_ok=True)
+    if os.name == "posix" and (path.stat().st_mode & 0o077):
+        os.chmod(path, 0o700)  # created by an older version with the default umask
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone ``src`` to ``dst`` sharing data blocks; False when unsupported."""
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            dst.unlink(missing_ok=True)
+            return False
+        shutil.copystat(src, dst)
+        return True
+    if sys.platform == "darwin":
+        import ctypes
+
+        try:
+            clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        except (OSError, AttributeError):
+            return False
+        return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    return False
+
+
+def _copy_and_hash(src: Path, dst: Path) -> str:
+    """Copy ``src`` to ``dst`` (with metadata) and return its sha256 in the same pass."""
+    digest = hashlib.sha256()
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        while True:
+            chunk = s.read(_CHUNK)
+            if not chunk:
+                break
+            digest.update(chunk)
+            d.write(chunk)
+    shutil.copystat(src, dst)
+    return digest.hexdigest()
+
+
+def prune_snapshots(root: Optional[Path] = None) -> int:
+    """
+    Remove golden copies whose source profile no longer exists.
+
+    Returns:
+        int: Number of snapshot directories removed
+    """
+    root = Path(root) if root else default_snapshot_root()
+    removed = 0
+    try:
+        candidates = [p for p in root.iterdir() if p.is_dir()]
+    except FileNotFoundError:
+        return 0
+    for snapshot_dir in candidates:
+        try:
+            source = json.loads((snapshot_dir / MANIFEST_FILENAME).read_text(encoding="utf-8")).get("source")
+        except (OSError, ValueError, AttributeError):
+            continue  # being created, or not ours
+        if source and not Path(source).exists():
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+            removed += 1
+    if removed:
+        logger.info(f"🗑️ Removed {removed} stale profile snapshot(s) from {root}")
+    return removed
+
+
+class ProfileSnapshot:
+    """
+    Golden copy of the essential files of one source profile.
+
+    Example:
+        ```python
+        snapshot = ProfileSnapshot.for_source(Path("~/Library/Application Support/Google/Chrome").expanduser(),
+                                              ProfileManager.ESSENTIAL_FILES)
+        snapshot.refresh()  # {"copied": 1, "unchanged": 7, "removed": 0}
+        entries = snapshot.materialize(Path(workspace) / "SeleniumProfile")
+        ```
+    """
+
+    _instances: Dict[Tuple[Path, Path], "ProfileSnapshot"] = {}
+    _instances_lock = threading.Lock()
+    _pruned_roots: set = set()
+
+    def __init__(self, source_dir: Path, entries: Iterable[str], root: Optional[Path] = None):
+        self.source_dir = Path(source_dir)
+        self.entries = list(entries)
+        self.root = Path(root) if root else default_snapshot_root()
+        key = hashlib.sha256(str(self.source_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+        self.dir = self.root / key
+        self.golden_dir = self.dir / "golden"
+        self.manifest_path = self.dir / MANIFEST_FILENAME
+        self._lock = threading.Lock()
+        self._manifest: Optional[dict] = None
+        self._reflink_supported = True
+        self._hardlink_supported = os.name == "posix"
+
+    @classmethod
+    def for_source(cls, source_dir: Path, entries: Iterable[str], root: Optional[Path] = None) -> "ProfileSnapshot":
+        """Return the shared snapshot for a source profile."""
+        root = Path(root) if root else default_snapshot_root()
+        with cls._instances_lock:
+            if root not in cls._pruned_roots:
+                cls._pruned_roots.add(root)
+                prune_snapshots(root)
+            snapshot = cls._instances.get((source_dir, root))
+            if snapshot is None:
+                snapshot = cls._instances[(source_dir, root)] = cls(source_dir, entries, root)
+            return snapshot
+
+    @property
+    def snapshot_id(self) -> Optional[str]:
+        """Content hash of the current golden copy (None before the first refresh)."""
+        return (self._manifest or {}).get("snapshot_id")
+
+    # ---------------- Manifest -------------------
+    def _load_manifest(self) -> dict:
+        if self._manifest is None:
+            try:
+                data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+                if data.get("source") != str(self.source_dir):
+                    raise ValueError("manifest belongs to another source")
+                self._manifest = data
+            except (OSError, ValueError, AttributeError):
+                self._manifest = {"source": str(self.source_dir), "files": {}}
+        return self._manifest
+
+    def _save_manifest(self, manifest: dict) -> None:
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    def _source_files(self) -> Dict[str, Tuple[str, os.stat_result]]:
+        """Map relative path -> (essential entry, stat) for every file to snapshot."""
+        files: Dict[str, Tuple[str, os.stat_result]] = {}
+        for entry in self.entries:
+            path = self.source_dir / entry
+            if path.is_dir():
+                candidates = [p for p in path.rglob("*") if p.is_file()]
+            elif path.is_file():
+                candidates = [path]
+            else:
+                continue
+            for candidate in candidates:
+                stats = candidate.stat()
+                rel = candidate.relative_to(self.source_dir).as_posix()
+                if stats.st_size > MAX_FILE_BYTES:
+                    logger.warning(f"⚠️ Skipping large file {rel}: {stats.st_size / 1024 / 1024:.1f}MB")
+                    continue
+                files[rel] = (entry, stats)
+        return files
+
+    # ---------------- Refresh -------------------
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the golden copy in line with the source profile.
+
+        Returns:
+            Dict[str, int]: Number of ``copied``, ``unchanged`` and ``removed`` files
+        """
+        with self._lock:
+            # cookies and login data live here: no window with default permissions
+            _make_private_dir(self.root)
+            _make_private_dir(self.dir)
+            self.golden_dir.mkdir(mode=0o700, exist_ok=True)
+            manifest = self._load_manifest()
+            known: Dict[str, dict] = manifest["files"]
+            current = self._source_files()
+            copied = unchanged = 0
+
+            for rel, (entry, stats) in current.items():
+                record = known.get(rel)
+                golden = self.golden_dir / rel
+                if record and record["size"] == stats.st_size and record["mtime_ns"] == stats.st_mtime_ns \
+                        and self._golden_intact(golden, record):
+                    record["entry"] = entry
+                    unchanged += 1
+                    continue
+                golden.parent.mkdir(parents=True, exist_ok=True)
+                tmp = golden.with_name(golden.name + ".part")
+                tmp.unlink(missing_ok=True)
+                sha256 = _copy_and_hash(self.source_dir / rel, tmp)
+                if self._hardlink_supported:
+                    os.chmod(tmp, 0o444)
+                os.replace(tmp, golden)
+                golden_stats = golden.stat()
+                known[rel] = {
+                    "entry": entry,
+                    "size": stats.st_size,
+                    "mtime_ns": stats.st_mtime_ns,
+                    "sha256": sha256,
+                    "golden_mtime_ns": golden_stats.st_mtime_ns,
+                }
+                copied += 1
+
+            removed = [rel for rel in known if rel not in current]
+            for rel in removed:
+                (self.golden_dir / rel).unlink(missing_ok=True)
+                del known[rel]
+
+            if copied or removed or "snapshot_id" not in manifest:
+                digest = hashlib.sha256()
+                for rel in sorted(known):
+                    digest.update(f"{rel}\0{known[rel]['sha256']}\n".encode("utf-8"))
+                manifest["snapshot_id"] = digest.hexdigest()
+                self._save_manifest(manifest)
+                logger.info(f"📸 Profile snapshot {manifest['snapshot_id'][:12]} updated "
+                            f"({copied} copied, {unchanged} unchanged, {len(removed)} removed)")
+        return {"copied": copied, "unchanged": unchanged, "removed": len(removed)}
+
+    @staticmethod
+    def _golden_intact(golden: Path, record: dict) -> bool:
+        try:
+            stats = golden.stat()
+        except FileNotFoundError:
+            return False
+        return stats.st_size == record["size"] and stats.st_mtime_ns == record["golden_mtime_ns"]
+
+    # ---------------- Materialize -------------------
+    def _place(self, golden: Path, target: Path) -> str:
+        if self._reflink_supported:
+            if _reflink(golden, target):
+                os.chmod(target, 0o644)
+                return "reflink"
+            self._reflink_supported = False
+        if self._hardlink_supported and golden.name in ATOMIC_REPLACE_FILES:
+            try:
+                os.link(golden, target)
+                return "hardlink"
+            except OSError:  # e.g. EXDEV: cache and workspace on different filesystems
+                self._hardlink_supported = False
+        shutil.copy2(golden, target)
+        os.chmod(target, 0o644)
+        return "copy"
+
+    def materialize(self, target_dir: Path) -> List[str]:
+        """
+        Populate ``target_dir`` from the golden copy (call ``refresh()`` first).
+
+        Args:
+            target_dir: SeleniumProfile directory (must not contain the files yet)
+
+        Returns:
+            List[str]: Essential entries that were materialized
+        """
+        target_dir = Path(target_dir)
+        methods: Dict[str, int] = {}
+        entries = set()
+        with self._lock:
+            for rel, record in self._load_manifest()["files"].items():
+                target = target_dir / rel
+                target.parent.mkdir(parents=True, exist_ok=True)
+                method = self._place(self.golden_dir / rel, target)
+                methods[method] = methods.get(method, 0) + 1
+                entries.add(record["entry"])
+        logger.debug(f"Profile snapshot materialized into {target_dir}: {methods}")
+        return [entry for entry in self.entries if entry in entries]
+
+
+__all__ = ["ProfileSnapshot", "default_snapshot_root", "prune_snapshots", "ATOMIC_REPLACE_FILES", "SNAPSHOT_DIR_ENV"]
@@ -268,6 +268,21 @@ def get_latest_files(directory: str, file_types: list = ['.webm', '.zip']) -> Di
             print(f"Error getting latest {file_type} file: {e}")
             
     return latest_files
+
+
+def get_live_page(browser_context):
+    """Return the page shown in the live view: first non about:blank page, else the first page."""
+    playwright_browser = browser_context.browser.playwright_browser
+    if not (playwright_browser and playwright_browser.contexts):
+        return None
+    ctx = playwright_browser.contexts[0]
+    pages = list(ctx.pages) if ctx else []
+    for p in pages:
+        if p.url != "about:blank":
+            return p
+    return pages[0] if pages else None
+
+
 async def capture_screenshot(browser_context):
     """Capture and encode a screenshot (Issue #33 unified path).
 
@@ -275,18 +290,7 @@ async def capture_screenshot(browser_context):
     Returns base64 string or None.
     """
     try:
-        playwright_browser = browser_context.browser.playwright_browser
-        if not (playwright_browser and playwright_browser.contexts):
-            return None
-        ctx = playwright_browser.contexts[0]
-        pages = list(ctx.pages) if ctx else []
-        target = None
-        for p in pages:
-            if p.url != "about:blank":
-                target = p
-                break
-        if not target and pages:
-            target = pages[0]
+        target = get_live_page(browser_context)
         if not target:
             return None
         from src.core.screenshot_manager import capture_page_screenshot
@@ -8,21 +8,23 @@ Key Features:
 - Queue-based conversion with deduplication
 - Existing GIF cache priority (avoid re-generation)
 - Configurable retry logic with failure tracking
-- Throttling to prevent excessive resource usage
+- Conversion pool sized to the available CPU cores (replaces fixed throttling)
+- Single-pass ffmpeg filter graph (split/palettegen/paletteuse), capability probed once
+- Completed/failed state persisted to a JSONL file across restarts
 - Feature flag gated: artifacts.recordings_gif_fallback_enabled
 """
 
 import asyncio
+import json
 import logging
 import os
-import subprocess
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 
 from src.config.feature_flags import FeatureFlags
+from src.utils.fs_paths import get_artifacts_base_dir
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +33,34 @@ logger = logging.getLogger(__name__)
 BYTES_TO_MB = 1024 * 1024
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 5
-THROTTLE_DELAY_SECONDS = 2
 GIF_MAX_SIZE_MB = 10
 GIF_FPS = 10
 GIF_WIDTH = 640
+# Upper bound for concurrent ffmpeg processes; each gets cores // workers threads
+GIF_POOL_MAX_WORKERS = 4
+FFMPEG_THREADS_PER_WORKER = 2
+STATE_FILENAME = "gif_fallback_state.jsonl"
+
+
+def _available_cores() -> int:
+    """CPU cores usable by this process (honours affinity / cgroup cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # macOS / Windows
+        return os.cpu_count() or 1
+
+
+def default_pool_size(cores: Optional[int] = None) -> int:
+    """Number of concurrent conversions for ``cores`` available cores."""
+    cores = cores or _available_cores()
+    return max(1, min(GIF_POOL_MAX_WORKERS, cores // FFMPEG_THREADS_PER_WORKER))
+
+
+@dataclass(frozen=True)
+class FfmpegCapabilities:
+    """Result of the one-time ffmpeg probe."""
+    available: bool
+    palette_filters: bool = False
 
 
 @dataclass
@@ -54,18 +80,93 @@ class GifFallbackWorker:
     
     Attributes:
         queue: Pending conversion tasks
+        queued: Video paths enqueued and not yet finished (including retries)
         processing: Currently processing task paths
         completed: Successfully completed task paths
         failed: Failed task paths with error info
+        max_workers: Number of conversions run concurrently
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None, state_path: Optional[Path] = None):
+        """
+        Args:
+            max_workers: Concurrent conversions (default: ``default_pool_size()``)
+            state_path: JSONL file persisting completed/failed videos; ``None``
+                keeps state in memory only
+        """
         self.queue: asyncio.Queue[ConversionTask] = asyncio.Queue()
+        self.queued: Set[str] = set()
         self.processing: Set[str] = set()
         self.completed: Set[str] = set()
         self.failed: Dict[str, str] = {}
+        self.max_workers = max(1, max_workers or default_pool_size())
+        self.ffmpeg_threads = max(1, _available_cores() // self.max_workers)
+        self.state_path = Path(state_path) if state_path else None
+        self._ffmpeg: Optional[FfmpegCapabilities] = None
+        self._ffmpeg_lock: Optional[asyncio.Lock] = None
         self._running = False
         self._worker_task: Optional[asyncio.Task] = None
+        self._load_state()
+
+    # ---------------- Persistent state -------------------
+    def _load_state(self) -> None:
+        """Replay the state log (last record per video wins) and compact it."""
+        if not self.state_path or not self.state_path.exists():
+            return
+        records = 0
+        try:
+            with self.state_path.open("r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        record = json.loads(line)
+                        video_path = record["video"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    records += 1
+                    self.completed.discard(video_path)
+                    self.failed.pop(video_path, None)
+                    if record.get("status") == "completed":
+                        self.completed.add(video_path)
+                    elif record.get("status") == "failed":
+                        self.failed[video_path] = record.get("error") or "failed"
+        except OSError as e:
+            logger.warning(f"Failed to load GIF worker state {self.state_path}: {e}")
+            return
+        if records > 2 * (len(self.completed) + len(self.failed)) + 100:
+            self._compact_state()
+
+    def _compact_state(self) -> None:
+        tmp = self.state_path.with_suffix(".tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as fh:
+                for video_path in sorted(self.completed):
+                    fh.write(json.dumps({"video": video_path, "status": "completed"}, ensure_ascii=False) + "\n")
+                for video_path, error in sorted(self.failed.items()):
+                    fh.write(json.dumps({"video": video_path, "status": "failed", "error": error},
+                                        ensure_ascii=False) + "\n")
+            tmp.replace(self.state_path)
+        except OSError as e:
+            logger.warning(f"Failed to compact GIF worker state {self.state_path}: {e}")
+
+    def _record_state(self, video_path: str, status: str, error: Optional[str] = None) -> None:
+        if not self.state_path:
+            return
+        record = {"video": video_path, "status": status, "ts": time.time()}
+        if error:
+            record["error"] = error
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.state_path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to persist GIF worker state: {e}")
+
+    def forget(self, video_path: str) -> None:
+        """Drop completed/failed state for a video so it can be converted again."""
+        if video_path in self.completed or video_path in self.failed:
+            self.completed.discard(video_path)
+            self.failed.pop(video_path, None)
+            self._record_state(video_path, "forgotten")
     
     def is_enabled(self) -> bool:
         """Check if GIF fallback is enabled via feature flag."""
@@ -96,22 +197,23 @@ class GifFallbackWorker:
             logger.warning(f"Video file not found: {video_path}")
             return False
         
+        # Priority 1: Already completed (in this or a previous process, no GIF stat)
+        if video_path in self.completed:
+            logger.debug(f"Video already converted: {video_path}")
+            return False
+        
+        # Priority 2: Already queued or processing (two workers would share one .part file)
+        if video_path in self.queued or video_path in self.processing:
+            logger.debug(f"Video already queued or processing: {video_path}")
+            return False
+        
         gif_path = self.get_gif_path(video_path)
         
-        # Priority 1: Existing GIF (cache hit)
+        # Priority 3: Existing GIF (cache hit)
         if os.path.exists(gif_path):
             logger.debug(f"GIF already exists, skipping: {gif_path}")
             self.completed.add(video_path)
-            return False
-        
-        # Priority 2: Already processing
-        if video_path in self.processing:
-            logger.debug(f"Video already processing: {video_path}")
-            return False
-        
-        # Priority 3: Already completed
-        if video_path in self.completed:
-            logger.debug(f"Video already converted: {video_path}")
+            self._record_state(video_path, "completed")
             return False
         
         # Priority 4: Previously failed (don't retry immediately)
@@ -124,6 +226,7 @@ class GifFallbackWorker:
             video_path=video_path,
             gif_path=gif_path
         )
+        self.queued.add(video_path)
         await self.queue.put(task)
         logger.info(f"Enqueued video for GIF conversion: {video_path}")
         return True
@@ -140,7 +243,7 @@ class GifFallbackWorker:
         
         self._running = True
         self._worker_task = asyncio.create_task(self._process_queue())
-        logger.info("GIF fallback worker started")
+        logger.info(f"GIF fallback worker started ({self.max_workers} workers, {self.ffmpeg_threads} ffmpeg threads each)")
         await asyncio.sleep(0)  # Yield control to event loop
     
     async def stop(self):
@@ -159,7 +262,11 @@ class GifFallbackWorker:
         await asyncio.sleep(0)  # Yield control to event loop
     
     async def _process_queue(self):
-        """Main worker loop - processes queued tasks."""
+        """Main worker loop - runs ``max_workers`` consumers over the shared queue."""
+        await asyncio.gather(*(self._consume(i) for i in range(self.max_workers)))
+
+    async def _consume(self, worker_id: int):
+        """Pool member: converts queued tasks one at a time until stopped."""
         while self._running:
             try:
                 # Wait for task with timeout to allow checking _running flag
@@ -176,8 +283,6 @@ class GifFallbackWorker:
                 logger.error(f"Unexpected error processing task: {e}", exc_info=True)
             finally:
                 self.queue.task_done()
-                # Throttle to prevent resource exhaustion
-                await asyncio.sleep(THROTTLE_DELAY_SECONDS)
     
     async def _process_task(self, task: ConversionTask):
         """Process a single conversion task."""
@@ -197,6 +302,7 @@ class GifFallbackWorker:
             if success:
                 task.status = "completed"
                 self.completed.add(video_path)
+                self._record_state(video_path, "completed")
                 logger.info(f"GIF conversion completed: {gif_path}")
             else:
                 # Retry logic
@@ -209,18 +315,28 @@ class GifFallbackWorker:
                 else:
                     task.status = "failed"
                     task.error_message = f"Exceeded max retries ({MAX_RETRIES})"
-                    self.failed[video_path] = task.error_message
+                    self._mark_failed(video_path, task.error_message)
                     logger.error(f"GIF conversion failed after {MAX_RETRIES} retries: {video_path}")
         
         except Exception as e:
             task.status = "failed"
             task.error_message = str(e)
-            self.failed[video_path] = task.error_message
+            self._mark_failed(video_path, task.error_message)
             logger.error(f"GIF conversion exception: {e}", exc_info=True)
         
         finally:
-            # Remove from processing set
+            # Remove from processing set; a retry stays queued
             self.processing.discard(video_path)
+            if task.status != "pending":
+                self.queued.discard(video_path)
+
+    def _mark_failed(self, video_path: str, error: str) -> None:
+        """Record a failure; only persisted when ffmpeg itself is usable."""
+        self.failed[video_path] = error
+        if self._ffmpeg is not None and not self._ffmpeg.available:
+            # Missing ffmpeg is not the video's fault: retry after a restart
+            return
+        self._record_state(video_path, "failed", error)
     
     async def _convert_video_to_gif(self, video_path: str, gif_path: str) -> bool:
         """
@@ -237,6 +353,56 @@ class GifFallbackWorker:
         logger.warning("ffmpeg not available or conversion failed, GIF generation skipped")
         return False
     
+    async def probe_ffmpeg(self) -> FfmpegCapabilities:
+        """Probe ffmpeg once (availability and palette filters) and cache the result."""
+        if self._ffmpeg is not None:
+            return self._ffmpeg
+        if self._ffmpeg_lock is None:
+            self._ffmpeg_lock = asyncio.Lock()
+        async with self._ffmpeg_lock:
+            if self._ffmpeg is None:
+                self._ffmpeg = await self._run_ffmpeg_probe()
+                logger.info(f"ffmpeg capabilities: {self._ffmpeg}")
+        return self._ffmpeg
+
+    async def _run_ffmpeg_probe(self) -> FfmpegCapabilities:
+        try:
+            result = await asyncio.create_subprocess_exec(
+                'ffmpeg', '-hide_banner', '-filters',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, _ = await result.communicate()
+        except (FileNotFoundError, PermissionError):
+            logger.debug("ffmpeg not found in PATH")
+            return FfmpegCapabilities(available=False)
+        if result.returncode != 0:
+            logger.debug("ffmpeg not available")
+            return FfmpegCapabilities(available=False)
+        filters = (stdout or b"").decode(errors="replace")
+        return FfmpegCapabilities(
+            available=True,
+            palette_filters="palettegen" in filters and "paletteuse" in filters,
+        )
+
+    def build_ffmpeg_command(self, video_path: str, output_path: str, palette_filters: bool = True) -> List[str]:
+        """
+        Build the single-pass conversion command.
+
+        The video is decoded once; ``split`` feeds the same frames to
+        ``palettegen`` and ``paletteuse``. Without palette filters the default
+        GIF palette is used.
+        """
+        base = f'fps={GIF_FPS},scale={GIF_WIDTH}:-1:flags=lanczos'
+        graph = f'{base},split[s0][s1];[s0]palettegen[p];[s1][p]paletteuse' if palette_filters else base
+        return [
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-threads', str(self.ffmpeg_threads),
+            '-i', video_path,
+            '-filter_complex', graph,
+            '-f', 'gif', '-y', output_path,
+        ]
+
     async def _convert_with_ffmpeg(self, video_path: str, gif_path: str) -> bool:
         """
         Convert video to GIF using ffmpeg.
@@ -244,47 +410,18 @@ class GifFallbackWorker:
         Command optimizes for file size while maintaining quality:
         - Scale to GIF_WIDTH maintaining aspect ratio
         - Set FPS to GIF_FPS
-        - Use palette generation for better colors
+        - Use palette generation for better colors (single decode pass)
+        
+        The GIF is written to a temporary file and renamed, so a GIF on disk is
+        always complete.
         """
+        partial_path = gif_path + ".part"
         try:
-            # Check if ffmpeg is available
-            result = await asyncio.create_subprocess_exec(
-                'ffmpeg', '-version',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await result.communicate()
-            if result.returncode != 0:
-                logger.debug("ffmpeg not available")
+            capabilities = await self.probe_ffmpeg()
+            if not capabilities.available:
                 return False
             
-            # Generate palette for better color quality
-            palette_path = gif_path + ".palette.png"
-            palette_cmd = [
-                'ffmpeg', '-i', video_path,
-                '-vf', f'fps={GIF_FPS},scale={GIF_WIDTH}:-1:flags=lanczos,palettegen',
-                '-y', palette_path
-            ]
-            
-            logger.debug(f"Generating palette: {' '.join(palette_cmd)}")
-            result = await asyncio.create_subprocess_exec(
-                *palette_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            _, stderr = await result.communicate()
-            
-            if result.returncode != 0:
-                logger.error(f"Palette generation failed: {stderr.decode()}")
-                return False
-            
-            # Convert to GIF using palette
-            convert_cmd = [
-                'ffmpeg', '-i', video_path, '-i', palette_path,
-                '-lavfi', f'fps={GIF_FPS},scale={GIF_WIDTH}:-1:flags=lanczos[x];[x][1:v]paletteuse',
-                '-y', gif_path
-            ]
-            
+            convert_cmd = self.build_ffmpeg_command(video_path, partial_path, capabilities.palette_filters)
             logger.debug(f"Converting to GIF: {' '.join(convert_cmd)}")
             result = await asyncio.create_subprocess_exec(
                 *convert_cmd,
@@ -293,20 +430,15 @@ class GifFallbackWorker:
             )
             _, stderr = await result.communicate()
             
-            # Cleanup palette
-            try:
-                os.remove(palette_path)
-            except Exception:
-                pass
-            
             if result.returncode != 0:
-                logger.error(f"GIF conversion failed: {stderr.decode()}")
+                logger.error(f"GIF conversion failed: {stderr.decode(errors='replace')}")
                 return False
             
             # Verify output
-            if not os.path.exists(gif_path):
+            if not os.path.exists(partial_path):
                 logger.error(f"GIF file not created: {gif_path}")
                 return False
+            os.replace(partial_path, gif_path)
             
             # Check file size
             gif_size_mb = os.path.getsize(gif_path) / BYTES_TO_MB
@@ -323,13 +455,21 @@ class GifFallbackWorker:
         except Exception as e:
             logger.error(f"ffmpeg conversion error: {e}", exc_info=True)
             return False
+        finally:
+            try:
+                os.remove(partial_path)
+            except OSError:
+                pass
     
     def get_status(self) -> Dict:
         """Get current worker status for monitoring/metrics."""
         return {
             "enabled": self.is_enabled(),
             "running": self._running,
+            "workers": self.max_workers,
+            "ffmpeg_available": self._ffmpeg.available if self._ffmpeg else None,
             "queue_size": self.queue.qsize(),
+            "queued_count": len(self.queued),
             "processing_count": len(self.processing),
             "completed_count": len(self.completed),
             "failed_count": len(self.failed)
@@ -344,5 +484,5 @@ def get_worker() -> GifFallbackWorker:
     """Get or create the global worker instance."""
     global _worker_instance
     if _worker_instance is None:
-        _worker_instance = GifFallbackWorker()
+        _worker_instance = GifFallbackWorker(state_path=get_artifacts_base_dir() / STATE_FILENAME)
     return _worker_instance
@@ -283,6 +283,60 @@ class TestRunHistoryWebSocket:
         await run_history_stream(mock_ws)
 
 
+@pytest.mark.ci_safe
+class TestLiveViewWebSocket:
+    """Tests for live_view_stream WebSocket endpoint."""
+
+    @pytest.mark.asyncio
+    @patch('src.api.realtime_router._LIVE_VIEW_WAIT_INTERVAL', 0.01)
+    async def test_streams_frames_until_close(self):
+        """Frames are sent as JSON and an end message follows close()."""
+        from src.browser.screencast import ScreencastFrame, ScreencastStream, register_stream, unregister_stream
+        from src.api.realtime_router import live_view_stream
+
+        stream = ScreencastStream()
+        mock_ws = AsyncMock(spec=WebSocket)
+        task = asyncio.create_task(live_view_stream(mock_ws, "run-1"))
+        await asyncio.sleep(0.03)  # viewer waits for the stream to be registered
+
+        register_stream("run-1", stream)
+        await asyncio.sleep(0.03)
+        stream.publish(ScreencastFrame(seq=1, data="AAAA", width=10, height=10, quality=60, timestamp=0.0))
+        await asyncio.sleep(0)
+        await stream.close()
+        await asyncio.wait_for(task, timeout=1)
+        unregister_stream("run-1")
+
+        sent = [json.loads(call.args[0]) for call in mock_ws.send_text.call_args_list]
+        assert sent[0]["type"] == "frame" and sent[0]["data"] == "AAAA"
+        assert sent[-1] == {"type": "end"}
+
+    @pytest.mark.asyncio
+    @patch('src.api.realtime_router._LIVE_VIEW_WAIT_INTERVAL', 0.01)
+    @patch('src.api.realtime_router._LIVE_VIEW_WAIT_TIMEOUT', 0.03)
+    async def test_unknown_stream_ends(self):
+        """A stream that never appears ends the socket after the wait timeout."""
+        from src.api.realtime_router import live_view_stream
+
+        mock_ws = AsyncMock(spec=WebSocket)
+        await asyncio.wait_for(live_view_stream(mock_ws, "missing"), timeout=1)
+
+        mock_ws.send_text.assert_called_once_with(json.dumps({"type": "end"}))
+
+    @pytest.mark.asyncio
+    @patch('src.api.realtime_router.FeatureFlags.get', return_value=False)
+    async def test_disabled_feature_flag_closes_socket(self, mock_flag):
+        """With ui.live_view_screencast off the socket is closed without frames."""
+        from src.api.realtime_router import live_view_stream
+
+        mock_ws = AsyncMock(spec=WebSocket)
+        await asyncio.wait_for(live_view_stream(mock_ws, "run-1"), timeout=1)
+
+        mock_flag.assert_called_once_with("ui.live_view_screencast", expected_type=bool, default=True)
+        mock_ws.close.assert_awaited_once()
+        mock_ws.send_text.assert_not_called()
+
+
 @pytest.mark.ci_safe
 class TestRealtimeRouterIntegration:
     """Integration tests for realtime router."""
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import os
+import shutil
+import sqlite3
 import time
 from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from src.recordings.recordings_index import INDEX_FILENAME, RecordingsIndex
 from src.recordings.recordings_scanner import DEFAULT_EXTENSIONS, scan_recordings
 from src.config.feature_flags import FeatureFlags
 
@@ -168,3 +172,81 @@ def test_custom_extension_normalisation(tmp_path: Path) -> None:
     result = list(scan_recordings(root, allow_extensions=["CUSTOM", "mp4"]))
 
     assert [item.path for item in result] == [sample]
+
+
+def _age_dirs(root: Path, mtime: float) -> None:
+    for current, _dirs, _files in os.walk(root):
+        os.utime(current, (mtime, mtime))
+
+
+@pytest.mark.ci_safe
+def test_index_rescans_only_changed_directories(tmp_path: Path) -> None:
+    root = tmp_path / "runs"
+    base = time.time() - 3600
+    for run in ("a", "b", "c"):
+        (root / run).mkdir(parents=True)
+        _touch(root / run / f"{run}.webm", mtime=base)
+    _age_dirs(root, base)
+
+    index = RecordingsIndex(root)
+    assert index.refresh() == {"rescanned": 4, "removed": 0}
+    _age_dirs(root, base)  # creating the index file touched the root
+    index.refresh()
+    assert index.refresh() == {"rescanned": 0, "removed": 0}
+
+    _touch(root / "b" / "b2.webm", mtime=base + 10)
+    shutil.rmtree(root / "c")
+    for changed in (root, root / "b"):
+        os.utime(changed, (base + 20, base + 20))
+    assert index.refresh() == {"rescanned": 2, "removed": 1}
+
+    rows = index.query({".webm"}, limit=10, offset=0)
+    assert [path.name for path, _, _ in rows] == ["b2.webm", "a.webm", "b.webm"]
+    assert [path.name for path, _, _ in index.query({".webm"}, limit=1, offset=1)] == ["a.webm"]
+    index.close()
+
+    # Persistent: a new instance reuses the stored listings; only the root is
+    # re-listed because closing the index removed its WAL files
+    reopened = RecordingsIndex(root)
+    assert reopened.refresh() == {"rescanned": 1, "removed": 0}
+    assert len(reopened.query({".webm"}, limit=10, offset=0)) == 3
+    reopened.close()
+
+
+@pytest.mark.ci_safe
+def test_index_restats_recordings_still_being_written(tmp_path: Path) -> None:
+    root = tmp_path / "runs"
+    root.mkdir()
+    now = time.time()
+    growing = root / "growing.webm"
+    _touch(growing, mtime=now)
+    _age_dirs(root, now - 3600)
+
+    index = RecordingsIndex(root, clock=lambda: now)
+    index.refresh()
+    with growing.open("ab") as handle:
+        handle.write(b"more frames")
+    os.utime(growing, (now + 1, now + 1))
+
+    index.refresh()
+    [(path, size, mtime)] = index.query({".webm"}, limit=1, offset=0)
+    assert size == growing.stat().st_size
+    assert mtime == now + 1
+    index.close()
+
+
+@pytest.mark.ci_safe
+def test_scan_uses_index_and_falls_back_to_walk(tmp_path: Path) -> None:
+    FeatureFlags.set_override(_FLAG, True)
+
+    root = tmp_path / "runs"
+    nested = root / "run-1" / "videos"
+    nested.mkdir(parents=True)
+    sample = nested / "sample.webm"
+    _touch(sample, mtime=time.time())
+
+    assert [item.path for item in scan_recordings(root)] == [sample]
+    assert (root / INDEX_FILENAME).exists()
+
+    with patch.object(RecordingsIndex, "for_root", side_effect=sqlite3.OperationalError("readonly")):
+        assert [item.path for item in scan_recordings(root)] == [sample]
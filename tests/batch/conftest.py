@@ -26,6 +26,12 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture(autouse=True)
+def isolated_artifacts_dir(tmp_path, monkeypatch):
+    """Keep the batch manifest index out of the repository artifacts dir."""
+    monkeypatch.setenv("ARTIFACTS_BASE_DIR", str(tmp_path / "artifacts"))
+
+
 @pytest.fixture
 def run_context(temp_dir):
     """Create mock run context."""
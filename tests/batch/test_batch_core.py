@@ -107,6 +107,25 @@ class TestBatchEngineCSVParsing:
         assert rows[0] == {"name": "test0", "value": "data0"}
         assert rows[-1] == {"name": "test999", "value": "data999"}
 
+    def test_iter_csv_chunks_streams_in_chunks(self, engine, temp_dir):
+        """Test streaming CSV ingestion yields bounded chunks."""
+        csv_file = temp_dir / "stream.csv"
+        csv_file.write_text("name;value\n" + "".join(f"test{i};data{i}\n" for i in range(25)))
+
+        chunks = list(engine.iter_csv_chunks(str(csv_file), chunk_size=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert chunks[0][0] == {"name": "test0", "value": "data0"}
+        assert chunks[-1][-1] == {"name": "test24", "value": "data24"}
+
+    def test_iter_csv_chunks_no_data_rows(self, engine, temp_dir):
+        """Test streaming ingestion rejects header-only files."""
+        csv_file = temp_dir / "header_only.csv"
+        csv_file.write_text("name,value\n")
+
+        with pytest.raises(FileProcessingError, match="No valid data rows found"):
+            list(engine.iter_csv_chunks(str(csv_file)))
+
     def test_parse_csv_custom_config(self, temp_dir):
         """Test CSV parsing with custom configuration."""
         from src.runtime.run_context import RunContext
@@ -314,6 +333,16 @@ class TestBatchEngineConfiguration:
         with pytest.raises(ConfigurationError, match="log_level must be one of"):
             BatchEngine(run_context, invalid_config)
 
+    def test_config_validation_invalid_max_parallel_jobs(self, run_context):
+        """Test configuration validation for invalid max_parallel_jobs values."""
+        from src.batch.engine import BatchEngine
+
+        with pytest.raises(ConfigurationError, match="max_parallel_jobs must be a positive integer"):
+            BatchEngine(run_context, {'max_parallel_jobs': 0})
+
+        with pytest.raises(ConfigurationError, match="max_parallel_jobs too large"):
+            BatchEngine(run_context, {'max_parallel_jobs': 1000})
+
     def test_config_validation_env_vars(self, run_context, monkeypatch):
         """Test configuration loading from environment variables."""
         from src.batch.engine import BatchEngine
@@ -324,6 +353,7 @@ class TestBatchEngineConfiguration:
         monkeypatch.setenv('BATCH_ENCODING', 'utf-8')
         monkeypatch.setenv('BATCH_ALLOW_PATH_TRAVERSAL', 'false')
         monkeypatch.setenv('BATCH_LOG_LEVEL', 'DEBUG')
+        monkeypatch.setenv('BATCH_MAX_PARALLEL_JOBS', '4')
         
         # Create engine without explicit config
         engine = BatchEngine(run_context)
@@ -334,6 +364,7 @@ class TestBatchEngineConfiguration:
         assert engine.config['encoding'] == 'utf-8'
         assert engine.config['allow_path_traversal'] is False
         assert engine.config['log_level'] == 'DEBUG'
+        assert engine.config['max_parallel_jobs'] == 4
 
 
 @pytest.mark.ci_safe
@@ -7,8 +7,10 @@ This module tests:
 - Job creation and execution logging
 - Security check exception logging
 - Batch execution with different contexts and configurations
+- Concurrent execution of batch jobs (max_parallel_jobs)
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from unittest.mock import patch, Mock
@@ -54,7 +56,7 @@ class TestStartBatch:
 
             assert result == mock_manifest
             mock_get.assert_called_once()
-            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file))
+            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file), retain_jobs=False)
 
     def test_start_batch_with_provided_context(self, tmp_path):
         """Test start_batch with provided run context."""
@@ -80,7 +82,7 @@ class TestStartBatch:
             result = _run_async(_inner)
 
             assert result == mock_manifest
-            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file))
+            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file), retain_jobs=False)
 
     def test_start_batch_with_config(self, tmp_path):
         """Test start_batch with custom configuration."""
@@ -114,7 +116,54 @@ class TestStartBatch:
             assert result == mock_manifest
             # Verify BatchEngine was created with config
             mock_engine_class.assert_called_once_with(mock_context, custom_config)
-            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file))
+            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file), retain_jobs=False)
+
+
+@pytest.mark.ci_safe
+class TestConcurrentBatchExecution:
+    """Test execute_batch_jobs with a bounded worker pool."""
+
+    def test_execute_batch_jobs_respects_max_parallel_jobs(self, run_context, temp_dir):
+        """Jobs run concurrently, never exceeding max_parallel_jobs."""
+        engine = BatchEngine(run_context, {'max_parallel_jobs': 3})
+        csv_file = temp_dir / "test.csv"
+        csv_file.write_text("name,value\n" + "".join(f"test{i},data{i}\n" for i in range(8)))
+        manifest = engine.create_batch_jobs(str(csv_file))
+
+        state = {"active": 0, "peak": 0}
+
+        async def fake_execute(job):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            if job.row_data["name"] == "test5":
+                raise RuntimeError("boom")
+            return 'completed'
+
+        progress_calls = []
+
+        async def _inner():
+            with patch.object(engine, '_execute_single_job', side_effect=fake_execute):
+                return await engine.execute_batch_jobs(
+                    manifest.batch_id,
+                    max_retries=0,
+                    progress_callback=lambda done, total: progress_calls.append((done, total)),
+                )
+
+        result = _run_async(_inner)
+
+        assert state["peak"] == 3
+        assert result['executed'] == 8
+        assert result['completed'] == 7
+        assert result['failed'] == 1
+        assert len(progress_calls) == 8
+        assert [done for done, _ in progress_calls] == sorted(done for done, _ in progress_calls)
+
+        persisted = engine._load_manifest_by_batch_id(manifest.batch_id)
+        assert persisted.completed_jobs == 7
+        assert persisted.failed_jobs == 1
+        assert all(job.status in ('completed', 'failed') for job in persisted.jobs)
 
 
 @pytest.mark.ci_safe
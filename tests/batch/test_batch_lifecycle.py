@@ -7,10 +7,13 @@ This module tests:
 - Batch summary retrieval
 - stop_batch functionality
 - Manifest persistence and reloading
+- Job-state journal replay and compaction
+- Persistent job/batch -> manifest index
 """
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -19,8 +22,11 @@ from tests.batch import (
     BatchManifest,
     FileProcessingError,
     _run_async,
+    start_batch,
 )
 from src.batch.engine import BATCH_MANIFEST_FILENAME
+from src.batch.manifest_index import BatchManifestIndex
+from src.batch.manifest_store import ManifestJournal
 
 
 @pytest.mark.ci_safe
@@ -64,6 +70,38 @@ class TestBatchJobCreation:
             assert data["total_jobs"] == 2
             assert len(data["jobs"]) == 2
 
+    def test_create_batch_jobs_without_retaining_jobs(self, run_context, temp_dir):
+        """Test streaming job creation persists every job without keeping them in memory."""
+        engine = BatchEngine(run_context, {'chunk_size': 3})
+        csv_file = temp_dir / "many.csv"
+        csv_file.write_text("name,value\n" + "".join(f"test{i},data{i}\n" for i in range(10)))
+
+        manifest = engine.create_batch_jobs(str(csv_file), retain_jobs=False)
+
+        assert manifest.total_jobs == 10
+        assert manifest.jobs == []
+
+        manifest_file = temp_dir / "test_run_123-batch" / BATCH_MANIFEST_FILENAME
+        persisted = BatchManifest.from_dict(json.loads(manifest_file.read_text()))
+        assert persisted.batch_id == manifest.batch_id
+        assert persisted.total_jobs == 10
+        assert [job.row_index for job in persisted.jobs] == list(range(10))
+        assert persisted.jobs[-1].row_data == {"name": "test9", "value": "data9"}
+        assert not manifest_file.with_name(manifest_file.name + ".tmp").exists()
+
+    def test_start_batch_streams_jobs(self, run_context, temp_dir):
+        """start_batch does not keep the created jobs in memory."""
+        csv_file = temp_dir / "many.csv"
+        csv_file.write_text("name,value\n" + "".join(f"test{i},data{i}\n" for i in range(5)))
+
+        manifest = _run_async(lambda: start_batch(str(csv_file), run_context, execute_immediately=False))
+
+        assert manifest.total_jobs == 5
+        assert manifest.jobs == []
+        assert len(list((temp_dir / "test_run_123-jobs").glob("*.json"))) == 5
+        persisted = json.loads((temp_dir / "test_run_123-batch" / BATCH_MANIFEST_FILENAME).read_text())
+        assert len(persisted["jobs"]) == 5
+
     def test_create_batch_jobs_empty_csv(self, engine, temp_dir):
         """Test batch job creation with empty CSV."""
         csv_content = "name,value\n"  # Only header
@@ -130,6 +168,139 @@ class TestJobStatusUpdates:
         # Should not raise exception, just log warning
 
 
+@pytest.mark.ci_safe
+class TestManifestJournal:
+    """Tests for the append-only job-state journal."""
+
+    def _create(self, engine, temp_dir, rows=3):
+        csv_file = temp_dir / "journal.csv"
+        csv_file.write_text("name,value\n" + "".join(f"test{i},data{i}\n" for i in range(rows)))
+        manifest = engine.create_batch_jobs(str(csv_file))
+        manifest_file = temp_dir / "test_run_123-batch" / BATCH_MANIFEST_FILENAME
+        return manifest, manifest_file
+
+    def test_update_job_status_appends_journal_and_replays(self, engine, temp_dir, run_context):
+        """Status changes are journaled and replayed on load, without rewriting the manifest."""
+        manifest, manifest_file = self._create(engine, temp_dir)
+        job_id = manifest.jobs[0].job_id
+        before = manifest_file.read_text(encoding="utf-8")
+
+        engine.update_job_status(job_id, "failed", "boom")
+
+        assert manifest_file.read_text(encoding="utf-8") == before
+        journal = ManifestJournal(manifest_file)
+        records = list(journal.read_records())
+        assert len(records) == 1
+        assert records[0]["job_id"] == job_id
+
+        loaded = engine._load_manifest(manifest_file)
+        assert loaded.failed_jobs == 1
+        assert loaded.jobs[0].status == "failed"
+        assert loaded.jobs[0].error_message == "boom"
+
+    def test_replay_ignores_torn_last_line(self, engine, temp_dir, run_context):
+        """A partially written record (crash mid-append) does not break recovery."""
+        manifest, manifest_file = self._create(engine, temp_dir)
+        engine.update_job_status(manifest.jobs[0].job_id, "completed")
+        journal = ManifestJournal(manifest_file)
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"op":"status","job_id":')
+
+        loaded = engine._load_manifest(manifest_file)
+
+        assert loaded.completed_jobs == 1
+        assert loaded.jobs[0].status == "completed"
+
+    def test_execute_batch_jobs_compacts_on_interval_and_at_end(self, run_context, temp_dir):
+        """The manifest is rewritten per checkpoint interval, not per job."""
+        engine = BatchEngine(run_context, {'manifest_checkpoint_interval': 4})
+        manifest, manifest_file = self._create(engine, temp_dir, rows=5)
+
+        async def _inner():
+            with patch.object(engine, '_execute_single_job', return_value='completed'), \
+                    patch.object(engine, '_save_manifest', wraps=engine._save_manifest) as mock_save:
+                result = await engine.execute_batch_jobs(manifest.batch_id)
+            return result, mock_save.call_count
+
+        result, save_calls = _run_async(_inner)
+
+        assert result['completed'] == 5
+        # 10 journal records (running + finished per job) -> 2 checkpoints + final compaction
+        assert save_calls == 3
+        assert not ManifestJournal(manifest_file).exists()
+        data = json.loads(manifest_file.read_text(encoding="utf-8"))
+        assert data["completed_jobs"] == 5
+        assert all(job["status"] == "completed" for job in data["jobs"])
+
+
+@pytest.mark.ci_safe
+class TestManifestIndex:
+    """Tests for the persistent job/batch -> manifest index."""
+
+    def _create(self, engine, temp_dir):
+        csv_file = temp_dir / "index.csv"
+        csv_file.write_text("name,value\na,1\nb,2\n")
+        return engine.create_batch_jobs(str(csv_file))
+
+    def test_create_batch_jobs_registers_index(self, engine, temp_dir, run_context):
+        """Jobs and the batch are indexed at creation time."""
+        manifest = self._create(engine, temp_dir)
+        manifest_file = (temp_dir / "test_run_123-batch" / BATCH_MANIFEST_FILENAME).resolve()
+
+        index = BatchManifestIndex()
+        try:
+            assert index.lookup_batch(manifest.batch_id) == manifest_file
+            assert all(index.lookup_job(job.job_id) == manifest_file for job in manifest.jobs)
+            assert index.lookup_job("unknown_job") is None
+        finally:
+            index.close()
+
+    def test_unwritable_index_dir_is_a_miss(self, temp_dir):
+        """An index directory that cannot be created reports misses instead of raising."""
+        blocker = temp_dir / "not-a-dir"
+        blocker.write_text("")
+        index = BatchManifestIndex(blocker / "runs" / "batch_index.sqlite3")
+
+        index.register_batch("batch-1", temp_dir / BATCH_MANIFEST_FILENAME)
+        index.register_jobs("batch-1", temp_dir / BATCH_MANIFEST_FILENAME, ["job-1"])
+        assert index.lookup_job("job-1") is None
+        assert index.lookup_batch("batch-1") is None
+        index.forget_batch("batch-1")
+
+    def test_update_job_status_uses_index_outside_run_context(self, engine, temp_dir, run_context):
+        """A job is found through the index when the current context points elsewhere."""
+        manifest = self._create(engine, temp_dir)
+        job_id = manifest.jobs[1].job_id
+        run_context.artifact_dir = lambda component: temp_dir / "elsewhere"
+
+        engine.update_job_status(job_id, "completed")
+
+        manifest_file = temp_dir / "test_run_123-batch" / BATCH_MANIFEST_FILENAME
+        loaded = engine._load_manifest(manifest_file)
+        assert loaded.completed_jobs == 1
+        assert loaded.jobs[1].status == "completed"
+
+    def test_stale_index_entry_is_repaired_by_scan(self, engine, temp_dir, run_context):
+        """A stale entry is dropped and replaced with the manifest found by scanning."""
+        manifest = self._create(engine, temp_dir)
+        job_id = manifest.jobs[0].job_id
+        source = temp_dir / "test_run_123-batch" / BATCH_MANIFEST_FILENAME
+
+        # Move the manifest into artifacts/runs, leaving the index pointing at the old path
+        runs_dir = Path(engine._get_manifest_index().index_path).parent
+        moved = runs_dir / "moved-batch" / BATCH_MANIFEST_FILENAME
+        moved.parent.mkdir(parents=True)
+        source.rename(moved)
+        run_context.artifact_dir = lambda component: temp_dir / "elsewhere"
+
+        assert engine._find_manifest_file_for_job(job_id) == moved
+        assert engine._find_manifest_file_for_batch(manifest.batch_id) == moved
+
+        index = engine._get_manifest_index()
+        assert index.lookup_job(job_id) == moved.resolve()
+        assert index.lookup_batch(manifest.batch_id) == moved.resolve()
+
+
 @pytest.mark.ci_safe
 class TestBatchSummary:
     """Tests for batch summary retrieval and reporting."""
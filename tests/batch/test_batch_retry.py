@@ -5,13 +5,16 @@ This module tests:
 - retry_batch_jobs() - Retry failed batch jobs
 - execute_job_with_retry() - Execute individual jobs with retry logic
 - Exponential backoff implementation
+- RetryScheduler (non-blocking full-jitter backoff, delayed-retry queue)
 - Retry parameter validation
 - Security (no sensitive data in logs)
 - Load manifest by batch_id helper methods
 """
 
+import asyncio
 import logging
-from unittest.mock import patch, Mock
+import random
+from unittest.mock import AsyncMock, patch, Mock
 
 import pytest
 
@@ -20,6 +23,7 @@ from tests.batch import (
     BatchJob,
     _run_async,
 )
+from src.batch.retry import RetryScheduler
 
 
 @pytest.mark.ci_safe
@@ -273,7 +277,8 @@ class TestExponentialBackoff:
 
             # Mock execution to always fail
             with patch.object(engine, '_execute_single_job', side_effect=Exception("Test failure")):
-                with patch('time.sleep') as mock_sleep:
+                with patch('src.batch.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                        patch('src.batch.retry.random.uniform', side_effect=lambda low, high: high):
                     with pytest.raises(Exception):
                         await engine.execute_job_with_retry(
                             job,
@@ -298,7 +303,8 @@ class TestExponentialBackoff:
 
             # Mock execution to always fail
             with patch.object(engine, '_execute_single_job', side_effect=Exception("Test failure")):
-                with patch('time.sleep') as mock_sleep:
+                with patch('src.batch.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                        patch('src.batch.retry.random.uniform', side_effect=lambda low, high: high):
                     with pytest.raises(Exception):
                         await engine.execute_job_with_retry(
                             job,
@@ -316,6 +322,103 @@ class TestExponentialBackoff:
         _run_async(_inner)
 
 
+@pytest.mark.ci_safe
+class TestRetryScheduler:
+    """Tests for the non-blocking retry scheduler."""
+
+    def test_compute_delay_is_full_jitter_within_ceiling(self):
+        """Delays are drawn from [0, capped exponential ceiling]."""
+        scheduler = RetryScheduler(max_retries=5, retry_delay=1.0, backoff_factor=2.0,
+                                   max_retry_delay=5.0, rng=random.Random(42))
+
+        assert [scheduler.backoff_ceiling(n) for n in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+        for retry_number in range(5):
+            for _ in range(20):
+                delay = scheduler.compute_delay(retry_number)
+                assert 0.0 <= delay <= scheduler.backoff_ceiling(retry_number)
+
+    def test_backoff_does_not_block_event_loop_or_hold_slot(self):
+        """Other work proceeds and the slot is free while a job waits to retry."""
+
+        async def _inner():
+            scheduler = RetryScheduler(max_retries=1, retry_delay=0.05, backoff_factor=2.0,
+                                       max_retry_delay=0.05, rng=random.Random(0))
+            slot = asyncio.Semaphore(1)
+            calls = []
+
+            async def flaky(attempt):
+                calls.append(attempt)
+                if attempt == 1:
+                    raise RuntimeError("transient")
+                return 'completed'
+
+            async def other_job():
+                # Wait until the flaky job is parked in the delayed-retry queue
+                while not scheduler.pending_retries():
+                    await asyncio.sleep(0)
+                assert "job-a" in scheduler.pending_retries()
+                async with slot:
+                    calls.append("other")
+                return 'completed'
+
+            outcome, other = await asyncio.gather(scheduler.run("job-a", flaky, slot=slot), other_job())
+            return outcome, other, calls, scheduler.pending_retries()
+
+        outcome, other, calls, pending = _run_async(_inner)
+
+        assert outcome.status == 'completed'
+        assert other == 'completed'
+        assert calls == [1, "other", 2]
+        assert pending == {}
+        assert [a.outcome for a in outcome.attempts] == ['failed', 'completed']
+        assert outcome.attempts[0].error_type == 'RuntimeError'
+        assert outcome.attempts[0].retry_delay_seconds is not None
+        assert all(a.duration_seconds >= 0 for a in outcome.attempts)
+
+    def test_attempt_duration_excludes_slot_wait(self):
+        """Time spent waiting for a free slot is not counted as attempt duration."""
+
+        async def _inner():
+            scheduler = RetryScheduler(max_retries=0, retry_delay=0.001, backoff_factor=2.0,
+                                       max_retry_delay=0.001)
+            slot = asyncio.Semaphore(1)
+            await slot.acquire()
+
+            async def quick(attempt):
+                return 'completed'
+
+            async def release_later():
+                await asyncio.sleep(0.2)
+                slot.release()
+
+            outcome, _ = await asyncio.gather(scheduler.run("job-c", quick, slot=slot), release_later())
+            return outcome
+
+        outcome = _run_async(_inner)
+
+        assert outcome.status == 'completed'
+        assert outcome.attempts[0].duration_seconds < 0.1
+
+    def test_run_returns_last_error_when_exhausted(self):
+        """Exhausted retries report failure with the last exception."""
+
+        async def _inner():
+            scheduler = RetryScheduler(max_retries=2, retry_delay=0.001, backoff_factor=2.0,
+                                       max_retry_delay=0.001)
+
+            async def always_fails(attempt):
+                raise ValueError(f"attempt {attempt}")
+
+            return await scheduler.run("job-b", always_fails)
+
+        outcome = _run_async(_inner)
+
+        assert outcome.status == 'failed'
+        assert len(outcome.attempts) == 3
+        assert str(outcome.error) == "attempt 3"
+        assert outcome.attempts[-1].retry_delay_seconds is None
+
+
 @pytest.mark.ci_safe
 class TestJobExecutionValidation:
     """Tests for job execution validation."""
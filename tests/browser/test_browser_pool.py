@@ -0,0 +1,238 @@
+"""
+Tests for src/browser/browser_pool.py (warm browser pool).
+
+Playwright is replaced by small fakes; only the pool bookkeeping is tested.
+"""
+
+import asyncio
+
+import pytest
+
+from src.browser.browser_pool import (
+    BrowserContextPool,
+    PoolKey,
+    PooledBrowser,
+    closing_browser_pool,
+    get_browser_pool,
+    shutdown_browser_pool,
+)
+from src.config.feature_flags import FeatureFlags
+
+
+class FakeContext:
+    def __init__(self, options=None):
+        self.options = options or {}
+        self.pages = []
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def cookies(self):
+        if self.closed:
+            raise RuntimeError("context closed")
+        return []
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+
+    async def close(self):
+        self.context.pages.remove(self)
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakeLauncher:
+    def __init__(self, persistent=False):
+        self.persistent = persistent
+        self.launched = []
+
+    async def __call__(self, key):
+        await asyncio.sleep(0)
+        if self.persistent:
+            slot = PooledBrowser(key, context=FakeContext())
+        else:
+            slot = PooledBrowser(key, browser=FakeBrowser())
+        self.launched.append(slot)
+        return slot
+
+
+KEY = PoolKey("chrome", headless=True, recording=False)
+
+
+@pytest.mark.ci_safe
+class TestBrowserContextPool:
+    """Test cases for BrowserContextPool"""
+
+    async def test_reuses_warm_browser_with_fresh_contexts(self):
+        launcher = FakeLauncher()
+        pool = BrowserContextPool(size=1, max_uses=10, launcher=launcher)
+
+        async with pool.lease(KEY, record_video_dir="/tmp/videos") as first:
+            assert first.options == {"record_video_dir": "/tmp/videos"}
+        async with pool.lease(KEY) as second:
+            assert second is not first
+
+        assert len(launcher.launched) == 1
+        assert first.closed and second.closed
+        assert pool.stats()["hits"] == 1
+        await pool.close()
+        assert not launcher.launched[0].browser.connected
+
+    async def test_persistent_context_closes_leased_pages(self):
+        launcher = FakeLauncher(persistent=True)
+        pool = BrowserContextPool(size=1, launcher=launcher)
+
+        async with pool.lease(KEY) as context:
+            await context.new_page()
+            assert len(context.pages) == 1
+        assert context.pages == []
+        assert not context.closed  # the profile context stays warm
+        await pool.close()
+        assert context.closed
+
+    async def test_recycles_after_max_uses(self):
+        launcher = FakeLauncher()
+        pool = BrowserContextPool(size=1, max_uses=2, launcher=launcher)
+
+        for _ in range(2):
+            async with pool.lease(KEY):
+                pass
+        first = launcher.launched[0]
+        assert not first.browser.connected
+        await asyncio.gather(*pool._tasks)  # background replacement
+        assert len(launcher.launched) == 2
+        assert pool.stats()["recycled"] == 1
+
+        async with pool.lease(KEY):
+            pass
+        assert len(launcher.launched) == 2  # replacement was warm
+        await pool.close()
+
+    async def test_unhealthy_browser_is_replaced(self):
+        launcher = FakeLauncher()
+        pool = BrowserContextPool(size=1, launcher=launcher)
+        await pool.warm(KEY)
+        launcher.launched[0].browser.connected = False
+
+        async with pool.lease(KEY):
+            pass
+        assert len(launcher.launched) == 2
+        assert pool.stats()["unhealthy"] == 1
+        await pool.close()
+
+    async def test_overflow_when_all_slots_busy(self):
+        launcher = FakeLauncher()
+        pool = BrowserContextPool(size=1, launcher=launcher)
+
+        async with pool.lease(KEY):
+            async with pool.lease(KEY):
+                assert len(launcher.launched) == 2
+        overflow = launcher.launched[1]
+        assert not overflow.browser.connected  # closed on release
+        assert launcher.launched[0].browser.connected
+        stats = pool.stats()
+        assert stats["overflow"] == 1
+        assert stats["keys"]["chrome/headless"] == {"slots": 1, "in_use": 0}
+        await pool.close()
+
+    async def test_keys_are_isolated(self):
+        launcher = FakeLauncher()
+        pool = BrowserContextPool(size=2, launcher=launcher)
+        assert await pool.warm(KEY) == 2
+        assert await pool.warm(KEY) == 0
+
+        async with pool.lease(PoolKey("chrome", headless=False, recording=True)):
+            pass
+        assert len(launcher.launched) == 3
+        await pool.close()
+        with pytest.raises(RuntimeError):
+            async with pool.lease(KEY):
+                pass
+
+    async def test_health_probe_does_not_block_other_keys(self):
+        launcher = FakeLauncher(persistent=True)
+        pool = BrowserContextPool(size=1, launcher=launcher)
+        await pool.warm(KEY)
+        probing = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _slow_cookies():
+            probing.set()
+            await release.wait()
+            return []
+
+        launcher.launched[0].context.cookies = _slow_cookies
+
+        async def _lease_slow_key():
+            async with pool.lease(KEY):
+                pass
+
+        slow = asyncio.ensure_future(_lease_slow_key())
+        await probing.wait()
+        # The slot being probed is reserved, and other keys are not blocked on the probe
+        async with pool.lease(PoolKey("chrome", headless=False, recording=False)):
+            pass
+        release.set()
+        await slow
+        assert pool.stats()["hits"] == 1
+        await pool.close()
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            BrowserContextPool(size=0)
+        with pytest.raises(ValueError):
+            PooledBrowser(KEY)
+
+
+@pytest.mark.ci_safe
+class TestGetBrowserPool:
+    """Test cases for the shared per-loop pool"""
+
+    def teardown_method(self):
+        FeatureFlags.clear_all_overrides()
+
+    async def test_disabled_by_default(self):
+        FeatureFlags.set_override("browser.warm_pool_enabled", False)
+        assert get_browser_pool() is None
+
+    async def test_shared_within_loop(self):
+        FeatureFlags.set_override("browser.warm_pool_enabled", True)
+        FeatureFlags.set_override("browser.warm_pool_size", 3)
+        pool = get_browser_pool()
+        assert pool is get_browser_pool()
+        assert pool.size == 3
+        await shutdown_browser_pool()
+
+    async def test_closing_browser_pool_shuts_down_loop_pool(self):
+        FeatureFlags.set_override("browser.warm_pool_enabled", True)
+
+        async def _run():
+            return get_browser_pool()
+
+        pool = await closing_browser_pool(_run())
+        assert pool._closed
+        assert get_browser_pool() is not pool
+        await shutdown_browser_pool()
@@ -0,0 +1,184 @@
+"""
+Tests for src/browser/screencast.py (CDP screencast live view).
+
+The CDP session is replaced by a small fake that records sent commands.
+"""
+
+import asyncio
+
+import pytest
+
+from src.browser import screencast
+from src.browser.screencast import (
+    ScreencastFrame,
+    ScreencastStream,
+    get_stream,
+    is_live_view_served,
+    register_stream,
+    set_live_view_served,
+    unregister_stream,
+)
+
+
+class FakeCDPSession:
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+        self.detached = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def send(self, method, params=None):
+        self.sent.append((method, params))
+
+    async def detach(self):
+        self.detached = True
+
+    def emit_frame(self, session_id=1, data="AAAA"):
+        self.handlers["Page.screencastFrame"]({
+            "data": data,
+            "sessionId": session_id,
+            "metadata": {"deviceWidth": 1280, "deviceHeight": 720},
+        })
+
+    def methods(self):
+        return [method for method, _ in self.sent]
+
+
+class FakeContext:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.session = FakeCDPSession()
+
+    async def new_cdp_session(self, page):
+        if self.fail:
+            raise RuntimeError("CDP session is only available in Chromium")
+        return self.session
+
+
+class FakePage:
+    def __init__(self, fail=False):
+        self.context = FakeContext(fail)
+        self.url = "https://example.com"
+
+
+def _frame(seq):
+    return ScreencastFrame(seq=seq, data="AAAA", width=1, height=1, quality=60, timestamp=0.0)
+
+
+@pytest.mark.ci_safe
+class TestScreencastStream:
+
+    @pytest.mark.asyncio
+    async def test_start_and_ack_frames(self):
+        page = FakePage()
+        stream = ScreencastStream(max_width=800, max_height=600)
+
+        assert await stream.start(page) is True
+        method, params = page.context.session.sent[0]
+        assert method == "Page.startScreencast"
+        assert params["format"] == "jpeg" and params["maxWidth"] == 800
+
+        page.context.session.emit_frame(session_id=7)
+        await asyncio.sleep(0)
+        assert ("Page.screencastFrameAck", {"sessionId": 7}) in page.context.session.sent
+        assert stream.frames_received == 1
+
+    @pytest.mark.asyncio
+    async def test_start_returns_false_without_cdp(self):
+        stream = ScreencastStream()
+
+        assert await stream.start(FakePage(fail=True)) is False
+        assert stream.active is False
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_only_sees_latest_frame(self):
+        stream = ScreencastStream()
+        await stream.start(FakePage())
+        frames = stream.frames()
+        first = asyncio.ensure_future(frames.__anext__())
+        await asyncio.sleep(0)
+
+        stream.publish(_frame(1))
+        assert (await first).seq == 1
+        # The subscriber is busy: frames 2 and 3 arrive before it asks again
+        stream.publish(_frame(2))
+        stream.publish(_frame(3))
+
+        assert (await frames.__anext__()).seq == 3
+        assert stream.frames_dropped == 1
+        await frames.aclose()
+
+    @pytest.mark.asyncio
+    async def test_quality_adapts_to_drop_ratio(self, monkeypatch):
+        monkeypatch.setattr(screencast, "ADAPT_WINDOW_FRAMES", 4)
+        page = FakePage()
+        stream = ScreencastStream(quality=60)
+        await stream.start(page)
+        stream.publish(_frame(0))
+        frames = stream.frames()
+        await frames.__anext__()  # subscribed, slot now empty
+
+        # Nobody consumes: 3 of 4 publishes replace an undelivered frame
+        for seq in range(1, 5):
+            stream.publish(_frame(seq))
+        await asyncio.sleep(0)
+        assert stream.quality == 50
+        assert page.context.session.methods()[-2:] == ["Page.stopScreencast", "Page.startScreencast"]
+        assert page.context.session.sent[-1][1]["quality"] == 50
+
+        # A window without drops raises the quality again
+        for seq in range(5, 9):
+            await frames.__anext__()
+            stream.publish(_frame(seq))
+        await asyncio.sleep(0)
+        assert stream.quality == 55
+        await frames.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_ends_subscribers(self):
+        page = FakePage()
+        stream = ScreencastStream()
+        await stream.start(page)
+        stream.publish(_frame(1))
+
+        received = []
+
+        async def consume():
+            async for frame in stream.frames():
+                received.append(frame.seq)
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        await stream.close()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert received == [1]
+        assert page.context.session.detached is True
+        # Late viewers still get the last frame
+        assert [frame.seq async for frame in stream.frames()] == [1]
+
+
+@pytest.mark.ci_safe
+def test_stream_registry():
+    stream = ScreencastStream()
+    register_stream("abc", stream)
+    assert get_stream("abc") is stream
+    unregister_stream("abc")
+    assert get_stream("abc") is None
+
+
+@pytest.mark.ci_safe
+def test_headless_live_view_polls_without_live_view_router(monkeypatch):
+    """Without a server mounting /ws/live-view the UI keeps screenshot polling."""
+    pytest.importorskip("gradio")
+    from src.ui import stream_manager
+
+    monkeypatch.setattr(stream_manager.FeatureFlags, "get", lambda *args, **kwargs: True)
+    monkeypatch.setattr(screencast, "_live_view_served", False)
+    assert is_live_view_served() is False
+    assert stream_manager._HeadlessLiveView(1280, 720, 80, 45).stream is None
+
+    set_live_view_served()
+    assert stream_manager._HeadlessLiveView(1280, 720, 80, 45).stream is not None
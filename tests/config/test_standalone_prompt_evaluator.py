@@ -0,0 +1,144 @@
+"""
+Tests for src/config/standalone_prompt_evaluator.py
+
+This module tests the cached llms.txt action registry, the compiled command
+matcher and parameter extraction.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.config import standalone_prompt_evaluator as evaluator
+from src.config.standalone_prompt_evaluator import (
+    ActionRegistry,
+    SubstringIndex,
+    clear_action_registry_cache,
+    extract_params_standalone,
+    get_action_registry_standalone,
+    pre_evaluate_prompt_standalone,
+)
+
+LLMS_CONTENT = """actions:
+  - name: phrase-search
+    type: browser-control
+    params:
+      - name: query
+  - name: phrase-search-extra
+    type: browser-control
+  - name: get-title
+    type: browser-control
+"""
+
+
+@pytest.fixture
+def llms_file(tmp_path):
+    """Point the evaluator at a temporary llms.txt with a clean cache."""
+    path = tmp_path / "llms.txt"
+    path.write_text(LLMS_CONTENT, encoding="utf-8")
+    clear_action_registry_cache()
+    with patch.object(evaluator, "_DEFAULT_CONFIG_PATH", str(path)):
+        yield path
+    clear_action_registry_cache()
+
+
+@pytest.mark.ci_safe
+class TestActionRegistryCache:
+    """Tests for get_action_registry_standalone caching."""
+
+    def test_registry_is_parsed_once(self, llms_file):
+        """Repeated lookups reuse the parsed registry."""
+        with patch.object(evaluator.yaml, "safe_load", wraps=evaluator.yaml.safe_load) as mock_load:
+            first = get_action_registry_standalone()
+            second = get_action_registry_standalone()
+
+        assert first is second
+        assert mock_load.call_count == 1
+        assert list(first.by_name) == ["phrase-search", "phrase-search-extra", "get-title"]
+
+    def test_registry_reloads_when_file_changes(self, llms_file):
+        """A changed mtime/size invalidates the cached registry."""
+        first = get_action_registry_standalone()
+        llms_file.write_text(LLMS_CONTENT + "  - name: new-action\n", encoding="utf-8")
+        stat = llms_file.stat()
+        os.utime(llms_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = get_action_registry_standalone()
+
+        assert second is not first
+        assert "new-action" in second.by_name
+
+    def test_missing_file_returns_empty_registry(self, tmp_path):
+        """A missing llms.txt yields an empty registry and no match."""
+        registry = get_action_registry_standalone(str(tmp_path / "missing.txt"))
+        assert registry.by_name == {}
+
+
+@pytest.mark.ci_safe
+class TestPreEvaluatePromptStandalone:
+    """Tests for pre_evaluate_prompt_standalone matching."""
+
+    def test_exact_command_match(self, llms_file):
+        """@name selects the action and extracts parameters."""
+        result = pre_evaluate_prompt_standalone("@phrase-search query=pytest")
+
+        assert result["command_name"] == "phrase-search"
+        assert result["params"] == {"query": "pytest"}
+
+    def test_exact_command_match_prefers_full_token(self, llms_file):
+        """A longer command name is not shadowed by a shorter prefix."""
+        result = pre_evaluate_prompt_standalone("run @phrase-search-extra now")
+        assert result["command_name"] == "phrase-search-extra"
+
+    def test_exact_command_match_with_trailing_punctuation(self, llms_file):
+        """Commands followed by punctuation still match."""
+        result = pre_evaluate_prompt_standalone("please run @get-title.")
+        assert result["command_name"] == "get-title"
+
+    def test_keyword_match(self, llms_file):
+        """All name keywords present in the prompt gives a partial match."""
+        result = pre_evaluate_prompt_standalone("Get the page title")
+        assert result["command_name"] == "get-title"
+
+    def test_no_match(self, llms_file):
+        """Unrelated prompts return None."""
+        assert pre_evaluate_prompt_standalone("hello world") is None
+
+
+@pytest.mark.ci_safe
+class TestCompiledMatcher:
+    """Tests for the Aho-Corasick index and compiled parameter extraction."""
+
+    def test_substring_index_finds_overlapping_patterns(self):
+        """Overlapping and nested patterns are all reported."""
+        index = SubstringIndex(["he", "she", "his", "hers"])
+        assert index.find("ushers") == {"she", "he", "hers"}
+        assert index.find("xyz") == set()
+
+    def test_keyword_match_prefers_definition_order(self):
+        """The first defined action whose keywords all appear wins."""
+        registry = ActionRegistry({"actions": [
+            {"name": "search-nlp"},
+            {"name": "search"},
+            {"name": "nlp"},
+        ]})
+        assert registry.match_keywords("nlp search please")["name"] == "search-nlp"
+        assert registry.match_keywords("search only")["name"] == "search"
+        assert registry.match_keywords("nothing here") is None
+
+    def test_keyword_match_is_substring_based(self):
+        """Keywords match inside longer words, as before indexing."""
+        registry = ActionRegistry({"actions": [{"name": "get-title"}]})
+        assert registry.match_keywords("Together with subtitles")["name"] == "get-title"
+
+    def test_registry_extract_params_matches_standalone(self):
+        """Precompiled extraction gives the same result as extract_params_standalone."""
+        params = [{"name": "query"}, {"name": "limit"}]
+        registry = ActionRegistry({"actions": [{"name": "search", "params": params}]})
+        prompt = "@search query=foo.bar limit 5"
+
+        expected = {"query": "foo.bar", "limit": "5"}
+        assert extract_params_standalone(prompt, params) == expected
+        assert registry.extract_params(prompt, registry.by_name["search"]) == expected
+        assert extract_params_standalone("a=1 b=2", "a, b") == {"a": "1", "b": "2"}
@@ -325,3 +325,164 @@ def test_single_path_output_verification(tmp_path, monkeypatch):
     
     # Ensure no logs exist outside ./logs/
     # (This would be a more comprehensive check in real implementation)
+
+
+@pytest.mark.ci_safe
+def test_async_writer_batches_and_flushes(tmp_path, monkeypatch):
+    """BYKILT_LOG_ASYNC queues lines to a background writer; flush() makes them visible."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BYKILT_RUN_ID", "runasync")
+    monkeypatch.setenv("BYKILT_LOG_ASYNC", "1")
+    monkeypatch.setenv("BYKILT_LOG_ASYNC_FLUSH_MS", "60000")  # only size/explicit flushes
+    RunContext._instance = None  # type: ignore[attr-defined]
+    JsonlLogger._instances.clear()  # type: ignore[attr-defined]
+
+    logger = JsonlLogger.get("async_core")
+    try:
+        for i in range(50):
+            logger.info("queued", i=i)
+        assert logger.flush(timeout=5)
+        lines = logger.file_path.read_text(encoding="utf-8").strip().splitlines()
+        assert [json.loads(line)["i"] for line in lines] == list(range(50))
+    finally:
+        logger.close()
+
+    # After close, writes fall back to the synchronous path
+    logger.info("after close")
+    lines = logger.file_path.read_text(encoding="utf-8").strip().splitlines()
+    assert json.loads(lines[-1])["msg"] == "after close"
+
+
+@pytest.mark.ci_safe
+def test_async_writer_rotation(tmp_path, monkeypatch):
+    """Rotation and retention behave as in synchronous mode."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BYKILT_RUN_ID", "runasyncrot")
+    monkeypatch.setenv("BYKILT_LOG_ASYNC", "1")
+    monkeypatch.setenv("BYKILT_LOG_MAX_SIZE", "200")
+    monkeypatch.setenv("BYKILT_LOG_MAX_FILES", "3")
+    RunContext._instance = None  # type: ignore[attr-defined]
+    JsonlLogger._instances.clear()  # type: ignore[attr-defined]
+
+    logger = JsonlLogger.get("async_rot")
+    try:
+        for i in range(120):
+            logger.info("line", i=i, payload="x" * 10)
+        assert logger.flush(timeout=5)
+    finally:
+        logger.close()
+
+    fp = logger.file_path
+    rotated = [fp.with_name(fp.name + f".{n}") for n in (1, 2, 3, 4)]
+    assert all(r.exists() for r in rotated[:3])
+    assert not rotated[3].exists()
+    for r in [fp] + rotated[:3]:
+        assert r.stat().st_size <= 400
+    # The newest line is in the active file, or in .1 if it triggered a rotation
+    newest = fp if fp.stat().st_size else rotated[0]
+    assert json.loads(newest.read_text(encoding="utf-8").strip().splitlines()[-1])["i"] == 119
+
+
+@pytest.mark.ci_safe
+def test_flush_always_overrides_async(tmp_path, monkeypatch):
+    """Durable mode (BYKILT_LOG_FLUSH_ALWAYS) keeps synchronous fsync writes."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BYKILT_RUN_ID", "rundurable")
+    monkeypatch.setenv("BYKILT_LOG_ASYNC", "1")
+    monkeypatch.setenv("BYKILT_LOG_FLUSH_ALWAYS", "1")
+    RunContext._instance = None  # type: ignore[attr-defined]
+    JsonlLogger._instances.clear()  # type: ignore[attr-defined]
+
+    logger = JsonlLogger.get("durable_core")
+    logger.info("durable")
+
+    assert logger._c.sink is None  # type: ignore[attr-defined]
+    assert json.loads(logger.file_path.read_text(encoding="utf-8").strip())["msg"] == "durable"
+
+
+@pytest.mark.ci_safe
+def test_gzip_segments_with_index(tmp_path, monkeypatch):
+    """BYKILT_LOG_COMPRESS=gzip rotates into compressed segments with a sidecar index."""
+    import gzip
+    from src.logging.log_segments import list_segments, read_segment_index
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BYKILT_RUN_ID", "rungzip")
+    monkeypatch.setenv("BYKILT_LOG_COMPRESS", "gzip")
+    monkeypatch.setenv("BYKILT_LOG_MAX_SIZE", "2000")
+    monkeypatch.setenv("BYKILT_LOG_MAX_FILES", "3")
+    monkeypatch.setenv("BYKILT_LOG_LEVEL", "DEBUG")
+    RunContext._instance = None  # type: ignore[attr-defined]
+    JsonlLogger._instances.clear()  # type: ignore[attr-defined]
+
+    logger = JsonlLogger.get("gzip_core")
+    for i in range(200):
+        (logger.warning if i % 4 == 0 else logger.info)("line", i=i, payload="x" * 40)
+    assert logger.flush(timeout=10)
+
+    fp = logger.file_path
+    segments = list_segments(fp)
+    assert len(segments) == 3  # retention keeps the newest max_files segments
+    assert not list(fp.parent.glob("*.pending"))
+    assert not fp.with_name(fp.name + ".1").exists()
+
+    seqs = []
+    for segment in segments:
+        index = read_segment_index(segment)
+        lines = [json.loads(raw) for raw in gzip.decompress(segment.read_bytes()).splitlines()]
+        assert index["lines"] == len(lines)
+        assert index["first_seq"] == lines[0]["seq"] and index["last_seq"] == lines[-1]["seq"]
+        assert index["first_ts"] == lines[0]["ts"] and index["last_ts"] == lines[-1]["ts"]
+        assert sum(index["levels"].values()) == len(lines)
+        assert index["compressed_bytes"] < index["raw_bytes"]
+        seqs.extend(line["seq"] for line in lines)
+    active = [json.loads(raw)["seq"] for raw in fp.read_text(encoding="utf-8").splitlines()]
+    # Segments and the active file together hold a contiguous tail of the sequence
+    assert seqs + active == list(range(seqs[0], 201))
+
+
+@pytest.mark.ci_safe
+def test_segment_order_with_same_stamp(tmp_path):
+    """Same-timestamp collisions sort after the first segment, so retention drops the oldest."""
+    from src.logging import log_segments
+
+    fp = tmp_path / "app.log.jsonl"
+    names = [
+        "app.log.jsonl.20261016T100000000000Z.gz",
+        "app.log.jsonl.20261016T100000000000Z-1.gz",
+        "app.log.jsonl.20261016T100000000000Z-2.gz",
+        "app.log.jsonl.20261016T100001000000Z.gz",
+    ]
+    for name in reversed(names):
+        (tmp_path / name).write_bytes(b"")
+
+    assert [p.name for p in log_segments.list_segments(fp)] == names
+    log_segments._apply_retention(fp, 2)
+    assert [p.name for p in log_segments.list_segments(fp)] == names[2:]
+
+
+@pytest.mark.ci_safe
+def test_time_based_rotation(tmp_path, monkeypatch):
+    """BYKILT_LOG_ROTATE_SECONDS rotates an aged active file even below max size."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BYKILT_RUN_ID", "runtime")
+    monkeypatch.setenv("BYKILT_LOG_ROTATE_SECONDS", "60")
+    RunContext._instance = None  # type: ignore[attr-defined]
+    JsonlLogger._instances.clear()  # type: ignore[attr-defined]
+
+    clock = [1000.0]
+    monkeypatch.setattr("src.logging.jsonl_logger.time.time", lambda: clock[0])
+    logger = JsonlLogger.get("time_core")
+    logger.info("first")
+    clock[0] += 30
+    logger.info("second")
+    fp = logger.file_path
+    assert not fp.with_name(fp.name + ".1").exists()
+
+    clock[0] += 31
+    logger.info("third")  # written, then the aged file is rotated
+    logger.info("fourth")
+
+    rotated = fp.with_name(fp.name + ".1").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["msg"] for line in rotated] == ["first", "second", "third"]
+    assert json.loads(fp.read_text(encoding="utf-8").strip())["msg"] == "fourth"
@@ -20,7 +20,9 @@ from src.modules.direct_browser_control import (
     _normalize_from_dict,
     _normalize_extract_entries,
     _register_video_artifact,
+    _relocate_video,
     _cancelled,
+    _handle_extract_content,
 )
 from src.utils.timeout_manager import TimeoutManager
 
@@ -245,6 +247,31 @@ class TestRegisterVideoArtifact:
         mock_manager.register_video_file.assert_not_called()
 
 
+@pytest.mark.ci_safe
+class TestRelocateVideo:
+    """Test _relocate_video function (warm pool profile recordings)"""
+
+    def test_moves_video_into_recording_dir(self, tmp_path):
+        workspace_video = tmp_path / "pool" / "videos" / "abc.webm"
+        workspace_video.parent.mkdir(parents=True)
+        workspace_video.write_bytes(b"webm")
+        recording_dir = tmp_path / "recordings"
+        recording_dir.mkdir()
+
+        result = _relocate_video(workspace_video, recording_dir)
+
+        assert result == recording_dir / "abc.webm"
+        assert result.read_bytes() == b"webm"
+        assert not workspace_video.exists()
+
+    def test_keeps_video_already_in_place(self, tmp_path):
+        video = tmp_path / "abc.webm"
+        video.write_bytes(b"webm")
+
+        assert _relocate_video(video, tmp_path) == video
+        assert _relocate_video(None, tmp_path) is None
+
+
 @pytest.mark.ci_safe
 class TestCancelled:
     """Test _cancelled function"""
@@ -302,3 +329,32 @@ class TestMaybeSlowMoIntegration:
         result = await _maybe_sleep_with_cancel(timeout_manager, 100)
         
         assert result is True
+
+
+@pytest.mark.ci_safe
+class TestHandleExtractContentBatch:
+    """Test batched extraction in _handle_extract_content"""
+
+    @pytest.mark.asyncio
+    async def test_single_evaluate_with_per_element_fallback(self):
+        """CSS selectors use the batch payload; Playwright-only selectors fall back"""
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value=[
+            {"count": 2, "preview": ["a", "b"], "content_count": 2, "text": ["a", "b"]},
+            {"error": "SyntaxError"},
+        ])
+        element = MagicMock()
+        element.text_content = AsyncMock(return_value=" c ")
+        page.query_selector_all = AsyncMock(return_value=[element])
+        cmd = {"args": [{"selectors": ["td.name", "text=Total"]}]}
+
+        with patch('src.modules.direct_browser_control.capture_batch_result') as batch_capture, \
+             patch('src.modules.direct_browser_control.async_capture_element_value',
+                   new_callable=AsyncMock) as element_capture:
+            assert await _handle_extract_content(page, MagicMock(), cmd, {}) is True
+
+        page.evaluate.assert_awaited_once()
+        batch_capture.assert_called_once()
+        assert batch_capture.call_args.kwargs["selector"] == "td.name"
+        page.query_selector_all.assert_awaited_once_with("text=Total")
+        assert element_capture.await_args.kwargs["selector"] == "text=Total"
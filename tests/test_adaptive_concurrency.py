@@ -0,0 +1,162 @@
+"""
+Tests for the adaptive concurrency controller and its QueueManager integration.
+"""
+
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.runner.adaptive_concurrency import AdaptiveConcurrencyConfig, AdaptiveConcurrencyController
+from src.runner.queue_manager import QueueManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(initial=4, resources=None, **config):
+    clock = FakeClock()
+    probe_state = {"resources": resources or {}}
+    controller = AdaptiveConcurrencyController(
+        initial_limit=initial,
+        config=AdaptiveConcurrencyConfig(**config),
+        resource_probe=lambda: probe_state["resources"],
+        clock=clock,
+    )
+    return controller, clock, probe_state
+
+
+@pytest.mark.ci_safe
+class TestAdaptiveConcurrencyController:
+    """Test cases for AdaptiveConcurrencyController"""
+
+    def test_additive_increase_when_saturated(self):
+        controller, clock, _ = _controller(initial=2, max_limit=3, adjust_interval_seconds=5)
+
+        assert controller.adjust(active=2) == 3
+        assert controller.adjust(active=3) == 3  # rate limited
+        clock.now += 5
+        assert controller.adjust(active=3) == 3  # capped at max_limit
+        assert controller.adjust(active=1, force=True) == 3  # not saturated: unchanged
+
+    def test_memory_pressure_decreases_multiplicatively(self):
+        controller, _, probe = _controller(initial=10, decrease_factor=0.5,
+                                           resources={"pressure_level": "high", "used_percent": 88})
+
+        assert controller.adjust(active=10, force=True) == 5
+        assert "memory pressure" in controller.last_reason
+        assert controller.adjust(active=5, force=True) == 2
+        assert controller.adjust(active=2, force=True) == 1
+        assert controller.adjust(active=1, force=True) == 1  # never below min_limit
+
+        probe["resources"] = {"pressure_level": "low", "rss_mb": 4000}
+        assert controller.adjust(active=1, force=True) == 2
+
+    def test_rss_and_cpu_limits(self):
+        controller, _, probe = _controller(initial=4, max_rss_mb=2000, resources={"rss_mb": 2500})
+        assert controller.adjust(active=4, force=True) == 2
+
+        probe["resources"] = {"cpu_percent": 97.0}
+        assert controller.adjust(active=2, force=True) == 1
+        assert controller.last_reason.startswith("cpu")
+
+    def test_failure_rate_decreases(self):
+        controller, _, _ = _controller(initial=4, min_samples=4, max_failure_rate=0.25)
+        for ok in (True, False, False, True):
+            controller.record_result(1.0, ok)
+
+        assert controller.adjust(active=4, force=True) == 2
+        assert controller.snapshot()["samples"] == 0  # judged again on fresh results
+
+    def test_run_time_drift_decreases(self):
+        controller, _, _ = _controller(initial=6, min_samples=5, window_size=5, latency_tolerance=2.0)
+        for _ in range(5):
+            controller.record_result(10.0, True)
+        assert controller.adjust(active=6, force=True) == 7
+
+        for _ in range(5):
+            controller.record_result(40.0, True)
+        assert controller.adjust(active=7, force=True) == 4
+        assert "run time" in controller.last_reason
+
+    def test_probe_errors_are_ignored(self):
+        def broken_probe():
+            raise OSError("no /proc")
+
+        controller = AdaptiveConcurrencyController(2, resource_probe=broken_probe)
+        assert controller.adjust(active=2, force=True) == 3
+
+    def test_config(self):
+        config = AdaptiveConcurrencyConfig.from_dict({"enabled": True, "max_limit": 8, "unknown": 1})
+        assert config.max_limit == 8
+
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyController(2, AdaptiveConcurrencyConfig(min_limit=4, max_limit=2))
+        assert AdaptiveConcurrencyController(50, AdaptiveConcurrencyConfig(max_limit=8)).limit == 8
+
+
+@pytest.mark.ci_safe
+class TestQueueManagerAdaptive:
+    """Test cases for QueueManager driven by the adaptive controller"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.artifacts_dir = Path(self.temp_dir.name) / "test_artifacts"
+        self.patcher = patch("src.core.artifact_manager.get_artifact_manager")
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+        self.temp_dir.cleanup()
+
+    def _run(self, coro_fn):
+        result = {}
+
+        def worker():
+            result["value"] = asyncio.run(coro_fn())
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        thread.join()
+        return result.get("value")
+
+    def test_limit_follows_controller_without_drain(self):
+        controller, _, probe = _controller(initial=2, max_limit=4, adjust_interval_seconds=0)
+        manager = QueueManager(self.artifacts_dir, max_concurrency=99, concurrency_controller=controller)
+        assert manager.max_concurrency == 2
+        for i in range(6):
+            manager.enqueue(f"job-{i}", f"Job {i}")
+
+        async def _inner():
+            await manager.execute_next()
+            await manager.execute_next()
+            # Both slots busy with work waiting: the controller raises the limit
+            third = await asyncio.wait_for(manager.execute_next(), timeout=5)
+            assert manager.max_concurrency == 3
+
+            probe["resources"] = {"pressure_level": "critical", "used_percent": 97}
+            manager.complete_item("job-0")
+            return third
+
+        assert self._run(_inner).id == "job-2"
+        assert manager.max_concurrency == 2
+        status = manager.get_queue_status()
+        assert status["running_count"] == 2  # running items were not interrupted
+        assert status["adaptive_concurrency"]["limit"] == 2
+
+    def test_manual_update_is_clamped(self):
+        controller, _, _ = _controller(initial=2, max_limit=4)
+        manager = QueueManager(self.artifacts_dir, concurrency_controller=controller)
+        manager._add_active_item_for_testing("active", "Active")
+
+        manager.update_max_concurrency(10)
+        assert manager.max_concurrency == 4
+        assert controller.last_reason == "manual"
@@ -12,7 +12,7 @@ import logging
 import threading
 from pathlib import Path
 from src.utils.fs_paths import get_artifacts_base_dir
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from io import StringIO
 from _pytest.outcomes import OutcomeException
 
@@ -39,6 +39,12 @@ def _run_async(coro_fn):
     return result.get("value")
 
 
+@pytest.fixture(autouse=True)
+def isolated_artifacts_dir(tmp_path, monkeypatch):
+    """Keep the batch manifest index out of the repository artifacts dir."""
+    monkeypatch.setenv("ARTIFACTS_BASE_DIR", str(tmp_path / "artifacts"))
+
+
 @pytest.mark.ci_safe
 class TestBatchJob:
     """Test BatchJob dataclass."""
@@ -1019,7 +1025,7 @@ class TestStartBatch:
 
             assert result == mock_manifest
             mock_get.assert_called_once()
-            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file))
+            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file), retain_jobs=False)
 
     def test_start_batch_with_provided_context(self, tmp_path):
         """Test start_batch with provided run context."""
@@ -1045,7 +1051,7 @@ class TestStartBatch:
             result = _run_async(_inner)
 
             assert result == mock_manifest
-            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file))
+            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file), retain_jobs=False)
 
     def test_start_batch_with_config(self, tmp_path):
         """Test start_batch with custom configuration."""
@@ -1079,7 +1085,7 @@ class TestStartBatch:
             assert result == mock_manifest
             # Verify BatchEngine was created with config
             mock_engine_class.assert_called_once_with(mock_context, custom_config)
-            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file))
+            mock_engine.create_batch_jobs.assert_called_once_with(str(csv_file), retain_jobs=False)
 
 
 @pytest.mark.ci_safe
@@ -1288,7 +1294,8 @@ class TestBatchRetry:
 
         # Mock execution to always fail
         with patch.object(engine, '_execute_single_job', side_effect=Exception("Test failure")):
-            with patch('time.sleep') as mock_sleep:
+            with patch('src.batch.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                    patch('src.batch.retry.random.uniform', side_effect=lambda low, high: high):
                 with pytest.raises(Exception):
                     await engine.execute_job_with_retry(
                         job,
@@ -1309,7 +1316,8 @@ class TestBatchRetry:
 
         # Mock execution to always fail
         with patch.object(engine, '_execute_single_job', side_effect=Exception("Test failure")):
-            with patch('time.sleep') as mock_sleep:
+            with patch('src.batch.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                    patch('src.batch.retry.random.uniform', side_effect=lambda low, high: high):
                 with pytest.raises(Exception):
                     await engine.execute_job_with_retry(
                         job,
@@ -1478,7 +1486,8 @@ class TestBatchRetry:
             return 'completed'
 
         with patch.object(engine, '_execute_single_job', side_effect=mock_execute):
-            with patch('time.sleep') as mock_sleep:
+            with patch('src.batch.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                    patch('src.batch.retry.random.uniform', side_effect=lambda low, high: high):
                 status = await engine.execute_job_with_retry(
                     job,
                     max_retries=3,
@@ -1498,7 +1507,8 @@ class TestBatchRetry:
         # Test that calling the method again starts fresh (no side effects)
         call_count = 0
         with patch.object(engine, '_execute_single_job', side_effect=mock_execute):
-            with patch('time.sleep') as mock_sleep:
+            with patch('src.batch.retry.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                    patch('src.batch.retry.random.uniform', side_effect=lambda low, high: high):
                 status = await engine.execute_job_with_retry(
                     job,
                     max_retries=3,
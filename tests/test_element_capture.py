@@ -1,7 +1,7 @@
 from pathlib import Path
 import pytest
 
-from src.core.element_capture import capture_element_value
+from src.core.element_capture import capture_element_value, async_extract_batch, capture_batch_result
 from src.core.artifact_manager import get_artifact_manager, reset_artifact_manager_singleton
 from src.config.feature_flags import FeatureFlags
 from src.runtime.run_context import RunContext
@@ -131,3 +131,85 @@ def test_failure_branches(tmp_path, monkeypatch):
     res2 = capture_element_value(page, "#ok", label="ok", fields=["text","html"])
     assert res2 is not None, "Should return path when capture succeeds"
     assert res2.exists(), f"Captured file should exist: {res2}"
+
+
+class EvaluatePage:
+    def __init__(self, results=None, error=None):
+        self.results = results
+        self.error = error
+        self.calls = []
+
+    async def evaluate(self, script, arg):
+        self.calls.append(arg)
+        if self.error:
+            raise self.error
+        return self.results
+
+
+@pytest.mark.ci_safe
+async def test_extract_batch_single_round_trip():
+    """All selectors and fields of a command go through one page.evaluate."""
+    page = EvaluatePage(results=[{"count": 0}, {"count": 0}])
+    results = await async_extract_batch(page, [
+        {"selector": "td.name", "fields": ["HTML", "text"]},
+        {"selector": "//td", "fields": None},
+    ])
+    assert results == [{"count": 0}, {"count": 0}]
+    assert page.calls == [[
+        {"selector": "td.name", "fields": ["html", "text"]},
+        {"selector": "//td", "fields": ["text"]},
+    ]]
+
+    assert await async_extract_batch(EvaluatePage(error=RuntimeError("detached")), [{"selector": "a"}]) is None
+    assert await async_extract_batch(EvaluatePage(results=[]), [{"selector": "a"}]) is None
+
+
+_SHADOW_HOST_HTML = """
+<span class="item">light-1</span>
+<div id="host"></div>
+<span class="item">light-2</span>
+<script>
+  const root = document.getElementById('host').attachShadow({mode: 'open'});
+  root.innerHTML = '<span class="item">shadow-1</span>';
+</script>
+"""
+
+
+@pytest.mark.ci_safe
+@pytest.mark.playwright_required
+async def test_extract_batch_pierces_open_shadow_roots():
+    """Batch extraction matches the same elements as Playwright's CSS engine across shadow roots."""
+    async_api = pytest.importorskip("playwright.async_api")
+    async with async_api.async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page()
+            await page.set_content(_SHADOW_HOST_HTML)
+            [result] = await async_extract_batch(page, [{"selector": ".item", "fields": ["text"]}])
+            assert result["count"] == await page.locator(".item").count() == 3
+            assert result["text"] == await page.locator(".item").all_inner_texts()
+        finally:
+            await browser.close()
+
+
+@pytest.mark.ci_safe
+def test_capture_batch_result(tmp_path, monkeypatch):
+    """Columnar batch results persist in the same format as per-element capture."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BYKILT_RUN_ID", "TESTRUN127")
+    RunContext.reset()
+    reset_artifact_manager_singleton()
+    FeatureFlags.clear_all_overrides()
+
+    result = {
+        "count": 3,
+        "preview": ["Alice", "Bob"],
+        "content_count": 2,
+        "text": [" Alice ", "   ", "Bob"],
+        "value": [None, None, "b-val"],
+    }
+    p = capture_batch_result(result, "td", label="rows", fields=["text", "value"])
+    assert p is not None
+    assert p.read_text(encoding="utf-8") == "TEXT[0]: Alice\n\nTEXT[2]: Bob\n\nVALUE[2]: b-val"
+
+    assert capture_batch_result({"count": 0}, "td", label="rows") is None
@@ -165,6 +165,55 @@ class TestFeatureFlags(unittest.TestCase):
             else:
                 FeatureFlags.clear_override("enable_llm")
 
+    def test_cached_reads_do_not_take_lock(self):
+        """Resolved flags are read from the published snapshot without locking."""
+        from unittest import mock
+
+        FeatureFlags.is_enabled("engine.cdp_use")  # resolve once
+        snapshot = FeatureFlags._resolved_cache
+        guard = mock.MagicMock(wraps=FeatureFlags._lock)
+        with mock.patch.object(FeatureFlags, "_lock", guard):
+            for _ in range(100):
+                self.assertTrue(FeatureFlags.is_enabled("engine.cdp_use"))
+        guard.__enter__.assert_not_called()
+
+        # Writers swap the snapshot instead of mutating it
+        FeatureFlags.set_override("engine.cdp_use", False)
+        self.assertIsNot(FeatureFlags._resolved_cache, snapshot)
+        self.assertIn("engine.cdp_use", snapshot)
+        self.assertFalse(FeatureFlags.is_enabled("engine.cdp_use"))
+
+    def test_cached_reads_do_not_stat_flags_file(self):
+        """Cached reads within the check interval do no filesystem access."""
+        from unittest import mock
+
+        FeatureFlags.is_enabled("engine.cdp_use")  # resolve once
+        with mock.patch.object(Path, "stat") as stat, mock.patch.object(Path, "exists") as exists:
+            for _ in range(100):
+                self.assertTrue(FeatureFlags.is_enabled("engine.cdp_use"))
+        stat.assert_not_called()
+        exists.assert_not_called()
+
+        # Once the interval has passed the next read checks the mtime again
+        FeatureFlags._next_mtime_check = 0.0
+        FeatureFlags.is_enabled("engine.cdp_use")
+        self.assertGreater(FeatureFlags._next_mtime_check, time.monotonic())
+
+    def test_expiry_heap_skips_stale_deadlines(self):
+        """A replaced TTL override is not expired by its old heap entry."""
+        import heapq
+
+        FeatureFlags.set_override("ui.experimental_panel", True, ttl_seconds=3600)
+        heapq.heappush(FeatureFlags._expiry_heap, (0.0, "ui.experimental_panel"))
+        FeatureFlags._next_expiry = 0.0
+
+        self.assertTrue(FeatureFlags.is_enabled("ui.experimental_panel"))
+        self.assertGreater(FeatureFlags._next_expiry, time.time())
+        self.assertEqual(FeatureFlags.get_override_source("ui.experimental_panel"), "runtime")
+
+        FeatureFlags.clear_all_overrides()
+        self.assertEqual(FeatureFlags._expiry_heap, [])
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -16,6 +16,7 @@ def test_feature_flags_mtime_reload(monkeypatch, caplog):
     FeatureFlags.is_enabled("enable_llm")
     # Force old mtime sentinel
     FeatureFlags._flags_mtime = 0  # type: ignore[attr-defined]
+    FeatureFlags._next_mtime_check = 0.0  # type: ignore[attr-defined]  # skip the stat throttle
     caplog.set_level("INFO")
     FeatureFlags.is_enabled("enable_llm")
     msgs = [r.message for r in caplog.records if "Feature flags file modified on disk; reloading" in r.message]
@@ -1,14 +1,20 @@
 import json
+import shutil
+import uuid
 import pytest
 from pathlib import Path
 from src.utils.fs_paths import get_artifacts_base_dir
 
+from src.core import artifact_manager as artifact_manager_module
 from src.core.artifact_manager import ArtifactManager, reset_artifact_manager_singleton
+from src.core.manifest_log import delta_path, read_manifest
 from src.runtime.run_context import RunContext
 from src.config.feature_flags import FeatureFlags
 
 
 def _read_manifest_text(mgr) -> str:
+    # Run dirs for fixed run ids accumulate across sessions; compact write-behind entries first
+    mgr.flush_manifest()
     mp = mgr.manifest_path
     return mp.read_text(encoding="utf-8") if mp.exists() else ""
 
@@ -117,3 +123,110 @@ def test_video_entry_when_enabled(monkeypatch, tmp_path):
     data = json.loads(_read_manifest_text(mgr))
     vids = [a for a in data["artifacts"] if a["type"] == "video"]
     assert len(vids) - pre == 1
+
+
+@pytest.mark.ci_safe
+def test_write_behind_delta_log(monkeypatch):
+    monkeypatch.setenv("BYKILT_RUN_ID", f"MWRITEBEHIND{uuid.uuid4().hex[:8]}")
+    RunContext.reset()
+    reset_artifact_manager_singleton()
+    FeatureFlags.set_override("artifacts.enable_manifest_v2", True)
+    monkeypatch.setattr(artifact_manager_module, "MANIFEST_INLINE_LIMIT", 2)
+    monkeypatch.setattr(artifact_manager_module, "MANIFEST_FLUSH_DELAY_SECONDS", 3600)
+    mgr = ArtifactManager()
+
+    for i in range(5):
+        mgr.save_screenshot_bytes(b"png", prefix=f"wb{i}")
+
+    # Only the first entries were rewritten inline; the rest wait in the delta log
+    on_disk = json.loads(mgr.manifest_path.read_text(encoding="utf-8"))
+    assert len(on_disk["artifacts"]) == 2
+    assert len(delta_path(mgr.manifest_path).read_text(encoding="utf-8").splitlines()) == 3
+    assert len(read_manifest(mgr.manifest_path)["artifacts"]) == 5
+    assert len(mgr.get_manifest(reload=True)["artifacts"]) == 5
+
+    # A torn trailing line (crash mid-append) is ignored on replay
+    with open(delta_path(mgr.manifest_path), "a", encoding="utf-8") as f:
+        f.write('{"type": "screenshot", "pa')
+    assert len(read_manifest(mgr.manifest_path)["artifacts"]) == 5
+
+    mgr.flush_manifest()
+    assert not delta_path(mgr.manifest_path).exists()
+    on_disk = json.loads(mgr.manifest_path.read_text(encoding="utf-8"))
+    assert [a["path"].rsplit("/", 1)[-1].split("_")[0] for a in on_disk["artifacts"]] == ["wb0", "wb1", "wb2", "wb3", "wb4"]
+    shutil.rmtree(mgr.dir, ignore_errors=True)
+
+
+@pytest.mark.ci_safe
+def test_video_dedupe_uses_entry_index(monkeypatch):
+    monkeypatch.setenv("BYKILT_RUN_ID", f"MWRITEBEHIND{uuid.uuid4().hex[:8]}")
+    RunContext.reset()
+    reset_artifact_manager_singleton()
+    FeatureFlags.set_override("artifacts.enable_manifest_v2", True)
+    FeatureFlags.set_override("artifacts.video_target_container", "auto")
+    mgr = ArtifactManager()
+    sample = mgr.dir / "videos" / "dup.webm"
+    sample.parent.mkdir(parents=True, exist_ok=True)
+    sample.write_bytes(b"FAKEVID")
+
+    mgr.register_video_file(sample)
+    mgr.register_video_file(sample)
+    # A duplicate written by an older process is removed when loaded
+    data = json.loads(mgr.manifest_path.read_text(encoding="utf-8"))
+    data["artifacts"].append(dict(data["artifacts"][0]))
+    mgr.manifest_path.write_text(json.dumps(data), encoding="utf-8")
+    mgr.get_manifest(reload=True)
+    mgr._dedupe_video_entries()
+
+    vids = [a for a in json.loads(_read_manifest_text(mgr))["artifacts"] if a["type"] == "video"]
+    assert len(vids) == 1
+    FeatureFlags.clear_all_overrides()
+    shutil.rmtree(mgr.dir, ignore_errors=True)
+
+
+@pytest.mark.ci_safe
+def test_managers_share_one_exit_hook(monkeypatch):
+    monkeypatch.setenv("BYKILT_RUN_ID", f"MWRITEBEHIND{uuid.uuid4().hex[:8]}")
+    RunContext.reset()
+    reset_artifact_manager_singleton()
+    registered = []
+    monkeypatch.setattr(artifact_manager_module.atexit, "register", registered.append)
+
+    managers = [ArtifactManager() for _ in range(3)]
+
+    assert registered == []
+    assert all(m in artifact_manager_module._live_managers for m in managers)
+    shutil.rmtree(managers[0].dir, ignore_errors=True)
+
+
+@pytest.mark.ci_safe
+def test_update_manifest_holds_lock_through_persist(monkeypatch):
+    import threading
+
+    monkeypatch.setenv("BYKILT_RUN_ID", f"MWRITEBEHIND{uuid.uuid4().hex[:8]}")
+    RunContext.reset()
+    reset_artifact_manager_singleton()
+    FeatureFlags.set_override("artifacts.enable_manifest_v2", True)
+    mgr = ArtifactManager()
+    entered, release = threading.Event(), threading.Event()
+
+    def mutator(manifest):
+        manifest["queue_state"] = {"items": {}}
+        entered.set()
+        release.wait(5)
+
+    updater = threading.Thread(target=mgr.update_manifest, args=(mutator,))
+    updater.start()
+    assert entered.wait(5)
+    writer = threading.Thread(target=lambda: mgr.save_screenshot_bytes(b"png", prefix="locked"))
+    writer.start()
+    writer.join(0.2)
+    assert writer.is_alive()  # the concurrent add_entry waits for the locked update
+    release.set()
+    updater.join(5)
+    writer.join(5)
+
+    data = json.loads(_read_manifest_text(mgr))
+    assert data["queue_state"] == {"items": {}}
+    assert any("locked" in a["path"] for a in data["artifacts"])
+    shutil.rmtree(mgr.dir, ignore_errors=True)
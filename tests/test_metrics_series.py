@@ -0,0 +1,282 @@
+"""
+Tests for MetricSeries ring-buffer storage, quantile sketches, compute_summary
+and MetricsCollector label handling.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("psutil")
+
+from src.metrics.aggregator import compute_summary
+from src.metrics.collector import (
+    OVERFLOW_LABEL,
+    MetricsCollector,
+    MetricSeries,
+    MetricType,
+    record_job_status,
+)
+from src.metrics.sketch import QuantileSketch
+
+
+@pytest.mark.ci_safe
+class TestMetricSeriesStorage:
+    """Tests for the array-backed MetricSeries."""
+
+    def test_add_and_get_values(self):
+        series = MetricSeries("test.series", MetricType.GAUGE)
+        series.add_value(1, tags={"phase": "a"})
+        series.add_value(2.5, tags={"phase": "b"})
+        series.add_value(3, tags={"phase": "a"})
+
+        values = series.get_values()
+        assert [v.value for v in values] == [1.0, 2.5, 3.0]
+        assert values[0].name == "test.series"
+        assert values[0].tags == {"phase": "a"}
+        assert [v.value for v in series.get_values({"phase": "a"})] == [1.0, 3.0]
+        assert series.get_latest_value({"phase": "b"}).value == 2.5
+        assert series.get_latest_value({"phase": "missing"}) is None
+        assert len(series) == 3
+
+    def test_returned_tags_are_copies(self):
+        series = MetricSeries("test.series", MetricType.GAUGE)
+        series.add_value(1, tags={"phase": "a"})
+        series.get_values()[0].tags["phase"] = "changed"
+        assert series.get_values({"phase": "a"})[0].tags == {"phase": "a"}
+
+    def test_capacity_overwrites_oldest(self):
+        series = MetricSeries("test.series", MetricType.GAUGE, capacity=4)
+        for i in range(10):
+            series.add_value(i)
+
+        assert [v.value for v in series.get_values()] == [6.0, 7.0, 8.0, 9.0]
+        timestamps, values = series.get_arrays()
+        assert list(values) == [6.0, 7.0, 8.0, 9.0]
+        assert list(timestamps) == sorted(timestamps)
+
+    def test_eviction_by_age(self):
+        series = MetricSeries("test.series", MetricType.GAUGE, max_age_seconds=10, capacity=8)
+        with patch("src.metrics.collector.time.time") as mock_time:
+            for i in range(12):
+                mock_time.return_value = 1000.0 + i * 5
+                series.add_value(i)
+
+        # Last insert at t=1055 keeps points newer than t=1045
+        assert [v.value for v in series.get_values()] == [10.0, 11.0]
+        assert series.get_values()[-1].timestamp.timestamp() == 1055.0
+
+    def test_unreferenced_tag_sets_are_compacted(self):
+        series = MetricSeries("test.series", MetricType.COUNTER, capacity=2)
+        for i in range(20):
+            series.add_value(1, tags={"job_id": str(i)})
+
+        assert len(series._tag_sets) <= 4
+        assert [v.tags["job_id"] for v in series.get_values()] == ["18", "19"]
+
+
+@pytest.mark.ci_safe
+class TestComputeSummary:
+    """Tests for compute_summary over series arrays."""
+
+    def test_summary_percentiles(self):
+        series = MetricSeries("test.timer", MetricType.TIMER)
+        for v in [10, 20, 30, 40, 50]:
+            series.add_value(v, tags={"phase": "test"})
+        series.add_value(1000, tags={"phase": "other"})
+
+        summary = compute_summary(series, tags_filter={"phase": "test"})
+
+        assert summary["count"] == 5
+        assert summary["min"] == 10
+        assert summary["max"] == 50
+        assert summary["avg"] == 30
+        assert summary["p50"] == 30
+        assert summary["p99"] == 50
+        assert summary["type"] == "timer"
+
+    def test_summary_since_seconds(self):
+        series = MetricSeries("test.timer", MetricType.TIMER)
+        with patch("src.metrics.collector.time.time") as mock_time:
+            for i, v in enumerate([1, 2, 3, 4]):
+                mock_time.return_value = 1000.0 + i * 10
+                series.add_value(v)
+
+        summary = compute_summary(series, since_seconds=15)
+
+        assert summary["count"] == 2
+        assert summary["min"] == 3
+
+    def test_summary_empty(self):
+        series = MetricSeries("test.timer", MetricType.TIMER)
+        assert compute_summary(series)["count"] == 0
+
+    def test_sketch_mode_matches_exact_within_accuracy(self):
+        series = MetricSeries("test.timer", MetricType.TIMER)
+        for v in range(1, 2001):
+            series.add_value(v, tags={"phase": "test"})
+
+        exact = compute_summary(series, exact=True)
+        approx = compute_summary(series, exact=False)
+
+        assert approx["count"] == exact["count"] == 2000
+        assert approx["min"] == 1 and approx["max"] == 2000
+        assert approx["avg"] == pytest.approx(exact["avg"])
+        for key in ("p50", "p90", "p95", "p99"):
+            assert approx[key] == pytest.approx(exact[key], rel=0.02)
+
+    def test_sketch_mode_respects_tags_filter(self):
+        series = MetricSeries("test.timer", MetricType.TIMER)
+        for v in [10, 20, 30]:
+            series.add_value(v, tags={"phase": "test"})
+        series.add_value(1000, tags={"phase": "other"})
+
+        summary = compute_summary(series, tags_filter={"phase": "test"}, exact=False)
+
+        assert summary["count"] == 3
+        assert summary["max"] == 30
+
+    def test_high_cardinality_tags_keep_sketches_bounded(self):
+        series = MetricSeries("test.timer", MetricType.TIMER, capacity=1000)
+        with patch("src.metrics.collector.time.time", return_value=1000.0):
+            for i in range(20_000):
+                series.add_value(i % 100, tags={"job_id": f"job-{i}"})
+
+        assert len(series) == 1000
+        assert len(series._sketches) == 1
+        assert series._tagged_sketches[int(1000.0 // series.sketch_interval_seconds)] is None
+        assert series.get_sketch().count == 20_000
+        # Filtered summaries fall back to the retained points
+        filtered = series.get_sketch(tags_filter={"job_id": "job-19999"})
+        assert filtered.count == 1 and filtered.quantile(1) == 99
+
+    def test_sketch_buckets_expire_with_retention(self):
+        series = MetricSeries("test.timer", MetricType.TIMER, max_age_seconds=60,
+                              sketch_interval_seconds=10)
+        with patch("src.metrics.collector.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            series.add_value(500)
+            mock_time.return_value = 1200.0
+            series.add_value(1)
+
+        assert series.get_sketch().count == 1
+
+
+@pytest.mark.ci_safe
+class TestQuantileSketch:
+    """Tests for the DDSketch-style QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        values = [float(v) for v in range(1, 10001)]
+        for v in values:
+            sketch.add(v)
+
+        for q in (0.5, 0.9, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+    def test_negative_and_zero_values(self):
+        sketch = QuantileSketch()
+        for v in (-10, -1, 0, 0, 5):
+            sketch.add(v)
+
+        assert sketch.quantile(0) == -10
+        assert sketch.quantile(0.5) == 0
+        assert sketch.quantile(1) == 5
+
+    def test_merge_and_round_trip(self):
+        left, right = QuantileSketch(), QuantileSketch()
+        for v in range(1, 501):
+            left.add(v)
+        for v in range(501, 1001):
+            right.add(v)
+
+        merged = QuantileSketch.from_dict(left.to_dict()).merge(QuantileSketch.from_dict(right.to_dict()))
+
+        assert merged.count == 1000
+        assert merged.min == 1 and merged.max == 1000
+        assert merged.quantile(0.5) == pytest.approx(500, rel=0.01)
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.05))
+
+    def test_empty_sketch(self):
+        assert QuantileSketch().quantile(0.5) is None
+
+
+@pytest.mark.ci_safe
+class TestCollectorLabels:
+    """Tests for label schemas, pre-aggregation and the cardinality guard."""
+
+    def test_schema_folds_job_id_into_exemplar(self):
+        collector = MetricsCollector()
+        for i in range(50):
+            collector.record_metric("job_status", 1, metric_type=MetricType.COUNTER, tags={
+                "job_id": f"job_{i}", "run_id": "r1", "status": "completed", "batch_id": "b1",
+            })
+
+        aggregates = collector.get_aggregates("job_status")
+        assert len(aggregates) == 1
+        assert aggregates[0].labels == {"run_id": "r1", "status": "completed", "batch_id": "b1"}
+        assert aggregates[0].count == 50
+        assert aggregates[0].exemplar.labels == {"job_id": "job_49"}
+        series = collector.get_metric_series("job_status")
+        assert len(series._tag_sets) == 1
+        assert "job_id" not in series.get_latest_value().tags
+
+    def test_registered_schema(self):
+        collector = MetricsCollector()
+        collector.register_label_schema("custom", ["phase"])
+        collector.record_metric("custom", 2.0, tags={"phase": "a", "row": "17"},
+                                metric_type=MetricType.HISTOGRAM)
+
+        aggregate = collector.get_aggregates("custom")[0]
+        assert aggregate.labels == {"phase": "a"}
+        assert aggregate.sketch.count == 1
+        assert aggregate.exemplar.labels == {"row": "17"}
+
+    def test_cardinality_guard_folds_label(self):
+        collector = MetricsCollector(max_label_values=5)
+        for i in range(20):
+            collector.record_metric("requests", 1, tags={"route": "/a", "request_id": str(i)},
+                                    metric_type=MetricType.COUNTER)
+
+        assert collector.get_folded_labels("requests") == {"request_id"}
+        aggregates = {tuple(sorted(a.labels.items())): a for a in collector.get_aggregates("requests")}
+        assert aggregates[(("route", "/a"),)].count == 15
+        assert aggregates[(("route", "/a"),)].exemplar.labels == {"request_id": "19"}
+
+    def test_label_set_overflow(self):
+        collector = MetricsCollector(max_label_values=100, max_label_sets=3)
+        for i in range(10):
+            collector.record_metric("pairs", 1, tags={"a": str(i)}, metric_type=MetricType.COUNTER)
+
+        aggregates = collector.get_aggregates("pairs")
+        assert len(aggregates) == 4
+        overflow = [a for a in aggregates if OVERFLOW_LABEL in a.labels][0]
+        assert overflow.count == 7
+        assert overflow.exemplar.labels == {"a": "9"}
+
+    def test_record_job_status_uses_single_series(self, monkeypatch):
+        collector = MetricsCollector()
+        monkeypatch.setattr("src.metrics.collector._default_collector", collector)
+        for i in range(10):
+            record_job_status(f"job_{i}", "running", run_id="r1")
+
+        assert sorted(collector.list_series()) == ["job.status", "job.status_change"]
+        assert len(collector.get_aggregates("job.status")) == 1
+
+    def test_export_includes_aggregates(self):
+        import json
+
+        collector = MetricsCollector()
+        collector.record_metric("job_duration_seconds", 1.5, metric_type=MetricType.HISTOGRAM,
+                                tags={"job_id": "j1", "run_id": "r1", "status": "completed", "batch_id": "b1"})
+
+        data = json.loads(collector.export_to_json())
+        aggregate = data["job_duration_seconds"]["aggregates"][0]
+        assert aggregate["count"] == 1
+        assert aggregate["p50"] == pytest.approx(1.5, rel=0.01)
+        assert aggregate["exemplar"]["labels"] == {"job_id": "j1"}
@@ -12,6 +12,7 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.utils.profile_manager import ProfileManager
+from src.utils.profile_snapshot import ProfileSnapshot, SNAPSHOT_DIR_ENV, default_snapshot_root, prune_snapshots
 
 
 @pytest.mark.ci_safe
@@ -210,5 +211,96 @@ class TestProfileManager:
         assert Path(selenium_profile).exists()
 
 
+
+@pytest.mark.ci_safe
+class TestProfileSnapshot:
+    """ProfileSnapshot (ゴールデンコピー) のテスト"""
+
+    @pytest.fixture
+    def profile(self, tmp_path):
+        source = tmp_path / "source_profile"
+        (source / "Default").mkdir(parents=True)
+        (source / "Default" / "Preferences").write_text('{"profile":{"name":"Test"}}')
+        (source / "Default" / "Cookies").write_text("SQLite format 3\x00cookies")
+        (source / "Local State").write_text('{"browser":{}}')
+        return source, ProfileSnapshot(source, ProfileManager.ESSENTIAL_FILES, root=tmp_path / "snapshots")
+
+    def test_refresh_copies_only_changed_files(self, profile):
+        source, snapshot = profile
+        assert snapshot.refresh() == {"copied": 3, "unchanged": 0, "removed": 0}
+        first_id = snapshot.snapshot_id
+        assert snapshot.refresh() == {"copied": 0, "unchanged": 3, "removed": 0}
+
+        cookies = source / "Default" / "Cookies"
+        cookies.write_text("SQLite format 3\x00cookies-v2")
+        os.utime(cookies, ns=(cookies.stat().st_atime_ns, cookies.stat().st_mtime_ns + 1_000_000_000))
+        (source / "Local State").unlink()
+        assert snapshot.refresh() == {"copied": 1, "unchanged": 1, "removed": 1}
+        assert snapshot.snapshot_id != first_id
+
+    def test_materialize_links_only_atomically_replaced_files(self, profile, tmp_path):
+        _, snapshot = profile
+        snapshot.refresh()
+        target = tmp_path / "run" / "SeleniumProfile"
+
+        entries = snapshot.materialize(target)
+
+        assert entries == ["Default/Preferences", "Default/Cookies", "Local State"]
+        assert (target / "Default" / "Cookies").read_text() == "SQLite format 3\x00cookies"
+        golden_cookies = snapshot.golden_dir / "Default" / "Cookies"
+        assert not os.path.samefile(golden_cookies, target / "Default" / "Cookies")
+        # Writing run state never reaches the golden copy
+        (target / "Default" / "Cookies").write_text("run state")
+        assert golden_cookies.read_text() == "SQLite format 3\x00cookies"
+
+    def test_tampered_golden_file_is_repaired(self, profile):
+        _, snapshot = profile
+        snapshot.refresh()
+        golden = snapshot.golden_dir / "Default" / "Preferences"
+        os.chmod(golden, 0o644)
+        golden.write_text("modified in place")
+
+        assert snapshot.refresh()["copied"] == 1
+        assert golden.read_text() == '{"profile":{"name":"Test"}}'
+
+    def test_profile_manager_uses_snapshot(self, profile, tmp_path, monkeypatch):
+        source, _ = profile
+        monkeypatch.setenv(SNAPSHOT_DIR_ENV, str(tmp_path / "env_snapshots"))
+
+        manager = ProfileManager(str(source), use_snapshots=True)
+        selenium_profile, copied = manager.create_selenium_profile_with_stats(str(tmp_path / "ws"))
+
+        assert copied == 3
+        assert (Path(selenium_profile) / "Local State").read_text() == '{"browser":{}}'
+        assert any((tmp_path / "env_snapshots").iterdir())
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_snapshot_dirs_are_private(self, profile):
+        _, snapshot = profile
+        old_umask = os.umask(0o022)
+        try:
+            snapshot.refresh()
+        finally:
+            os.umask(old_umask)
+
+        for directory in (snapshot.root, snapshot.dir, snapshot.golden_dir):
+            assert directory.stat().st_mode & 0o777 == 0o700
+
+    @pytest.mark.skipif(sys.platform in ("win32", "darwin"), reason="XDG cache layout")
+    def test_default_root_is_per_user_cache(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(SNAPSHOT_DIR_ENV, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+        assert default_snapshot_root() == tmp_path / "cache" / "2bykilt" / "profile_snapshots"
+
+    def test_prune_removes_snapshots_of_deleted_profiles(self, profile, tmp_path):
+        source, snapshot = profile
+        snapshot.refresh()
+        shutil.rmtree(source)
+
+        assert prune_snapshots(tmp_path / "snapshots") == 1
+        assert not snapshot.dir.exists()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -139,7 +139,8 @@ class TestQueueManager:
         item2 = await self.manager.execute_next()
         assert item2.id == "medium-priority"
 
-        # Third item should be low priority
+        # Third item should be low priority once a slot frees up
+        self.manager.complete_item(item1.id)
         item3 = await self.manager.execute_next()
         assert item3.id == "low-priority"
 
@@ -159,8 +160,9 @@ class TestQueueManager:
         item1 = await manager.execute_next()
         assert item1 is not None
 
-        # Try to start second item - should be blocked by semaphore
-        # In real usage, this would be handled by the semaphore
+        # The second item waits for the running one to finish
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(manager.execute_next(), timeout=0.2)
         status = manager.get_queue_status()
         assert status["running_count"] == 1
         assert status["queue_length"] == 1
@@ -186,35 +188,44 @@ class TestQueueManager:
         with pytest.raises(ValueError):
             self.manager.update_max_concurrency(0)
 
-    @pytest.mark.asyncio
-    async def test_update_max_concurrency_with_active_tasks_raises_error(self):
-        """Test that updating max concurrency with active tasks raises RuntimeError"""
-        # Simulate active task using test helper method
+    def test_update_max_concurrency_with_active_tasks(self):
+        """Test that max concurrency can be changed while tasks are active"""
         self.manager._add_active_item_for_testing("active-test", "Active Test")
 
-        # Try to update max concurrency while there are active tasks - should raise RuntimeError
-        with pytest.raises(RuntimeError, match="Cannot change max_concurrency while tasks are active"):
-            self.manager.update_max_concurrency(3)
+        self.manager.update_max_concurrency(3)
+        assert self.manager.max_concurrency == 3
+        assert self.manager.get_queue_status()["running_count"] == 1
 
-    @pytest.mark.asyncio
-    async def test_set_max_concurrency_with_active_tasks_raises_error(self):
-        """Test that setting max concurrency with active tasks raises RuntimeError"""
-        # Simulate active task using test helper method
+    def test_set_max_concurrency_with_active_tasks(self):
+        """Test that setting max concurrency with active tasks takes effect immediately"""
         self.manager._add_active_item_for_testing("active-test", "Active Test")
 
-        # Try to set max concurrency while there are active tasks - should raise RuntimeError
-        with pytest.raises(RuntimeError, match="Cannot change max_concurrency while tasks are active"):
-            self.manager.max_concurrency = 3
+        self.manager.max_concurrency = 1
+        assert self.manager.max_concurrency == 1
+        with pytest.raises(ValueError):
+            self.manager.max_concurrency = 0
+
+    def test_lowered_limit_delays_new_starts(self):
+        """Test that a live lower limit applies to the next start without a drain"""
+        self.manager.enqueue("a", "A")
+        self.manager.enqueue("b", "B")
+        self.manager.enqueue("c", "C")
 
-    @pytest.mark.asyncio
-    async def test_update_max_concurrency_with_waiting_tasks_raises_error(self):
-        """Test that updating max concurrency with waiting tasks raises RuntimeError"""
-        # Add waiting task to queue
-        self.manager.enqueue("waiting-test", "Waiting Test")
+        async def _inner():
+            await self.manager.execute_next()
+            await self.manager.execute_next()
+            self.manager.update_max_concurrency(1)
 
-        # Try to update max concurrency while there are waiting tasks - should raise RuntimeError
-        with pytest.raises(RuntimeError, match="Cannot change max_concurrency while tasks are active"):
-            self.manager.update_max_concurrency(2)
+            waiter = asyncio.create_task(self.manager.execute_next())
+            await asyncio.sleep(0.1)
+            assert not waiter.done()  # 2 running > limit 1
+            self.manager.complete_item("a")
+            await asyncio.sleep(0.1)
+            assert not waiter.done()  # 1 running == limit 1
+            self.manager.complete_item("b")
+            return await asyncio.wait_for(waiter, timeout=5)
+
+        assert _run_async(_inner).id == "c"
 
     @patch('src.config.multi_env_loader.load_config')
     def test_get_queue_manager_with_config(self, mock_load_config):
@@ -259,6 +270,166 @@ class TestQueueManager:
         _run_async(_inner)
 
 
+@pytest.mark.ci_safe
+class TestQueuePersistence:
+    """Test cases for the durable queue store and completed retention"""
+
+    def setup_method(self):
+        import tempfile
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.artifacts_dir = Path(self.temp_dir.name) / "test_artifacts"
+        self.artifacts_dir.mkdir(exist_ok=True)
+        self.store_path = Path(self.temp_dir.name) / "queue_state.sqlite3"
+
+    def teardown_method(self):
+        reset_queue_manager()
+        self.temp_dir.cleanup()
+
+    def _manager(self, **kwargs) -> QueueManager:
+        return QueueManager(self.artifacts_dir, max_concurrency=2, store_path=self.store_path, **kwargs)
+
+    def test_restart_resumes_waiting_and_orphaned_running_items(self):
+        """Waiting items keep their order and running items are re-queued"""
+        first = self._manager()
+        first.enqueue("low", "Low", priority=1)
+        first.enqueue("high", "High", priority=5, metadata={"batch_id": "b1"})
+        first.enqueue("mid", "Mid", priority=3)
+        first.enqueue("done", "Done", priority=0)
+
+        async def _start_two():
+            started = [await first.execute_next(), await first.execute_next()]
+            return [item.id for item in started]
+
+        assert _run_async(_start_two) == ["high", "mid"]
+        first.complete_item("mid")
+        # Simulate a crash: no shutdown, just a new manager on the same store
+        second = self._manager()
+
+        status = second.get_queue_status()
+        assert [item["id"] for item in status["waiting_items"]] == ["high", "low", "done"]
+        assert status["running_count"] == 0
+        recovered = second.get_item("high")
+        assert recovered.state == QueueState.WAITING
+        assert recovered.started_at is None
+        assert recovered.metadata == {"batch_id": "b1", "recovered_runs": 1}
+        assert second.get_item("mid").state == QueueState.COMPLETED
+
+        with pytest.raises(ValueError, match="already exists in queue"):
+            second.enqueue("low", "Low again")
+
+    def test_shutdown_cancelled_items_are_not_resumed(self):
+        first = self._manager()
+        first.enqueue("test-1", "Test Item")
+        _run_async(first.shutdown)
+
+        second = self._manager()
+        assert second.get_queue_status()["queue_length"] == 0
+        assert second.get_item("test-1").state == QueueState.CANCELLED
+
+    def test_completed_retention_is_bounded(self):
+        """Only the newest finished items are kept in memory and in the store"""
+        manager = self._manager(completed_retention=3)
+
+        async def _run_all():
+            for i in range(10):
+                manager.enqueue(f"job-{i}", f"Job {i}")
+                item = await manager.execute_next()
+                manager.complete_item(item.id, success=i % 2 == 0)
+
+        _run_async(_run_all)
+
+        assert list(manager._completed) == ["job-7", "job-8", "job-9"]
+        assert manager.get_queue_status()["completed_count"] == 10
+        assert manager.get_item("job-0") is None
+
+        reloaded = self._manager(completed_retention=3)
+        assert list(reloaded._completed) == ["job-7", "job-8", "job-9"]
+        assert reloaded.get_item("job-8").state == QueueState.COMPLETED
+
+    def test_in_memory_manager_has_no_store(self):
+        manager = QueueManager(self.artifacts_dir)
+        manager.enqueue("test-1", "Test Item")
+        assert manager._store is None
+        assert not self.store_path.exists()
+
+
+@pytest.mark.ci_safe
+class TestQueueEventStream:
+    """Test cases for the queue event stream and debounced manifest snapshot"""
+
+    def setup_method(self):
+        import tempfile
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.artifacts_dir = Path(self.temp_dir.name) / "test_artifacts"
+        self.manifest = {}
+        self.artifact_manager = MagicMock()
+        self.artifact_manager.update_manifest.side_effect = lambda mutator: mutator(self.manifest)
+        self.patcher = patch("src.core.artifact_manager.get_artifact_manager", return_value=self.artifact_manager)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+        reset_queue_manager()
+        self.temp_dir.cleanup()
+
+    def _process(self, manager: QueueManager, count: int) -> None:
+        async def _run_all():
+            for i in range(count):
+                manager.enqueue(f"job-{i}", f"Job {i}")
+                item = await manager.execute_next()
+                manager.complete_item(item.id)
+
+        _run_async(_run_all)
+
+    def test_events_are_appended_to_stream(self):
+        import json
+
+        manager = QueueManager(self.artifacts_dir, manifest_debounce_seconds=60)
+        self._process(manager, 2)
+
+        lines = (self.artifacts_dir / "queue_events.jsonl").read_text(encoding="utf-8").splitlines()
+        events = [json.loads(line) for line in lines]
+        assert [(e["event"], e["item_id"]) for e in events] == [
+            ("enqueued", "job-0"), ("started", "job-0"), ("completed", "job-0"),
+            ("enqueued", "job-1"), ("started", "job-1"), ("completed", "job-1"),
+        ]
+        assert "run_time" in events[2]
+        assert not (self.artifacts_dir / "runs").exists()  # no per-item queue.log
+
+    def test_manifest_snapshot_is_debounced(self):
+        manager = QueueManager(self.artifacts_dir, manifest_debounce_seconds=60)
+        self._process(manager, 20)
+
+        self.artifact_manager.update_manifest.assert_not_called()
+        manager.flush_manifest_snapshot()
+        manager.flush_manifest_snapshot()  # nothing changed since
+
+        assert self.artifact_manager.update_manifest.call_count == 1
+        queue_state = self.manifest["queue_state"]
+        assert len(queue_state["items"]) == 20
+        assert queue_state["items"]["job-3"]["state"] == "completed"
+        assert len(queue_state["events"]) == 60
+        assert queue_state["event_log"].endswith("queue_events.jsonl")
+
+    def test_timer_writes_snapshot(self):
+        manager = QueueManager(self.artifacts_dir, manifest_debounce_seconds=0.01)
+        manager.enqueue("job-0", "Job 0")
+
+        deadline = time.time() + 5
+        while not self.artifact_manager.update_manifest.called and time.time() < deadline:
+            time.sleep(0.01)
+        assert self.manifest["queue_state"]["items"]["job-0"]["state"] == "waiting"
+
+    def test_shutdown_flushes_snapshot_and_stats(self):
+        manager = QueueManager(self.artifacts_dir, manifest_debounce_seconds=60)
+        manager.enqueue("job-0", "Job 0")
+        _run_async(manager.shutdown)
+
+        assert self.manifest["queue_state"]["items"]["job-0"]["state"] == "cancelled"
+        assert len(self.manifest["queue_stats"]) == 1
+        assert manager._snapshot_timer is None
+
+
 @pytest.mark.ci_safe
 class TestQueueItem:
     """Test cases for QueueItem"""
@@ -3,10 +3,20 @@
 Tests the artifacts listing service layer.
 """
 import json
+import os
+import shutil
+import sqlite3
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+from src.core.artifact_catalog import (
+    ArtifactCatalog,
+    CATALOG_FILENAME,
+    load_manifest_rows,
+    notify_manifest_written,
+)
+from src.core.manifest_log import append_delta
 from src.services.artifacts_service import (
     list_artifacts,
     get_artifact_summary,
@@ -352,6 +362,148 @@ class TestListArtifacts:
         assert len(unregistered_items) == 3  # 2 txt + 1 csv
 
 
+@pytest.mark.ci_safe
+class TestArtifactCatalog:
+    """Test suite for the catalog-backed listing (keyset pagination, reconciliation)."""
+
+    def _make_run(self, runs_root, run_id, shots, mtime):
+        run_dir = runs_root / f"{run_id}-art"
+        (run_dir / "screenshots").mkdir(parents=True)
+        entries = []
+        for name in shots:
+            (run_dir / "screenshots" / name).write_bytes(b"png")
+            entries.append({"type": "screenshot", "path": f"screenshots/{name}", "size": 3,
+                            "created_at": "2025-01-13T12:00:00Z"})
+        manifest = run_dir / "manifest_v2.json"
+        manifest.write_text(json.dumps({"artifacts": entries}))
+        os.utime(manifest, (mtime, mtime))
+        return run_dir
+
+    def _collect_by_cursor(self, limit, **filters):
+        items, cursor = [], None
+        while True:
+            page = list_artifacts(ListArtifactsParams(limit=limit, cursor=cursor, **filters))
+            items.extend(page.items)
+            if not page.has_next:
+                assert page.next_cursor is None
+                return items
+            cursor = page.next_cursor
+
+    @patch('src.services.artifacts_service.get_artifacts_base_dir')
+    def test_cursor_pages_match_offset_order(self, mock_get_artifacts_base_dir, tmp_path):
+        runs_root = tmp_path / "runs"
+        self._make_run(runs_root, "run-old", ["a.png", "b.png"], 1_000)
+        self._make_run(runs_root, "run-new", ["c.png", "d.png", "e.png"], 2_000)
+        mock_get_artifacts_base_dir.return_value = tmp_path
+
+        full = list_artifacts(ListArtifactsParams(limit=0))
+        assert [Path(i.path).name for i in full.items] == ["c.png", "d.png", "e.png", "a.png", "b.png"]
+        assert (runs_root / CATALOG_FILENAME).exists()
+
+        assert self._collect_by_cursor(2) == full.items
+        assert [i.run_id for i in self._collect_by_cursor(1, run_id="run-old")] == ["run-old", "run-old"]
+
+        with pytest.raises(ValueError, match="invalid cursor"):
+            list_artifacts(ListArtifactsParams(cursor="not-a-cursor"))
+
+    @patch('src.services.artifacts_service.get_artifacts_base_dir')
+    def test_unchanged_runs_are_not_reparsed(self, mock_get_artifacts_base_dir, tmp_path):
+        runs_root = tmp_path / "runs"
+        self._make_run(runs_root, "run-1", ["a.png"], 1_000)
+        old_run = self._make_run(runs_root, "run-2", ["b.png"], 2_000)
+        mock_get_artifacts_base_dir.return_value = tmp_path
+        list_artifacts(ListArtifactsParams(limit=10))
+
+        with patch('src.core.artifact_catalog.load_manifest_rows', wraps=load_manifest_rows) as loader:
+            assert list_artifacts(ListArtifactsParams(limit=10)).total_count == 2
+            assert loader.call_count == 0
+
+            # New run, changed run and removed run are picked up from directory mtimes
+            self._make_run(runs_root, "run-3", ["c.png", "d.png"], 3_000)
+            (runs_root / "run-1-art" / "screenshots" / "z.png").write_bytes(b"png")
+            manifest = runs_root / "run-1-art" / "manifest_v2.json"
+            data = json.loads(manifest.read_text())
+            data["artifacts"].append({"type": "screenshot", "path": "screenshots/z.png", "size": 3,
+                                      "created_at": "2025-01-13T12:00:00Z"})
+            manifest.write_text(json.dumps(data))
+            os.utime(manifest, (4_000, 4_000))
+            shutil.rmtree(old_run)
+
+            result = list_artifacts(ListArtifactsParams(limit=10))
+            assert loader.call_count == 2
+
+        assert [Path(i.path).name for i in result.items] == ["a.png", "z.png", "c.png", "d.png"]
+
+    @patch('src.services.artifacts_service.get_artifacts_base_dir')
+    def test_manifest_writes_update_catalog(self, mock_get_artifacts_base_dir, tmp_path):
+        runs_root = tmp_path / "runs"
+        run_dir = self._make_run(runs_root, "run-1", ["a.png"], 1_000)
+        mock_get_artifacts_base_dir.return_value = tmp_path
+        list_artifacts(ListArtifactsParams(limit=10))
+
+        (run_dir / "screenshots" / "b.png").write_bytes(b"png")
+        manifest = run_dir / "manifest_v2.json"
+        data = json.loads(manifest.read_text())
+        data["artifacts"].append({"type": "video", "path": "screenshots/b.png", "size": 3, "created_at": ""})
+        manifest.write_text(json.dumps(data))
+        notify_manifest_written(manifest, data)
+
+        catalog = ArtifactCatalog.for_root(runs_root, tmp_path)
+        rows, _, total = catalog.query(artifact_type="video")
+        assert total == 1 and Path(rows[0]["path"]).name == "b.png"
+        assert catalog.reconcile() == {"indexed": 0, "removed": 0}
+
+    @patch('src.services.artifacts_service.get_artifacts_base_dir')
+    def test_listing_skips_walk_while_root_unchanged(self, mock_get_artifacts_base_dir, tmp_path):
+        runs_root = tmp_path / "runs"
+        self._make_run(runs_root, "run-1", ["a.png"], 1_000)
+        mock_get_artifacts_base_dir.return_value = tmp_path
+        list_artifacts(ListArtifactsParams(limit=10))
+        catalog = ArtifactCatalog.for_root(runs_root, tmp_path)
+
+        with patch.object(catalog, "_run_signature", wraps=catalog._run_signature) as signature:
+            assert list_artifacts(ListArtifactsParams(limit=10)).total_count == 1
+            assert signature.call_count == 0
+
+            # TTL expiry reconciles even when the root directory did not change
+            assert catalog.reconcile_if_stale(ttl=0) == {"indexed": 0, "removed": 0}
+            assert signature.call_count == 1
+
+    def test_delta_log_appends_are_reconciled(self, tmp_path):
+        runs_root = tmp_path / "runs"
+        run_dir = self._make_run(runs_root, "run-1", ["a.png"], 1_000)
+        catalog = ArtifactCatalog(runs_root, tmp_path)
+        catalog.reconcile()
+
+        (run_dir / "screenshots" / "b.png").write_bytes(b"png")
+        append_delta(run_dir / "manifest_v2.json", {"type": "screenshot", "path": "screenshots/b.png",
+                                                     "size": 3, "created_at": "2025-01-13T12:00:01Z"})
+
+        assert catalog.reconcile() == {"indexed": 1, "removed": 0}
+        rows, _, total = catalog.query()
+        assert total == 2 and Path(rows[-1]["path"]).name == "b.png"
+        catalog.close()
+
+    @patch('src.services.artifacts_service.ArtifactCatalog.for_root')
+    @patch('src.services.artifacts_service.get_artifacts_base_dir')
+    def test_scan_fallback_matches_catalog(self, mock_get_artifacts_base_dir, mock_for_root, tmp_path):
+        runs_root = tmp_path / "runs"
+        self._make_run(runs_root, "run-old", ["a.png", "b.png"], 1_000)
+        self._make_run(runs_root, "run-new", ["c.png"], 2_000)
+        mock_get_artifacts_base_dir.return_value = tmp_path
+        mock_for_root.side_effect = sqlite3.OperationalError("unable to open database file")
+
+        first = list_artifacts(ListArtifactsParams(limit=2))
+        assert first.total_count == 3
+        assert [Path(i.path).name for i in first.items] == ["c.png", "a.png"]
+
+        mock_for_root.side_effect = None
+        mock_for_root.return_value = ArtifactCatalog(runs_root, tmp_path)
+        second = list_artifacts(ListArtifactsParams(limit=2, cursor=first.next_cursor))
+        assert [Path(i.path).name for i in second.items] == ["b.png"]
+        assert not second.has_next
+
+
 @pytest.mark.ci_safe
 class TestGetArtifactSummary:
     """Test suite for get_artifact_summary function."""
@@ -12,6 +12,7 @@ Tests cover:
 """
 
 import asyncio
+import contextlib
 import os
 import tempfile
 from pathlib import Path
@@ -20,8 +21,12 @@ from unittest import mock
 import pytest
 
 from src.workers.gif_fallback_worker import (
+    GIF_POOL_MAX_WORKERS,
+    MAX_RETRIES,
     ConversionTask,
+    FfmpegCapabilities,
     GifFallbackWorker,
+    default_pool_size,
     get_worker,
 )
 
@@ -377,5 +382,155 @@ class TestFfmpegConversion:
         assert result is False
 
 
+@pytest.mark.local_only
+class TestConversionPool:
+    """Test the parallel pool, single-pass command and persisted state."""
+
+    @staticmethod
+    def _run(coro):
+        return asyncio.run(coro)
+
+    def test_single_pass_filter_graph(self):
+        worker = GifFallbackWorker(max_workers=2)
+        cmd = worker.build_ffmpeg_command("in.webm", "out.gif.part")
+
+        assert cmd.count("-i") == 1
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "split[s0][s1]" in graph and "palettegen" in graph and "paletteuse" in graph
+        assert cmd[cmd.index("-threads") + 1] == str(worker.ffmpeg_threads)
+        assert "palettegen" not in " ".join(worker.build_ffmpeg_command("in.webm", "o", palette_filters=False))
+
+    def test_pool_size_follows_cores(self):
+        assert default_pool_size(1) == 1
+        assert default_pool_size(4) == 2
+        assert default_pool_size(64) == GIF_POOL_MAX_WORKERS
+
+    @mock.patch('src.workers.gif_fallback_worker.asyncio.create_subprocess_exec')
+    def test_ffmpeg_probed_once(self, mock_exec, tmp_path):
+        def _spawn(*cmd, **kwargs):
+            process = mock.AsyncMock()
+            process.returncode = 0
+            if "-filters" in cmd:
+                process.communicate = mock.AsyncMock(return_value=(b" ... palettegen ... paletteuse", b""))
+            else:
+                Path(cmd[-1]).write_bytes(b"GIF89a")
+                process.communicate = mock.AsyncMock(return_value=(b"", b""))
+            return process
+
+        mock_exec.side_effect = _spawn
+        worker = GifFallbackWorker(max_workers=2)
+
+        async def _convert_two():
+            for name in ("a", "b"):
+                video = tmp_path / f"{name}.webm"
+                video.write_bytes(b"video")
+                assert await worker._convert_with_ffmpeg(str(video), worker.get_gif_path(str(video)))
+
+        self._run(_convert_two())
+        commands = [call.args for call in mock_exec.call_args_list]
+        assert sum("-filters" in cmd for cmd in commands) == 1
+        assert len(commands) == 3
+        assert (tmp_path / "a.gif").read_bytes() == b"GIF89a"
+        assert not list(tmp_path.glob("*.part"))
+
+    @mock.patch('src.workers.gif_fallback_worker.FeatureFlags.is_enabled', return_value=True)
+    def test_pool_converts_in_parallel(self, _mock_flag, tmp_path):
+        worker = GifFallbackWorker(max_workers=3)
+        state = {"active": 0, "peak": 0}
+
+        async def _fake_convert(video_path, gif_path):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.05)
+            state["active"] -= 1
+            return True
+
+        async def _scenario():
+            for i in range(6):
+                video = tmp_path / f"video_{i}.webm"
+                video.write_bytes(b"video")
+                await worker.enqueue(str(video))
+            await worker.start()
+            await asyncio.wait_for(worker.queue.join(), timeout=5)
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker.stop()
+
+        with mock.patch.object(worker, "_convert_video_to_gif", _fake_convert):
+            self._run(_scenario())
+
+        assert state["peak"] == 3
+        assert len(worker.completed) == 6
+
+    @mock.patch('src.workers.gif_fallback_worker.FeatureFlags.is_enabled', return_value=True)
+    def test_same_video_never_converted_concurrently(self, _mock_flag, tmp_path):
+        worker = GifFallbackWorker(max_workers=2)
+        video = tmp_path / "video.webm"
+        video.write_bytes(b"video")
+        state = {"active": 0, "peak": 0, "calls": 0}
+
+        async def _fake_convert(video_path, gif_path):
+            state["calls"] += 1
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.05)
+            state["active"] -= 1
+            return True
+
+        async def _scenario():
+            results = [await worker.enqueue(str(video)), await worker.enqueue(str(video))]
+            await worker.start()
+            await asyncio.wait_for(worker.queue.join(), timeout=5)
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker.stop()
+            return results
+
+        with mock.patch.object(worker, "_convert_video_to_gif", _fake_convert):
+            assert self._run(_scenario()) == [True, False]
+
+        assert state == {"active": 0, "peak": 1, "calls": 1}
+        assert worker.queued == set()
+
+    @mock.patch('src.workers.gif_fallback_worker.FeatureFlags.is_enabled', return_value=True)
+    def test_missing_ffmpeg_failure_not_persisted(self, _mock_flag, tmp_path):
+        state_path = tmp_path / "state.jsonl"
+        video = tmp_path / "video.webm"
+        video.write_bytes(b"video")
+        worker = GifFallbackWorker(state_path=state_path)
+        task = ConversionTask(str(video), worker.get_gif_path(str(video)), retry_count=MAX_RETRIES - 1)
+
+        with mock.patch.object(worker, "_run_ffmpeg_probe",
+                               mock.AsyncMock(return_value=FfmpegCapabilities(available=False))):
+            self._run(worker._process_task(task))
+
+        assert str(video) in worker.failed
+        assert str(video) not in GifFallbackWorker(state_path=state_path).failed
+
+    @mock.patch('src.workers.gif_fallback_worker.FeatureFlags.is_enabled', return_value=True)
+    def test_state_persists_across_restarts(self, _mock_flag, tmp_path):
+        state_path = tmp_path / "state.jsonl"
+        done = tmp_path / "done.webm"
+        broken = tmp_path / "broken.webm"
+        for video in (done, broken):
+            video.write_bytes(b"video")
+
+        worker = GifFallbackWorker(state_path=state_path)
+        with mock.patch.object(worker, "_convert_video_to_gif", mock.AsyncMock(return_value=True)):
+            self._run(worker._process_task(ConversionTask(str(done), worker.get_gif_path(str(done)))))
+        task = ConversionTask(str(broken), worker.get_gif_path(str(broken)), retry_count=MAX_RETRIES - 1)
+        with mock.patch.object(worker, "_convert_video_to_gif", mock.AsyncMock(return_value=False)):
+            self._run(worker._process_task(task))
+
+        restarted = GifFallbackWorker(state_path=state_path)
+        assert restarted.completed == {str(done)}
+        assert str(broken) in restarted.failed
+        with mock.patch('src.workers.gif_fallback_worker.os.path.exists', wraps=os.path.exists) as exists:
+            assert self._run(restarted.enqueue(str(done))) is False
+            assert mock.call(restarted.get_gif_path(str(done))) not in exists.call_args_list
+
+        restarted.forget(str(broken))
+        assert self._run(restarted.enqueue(str(broken))) is True
+        assert str(broken) not in GifFallbackWorker(state_path=state_path).failed
+
+
 # Apply pytest markers for test categorization
 pytestmark = [pytest.mark.unit, pytest.mark.asyncio]